@@ -0,0 +1,252 @@
+"""
+그룹웨어(epaper) API 클라이언트
+
+- 하나의 `httpx.AsyncClient`를 전용 이벤트 루프 스레드에서 공유해 커넥션 풀/keep-alive를 재사용
+- 엔드포인트별 타임아웃과 재시도 정책 (지수 백오프 + full jitter)
+- 동기 코드(LangGraph 동기 노드)는 `call_api`, 비동기 코드는 `acall_api`로 같은 풀을 사용
+- `StaleWhileRevalidateCache`: 키별 TTL 캐시. 만료된 값은 즉시 반환하고 백그라운드에서 갱신
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger("api_client")
+
+MAX_CONNECTIONS = int(os.getenv("GW_API_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GW_API_MAX_KEEPALIVE", "10"))
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("GW_API_KEEPALIVE_EXPIRY", "30"))
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("GW_API_DEFAULT_TIMEOUT", "10"))
+MAX_RETRIES = int(os.getenv("GW_API_MAX_RETRIES", "2"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("GW_API_RETRY_BACKOFF", "0.2"))
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class EndpointPolicy:
+    """엔드포인트별 호출 정책"""
+
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+    retries: int = MAX_RETRIES
+
+
+# 조회성 엔드포인트는 짧은 타임아웃 + 재시도, 신청(register)은 중복 제출 방지를 위해 재시도 없음
+ENDPOINT_POLICIES: Dict[str, EndpointPolicy] = {
+    "remainder": EndpointPolicy(timeout=5.0),
+    "myLine": EndpointPolicy(timeout=5.0),
+    "register": EndpointPolicy(timeout=30.0, retries=0),
+}
+
+
+class ApiClient:
+    """API 클라이언트 클래스"""
+
+    def __init__(self, api_url: str):
+        self.api_url = api_url
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """전용 이벤트 루프 스레드와 AsyncClient를 최초 사용 시 생성합니다."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="gw-api-client", daemon=True
+                ).start()
+                self._client = httpx.AsyncClient(
+                    timeout=DEFAULT_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                    ),
+                    headers={"Content-Type": "application/json"},
+                )
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """코루틴을 클라이언트 루프에서 실행하고 concurrent.futures.Future를 반환합니다."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Awaitable) -> Any:
+        """동기 코드에서 코루틴을 클라이언트 루프에서 실행하고 결과를 기다립니다."""
+        return self.submit(coro).result()
+
+    async def arun(self, coro: Awaitable) -> Any:
+        """다른 이벤트 루프에서 코루틴을 클라이언트 루프에서 실행하고 결과를 기다립니다."""
+        return await asyncio.wrap_future(self.submit(coro))
+
+    async def _request(self, endpoint: str, method: str, params: Dict = None) -> Dict:
+        policy = ENDPOINT_POLICIES.get(endpoint, EndpointPolicy())
+        url = f"{self.api_url}/{endpoint}"
+        method = method.upper()
+        if method == "GET":
+            request_kwargs = {"params": params}
+        else:
+            request_kwargs = {"json": params}
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.request(
+                    method, url, timeout=policy.timeout, **request_kwargs
+                )
+                if (
+                    response.status_code in RETRY_STATUS_CODES
+                    and attempt < policy.retries
+                ):
+                    raise httpx.HTTPStatusError(
+                        f"재시도 대상 상태 코드: {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                response.raise_for_status()
+                return response.json()
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retryable = isinstance(e, httpx.TransportError) or (
+                    e.response.status_code in RETRY_STATUS_CODES
+                )
+                if not retryable or attempt >= policy.retries:
+                    raise
+                # full jitter: 0 ~ base * 2^attempt 사이에서 무작위 대기
+                delay = random.uniform(0, RETRY_BACKOFF_SECONDS * (2**attempt))
+                attempt += 1
+                logger.warning(
+                    f"API 재시도 {attempt}/{policy.retries}: {method} {endpoint} "
+                    f"({type(e).__name__}: {str(e)}), {delay:.2f}s 후"
+                )
+                await asyncio.sleep(delay)
+
+    async def _call(self, endpoint: str, method: str, params: Dict = None) -> Dict:
+        logger.info(f"API 호출 시작: {method} {endpoint}")
+        logger.debug(f"API 파라미터: {params}")
+
+        if method.upper() not in ("GET", "POST", "PUT"):
+            return {"error": f"지원하지 않는 HTTP 메서드: {method}", "code": "-1"}
+
+        try:
+            return await self._request(endpoint, method, params)
+        except Exception as e:
+            error_msg = f"API 호출 오류: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg, "code": "-1"}
+
+    def call_api(self, endpoint: str, method: str, params: Dict = None) -> Dict:
+        """API 호출 함수 (동기). 실패 시 {"error": ..., "code": "-1"}을 반환합니다."""
+        return self.run(self._call(endpoint, method, params))
+
+    async def acall_api(self, endpoint: str, method: str, params: Dict = None) -> Dict:
+        """API 호출 함수 (비동기). 호출한 루프와 관계없이 공유 커넥션 풀을 사용합니다."""
+        return await self.arun(self._call(endpoint, method, params))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+            loop, client = self._loop, self._client
+            self._loop = self._client = None
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+class StaleWhileRevalidateCache:
+    """키별 TTL 캐시 (stale-while-revalidate)
+
+    - 신선(`ttl` 이내): 캐시 값 반환
+    - 오래됨(`ttl` ~ `ttl + stale_ttl`): 캐시 값을 즉시 반환하고 백그라운드에서 한 번만 갱신
+    - 만료/없음: 로더를 호출해 기다림 (같은 키의 동시 요청은 한 번만 로드)
+
+    로더는 `(값, 캐시 여부)`를 반환합니다. 대체 데이터처럼 캐시하면 안 되는 값은 False.
+    모든 로드는 `runner`(ApiClient) 루프에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Awaitable[Tuple[Any, bool]]],
+        runner: ApiClient,
+        ttl_seconds: float,
+        stale_ttl_seconds: float,
+        max_entries: int = 1024,
+    ):
+        self.loader = loader
+        self.runner = runner
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # invalidate() 횟수 (무효화 전에 시작한 로드 결과를 저장하지 않기 위함)
+        self._versions: Dict[str, int] = {}
+        self.stats = {"fresh": 0, "stale": 0, "miss": 0, "refresh": 0, "invalidate": 0}
+
+    def _load(self, key: str) -> asyncio.Task:
+        """클라이언트 루프 안에서만 호출. 같은 키의 로드는 하나의 Task를 공유합니다."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_and_store(key))
+            task.add_done_callback(self._log_failure)
+            self._inflight[key] = task
+        return task
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"캐시 로드 실패: {str(task.exception())}")
+
+    async def _load_and_store(self, key: str) -> Any:
+        version = self._versions.get(key, 0)
+        try:
+            value, cacheable = await self.loader(key)
+            if cacheable and version == self._versions.get(key, 0):
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                self._inflight.pop(key, None)
+
+    async def _get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl_seconds:
+                self.stats["fresh"] += 1
+                return entry[1]
+            if age < self.ttl_seconds + self.stale_ttl_seconds:
+                self.stats["stale"] += 1
+                if key not in self._inflight:
+                    self.stats["refresh"] += 1
+                    self._load(key)
+                return entry[1]
+        self.stats["miss"] += 1
+        return await self._load(key)
+
+    def get(self, key: str) -> Any:
+        return self.runner.run(self._get(key))
+
+    async def aget(self, key: str) -> Any:
+        return await self.runner.arun(self._get(key))
+
+    def invalidate(self, key: str) -> None:
+        """키의 캐시 값을 버립니다. 진행 중인 로드 결과도 저장하지 않고, 다음 조회는 새로 로드합니다."""
+        self.runner.run(self._invalidate(key))
+
+    async def _invalidate(self, key: str) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+        self._inflight.pop(key, None)
+        self.stats["invalidate"] += 1
+        self._entries.pop(key, None)
@@ -0,0 +1,101 @@
+"""
+영업일 달력 사본 일치 검사
+
+gw_agent와 form-selector는 따로 배포되므로 `business_calendar.py`를 각자 가지고 있습니다.
+이 스크립트는 두 파일을 (모듈 docstring을 제외하고) AST 단위로 비교하고, 다르면
+공휴일 표 등 상수의 차이를 출력한 뒤 0이 아닌 코드로 종료합니다. 모듈을 임포트하지 않으므로
+numpy 없이도 실행됩니다.
+
+실행 예:
+    python benchmarks/business_calendar_sync_check.py
+"""
+
+import ast
+import os
+import sys
+from typing import Any, Dict
+
+GW_AGENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+GW_CALENDAR = os.path.join(GW_AGENT_DIR, "business_calendar.py")
+FORM_SELECTOR_CALENDAR = os.path.abspath(
+    os.path.join(
+        GW_AGENT_DIR,
+        "..",
+        "..",
+        "form-selector",
+        "form_selector",
+        "business_calendar.py",
+    )
+)
+# 값을 비교해 차이를 보여줄 상수
+TABLE_NAMES = ("KR_HOLIDAYS", "FIXED_HOLIDAYS", "WEEKMASK", "DV_TYPE_DAYS")
+
+
+def parse_module(path: str) -> ast.Module:
+    with open(path, "r", encoding="utf-8") as f:
+        module = ast.parse(f.read(), filename=path)
+    body = module.body
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+    ):
+        module.body = body[1:]  # 모듈 docstring은 서로를 가리키므로 비교에서 제외
+    return module
+
+
+def tables(module: ast.Module) -> Dict[str, object]:
+    values = {}
+    for node in module.body:
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            name, value = node.target.id, node.value
+        elif (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+        ):
+            name, value = node.targets[0].id, node.value
+        else:
+            continue
+        if name in TABLE_NAMES:
+            values[name] = ast.literal_eval(value)
+    return values
+
+
+def flatten(value: Any, prefix: str = "") -> Dict[str, Any]:
+    """중첩 dict를 {"2025.2025-10-06": "추석"} 형태로 펼침 (차이 항목만 보여주기 위해)"""
+    if not isinstance(value, dict):
+        return {prefix: value}
+    flat = {}
+    for key, item in value.items():
+        flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def main():
+    gw_module = parse_module(GW_CALENDAR)
+    fs_module = parse_module(FORM_SELECTOR_CALENDAR)
+    if ast.dump(gw_module) == ast.dump(fs_module):
+        print(
+            f"OK: business_calendar.py 두 사본이 같습니다. ({len(gw_module.body)} statements)"
+        )
+        return
+
+    print("MISMATCH: business_calendar.py 사본이 다릅니다.")
+    print(f"  gw_agent     : {GW_CALENDAR}")
+    print(f"  form-selector: {FORM_SELECTOR_CALENDAR}")
+    gw_tables, fs_tables = tables(gw_module), tables(fs_module)
+    for name in TABLE_NAMES:
+        gw_flat = flatten(gw_tables.get(name), name)
+        fs_flat = flatten(fs_tables.get(name), name)
+        for key in sorted(set(gw_flat) | set(fs_flat)):
+            if gw_flat.get(key) != fs_flat.get(key):
+                print(
+                    f"  {key}: gw_agent={gw_flat.get(key)!r} "
+                    f"form-selector={fs_flat.get(key)!r}"
+                )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+체크포인트 저장소 소크 테스트
+
+합성 스레드(기본 10,000개)를 대상으로 실제 대화와 비슷한 패턴(턴마다 메시지 2개 추가 →
+체크포인트 저장 → 다음 턴에 최신 체크포인트 조회)을 반복하면서 주기적으로
+`maintenance()`를 실행합니다. LLM/외부 API는 호출하지 않습니다.
+
+출력: 백엔드별 RSS 변화, 체크포인트 쓰기/읽기 지연(p50/p99), 남은 스레드 수, DB 크기
+
+실행 예:
+    python benchmarks/checkpoint_soak.py --threads 10000 --turns 4
+    python benchmarks/checkpoint_soak.py --backend unbounded   # 기존 MemorySaver 비교
+"""
+
+import argparse
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+parser = argparse.ArgumentParser(description="checkpoint store soak test")
+parser.add_argument(
+    "--backend", choices=["sqlite", "memory", "unbounded"], default="sqlite"
+)
+parser.add_argument("--threads", type=int, default=10000)
+parser.add_argument("--turns", type=int, default=4, help="스레드당 대화 턴 수")
+parser.add_argument("--max-threads", type=int, default=2000)
+parser.add_argument("--maintenance-every", type=int, default=1000)
+args = parser.parse_args()
+
+# checkpoint_store는 임포트 시 환경 변수로 백엔드를 고르므로 먼저 설정
+db_path = os.path.join(tempfile.mkdtemp(prefix="gw_soak_"), "soak.sqlite3")
+os.environ["GW_CHECKPOINT_DB"] = db_path
+os.environ["GW_CHECKPOINT_BACKEND"] = "sqlite" if args.backend == "sqlite" else "memory"
+os.environ["GW_MAX_THREADS"] = str(args.max_threads)
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+from langgraph.checkpoint.base import empty_checkpoint  # noqa: E402
+from langgraph.checkpoint.base.id import uuid6  # noqa: E402
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+
+import checkpoint_store  # noqa: E402
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 최대 RSS로 대체
+    psutil = None
+
+
+def rss_mb() -> float:
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def make_checkpoint(messages: list, step: int) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["id"] = str(uuid6(clock_seq=step))
+    checkpoint["channel_values"] = {
+        "messages": messages,
+        "vacation_info": {"drafterId": "01180001", "mstPid": 1, "dayList": []},
+        "next": "supervisor",
+    }
+    checkpoint["channel_versions"] = {
+        "messages": step + 1,
+        "vacation_info": step + 1,
+        "next": step + 1,
+    }
+    return checkpoint
+
+
+def run() -> Dict[str, float]:
+    if args.backend == "unbounded":
+        saver = InMemorySaver()
+    else:
+        saver = checkpoint_store.checkpointer
+
+    put_ms: List[float] = []
+    get_ms: List[float] = []
+    maintenance_ms: List[float] = []
+    rss_start = rss_mb()
+    started = time.perf_counter()
+
+    for index in range(args.threads):
+        thread_id = f"soak-{index}"
+        config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+        messages: list = []
+        for turn in range(args.turns):
+            if turn:
+                t0 = time.perf_counter()
+                saver.get_tuple(
+                    {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+                )
+                get_ms.append((time.perf_counter() - t0) * 1000)
+            messages = messages + [
+                HumanMessage(
+                    content=f"{turn}번째 질문: 다음 주 월요일 연차 신청할게요"
+                ),
+                AIMessage(
+                    content="연차 종류와 사유를 알려주세요. " * random.randint(1, 4)
+                ),
+            ]
+            checkpoint = make_checkpoint(messages, turn)
+            t0 = time.perf_counter()
+            config = saver.put(
+                config,
+                checkpoint,
+                {"source": "loop", "step": turn},
+                checkpoint["channel_versions"],
+            )
+            put_ms.append((time.perf_counter() - t0) * 1000)
+
+        if (index + 1) % args.maintenance_every == 0 and args.backend != "unbounded":
+            t0 = time.perf_counter()
+            saver.maintenance()
+            maintenance_ms.append((time.perf_counter() - t0) * 1000)
+
+    elapsed = time.perf_counter() - started
+    threads_left = (
+        len(saver.storage) if args.backend == "unbounded" else saver.thread_count()
+    )
+    return {
+        "elapsed": elapsed,
+        "rss_start": rss_start,
+        "rss_end": rss_mb(),
+        "put_p50": statistics.median(put_ms),
+        "put_p99": percentile(put_ms, 0.99),
+        "get_p50": statistics.median(get_ms) if get_ms else 0.0,
+        "get_p99": percentile(get_ms, 0.99) if get_ms else 0.0,
+        "maintenance_p50": statistics.median(maintenance_ms) if maintenance_ms else 0.0,
+        "threads_left": threads_left,
+    }
+
+
+def main():
+    result = run()
+    print(
+        f"backend={args.backend} threads={args.threads} turns={args.turns} "
+        f"max_threads={args.max_threads} elapsed={result['elapsed']:.1f}s"
+    )
+    print(
+        f"RSS: start={result['rss_start']:.1f}MB end={result['rss_end']:.1f}MB "
+        f"(+{result['rss_end'] - result['rss_start']:.1f}MB)"
+        + ("" if psutil else " [ru_maxrss]")
+    )
+    print(
+        f"write: p50={result['put_p50']:.3f}ms p99={result['put_p99']:.3f}ms | "
+        f"read: p50={result['get_p50']:.3f}ms p99={result['get_p99']:.3f}ms"
+    )
+    print(
+        f"maintenance p50={result['maintenance_p50']:.1f}ms "
+        f"threads_left={result['threads_left']}"
+    )
+    if args.backend == "sqlite":
+        size = sum(
+            os.path.getsize(db_path + suffix)
+            for suffix in ("", "-wal")
+            if os.path.exists(db_path + suffix)
+        )
+        print(f"db size={size / 1024 / 1024:.1f}MB ({db_path})")
+
+
+if __name__ == "__main__":
+    main()
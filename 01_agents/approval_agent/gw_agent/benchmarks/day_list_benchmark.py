@@ -0,0 +1,114 @@
+"""
+dayList 생성 / 영업일 계산 벤치마크
+
+여러 해에 걸친 날짜 범위에 대해 연차 dayList 생성 시간을 비교합니다. (LLM 호출 없음)
+
+- legacy : 기존 create_day_list (하루씩 while 루프, 매 반복 map_vacation_type, 주말/공휴일 포함)
+- current: business_calendar 기반 create_day_list (numpy busday, 주말/공휴일 제외)
+- count  : 영업일 수만 필요한 경우 (np.busday_count, 범위 길이와 무관)
+
+실행 예:
+    python benchmarks/day_list_benchmark.py --repeat 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["GW_CHECKPOINT_BACKEND"] = "memory"
+
+import logging  # noqa: E402
+
+import business_calendar  # noqa: E402
+import general_chatbot  # noqa: E402
+
+logging.disable(logging.WARNING)
+
+RANGES = (
+    ("1 week", "2025-09-29", "2025-10-10"),
+    ("1 month", "2025-10-01", "2025-10-31"),
+    ("1 year", "2025-01-01", "2025-12-31"),
+    ("3 years", "2024-01-01", "2026-12-31"),
+    ("10 years", "2020-01-01", "2029-12-31"),
+)
+
+
+def legacy_create_day_list(
+    start_date: str, end_date: str, vacation_type: str
+) -> List[Dict]:
+    """기존 구현 (비교용)"""
+    day_list = []
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    current = start
+    while current <= end:
+        day_list.append(
+            {
+                "reqYmd": current.strftime("%Y-%m-%d"),
+                "dvType": general_chatbot.map_vacation_type(vacation_type),
+            }
+        )
+        current += timedelta(days=1)
+    return day_list
+
+
+def legacy_count(start_date: str, end_date: str) -> int:
+    """주말만 제외하는 순수 파이썬 일수 계산 (비교용)"""
+    current = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    count = 0
+    while current <= end:
+        count += current.weekday() < 5
+        current += timedelta(days=1)
+    return count
+
+
+def timeit(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="day list benchmark")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"{'range':<9} {'legacy_days':>11} {'current_days':>12} "
+        f"{'legacy_ms':>10} {'current_ms':>10} {'speedup':>8} "
+        f"{'py_count_ms':>11} {'busday_count_ms':>15}"
+    )
+    for name, start, end in RANGES:
+        legacy = legacy_create_day_list(start, end, "연차")
+        current = general_chatbot.create_day_list(start, end, "연차")
+        legacy_ms = timeit(
+            lambda: legacy_create_day_list(start, end, "연차"), args.repeat
+        )
+        current_ms = timeit(
+            lambda: general_chatbot.create_day_list(start, end, "연차"), args.repeat
+        )
+        py_count_ms = timeit(lambda: legacy_count(start, end), args.repeat)
+        count_ms = timeit(
+            lambda: business_calendar.count_business_days(start, end), args.repeat
+        )
+        assert business_calendar.count_business_days(start, end) == len(current)
+        print(
+            f"{name:<9} {len(legacy):>11} {len(current):>12} "
+            f"{legacy_ms:>10.3f} {current_ms:>10.3f} "
+            f"{legacy_ms / current_ms:>7.1f}x {py_count_ms:>11.3f} {count_ms:>15.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
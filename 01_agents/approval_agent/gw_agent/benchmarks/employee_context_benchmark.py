@@ -0,0 +1,177 @@
+"""
+직원 컨텍스트 프리페치 벤치마크
+
+epaper API(`remainder`, `myLine`)를 흉내 내는 로컬 스텁 서버를 띄우고, 연차 신청 첫 진입 시
+필요한 직원 컨텍스트 조회 시간을 비교합니다. (LLM 호출 없음)
+
+- legacy : 기존 방식 (단일 동기 httpx.Client, 엔드포인트 순차 호출)
+- cold   : fetch_employee_context 캐시 미스 (공유 AsyncClient, 동시 호출)
+- warm   : 캐시 적중 (TTL 이내)
+- stale  : TTL 경과 후 → 캐시 값 즉시 반환 + 백그라운드 갱신
+- flaky  : 일정 확률로 503을 돌려주는 스텁에서 재시도(지터) 포함 cold 조회
+
+실행 예:
+    python benchmarks/employee_context_benchmark.py --latency-ms 120 --drafters 50
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+parser = argparse.ArgumentParser(description="employee context prefetch benchmark")
+parser.add_argument("--latency-ms", type=float, default=100.0, help="스텁 응답 지연")
+parser.add_argument("--jitter-ms", type=float, default=20.0, help="지연 편차")
+parser.add_argument("--error-rate", type=float, default=0.2, help="flaky 단계 503 비율")
+parser.add_argument("--drafters", type=int, default=30)
+parser.add_argument("--port", type=int, default=18765)
+args = parser.parse_args()
+
+
+class StubState:
+    error_rate = 0.0
+    requests = 0
+
+
+class EpaperStubHandler(BaseHTTPRequestHandler):
+    """ntoday epaper API 스텁 (remainder / myLine / register)"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        StubState.requests += 1
+        delay = args.latency_ms + random.uniform(-args.jitter_ms, args.jitter_ms)
+        time.sleep(max(delay, 0) / 1000)
+
+        if random.random() < StubState.error_rate:
+            self._send(503, {"message": "temporarily unavailable"})
+            return
+
+        endpoint = self.path.rsplit("/", 1)[-1]
+        if endpoint == "remainder":
+            payload = {
+                "drafterId": body.get("drafterId"),
+                "total_days": 15,
+                "used_days": 3,
+                "remaining_days": 12,
+            }
+        elif endpoint == "myLine":
+            payload = {
+                "code": 1,
+                "message": "결재 라인 조회",
+                "data": [{"aprvPsId": "01150001", "aprvPsNm": "김팀장", "ordr": 1}],
+            }
+        else:
+            payload = {"code": 1, "message": "ok"}
+        self._send(200, payload)
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *log_args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", args.port), EpaperStubHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+BASE_URL = f"http://127.0.0.1:{args.port}/api/v1/epaper"
+os.environ["BASE_URL"] = BASE_URL
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ["GW_CHECKPOINT_BACKEND"] = "memory"
+
+import logging  # noqa: E402
+
+import httpx  # noqa: E402
+
+import general_chatbot  # noqa: E402
+
+logging.disable(logging.WARNING)
+
+
+def legacy_fetch(client: httpx.Client, drafter_id: str) -> None:
+    """기존 vacation_info_collector 경로: 순차 호출 (직원 정보는 로컬 예시 데이터)"""
+    general_chatbot.fetch_employee_info(drafter_id)
+    for endpoint, params in (
+        ("remainder", {"drafterId": drafter_id}),
+        ("myLine", {"mstPid": 1, "drafterId": drafter_id}),
+    ):
+        response = client.post(f"{BASE_URL}/{endpoint}", json=params)
+        response.raise_for_status()
+        response.json()
+
+
+def measure(fn: Callable[[str], object], drafters: List[str]) -> List[float]:
+    timings = []
+    for drafter_id in drafters:
+        started = time.perf_counter()
+        fn(drafter_id)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: List[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{name:<7} p50={statistics.median(timings):8.1f}ms "
+        f"p95={p95:8.1f}ms mean={statistics.mean(timings):8.1f}ms"
+    )
+
+
+def main():
+    cache = general_chatbot.employee_context_cache
+    drafters = [f"0118{i:04d}" for i in range(args.drafters)]
+    print(f"stub latency={args.latency_ms}±{args.jitter_ms}ms drafters={args.drafters}")
+
+    with httpx.Client(timeout=30) as client:
+        report("legacy", measure(lambda d: legacy_fetch(client, d), drafters))
+
+    fetch = general_chatbot.fetch_employee_context
+    report("cold", measure(fetch, drafters))
+    report("warm", measure(fetch, drafters))
+
+    cache.ttl_seconds = 0  # 모든 항목을 stale 상태로 만듦
+    report("stale", measure(fetch, drafters))
+    time.sleep(args.latency_ms * 3 / 1000)  # 백그라운드 갱신 완료 대기
+    cache.ttl_seconds = general_chatbot.EMPLOYEE_CONTEXT_TTL_SECONDS
+
+    StubState.error_rate = args.error_rate
+    flaky_drafters = [f"0119{i:04d}" for i in range(args.drafters)]
+    requests_before = StubState.requests
+    timings = measure(fetch, flaky_drafters)
+    report("flaky", timings)
+    print(
+        f"flaky: error_rate={args.error_rate} "
+        f"requests={StubState.requests - requests_before} "
+        f"(최소 {2 * args.drafters}, 초과분은 재시도)"
+    )
+    print(f"cache stats: {cache.stats}")
+
+    general_chatbot.api_client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
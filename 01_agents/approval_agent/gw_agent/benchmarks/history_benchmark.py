@@ -0,0 +1,180 @@
+"""
+대화 이력 관리 벤치마크 (턴 수에 따른 프롬프트 토큰/지연)
+
+합성 대화(연차 문의 + 일반 대화)를 턴마다 늘려 가며 supervisor / GENERAL_CHAT 프롬프트를
+두 방식으로 만들고 토큰 수를 비교합니다.
+
+- legacy  : 기존 방식 (시스템 프롬프트 + 전체 messages)
+- managed : history_manager (최근 N턴 + 누적 요약 + 노드별 토큰 상한)
+
+기본은 LLM 없이 고정 길이 요약을 돌려주는 가짜 요약기를 사용하며, 이력 관리 자체의
+오버헤드(compact + build_prompt)를 측정합니다. `--live`를 주면 실제 LLM(OPENAI_API_KEY 필요)으로
+GENERAL_CHAT 응답 지연도 함께 측정합니다.
+
+실행 예:
+    python benchmarks/history_benchmark.py --turns 40
+    python benchmarks/history_benchmark.py --turns 20 --live
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List
+from uuid import uuid4
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+parser = argparse.ArgumentParser(description="conversation history benchmark")
+parser.add_argument("--turns", type=int, default=40)
+parser.add_argument("--report-every", type=int, default=5)
+parser.add_argument("--keep-turns", type=int, default=None)
+parser.add_argument("--live", action="store_true", help="실제 LLM 지연 측정")
+args = parser.parse_args()
+
+os.environ.setdefault("GW_CHECKPOINT_BACKEND", "memory")
+if not args.live:
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import logging  # noqa: E402
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+import history_manager as hm  # noqa: E402
+
+logging.disable(logging.WARNING)
+
+SUPERVISOR_SYSTEM_PROMPT = (
+    "당신은 그룹웨어 챗봇의 supervisor입니다. 사용자의 요청을 분석하여 "
+    "VACATION_REQUEST, GENERAL_CHAT, FINISH 중 하나로 라우팅하세요. " * 6
+)
+GENERAL_CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 친절한 그룹웨어 챗봇입니다. 한국어로 간결하게 답변하세요.",
+}
+USER_TURNS = [
+    "다음 주 월요일에 연차 쓰고 싶어요",
+    "오전 반차로 바꿀 수 있을까요? 병원 예약이 있어서요",
+    "남은 연차가 며칠인지도 알려주세요",
+    "회의실 예약은 어떻게 하나요",
+    "점심 메뉴 추천해 줘",
+]
+AI_REPLY = (
+    "네, 확인했습니다. 연차 종류와 날짜, 사유를 정리하면 다음과 같습니다. "
+    "결재선은 팀장님으로 지정되며 신청 후 승인까지 보통 하루 정도 걸립니다. "
+)
+
+
+class FakeSummarizer:
+    """요약 호출을 흉내 냅니다. (고정 길이 요약, 지연 없음)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return AIMessage(content="이전 대화 요약: 연차 및 일반 문의. " * 8)
+
+
+def prompt_tokens(messages: List) -> int:
+    return sum(hm.message_tokens(m) for m in messages)
+
+
+def apply_update(state: dict, update: dict) -> None:
+    """그래프 리듀서 대신 summary/RemoveMessage 업데이트를 직접 반영"""
+    if not update:
+        return
+    removed = {m.id for m in update["messages"]}
+    state["messages"] = [m for m in state["messages"] if m.id not in removed]
+    state["summary"] = update["summary"]
+
+
+def run_offline() -> None:
+    manager = hm.HistoryManager(keep_turns=args.keep_turns or hm.HISTORY_KEEP_TURNS)
+    summarizer = FakeSummarizer()
+    supervisor_system = [{"role": "system", "content": SUPERVISOR_SYSTEM_PROMPT}]
+    legacy_messages: List = []
+    state = {"messages": [], "summary": ""}
+    overhead_ms: List[float] = []
+
+    print(
+        f"keep_turns={manager.keep_turns} fold_turns={manager.fold_turns} "
+        f"limits={manager.token_limits} tiktoken={hm._get_encoding() is not None}"
+    )
+    print(
+        f"{'turn':>4} {'legacy_sup':>10} {'managed_sup':>11} "
+        f"{'legacy_chat':>11} {'managed_chat':>12} {'stored_msgs':>11} "
+        f"{'overhead_ms':>11}"
+    )
+    for turn in range(1, args.turns + 1):
+        user = HumanMessage(content=USER_TURNS[turn % len(USER_TURNS)], id=str(uuid4()))
+        legacy_messages.append(user)
+        state["messages"].append(user)
+
+        started = time.perf_counter()
+        apply_update(state, manager.compact(state, summarizer))
+        managed_sup = manager.build_prompt("supervisor", state, supervisor_system)
+        managed_chat = manager.build_prompt("GENERAL_CHAT", state, [])
+        overhead_ms.append((time.perf_counter() - started) * 1000)
+
+        legacy_sup = supervisor_system + legacy_messages
+        legacy_chat = legacy_messages + [GENERAL_CHAT_SYSTEM_MESSAGE]
+
+        reply = AIMessage(content=AI_REPLY * (1 + turn % 3), id=str(uuid4()))
+        legacy_messages.append(reply)
+        state["messages"].append(reply)
+
+        if turn % args.report_every == 0 or turn == 1:
+            print(
+                f"{turn:>4} {prompt_tokens(legacy_sup):>10} "
+                f"{prompt_tokens(managed_sup):>11} "
+                f"{prompt_tokens(legacy_chat):>11} "
+                f"{prompt_tokens(managed_chat + [GENERAL_CHAT_SYSTEM_MESSAGE]):>12} "
+                f"{len(state['messages']):>11} {overhead_ms[-1]:>11.3f}"
+            )
+
+    print(
+        f"overhead: p50={statistics.median(overhead_ms):.3f}ms "
+        f"max={max(overhead_ms):.3f}ms summaries={summarizer.calls} "
+        f"stats={manager.stats}"
+    )
+
+
+def run_live() -> None:
+    """실제 LLM으로 GENERAL_CHAT 응답 지연 비교 (legacy 전체 이력 vs managed)"""
+    from langchain_openai import ChatOpenAI
+
+    llm = ChatOpenAI(model=os.getenv("GW_BENCHMARK_MODEL", "gpt-4o-mini"))
+    manager = hm.HistoryManager(keep_turns=args.keep_turns or hm.HISTORY_KEEP_TURNS)
+    legacy_messages: List = []
+    state = {"messages": [], "summary": ""}
+
+    print(f"{'turn':>4} {'legacy_ms':>10} {'managed_ms':>11} {'compact_ms':>11}")
+    for turn in range(1, args.turns + 1):
+        user = HumanMessage(content=USER_TURNS[turn % len(USER_TURNS)], id=str(uuid4()))
+        legacy_messages.append(user)
+        state["messages"].append(user)
+
+        started = time.perf_counter()
+        reply = llm.invoke(legacy_messages + [GENERAL_CHAT_SYSTEM_MESSAGE])
+        legacy_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        apply_update(state, manager.compact(state, llm))
+        compact_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        llm.invoke(
+            manager.build_prompt("GENERAL_CHAT", state, [])
+            + [GENERAL_CHAT_SYSTEM_MESSAGE]
+        )
+        managed_ms = (time.perf_counter() - started) * 1000
+
+        reply = AIMessage(content=reply.content, id=str(uuid4()))
+        legacy_messages.append(reply)
+        state["messages"].append(reply)
+        print(f"{turn:>4} {legacy_ms:>10.0f} {managed_ms:>11.0f} {compact_ms:>11.0f}")
+
+
+if __name__ == "__main__":
+    run_live() if args.live else run_offline()
@@ -0,0 +1,63 @@
+"""
+supervisor 사전 라우터 평가
+
+router_examples.jsonl(+ 라우터 로그)로 학습한 사전 라우터를 router_eval.jsonl에 적용해
+임계값별로 LLM 라우팅을 건너뛰는 비율과, 건너뛴 발화의 정확도를 출력합니다.
+정확도가 떨어지는 임계값은 잘못된 라우팅이 생긴다는 뜻이므로 GW_PREROUTER_THRESHOLD
+조정에 참고합니다.
+
+실행 예:
+    python benchmarks/prerouter_benchmark.py
+    python benchmarks/prerouter_benchmark.py --eval my_logged_turns.jsonl
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from intent_router import PREROUTER_THRESHOLD, load_examples, pre_router  # noqa: E402
+
+EVAL_PATH = os.path.join(os.path.dirname(__file__), "router_eval.jsonl")
+THRESHOLDS = (0.6, 0.7, 0.8, 0.9, 0.95, 0.99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pre-router evaluation")
+    parser.add_argument("--eval", default=EVAL_PATH, help="평가용 jsonl")
+    args = parser.parse_args()
+
+    cases = load_examples(args.eval)
+    predictions = [(pre_router.classify(text), label) for text, label in cases]
+
+    print(
+        f"eval={len(cases)} training={sum(pre_router.label_counts.values())} "
+        f"default_threshold={PREROUTER_THRESHOLD}"
+    )
+    print(f"{'threshold':>9} {'skip_rate':>10} {'skipped_acc':>12} {'misrouted':>10}")
+    for threshold in THRESHOLDS:
+        skipped = [
+            (predicted, label)
+            for (predicted, confidence), label in predictions
+            if predicted is not None and confidence >= threshold
+        ]
+        correct = sum(predicted == label for predicted, label in skipped)
+        accuracy = correct / len(skipped) if skipped else 0.0
+        print(
+            f"{threshold:>9.2f} {len(skipped) / len(cases):>10.1%} "
+            f"{accuracy:>12.1%} {len(skipped) - correct:>10}"
+        )
+
+    rounds = 200
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text, _ in cases:
+            pre_router.classify(text)
+    latency = (time.perf_counter() - started) / (rounds * len(cases)) * 1e6
+    print(f"classify latency={latency:.1f}µs/turn (LLM 라우팅 호출 대비 무시 가능)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,728 @@
+"""
+LangGraph 체크포인트/세션 저장소
+
+그래프 체크포인트(`checkpointer`)와 세션 부가 상태(`general_sessions`, `initialized_sessions`)를
+같은 백엔드에 저장합니다. 백엔드는 환경 변수 `GW_CHECKPOINT_BACKEND`로 고릅니다.
+
+- memory: 프로세스 내 저장 (기존 MemorySaver와 동일, 단 TTL/스레드 수 상한 적용)
+- sqlite: SQLite(WAL) 파일 저장. 재시작 후에도 유지되고 여러 uvicorn 워커가 같은 파일을 공유
+
+두 백엔드 모두 `maintenance()`에서 아래 정리를 수행합니다.
+
+1. TTL 만료: 마지막 접근 후 `GW_SESSION_TTL_SECONDS`가 지난 스레드/세션 삭제
+2. LRU 축출: 스레드 수가 `GW_MAX_THREADS`를 넘으면 가장 오래 쉬고 있는 스레드부터 삭제
+3. 압축: 스레드(네임스페이스)마다 최근 `GW_CHECKPOINTS_PER_THREAD`개 체크포인트만 남김
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+logger = logging.getLogger("checkpoint_store")
+
+CHECKPOINT_BACKEND = os.getenv("GW_CHECKPOINT_BACKEND", "sqlite").lower()
+CHECKPOINT_DB_PATH = os.getenv(
+    "GW_CHECKPOINT_DB", str(Path(__file__).parent / "gw_checkpoints.sqlite3")
+)
+SESSION_TTL_SECONDS = float(os.getenv("GW_SESSION_TTL_SECONDS", "21600"))
+MAX_THREADS = int(os.getenv("GW_MAX_THREADS", "10000"))
+CHECKPOINTS_PER_THREAD = int(os.getenv("GW_CHECKPOINTS_PER_THREAD", "5"))
+MAINTENANCE_INTERVAL_SECONDS = float(
+    os.getenv("GW_CHECKPOINT_MAINTENANCE_INTERVAL", "60")
+)
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_threads_last_access ON threads (last_access);
+CREATE TABLE IF NOT EXISTS sessions (
+    namespace TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (namespace, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_last_access ON sessions (namespace, last_access);
+"""
+
+
+class SqliteDatabase:
+    """프로세스당 하나의 SQLite 연결 (WAL 모드, 스레드 간 공유는 락으로 직렬화)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SQLITE_SCHEMA)
+        self.conn.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[int]):
+    """SQLite(WAL) 기반 체크포인터
+
+    체크포인트는 채널 값을 포함한 전체를 직렬화해 한 행에 저장합니다. 스레드별 최근
+    체크포인트 몇 개만 유지하므로(압축) 행 크기가 커도 총량은 스레드 수에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        db: SqliteDatabase,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_threads: int = MAX_THREADS,
+        checkpoints_per_thread: int = CHECKPOINTS_PER_THREAD,
+    ):
+        super().__init__()
+        self.db = db
+        self.ttl_seconds = ttl_seconds
+        self.max_threads = max_threads
+        self.checkpoints_per_thread = checkpoints_per_thread
+
+    def _parent_config(
+        self, thread_id: str, checkpoint_ns: str, parent_checkpoint_id: Optional[str]
+    ) -> Optional[RunnableConfig]:
+        if not parent_checkpoint_id:
+            return None
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": parent_checkpoint_id,
+            }
+        }
+
+    def _load_writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> List[Tuple[str, str, Any]]:
+        rows = self.db.conn.execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [
+            (task_id, channel, self.serde.loads_typed((type_, value)))
+            for task_id, channel, type_, value in rows
+        ]
+
+    def _row_to_tuple(self, row: Tuple) -> CheckpointTuple:
+        (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            parent_checkpoint_id,
+            type_,
+            checkpoint,
+            metadata_type,
+            metadata,
+        ) = row
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((type_, checkpoint)),
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=self._parent_config(
+                thread_id, checkpoint_ns, parent_checkpoint_id
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = (
+            "thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata"
+        )
+        with self.db.lock:
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self.db.conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self.db.conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            if row is None:
+                return None
+            return self._row_to_tuple(row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self.db.lock:
+            rows = self.db.conn.execute(query, params).fetchall()
+            results = []
+            for row in rows:
+                item = self._row_to_tuple(row)
+                if filter and any(
+                    item.metadata.get(key) != value for key, value in filter.items()
+                ):
+                    continue
+                results.append(item)
+                if limit is not None and len(results) >= limit:
+                    break
+        yield from results
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        metadata_type, serialized_metadata = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        with self.db.lock, self.db.conn:
+            self.db.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, "
+                "checkpoint_id, parent_checkpoint_id, type, checkpoint, "
+                "metadata_type, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    serialized_checkpoint,
+                    metadata_type,
+                    serialized_metadata,
+                ),
+            )
+            self.db.conn.execute(
+                "INSERT INTO threads (thread_id, last_access) VALUES (?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET last_access = excluded.last_access",
+                (thread_id, time.time()),
+            )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        # 특수 채널(에러/인터럽트 등)만 있으면 덮어쓰고, 일반 쓰기는 최초 값 유지
+        verb = (
+            "INSERT OR REPLACE"
+            if all(channel in WRITES_IDX_MAP for channel, _ in writes)
+            else "INSERT OR IGNORE"
+        )
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized = self.serde.dumps_typed(value)
+            rows.append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    task_id,
+                    WRITES_IDX_MAP.get(channel, idx),
+                    channel,
+                    type_,
+                    serialized,
+                    task_path,
+                )
+            )
+        with self.db.lock, self.db.conn:
+            self.db.conn.executemany(
+                f"{verb} INTO writes (thread_id, checkpoint_ns, checkpoint_id, "
+                "task_id, idx, channel, type, value, task_path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self.db.lock, self.db.conn:
+            self._delete_threads([thread_id])
+
+    def _delete_threads(self, thread_ids: Sequence[str]) -> None:
+        """호출자가 락과 트랜잭션을 잡고 있어야 합니다."""
+        params = [(thread_id,) for thread_id in thread_ids]
+        for table in ("checkpoints", "writes", "threads"):
+            self.db.conn.executemany(f"DELETE FROM {table} WHERE thread_id = ?", params)
+
+    def maintenance(self) -> Dict[str, int]:
+        """TTL 만료, LRU 축출, 체크포인트 압축을 한 번 수행하고 처리 건수를 반환합니다."""
+        stats = {"expired": 0, "evicted": 0, "compacted": 0}
+        with self.db.lock, self.db.conn:
+            conn = self.db.conn
+            cutoff = time.time() - self.ttl_seconds
+            expired = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT thread_id FROM threads WHERE last_access < ?", (cutoff,)
+                )
+            ]
+            self._delete_threads(expired)
+            stats["expired"] = len(expired)
+
+            (thread_count,) = conn.execute("SELECT COUNT(*) FROM threads").fetchone()
+            overflow = thread_count - self.max_threads
+            if overflow > 0:
+                evicted = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT thread_id FROM threads ORDER BY last_access LIMIT ?",
+                        (overflow,),
+                    )
+                ]
+                self._delete_threads(evicted)
+                stats["evicted"] = len(evicted)
+
+            # 스레드/네임스페이스별 최신 N개를 제외한 체크포인트와 그에 딸린 writes 삭제
+            stale = conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id FROM ("
+                "  SELECT thread_id, checkpoint_ns, checkpoint_id, ROW_NUMBER() OVER ("
+                "    PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC"
+                "  ) AS rank FROM checkpoints"
+                ") WHERE rank > ?",
+                (self.checkpoints_per_thread,),
+            ).fetchall()
+            if stale:
+                for table in ("checkpoints", "writes"):
+                    conn.executemany(
+                        f"DELETE FROM {table} WHERE thread_id = ? "
+                        "AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        stale,
+                    )
+            stats["compacted"] = len(stale)
+        return stats
+
+    def thread_count(self) -> int:
+        with self.db.lock:
+            return self.db.conn.execute("SELECT COUNT(*) FROM threads").fetchone()[0]
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """TTL/스레드 수 상한/압축을 적용한 프로세스 내 체크포인터 (단일 워커용)"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_threads: int = MAX_THREADS,
+        checkpoints_per_thread: int = CHECKPOINTS_PER_THREAD,
+    ):
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.max_threads = max_threads
+        self.checkpoints_per_thread = checkpoints_per_thread
+        self.last_access: "OrderedDict[str, float]" = OrderedDict()
+        self.lock = threading.RLock()
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self.lock:
+            thread_id = config["configurable"]["thread_id"]
+            self.last_access[thread_id] = time.time()
+            self.last_access.move_to_end(thread_id)
+            return super().put(config, checkpoint, metadata, new_versions)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self.lock:
+            self._delete_threads({thread_id})
+
+    def _delete_threads(self, thread_ids: set) -> None:
+        """writes/blobs를 한 번만 훑어 여러 스레드를 함께 삭제합니다."""
+        if not thread_ids:
+            return
+        for thread_id in thread_ids:
+            self.last_access.pop(thread_id, None)
+            self.storage.pop(thread_id, None)
+        for table in (self.writes, self.blobs):
+            for key in [key for key in table if key[0] in thread_ids]:
+                del table[key]
+
+    def _compact(self) -> int:
+        removed = 0
+        referenced = {}
+        for thread_id, namespaces in self.storage.items():
+            for checkpoint_ns, checkpoints in namespaces.items():
+                if len(checkpoints) <= self.checkpoints_per_thread:
+                    continue
+                for checkpoint_id in sorted(checkpoints)[
+                    : -self.checkpoints_per_thread
+                ]:
+                    del checkpoints[checkpoint_id]
+                    self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                    removed += 1
+                # 남은 체크포인트가 참조하는 채널 버전
+                versions = set()
+                for serialized, _, _ in checkpoints.values():
+                    checkpoint = self.serde.loads_typed(serialized)
+                    versions.update(checkpoint["channel_versions"].items())
+                referenced[(thread_id, checkpoint_ns)] = versions
+        if referenced:
+            for key in [
+                key
+                for key in self.blobs
+                if key[:2] in referenced and key[2:] not in referenced[key[:2]]
+            ]:
+                del self.blobs[key]
+        return removed
+
+    def maintenance(self) -> Dict[str, int]:
+        stats = {"expired": 0, "evicted": 0, "compacted": 0}
+        with self.lock:
+            cutoff = time.time() - self.ttl_seconds
+            expired = {t for t, at in self.last_access.items() if at < cutoff}
+            overflow = len(self.last_access) - len(expired) - self.max_threads
+            evicted = set()
+            if overflow > 0:
+                for thread_id in self.last_access:
+                    if len(evicted) >= overflow:
+                        break
+                    if thread_id not in expired:
+                        evicted.add(thread_id)
+            self._delete_threads(expired | evicted)
+            stats["expired"], stats["evicted"] = len(expired), len(evicted)
+            stats["compacted"] = self._compact()
+        return stats
+
+    def thread_count(self) -> int:
+        return len(self.last_access)
+
+
+class SessionStore(ABC):
+    """세션 ID → 값 저장소 (dict와 같은 방식으로 사용)
+
+    기존 전역 딕셔너리(`general_sessions`, `initialized_sessions`)를 그대로 대체할 수
+    있도록 `get`, `[]`, `in`, `del`을 지원합니다. 값은 쓰기 시점마다 접근 시각이 갱신되며
+    TTL과 최대 개수를 넘으면 오래된 것부터 삭제됩니다.
+    """
+
+    @abstractmethod
+    def get(self, session_id: str, default: Any = None) -> Any:
+        pass
+
+    @abstractmethod
+    def __setitem__(self, session_id: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def __delitem__(self, session_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def maintenance(self) -> Dict[str, int]:
+        """TTL 만료/개수 초과 항목을 삭제하고 삭제 건수를 반환합니다."""
+        pass
+
+    def __getitem__(self, session_id: str) -> Any:
+        value = self.get(session_id, _MISSING)
+        if value is _MISSING:
+            raise KeyError(session_id)
+        return value
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id, _MISSING) is not _MISSING
+
+
+_MISSING = object()
+
+
+class MemorySessionStore(SessionStore):
+    def __init__(
+        self, ttl_seconds: float = SESSION_TTL_SECONDS, max_entries: int = MAX_THREADS
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(session_id)
+            if entry is None:
+                return default
+            if time.time() - entry[0] > self.ttl_seconds:
+                del self._data[session_id]
+                return default
+            return entry[1]
+
+    def __setitem__(self, session_id: str, value: Any) -> None:
+        with self._lock:
+            self._data[session_id] = (time.time(), value)
+            self._data.move_to_end(session_id)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, session_id: str) -> None:
+        with self._lock:
+            del self._data[session_id]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def maintenance(self) -> Dict[str, int]:
+        with self._lock:
+            cutoff = time.time() - self.ttl_seconds
+            expired = [key for key, (at, _) in self._data.items() if at < cutoff]
+            for key in expired:
+                del self._data[key]
+        return {"expired": len(expired), "evicted": 0}
+
+
+class SqliteSessionStore(SessionStore):
+    def __init__(
+        self,
+        db: SqliteDatabase,
+        namespace: str,
+        serde: Any,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_entries: int = MAX_THREADS,
+    ):
+        self.db = db
+        self.namespace = namespace
+        self.serde = serde
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    def get(self, session_id: str, default: Any = None) -> Any:
+        with self.db.lock:
+            row = self.db.conn.execute(
+                "SELECT type, value, last_access FROM sessions "
+                "WHERE namespace = ? AND session_id = ?",
+                (self.namespace, session_id),
+            ).fetchone()
+        if row is None or time.time() - row[2] > self.ttl_seconds:
+            return default
+        return self.serde.loads_typed((row[0], row[1]))
+
+    def __setitem__(self, session_id: str, value: Any) -> None:
+        type_, serialized = self.serde.dumps_typed(value)
+        with self.db.lock, self.db.conn:
+            self.db.conn.execute(
+                "INSERT OR REPLACE INTO sessions (namespace, session_id, type, value, "
+                "last_access) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, session_id, type_, serialized, time.time()),
+            )
+
+    def __delitem__(self, session_id: str) -> None:
+        with self.db.lock, self.db.conn:
+            cursor = self.db.conn.execute(
+                "DELETE FROM sessions WHERE namespace = ? AND session_id = ?",
+                (self.namespace, session_id),
+            )
+        if cursor.rowcount == 0:
+            raise KeyError(session_id)
+
+    def __len__(self) -> int:
+        with self.db.lock:
+            return self.db.conn.execute(
+                "SELECT COUNT(*) FROM sessions WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    def maintenance(self) -> Dict[str, int]:
+        with self.db.lock, self.db.conn:
+            expired = self.db.conn.execute(
+                "DELETE FROM sessions WHERE namespace = ? AND last_access < ?",
+                (self.namespace, time.time() - self.ttl_seconds),
+            ).rowcount
+            evicted = self.db.conn.execute(
+                "DELETE FROM sessions WHERE namespace = ? AND session_id IN ("
+                "  SELECT session_id FROM sessions WHERE namespace = ? "
+                "  ORDER BY last_access DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.namespace, self.namespace, self.max_entries),
+            ).rowcount
+        return {"expired": expired, "evicted": evicted}
+
+
+# 프로세스 전역 백엔드 (모듈 임포트 시 한 번 생성)
+_database: Optional[SqliteDatabase] = None
+checkpointer: BaseCheckpointSaver
+_session_stores: Dict[str, SessionStore] = {}
+
+if CHECKPOINT_BACKEND == "sqlite":
+    _database = SqliteDatabase(CHECKPOINT_DB_PATH)
+    checkpointer = SqliteCheckpointSaver(_database)
+    logger.info(f"SQLite 체크포인터 사용: {CHECKPOINT_DB_PATH}")
+elif CHECKPOINT_BACKEND == "memory":
+    checkpointer = BoundedMemorySaver()
+    logger.info("메모리 체크포인터 사용 (단일 워커 전용)")
+else:
+    raise ValueError(f"지원하지 않는 GW_CHECKPOINT_BACKEND: {CHECKPOINT_BACKEND}")
+
+
+def get_session_store(namespace: str) -> SessionStore:
+    """네임스페이스별 세션 저장소를 반환합니다. (체크포인터와 같은 백엔드 사용)"""
+    store = _session_stores.get(namespace)
+    if store is None:
+        if _database is not None:
+            store = SqliteSessionStore(_database, namespace, checkpointer.serde)
+        else:
+            store = MemorySessionStore()
+        _session_stores[namespace] = store
+    return store
+
+
+def run_maintenance() -> Dict[str, Dict[str, int]]:
+    """체크포인터와 모든 세션 저장소를 정리합니다."""
+    started = time.perf_counter()
+    results = {"checkpoints": checkpointer.maintenance()}
+    for namespace, store in _session_stores.items():
+        results[f"sessions:{namespace}"] = store.maintenance()
+    logger.info(
+        f"체크포인트 저장소 정리 완료 ({(time.perf_counter() - started) * 1000:.1f}ms): {results}"
+    )
+    return results
+
+
+def close() -> None:
+    if _database is not None:
+        _database.close()
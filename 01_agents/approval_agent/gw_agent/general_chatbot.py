@@ -6,13 +6,13 @@
 
 import os
 import json
+import asyncio
 import logging
 import traceback
 import sys
 import re
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, TypedDict, Optional, Annotated
+from typing import Dict, List, Any, TypedDict, Optional, Annotated, AsyncIterator
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 from enum import Enum
@@ -20,15 +20,18 @@ from typing import Literal
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, RemoveMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_core.tools import tool
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langgraph.graph import StateGraph, START, END, MessagesState
 from langgraph.graph.message import add_messages
 from langgraph.types import Command, interrupt
-import httpx
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.types import RunnableConfig
+
+from api_client import ApiClient, StaleWhileRevalidateCache
+from business_calendar import business_day_strings
+from checkpoint_store import checkpointer, get_session_store
+from history_manager import history_manager
+from intent_router import PREROUTER_ENABLED, pre_router, record_llm_decision
 
 # ------------------------------------------------------
 # 1. 기본 설정
@@ -61,13 +64,16 @@ for handler in logger.handlers:
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 API_BASE_URL = os.getenv("BASE_URL", "https://dev-api.ntoday.kr/api/v1/epaper")
+# 직원 컨텍스트(직원 정보/잔여 연차/결재선) 캐시: TTL 이후 STALE 구간에는 즉시 반환 + 백그라운드 갱신
+EMPLOYEE_CONTEXT_TTL_SECONDS = float(os.getenv("GW_EMPLOYEE_CONTEXT_TTL", "300"))
+EMPLOYEE_CONTEXT_STALE_SECONDS = float(os.getenv("GW_EMPLOYEE_CONTEXT_STALE", "3600"))
 
 # LLM 초기화를 위한 전역 변수
 llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
 general_graph = None
 
-# 세션별 초기화 상태를 저장하는 전역 딕셔너리
-initialized_sessions = {}
+# 세션별 초기화 상태 저장소 (체크포인터와 같은 백엔드, TTL/개수 상한 적용)
+initialized_sessions = get_session_store("initialized")
 
 
 # 연차 종류 정의
@@ -157,6 +163,7 @@ class GeneralAgentState(TypedDict):
     vacation_info: Annotated[DocumentInfo, vacation_info_merger]
     next: Annotated[str, last_value]
     thread_id: Annotated[str, last_value]
+    summary: Annotated[str, last_value]  # 요약되어 제거된 이전 대화 (history_manager)
 
 
 class Router(TypedDict):
@@ -178,43 +185,7 @@ option = members + ["FINISH"]
 # ------------------------------------------------------
 
 
-class ApiClient:
-    """API 클라이언트 클래스"""
-
-    def __init__(self, api_url):
-        self.api_url = api_url
-        self.client = httpx.Client(timeout=30)
-
-    def call_api(self, endpoint: str, method: str, params: Dict = None) -> Dict:
-        """API 호출 함수"""
-        logger.info(f"API 호출 시작: {method} {endpoint}")
-        logger.debug(f"API 파라미터: {params}")
-
-        try:
-            url = f"{self.api_url}/{endpoint}"
-            logger.debug(f"완전한 URL: {url}")
-
-            headers = {"Content-Type": "application/json"}
-
-            if method.upper() == "GET":
-                response = self.client.get(url, params=params, headers=headers)
-            elif method.upper() == "POST":
-                response = self.client.post(url, json=params, headers=headers)
-            elif method.upper() == "PUT":
-                response = self.client.put(url, json=params, headers=headers)
-            else:
-                return {"error": f"지원하지 않는 HTTP 메서드: {method}", "code": "-1"}
-
-            response.raise_for_status()
-            return response.json()
-
-        except Exception as e:
-            error_msg = f"API 호출 오류: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg, "code": "-1"}
-
-
-# API 클라이언트 인스턴스 생성
+# API 클라이언트 인스턴스 생성 (커넥션 풀 공유, 엔드포인트별 타임아웃/재시도)
 api_client = ApiClient(API_BASE_URL)
 
 
@@ -236,6 +207,44 @@ def fetch_employee_info(drafterId: str) -> Dict:
         return {"error": str(e), "code": "-1"}
 
 
+def _remaining_days_from_response(drafterId: str, result: Dict) -> Dict:
+    """잔여 연차 API 응답을 정리합니다. (API 실패 시 예시 데이터)"""
+    if "error" in result:
+        logger.warning("API 호출 실패, 예시 데이터 사용")
+        return {
+            "drafterId": drafterId,
+            "total_days": 15,
+            "used_days": 7,
+            "remaining_days": 8,
+        }
+    return result
+
+
+def _approval_line_from_response(result: Dict) -> Dict:
+    """결재 라인 API 응답을 정리합니다. (API 실패 시 예시 데이터)"""
+    if "error" in result:
+        logger.warning("API 호출 실패, 예시 데이터 사용")
+        return {
+            "code": 1,
+            "message": "결재 라인 조회",
+            "data": [
+                {
+                    "aprvPsId": "01150001",
+                    "aprvPsNm": "김팀장",
+                    "aprvDvTy": "AGREEMENT",
+                    "ordr": 1,
+                },
+                {
+                    "aprvPsId": "01120001",
+                    "aprvPsNm": "이부장",
+                    "aprvDvTy": "AGREEMENT",
+                    "ordr": 2,
+                },
+            ],
+        }
+    return result
+
+
 def fetch_remaining_vacation_days(drafterId: str) -> Dict:
     """직원의 잔여 연차 일수를 직접 API로 조회합니다."""
     logger.info(f"잔여 연차 조회: drafterId={drafterId}")
@@ -245,18 +254,7 @@ def fetch_remaining_vacation_days(drafterId: str) -> Dict:
         params = {"drafterId": drafterId}
 
         result = api_client.call_api(endpoint, method, params)
-
-        # API 실패 시 예시 데이터 사용
-        if "error" in result:
-            logger.warning("API 호출 실패, 예시 데이터 사용")
-            return {
-                "drafterId": drafterId,
-                "total_days": 15,
-                "used_days": 7,
-                "remaining_days": 8,
-            }
-
-        return result
+        return _remaining_days_from_response(drafterId, result)
     except Exception as e:
         logger.error(f"잔여 연차 조회 오류: {str(e)}")
         return {
@@ -276,30 +274,7 @@ def fetch_approval_line(drafterId: str) -> Dict:
         params = {"mstPid": 1, "drafterId": drafterId}
 
         result = api_client.call_api(endpoint, method, params)
-
-        # API 실패 시 예시 데이터 사용
-        if "error" in result:
-            logger.warning("API 호출 실패, 예시 데이터 사용")
-            return {
-                "code": 1,
-                "message": "결재 라인 조회",
-                "data": [
-                    {
-                        "aprvPsId": "01150001",
-                        "aprvPsNm": "김팀장",
-                        "aprvDvTy": "AGREEMENT",
-                        "ordr": 1,
-                    },
-                    {
-                        "aprvPsId": "01120001",
-                        "aprvPsNm": "이부장",
-                        "aprvDvTy": "AGREEMENT",
-                        "ordr": 2,
-                    },
-                ],
-            }
-
-        return result
+        return _approval_line_from_response(result)
     except Exception as e:
         logger.error(f"결재 라인 조회 오류: {str(e)}")
         return {
@@ -310,6 +285,42 @@ def fetch_approval_line(drafterId: str) -> Dict:
         }
 
 
+async def _load_employee_context(drafterId: str):
+    """직원 정보/잔여 연차/결재선을 동시에 조회합니다. (api_client 루프에서 실행)
+
+    Returns:
+        (컨텍스트, 캐시 여부) - API 실패로 예시 데이터가 섞이면 캐시하지 않음
+    """
+    remainder, approval_line = await asyncio.gather(
+        api_client.acall_api("remainder", "POST", {"drafterId": drafterId}),
+        api_client.acall_api("myLine", "POST", {"mstPid": 1, "drafterId": drafterId}),
+    )
+    context = {
+        "employee_info": fetch_employee_info(drafterId),
+        "remaining_days": _remaining_days_from_response(drafterId, remainder),
+        "approval_line": _approval_line_from_response(approval_line),
+    }
+    return context, "error" not in remainder and "error" not in approval_line
+
+
+employee_context_cache = StaleWhileRevalidateCache(
+    _load_employee_context,
+    api_client,
+    ttl_seconds=EMPLOYEE_CONTEXT_TTL_SECONDS,
+    stale_ttl_seconds=EMPLOYEE_CONTEXT_STALE_SECONDS,
+)
+
+
+def fetch_employee_context(drafterId: str) -> Dict:
+    """연차 신청 시작에 필요한 직원 컨텍스트를 캐시 우선으로 조회합니다.
+
+    Returns:
+        {"employee_info": ..., "remaining_days": ..., "approval_line": ...}
+    """
+    logger.info(f"직원 컨텍스트 조회: drafterId={drafterId}")
+    return employee_context_cache.get(drafterId)
+
+
 def fetch_existing_vacations(drafterId: str) -> Dict:
     """직원의 기존 휴가 신청 목록을 직접 API로 조회합니다."""
     logger.info(f"기존 휴가 조회: drafterId={drafterId}")
@@ -348,6 +359,10 @@ def submit_vacation_request_to_api(request_json: Dict) -> Dict:
 
         result = api_client.call_api(endpoint, method, request_json)
 
+        # 신청이 등록되면 잔여 연차가 바뀌므로 캐싱된 직원 컨텍스트를 버림
+        if "error" not in result and request_json.get("drafterId"):
+            employee_context_cache.invalidate(request_json["drafterId"])
+
         # API 실패 시 예시 데이터 사용
         if "error" in result:
             logger.warning("API 호출 실패, 예시 데이터 사용")
@@ -397,6 +412,7 @@ def map_vacation_type(user_type: str) -> str:
 def create_day_list(start_date: str, end_date: str, vacation_type: str) -> List[Dict]:
     """
     시작일과 종료일 정보로 dayList 배열을 생성합니다.
+    주말과 공휴일은 제외합니다. (business_calendar)
 
     Args:
         start_date: 휴가 시작일(YYYY-MM-DD)
@@ -410,37 +426,20 @@ def create_day_list(start_date: str, end_date: str, vacation_type: str) -> List[
     if not end_date:
         end_date = start_date
 
-    day_list = []
-
     # 날짜 형식 검증
     if not start_date or not end_date:
-        return day_list
+        return []
 
     try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-
-        # 같은 날짜면 하루만 추가
-        if start_date == end_date:
-            day_list.append(
-                {"reqYmd": start_date, "dvType": map_vacation_type(vacation_type)}
-            )
-        else:
-            # 날짜 범위에 대해 각 날짜 추가
-            current = start
-            while current <= end:
-                day_list.append(
-                    {
-                        "reqYmd": current.strftime("%Y-%m-%d"),
-                        "dvType": map_vacation_type(vacation_type),
-                    }
-                )
-                current += timedelta(days=1)
+        days = business_day_strings(start_date, end_date)
     except ValueError as e:
         logger.error(f"날짜 형식 오류: {e}")
         return []
 
-    return day_list
+    if not days:
+        logger.info(f"영업일 없음: {start_date} ~ {end_date} (주말/공휴일)")
+    dv_type = map_vacation_type(vacation_type)
+    return [{"reqYmd": day, "dvType": dv_type} for day in days]
 
 
 # 제출 완료 후 카드 HTML 생성 함수
@@ -581,15 +580,21 @@ def create_vacation_request_json(
 # ------------------------------------------------------
 
 
-# SuperVisor 노드 생성
-def supervisor_node(state: GeneralAgentState):
-    """
-    사용자 메시지를 처리하고 현재 의도를 결정하는 함수입니다.
-    """
-
+def _receive_user_input(state: GeneralAgentState) -> None:
+    """사용자 입력을 기다렸다가(interrupt) 메시지 목록에 추가합니다."""
     user_input = interrupt({"text_to_revise": state["messages"]})
     state["messages"].append(HumanMessage(content=user_input))
 
+
+def _with_history_update(state: GeneralAgentState, history_update: Dict) -> Dict:
+    """이번 턴에 갱신된 요약을 반영한 상태 (프롬프트 구성용)"""
+    if "summary" in history_update:
+        return {**state, "summary": history_update["summary"]}
+    return state
+
+
+def _supervisor_messages(state: GeneralAgentState) -> List:
+    """라우팅용 LLM 입력 메시지 (요약 + 최근 턴, 토큰 상한 적용)"""
     system_prompt = """
     당신은 사용자 요청을 관리하는 Supervisor입니다. 
     다음 작업자들을 관리합니다: VACATION_REQUEST, GENERAL_CHAT
@@ -601,11 +606,12 @@ def supervisor_node(state: GeneralAgentState):
     각 작업자는 작업을 수행하고 결과와 상태를 반환합니다.
     작업자의 작업이 한번이라도 완료되면 FINISH를 반환합니다.
     """
-    messages = [
-        {"role": "system", "content": system_prompt},
-    ] + state["messages"]
+    return history_manager.build_prompt(
+        "supervisor", state, [{"role": "system", "content": system_prompt}]
+    )
 
-    response = llm.with_structured_output(Router).invoke(messages)
+
+def _route_supervisor_response(response: Router) -> Dict:
     goto = response["next"]
 
     # END 반환 방식 수정
@@ -615,6 +621,53 @@ def supervisor_node(state: GeneralAgentState):
     return {"next": goto}
 
 
+def _pre_route(state: GeneralAgentState) -> Optional[Dict]:
+    """사전 라우터가 확신하는 발화면 LLM 호출 없이 라우팅 결과를 반환합니다."""
+    if not PREROUTER_ENABLED:
+        return None
+    label = pre_router.route(state["messages"][-1].content)
+    if label is None:
+        return None
+    return _route_supervisor_response({"next": label})
+
+
+# SuperVisor 노드 생성
+def supervisor_node(state: GeneralAgentState):
+    """
+    사용자 메시지를 처리하고 현재 의도를 결정하는 함수입니다.
+    """
+
+    _receive_user_input(state)
+    # 오래된 턴은 요약으로 대체하고 체크포인트에서 제거 (RemoveMessage)
+    history_update = history_manager.compact(state, llm)
+    routed = _pre_route(state)
+    if routed:
+        return {**routed, **history_update}
+
+    messages = _supervisor_messages(_with_history_update(state, history_update))
+    response = llm.with_structured_output(Router).invoke(messages)
+    record_llm_decision(state["messages"][-1].content, response["next"])
+    return {**_route_supervisor_response(response), **history_update}
+
+
+async def asupervisor_node(state: GeneralAgentState):
+    """
+    supervisor_node의 비동기 버전입니다. (astream 경로에서 사용)
+    """
+    _receive_user_input(state)
+    history_update = await history_manager.acompact(state, llm)
+    routed = _pre_route(state)
+    if routed:
+        return {**routed, **history_update}
+
+    messages = _supervisor_messages(_with_history_update(state, history_update))
+    response = await llm.with_structured_output(Router).ainvoke(messages)
+    await asyncio.to_thread(
+        record_llm_decision, state["messages"][-1].content, response["next"]
+    )
+    return {**_route_supervisor_response(response), **history_update}
+
+
 # 연차 정보 수집 노드
 def vacation_info_collector(state: GeneralAgentState):
     """
@@ -630,12 +683,11 @@ def vacation_info_collector(state: GeneralAgentState):
     if thread_id not in initialized_sessions or not initialized_sessions[thread_id]:
         logger.info(f"vacation_info_collector 초기화 시작: thread_id={thread_id}")
 
-        # 직원 정보와 남은 연차 정보 가져오기
-        employee_info = fetch_employee_info(state["vacation_info"]["drafterId"])
-        remaining_days = fetch_remaining_vacation_days(
-            state["vacation_info"]["drafterId"]
-        )
-        approval_line = fetch_approval_line(state["vacation_info"]["drafterId"])
+        # 직원 정보, 남은 연차, 결재선을 한 번에 가져오기 (동시 조회 + 캐시)
+        employee_context = fetch_employee_context(state["vacation_info"]["drafterId"])
+        employee_info = employee_context["employee_info"]
+        remaining_days = employee_context["remaining_days"]
+        approval_line = employee_context["approval_line"]
 
         # 결재선 정보 저장
         state["vacation_info"]["lineList"] = approval_line.get("data", [])
@@ -954,15 +1006,29 @@ def vacation_submitter(state: GeneralAgentState):
         return state
 
 
+GENERAL_CHAT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 일반적인 대화를 담당하는 챗봇입니다.",
+}
+
+
 def general_chat_agent(state: GeneralAgentState):
     """
     일반 대화 작업을 처리하는 작업자 함수입니다.
     """
-    messages = state["messages"]
-    response = llm.invoke(
-        messages
-        + [{"role": "system", "content": "당신은 일반적인 대화를 담당하는 챗봇입니다."}]
-    )
+    messages = history_manager.build_prompt("GENERAL_CHAT", state, [])
+    response = llm.invoke(messages + [GENERAL_CHAT_SYSTEM_MESSAGE])
+    state["messages"] = [response]
+    state["next"] = "supervisor"
+    return state
+
+
+async def ageneral_chat_agent(state: GeneralAgentState):
+    """
+    general_chat_agent의 비동기 버전입니다. (astream 경로에서 토큰 단위로 스트리밍됨)
+    """
+    messages = history_manager.build_prompt("GENERAL_CHAT", state, [])
+    response = await llm.ainvoke(messages + [GENERAL_CHAT_SYSTEM_MESSAGE])
     state["messages"] = [response]
     state["next"] = "supervisor"
     return state
@@ -970,12 +1036,15 @@ def general_chat_agent(state: GeneralAgentState):
 
 # 그래프 구성
 builder = StateGraph(GeneralAgentState)
-builder.add_node("supervisor", supervisor_node)
+# LLM을 호출하는 노드는 동기/비동기 구현을 함께 등록 (stream은 동기, astream은 비동기 사용)
+builder.add_node("supervisor", RunnableLambda(supervisor_node, afunc=asupervisor_node))
 builder.add_node("VACATION_REQUEST", vacation_info_collector)
 builder.add_node("vacation_info_extractor", vacation_info_extractor)
 builder.add_node("vacation_confirmer", vacation_confirmer)
 builder.add_node("vacation_submitter", vacation_submitter)
-builder.add_node("GENERAL_CHAT", general_chat_agent)
+builder.add_node(
+    "GENERAL_CHAT", RunnableLambda(general_chat_agent, afunc=ageneral_chat_agent)
+)
 
 builder.set_entry_point("supervisor")
 builder.add_conditional_edges(
@@ -995,34 +1064,22 @@ builder.add_edge("vacation_confirmer", "vacation_submitter")
 builder.add_edge("vacation_submitter", "supervisor")
 builder.add_edge("GENERAL_CHAT", "supervisor")
 
-checkpointer = MemorySaver()
-# 그래프 컴파일 및 체크포인터 설정
+# 그래프 컴파일 및 체크포인터 설정 (checkpoint_store.py에서 백엔드 선택)
 graph = builder.compile(checkpointer=checkpointer)
 
 
-# 일반 챗봇 및 연차 신청 처리 함수
-def process_general_chat(message: str, session_state: GeneralAgentState) -> Dict:
-    """
-    일반 채팅 처리를 위한 함수
+# 토큰 단위로 클라이언트에 흘려보낼 노드 (supervisor/추출기의 구조화 출력은 제외)
+STREAM_TOKEN_NODES = {"GENERAL_CHAT"}
 
-    Args:
-        message: 사용자 메시지
-        session_state: 기존 세션 상태 (없으면 새로 생성)
 
-    Returns:
-        Dict: 응답 및 세션 상태를 포함한 딕셔너리
-    """
-    logger.info(f"process_general_chat 시작: message={message}")
+def _ensure_llm() -> Optional[Dict]:
+    """API 키/LLM 초기화를 확인하고, 문제가 있으면 오류 응답을 반환합니다."""
+    global llm
 
     # OpenAI API 키 확인
     if not OPENAI_API_KEY:
         logger.error("OPENAI_API_KEY가 설정되지 않았습니다")
-        return {
-            "response": "설정 오류: OpenAI API 키가 설정되지 않았습니다.",
-            "session_state": session_state or {},
-        }
-
-    global llm, graph, initialized_sessions
+        return {"response": "설정 오류: OpenAI API 키가 설정되지 않았습니다."}
 
     # LLM 초기화
     if llm is None:
@@ -1032,47 +1089,152 @@ def process_general_chat(message: str, session_state: GeneralAgentState) -> Dict
             temperature=0,
             api_key=OPENAI_API_KEY,
         )
+    return None
 
-    try:
-        # 이 함수는 session_state에 thread_id가 있다고 가정함
-        # main.py에서 전달된 session_id가 thread_id로 사용되어야 함
-        thread_id = session_state.get("thread_id", "")
-        logger.info(f"사용 중인 thread_id: {thread_id}")
-
-        # 세션 초기화 필요 또는 빈 세션 확인
-        needs_reset = initialized_sessions.get(thread_id) == False
-
-        if needs_reset or not session_state.get("messages"):
-            logger.info(f"새 세션 시작: thread_id={thread_id}")
-
-            # 완전히 새로운 세션 상태 생성
-            session_state = {
-                "messages": [HumanMessage(content=message)] if message else [],
-                "vacation_info": {"drafterId": "01180001", "mstPid": 1},
-                "thread_id": thread_id,
-                "interrupted": False,
-            }
 
-        else:
-            # 기존 세션 계속 사용 - 새 메시지 추가
-            if message:
-                session_state["messages"].append(HumanMessage(content=message))
-
-        # 그래프 실행 설정
-        config = RunnableConfig(
-            recursion_limit=10,
-            configurable={
-                "thread_id": thread_id,
-                "interrupt_before_return": True,
-                "initial_state": session_state,
+def _prepare_graph_run(message: str, session_state: GeneralAgentState):
+    """그래프 실행에 필요한 thread_id, 세션 상태, 실행 설정을 준비합니다."""
+    # 이 함수는 session_state에 thread_id가 있다고 가정함
+    # main.py에서 전달된 session_id가 thread_id로 사용되어야 함
+    thread_id = session_state.get("thread_id", "")
+    logger.info(f"사용 중인 thread_id: {thread_id}")
+
+    # 세션 초기화 필요 또는 빈 세션 확인
+    needs_reset = initialized_sessions.get(thread_id) == False
+
+    if needs_reset or not session_state.get("messages"):
+        logger.info(f"새 세션 시작: thread_id={thread_id}")
+
+        # 완전히 새로운 세션 상태 생성
+        session_state = {
+            "messages": [HumanMessage(content=message)] if message else [],
+            "vacation_info": {"drafterId": "01180001", "mstPid": 1},
+            "thread_id": thread_id,
+            "interrupted": False,
+        }
+
+    else:
+        # 기존 세션 계속 사용 - 새 메시지 추가
+        if message:
+            session_state["messages"].append(HumanMessage(content=message))
+
+    # 그래프 실행 설정
+    config = RunnableConfig(
+        recursion_limit=10,
+        configurable={
+            "thread_id": thread_id,
+            "interrupt_before_return": True,
+            "initial_state": session_state,
+        },
+        tags=["vacation-request"],
+    )
+    return thread_id, session_state, config
+
+
+def _finalize_graph_run(
+    thread_id: str, session_state: GeneralAgentState, final_checkpoint: Any
+) -> Dict:
+    """그래프 실행 결과로 응답을 만들고, END에 도달했으면 새 세션을 발급합니다."""
+    # 최종 상태 결정
+    # - 그래프 실행이 끝났다면 final_checkpoint가 있을 것이고
+    # - 그래프 실행이 아예 없었다면 session_state(딕셔너리) 자체를 결과로 반환
+    result = final_checkpoint if final_checkpoint else session_state
+
+    # 응답 메시지 추출
+    response_text = ""
+    if isinstance(result, dict):
+        # 결과가 딕셔너리 형태라면 messages 키가 있는지 확인
+        if "messages" in result and len(result["messages"]) > 0:
+            response_text = result["messages"][-1].content
+
+        # 세션 상태 업데이트
+        session_state.update(result)
+
+        # thread_id 유지 - main.py에서 받은 값 유지
+        session_state["thread_id"] = thread_id
+
+    elif hasattr(result, "values") and isinstance(result.values, dict):
+        # final_checkpoint가 Checkpoint 형태라면
+        if "messages" in result.values and len(result.values["messages"]) > 0:
+            response_text = result.values["messages"][-1].content
+
+        # 세션 상태 업데이트
+        session_state.update(result.values)
+
+        # thread_id 유지
+        session_state["thread_id"] = thread_id
+
+    # END 노드 도달 확인
+    if session_state.get("next") == "__end__":
+        logger.info(f"그래프 실행 완료: thread_id={thread_id} - 세션 초기화 진행")
+
+        # 새 스레드 ID 생성
+        new_thread_id = str(uuid.uuid4())
+        logger.info(f"새 스레드 ID 생성: {new_thread_id}")
+
+        # 초기화 상태 관리 - 기존 스레드 ID 삭제
+        if thread_id in initialized_sessions:
+            del initialized_sessions[thread_id]
+            logger.info(f"기존 thread_id({thread_id})의 초기화 상태 삭제")
+
+        # 다시 쓰이지 않는 기존 스레드의 체크포인트 삭제
+        checkpointer.delete_thread(thread_id)
+
+        # 새 세션 상태 생성 - thread_id를 새 값으로 설정
+        new_session_state = {
+            "messages": [],
+            "vacation_info": {
+                "drafterId": "01180001",
+                "mstPid": 1,
+                "aprvNm": "",
+                "docCn": "",
+                "dayList": [],
+                "lineList": [],
             },
-            tags=["vacation-request"],
-        )
+            "next": "supervisor",
+            "interrupted": False,
+            "thread_id": new_thread_id,  # 새 스레드 ID 설정
+        }
 
-        # 상태 이력(체크포인트) 조회 - 디버깅용
-        # 그래프 실행 - 스트리밍 모드로 진행
-        events = []
-        final_checkpoint = None
+        # 새 스레드 초기화 상태 설정
+        initialized_sessions[new_thread_id] = False
+
+        return {
+            "response": response_text,
+            "session_state": new_session_state,
+            "metadata": {"thread_id": new_thread_id, "session_reset": True},
+        }
+
+    # 일반적인 응답 반환
+    return {
+        "response": response_text,
+        "session_state": session_state,
+        "metadata": {
+            "thread_id": thread_id,
+        },
+    }
+
+
+# 일반 챗봇 및 연차 신청 처리 함수
+def process_general_chat(message: str, session_state: GeneralAgentState) -> Dict:
+    """
+    일반 채팅 처리를 위한 함수
+
+    Args:
+        message: 사용자 메시지
+        session_state: 기존 세션 상태 (없으면 새로 생성)
+
+    Returns:
+        Dict: 응답 및 세션 상태를 포함한 딕셔너리
+    """
+    logger.info(f"process_general_chat 시작: message={message}")
+
+    error = _ensure_llm()
+    if error:
+        return {**error, "session_state": session_state or {}}
+
+    try:
+        thread_id, session_state, config = _prepare_graph_run(message, session_state)
 
         # 2. 원하는 값으로 상태 업데이트
         graph.update_state(config, session_state)
@@ -1080,96 +1242,94 @@ def process_general_chat(message: str, session_state: GeneralAgentState) -> Dict
         # Command 객체 생성 - 사용자 입력을 resume 값으로 전달
         resume_command = Command(resume=message)
 
-        # 스트리밍으로 그래프 실행 재개
+        # 스트리밍으로 그래프 실행 재개 (마지막 상태만 유지)
+        final_checkpoint = None
         for event in graph.stream(
             resume_command,
             config=config,
             stream_mode="values",
             interrupt_after="GENERAL_CHAT",
         ):
-            events.append(event)
             final_checkpoint = event
 
-        # 최종 상태 결정
-        # - 그래프 실행이 끝났다면 final_checkpoint가 있을 것이고
-        # - 그래프 실행이 아예 없었다면 session_state(딕셔너리) 자체를 결과로 반환
-        result = final_checkpoint if final_checkpoint else session_state
-
-        # 응답 메시지 추출
-        response_text = ""
-        if isinstance(result, dict):
-            # 결과가 딕셔너리 형태라면 messages 키가 있는지 확인
-            if "messages" in result and len(result["messages"]) > 0:
-                response_text = result["messages"][-1].content
-
-            # 세션 상태 업데이트
-            session_state.update(result)
-
-            # thread_id 유지 - main.py에서 받은 값 유지
-            session_state["thread_id"] = thread_id
-
-        elif hasattr(result, "values") and isinstance(result.values, dict):
-            # final_checkpoint가 Checkpoint 형태라면
-            if "messages" in result.values and len(result.values["messages"]) > 0:
-                response_text = result.values["messages"][-1].content
-
-            # 세션 상태 업데이트
-            session_state.update(result.values)
-
-            # thread_id 유지
-            session_state["thread_id"] = thread_id
-
-        # END 노드 도달 확인
-        if session_state.get("next") == "__end__":
-            logger.info(f"그래프 실행 완료: thread_id={thread_id} - 세션 초기화 진행")
-
-            # 새 스레드 ID 생성
-            new_thread_id = str(uuid.uuid4())
-            logger.info(f"새 스레드 ID 생성: {new_thread_id}")
-
-            # 초기화 상태 관리 - 기존 스레드 ID 삭제
-            if thread_id in initialized_sessions:
-                del initialized_sessions[thread_id]
-                logger.info(f"기존 thread_id({thread_id})의 초기화 상태 삭제")
-
-            # 새 세션 상태 생성 - thread_id를 새 값으로 설정
-            new_session_state = {
-                "messages": [],
-                "vacation_info": {
-                    "drafterId": "01180001",
-                    "mstPid": 1,
-                    "aprvNm": "",
-                    "docCn": "",
-                    "dayList": [],
-                    "lineList": [],
-                },
-                "next": "supervisor",
-                "interrupted": False,
-                "thread_id": new_thread_id,  # 새 스레드 ID 설정
-            }
-
-            # 새 스레드 초기화 상태 설정
-            initialized_sessions[new_thread_id] = False
-
-            return {
-                "response": response_text,
-                "session_state": new_session_state,
-                "metadata": {"thread_id": new_thread_id, "session_reset": True},
-            }
+        return _finalize_graph_run(thread_id, session_state, final_checkpoint)
 
-        # 일반적인 응답 반환
+    except Exception as e:
+        logger.error(f"챗봇 처리 중 오류: {str(e)}")
+        logger.error(traceback.format_exc())
         return {
-            "response": response_text,
-            "session_state": session_state,
-            "metadata": {
-                "thread_id": thread_id,
-            },
+            "response": f"죄송합니다. 처리 중 오류가 발생했습니다: {str(e)}",
+            "session_state": session_state or {},
+            "metadata": {"error": str(e)},
         }
 
+
+async def astream_general_chat(
+    message: str, session_state: GeneralAgentState
+) -> AsyncIterator[Dict]:
+    """
+    process_general_chat의 스트리밍 버전
+
+    그래프를 `astream`으로 실행하면서 진행 상황을 이벤트로 바로 내보냅니다.
+
+    - {"event": "node", "node": ...}: 노드 실행 완료 (노드 전환)
+    - {"event": "token", "node": ..., "content": ...}: LLM 토큰 (STREAM_TOKEN_NODES만)
+    - {"event": "message", "content": ...}: 노드가 새로 추가한 AI 메시지
+    - {"event": "done", "response": ..., "session_state": ..., "metadata": ...}: 최종 결과
+      (process_general_chat 반환값과 동일한 구조)
+    """
+    logger.info(f"astream_general_chat 시작: message={message}")
+
+    error = _ensure_llm()
+    if error:
+        yield {"event": "done", **error, "session_state": session_state or {}}
+        return
+
+    try:
+        # 세션 저장소/체크포인트 접근(SQLite 가능)은 이벤트 루프를 막지 않도록 스레드에서 실행
+        thread_id, session_state, config = await asyncio.to_thread(
+            _prepare_graph_run, message, session_state
+        )
+        await graph.aupdate_state(config, session_state)
+
+        final_checkpoint = None
+        seen_messages = len(session_state.get("messages", []))
+        async for mode, chunk in graph.astream(
+            Command(resume=message),
+            config=config,
+            stream_mode=["messages", "updates", "values"],
+            interrupt_after="GENERAL_CHAT",
+        ):
+            if mode == "messages":
+                message_chunk, chunk_metadata = chunk
+                node = chunk_metadata.get("langgraph_node")
+                if node in STREAM_TOKEN_NODES and message_chunk.content:
+                    yield {
+                        "event": "token",
+                        "node": node,
+                        "content": message_chunk.content,
+                    }
+            elif mode == "updates":
+                for node in chunk:
+                    yield {"event": "node", "node": node}
+            else:
+                final_checkpoint = chunk
+                messages = chunk.get("messages", [])
+                for new_message in messages[seen_messages:]:
+                    if isinstance(new_message, AIMessage):
+                        yield {"event": "message", "content": new_message.content}
+                seen_messages = len(messages)
+
+        result = await asyncio.to_thread(
+            _finalize_graph_run, thread_id, session_state, final_checkpoint
+        )
+        yield {"event": "done", **result}
+
     except Exception as e:
-        logger.error(f"챗봇 처리 중 오류: {str(e)}")
+        logger.error(f"챗봇 스트리밍 처리 중 오류: {str(e)}")
         logger.error(traceback.format_exc())
-        return {
+        yield {
+            "event": "done",
             "response": f"죄송합니다. 처리 중 오류가 발생했습니다: {str(e)}",
             "session_state": session_state or {},
             "metadata": {"error": str(e)},
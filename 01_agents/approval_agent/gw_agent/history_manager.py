@@ -0,0 +1,198 @@
+"""
+대화 이력 관리 (슬라이딩 윈도우 + 누적 요약)
+
+- 최근 `GW_HISTORY_KEEP_TURNS`턴(사용자 메시지 기준)은 원문 그대로 유지
+- 그보다 오래된 턴이 `GW_HISTORY_FOLD_TURNS`턴 이상 쌓이면 LLM으로 기존 요약과 합쳐 요약하고,
+  요약된 메시지는 `RemoveMessage`로 체크포인트에서 제거
+- 노드별 프롬프트 토큰 상한(NODE_PROMPT_TOKEN_LIMITS)을 넘으면 오래된 메시지부터 제외
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+)
+
+logger = logging.getLogger("history_manager")
+
+HISTORY_KEEP_TURNS = int(os.getenv("GW_HISTORY_KEEP_TURNS", "4"))
+HISTORY_FOLD_TURNS = int(os.getenv("GW_HISTORY_FOLD_TURNS", "2"))
+TOKEN_ENCODING = os.getenv("GW_TOKEN_ENCODING", "o200k_base")
+
+# 노드별 프롬프트 토큰 상한 (시스템 프롬프트/요약 포함)
+NODE_PROMPT_TOKEN_LIMITS: Dict[str, int] = {
+    "supervisor": int(os.getenv("GW_SUPERVISOR_PROMPT_TOKENS", "1500")),
+    "GENERAL_CHAT": int(os.getenv("GW_GENERAL_CHAT_PROMPT_TOKENS", "4000")),
+}
+
+SUMMARY_PROMPT = """당신은 그룹웨어 챗봇의 대화 기록을 요약합니다.
+기존 요약과 새 대화를 합쳐 한국어로 5문장 이내로 요약하세요.
+연차 종류, 날짜, 사유, 결재선처럼 이후 대화에 필요한 사실은 빠뜨리지 말고,
+인사말이나 반복되는 안내 문구는 생략하세요."""
+
+_encoding: Any = None
+_encoding_failed = False
+
+
+def _get_encoding():
+    """tiktoken 인코딩 (최초 1회 로드, 실패 시 근사치 사용)"""
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            _encoding_failed = True
+            logger.warning(f"tiktoken 인코딩 로드 실패, 근사치 사용: {str(e)}")
+    return _encoding
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 근사치: 한글은 글자당 약 1토큰(UTF-8 3바이트), 영문은 약 3글자당 1토큰
+    return max(1, len(text.encode("utf-8")) // 3)
+
+
+def message_tokens(message: Any) -> int:
+    """메시지 하나의 토큰 수 (역할 등 메시지 오버헤드 4토큰 포함)"""
+    if isinstance(message, dict):
+        content = message.get("content", "")
+    else:
+        content = message.content
+    if not isinstance(content, str):
+        content = str(content)
+    return count_tokens(content) + 4
+
+
+def _turn_starts(messages: List[BaseMessage]) -> List[int]:
+    """턴 시작 위치. 연속된 사용자 메시지(입력 + interrupt 재개 값)는 한 턴으로 봅니다."""
+    return [
+        i
+        for i, m in enumerate(messages)
+        if isinstance(m, HumanMessage)
+        and (i == 0 or not isinstance(messages[i - 1], HumanMessage))
+    ]
+
+
+def _format_transcript(messages: List[BaseMessage]) -> str:
+    lines = []
+    for message in messages:
+        role = "사용자" if isinstance(message, HumanMessage) else "챗봇"
+        lines.append(f"{role}: {message.content}")
+    return "\n".join(lines)
+
+
+class HistoryManager:
+    """GeneralAgentState의 messages/summary를 관리합니다."""
+
+    def __init__(
+        self,
+        keep_turns: int = HISTORY_KEEP_TURNS,
+        fold_turns: int = HISTORY_FOLD_TURNS,
+        token_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.keep_turns = keep_turns
+        self.fold_turns = fold_turns
+        self.token_limits = token_limits or NODE_PROMPT_TOKEN_LIMITS
+        self.stats = {"compactions": 0, "folded_messages": 0, "trimmed_messages": 0}
+
+    def foldable(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        """요약 대상 메시지 (최근 keep_turns턴 이전). fold_turns턴 미만이면 빈 리스트"""
+        starts = _turn_starts(messages)
+        if len(starts) < self.keep_turns + self.fold_turns:
+            return []
+        cut = starts[len(starts) - self.keep_turns]
+        # ID가 없는 메시지는 RemoveMessage로 지울 수 없으므로 그 앞까지만 요약
+        folded = []
+        for message in messages[:cut]:
+            if not getattr(message, "id", None):
+                break
+            folded.append(message)
+        return folded
+
+    def _summary_request(self, summary: str, folded: List[BaseMessage]) -> List:
+        return [
+            SystemMessage(content=SUMMARY_PROMPT),
+            HumanMessage(
+                content=f"기존 요약:\n{summary or '(없음)'}\n\n새 대화:\n"
+                f"{_format_transcript(folded)}"
+            ),
+        ]
+
+    def _update(self, summary: str, folded: List[BaseMessage]) -> Dict:
+        self.stats["compactions"] += 1
+        self.stats["folded_messages"] += len(folded)
+        logger.info(f"대화 이력 요약: {len(folded)}개 메시지를 요약으로 대체")
+        return {
+            "summary": summary,
+            "messages": [RemoveMessage(id=message.id) for message in folded],
+        }
+
+    def compact(self, state: Dict, llm) -> Dict:
+        """오래된 턴을 요약에 합치고, 상태 업데이트(summary + RemoveMessage 목록)를 반환"""
+        folded = self.foldable(state.get("messages", []))
+        if not folded:
+            return {}
+        response = llm.invoke(self._summary_request(state.get("summary", ""), folded))
+        return self._update(response.content, folded)
+
+    async def acompact(self, state: Dict, llm) -> Dict:
+        folded = self.foldable(state.get("messages", []))
+        if not folded:
+            return {}
+        response = await llm.ainvoke(
+            self._summary_request(state.get("summary", ""), folded)
+        )
+        return self._update(response.content, folded)
+
+    def build_prompt(
+        self,
+        node: str,
+        state: Dict,
+        system_messages: List[Dict],
+    ) -> List:
+        """노드용 LLM 입력: 시스템 프롬프트 + 요약 + 최근 메시지 (토큰 상한 내)
+
+        최근 keep_turns턴만 사용하므로, 같은 턴에 요약되어 곧 제거될 메시지는 포함되지 않습니다.
+        """
+        prompt = list(system_messages)
+        summary = state.get("summary")
+        if summary:
+            prompt.append({"role": "system", "content": f"이전 대화 요약:\n{summary}"})
+
+        recent = list(state.get("messages", []))
+        starts = _turn_starts(recent)
+        if len(starts) > self.keep_turns:
+            recent = recent[starts[len(starts) - self.keep_turns] :]
+
+        budget = self.token_limits.get(node)
+        if budget is not None:
+            used = sum(message_tokens(m) for m in prompt)
+            kept: List = []
+            # 최신 메시지부터 채우되 마지막 메시지는 항상 포함
+            for message in reversed(recent):
+                cost = message_tokens(message)
+                if kept and used + cost > budget:
+                    break
+                kept.append(message)
+                used += cost
+            self.stats["trimmed_messages"] += len(recent) - len(kept)
+            recent = list(reversed(kept))
+        # 윈도우 앞부분이 AI 메시지로 시작하지 않도록 정리
+        while len(recent) > 1 and isinstance(recent[0], AIMessage):
+            recent = recent[1:]
+        return prompt + recent
+
+
+history_manager = HistoryManager()
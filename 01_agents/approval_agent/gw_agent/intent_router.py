@@ -0,0 +1,252 @@
+"""
+supervisor 사전 라우터
+
+사용자 발화를 키워드 + 문자 n-gram 나이브 베이즈로 분류해, 확신도가 임계값 이상이면
+supervisor의 LLM 라우팅 호출을 건너뜁니다. 확신이 없으면 None을 반환하고 기존 LLM
+라우터가 결정하며, 그 결정은 로그 파일에 쌓여 다음 기동 시(그리고 즉시 온라인으로) 학습에
+반영됩니다.
+
+학습 데이터:
+- router_examples.jsonl: 기본 예시 (`{"text": ..., "label": ...}` 한 줄에 하나)
+- GW_ROUTER_LOG_PATH: LLM 라우터가 결정한 실제 발화 로그 (같은 형식)
+
+라우터 로그에는 직원이 입력한 발화 원문이 그대로 저장됩니다. 기본 위치는 패키지 밖의
+데이터 디렉터리(`GW_DATA_DIR`, 기본 ~/.gw_agent)이며, GW_ROUTER_LOG_MAX_BYTES를 넘으면
+`.1` 파일로 교체해 최근 두 파일만 남깁니다. 기록을 끄려면 GW_ROUTER_LOG_PATH를 빈 값으로 둡니다.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("intent_router")
+
+LABELS = ("VACATION_REQUEST", "GENERAL_CHAT", "FINISH")
+
+PREROUTER_ENABLED = os.getenv("GW_PREROUTER_ENABLED", "true").lower() == "true"
+PREROUTER_THRESHOLD = float(os.getenv("GW_PREROUTER_THRESHOLD", "0.9"))
+EXAMPLES_PATH = Path(__file__).parent / "router_examples.jsonl"
+DATA_DIR = Path(os.getenv("GW_DATA_DIR", str(Path.home() / ".gw_agent")))
+ROUTER_LOG_PATH = os.getenv("GW_ROUTER_LOG_PATH", str(DATA_DIR / "router_turns.jsonl"))
+# 이 크기를 넘으면 .1 파일로 교체 (발화 원문이 무한히 쌓이지 않도록)
+ROUTER_LOG_MAX_BYTES = int(os.getenv("GW_ROUTER_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+# 로그가 무한히 커져도 기동 시 학습량이 일정하도록 최근 N건만 사용
+ROUTER_LOG_MAX_EXAMPLES = int(os.getenv("GW_ROUTER_LOG_MAX_EXAMPLES", "5000"))
+
+# 라벨을 강하게 시사하는 키워드. 포함되면 해당 라벨의 우도를 KEYWORD_BOOST배 높임
+KEYWORD_RULES: Dict[str, Tuple[str, ...]] = {
+    "VACATION_REQUEST": ("연차", "반차", "반반차", "휴가", "월차", "쉬고 싶", "쉴게"),
+    "FINISH": ("종료", "그만", "대화 끝", "끝낼게", "끝내줘", "bye"),
+}
+# 키워드를 포함하지만 다른 뜻인 표현 (예: "종료일"은 휴가 종료 날짜). 키워드 검사 전에 지움
+KEYWORD_EXCLUSIONS: Tuple[str, ...] = (
+    "종료일",
+    "종료 일",
+    "종료 날짜",
+    "종료날짜",
+    "종료 시간",
+    "종료시간",
+    "종료 시각",
+    "종료시각",
+    "그만두",
+    "그만 두",
+    "그만둔",
+    "그만 둔",
+    "그만둘",
+    "그만 둘",
+    "그만뒀",
+    "그만 뒀",
+)
+KEYWORD_BOOST = 4.0
+NGRAM_RANGE = (2, 3)
+SMOOTHING_ALPHA = 0.5
+MIN_TEXT_LENGTH = 2
+MIN_NGRAM_COVERAGE = float(os.getenv("GW_PREROUTER_MIN_COVERAGE", "0.3"))
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    return _WHITESPACE_PATTERN.sub(" ", text.strip().lower())
+
+
+def keyword_text(normalized: str) -> str:
+    """키워드 검사용 텍스트 (KEYWORD_EXCLUSIONS 표현을 지운 것)"""
+    for phrase in KEYWORD_EXCLUSIONS:
+        normalized = normalized.replace(phrase, " ")
+    return normalized
+
+
+def char_ngrams(text: str) -> List[str]:
+    padded = f" {text} "
+    grams = []
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        grams.extend(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+class IntentPreRouter:
+    """문자 n-gram 다항 나이브 베이즈 + 키워드 가중치 분류기 (온라인 학습 가능)"""
+
+    def __init__(self, threshold: float = PREROUTER_THRESHOLD):
+        self.threshold = threshold
+        self.label_counts: Counter = Counter()
+        self.gram_counts: Dict[str, Counter] = defaultdict(Counter)
+        self.gram_totals: Counter = Counter()
+        self.vocabulary: set = set()
+        self._lock = threading.Lock()
+        self.stats = {"turns": 0, "skipped": 0, "fallback": 0}
+        self.skipped_by_label: Counter = Counter()
+
+    def learn(self, text: str, label: str) -> None:
+        if label not in LABELS:
+            return
+        grams = char_ngrams(normalize(text))
+        with self._lock:
+            self.label_counts[label] += 1
+            self.gram_counts[label].update(grams)
+            self.gram_totals[label] += len(grams)
+            self.vocabulary.update(grams)
+
+    def fit(self, examples: Iterable[Tuple[str, str]]) -> "IntentPreRouter":
+        for text, label in examples:
+            self.learn(text, label)
+        return self
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """라벨별 사후 확률. 학습에서 본 n-gram 비율이 MIN_NGRAM_COVERAGE 미만이면 빈 dict
+
+        처음 보는 n-gram은 점수에서 제외합니다. (포함하면 예시가 적고 짧은 라벨이
+        스무딩 때문에 긴 미지 문장에서 과도하게 유리해짐)
+        """
+        normalized = normalize(text)
+        with self._lock:
+            total = sum(self.label_counts.values())
+            all_grams = char_ngrams(normalized)
+            grams = [gram for gram in all_grams if gram in self.vocabulary]
+            if not total or len(grams) < MIN_NGRAM_COVERAGE * len(all_grams):
+                return {}
+            vocab_size = len(self.vocabulary) + 1
+            keyword_source = keyword_text(normalized)
+            log_scores = {}
+            for label in LABELS:
+                if not self.label_counts[label]:
+                    continue
+                counts = self.gram_counts[label]
+                denominator = self.gram_totals[label] + SMOOTHING_ALPHA * vocab_size
+                score = math.log(self.label_counts[label] / total)
+                for gram in grams:
+                    score += math.log((counts[gram] + SMOOTHING_ALPHA) / denominator)
+                if any(k in keyword_source for k in KEYWORD_RULES.get(label, ())):
+                    score += math.log(KEYWORD_BOOST)
+                log_scores[label] = score
+
+        top = max(log_scores.values())
+        exps = {label: math.exp(score - top) for label, score in log_scores.items()}
+        norm = sum(exps.values())
+        return {label: value / norm for label, value in exps.items()}
+
+    def classify(self, text: str) -> Tuple[Optional[str], float]:
+        """(라벨, 확신도)를 반환합니다. 판단할 수 없으면 (None, 0.0)"""
+        if len(normalize(text)) < MIN_TEXT_LENGTH:
+            return None, 0.0
+        proba = self.predict_proba(text)
+        if not proba:
+            return None, 0.0
+        label = max(proba, key=proba.get)
+        normalized = normalize(text)
+        if label == "FINISH" and keyword_text(normalized) != normalized:
+            # "종료일", "그만두다" 등 종료 키워드와 겹치는 표현은 LLM 라우터가 판단
+            return None, 0.0
+        return label, proba[label]
+
+    def route(self, text: str) -> Optional[str]:
+        """확신도가 임계값 이상이면 라벨을, 아니면 None(LLM 라우터 사용)을 반환합니다."""
+        label, confidence = self.classify(text)
+        with self._lock:
+            self.stats["turns"] += 1
+            if label is not None and confidence >= self.threshold:
+                self.stats["skipped"] += 1
+                self.skipped_by_label[label] += 1
+            else:
+                self.stats["fallback"] += 1
+                label = None
+        logger.info(
+            f"사전 라우팅: label={label}, confidence={confidence:.3f}, "
+            f"threshold={self.threshold}"
+        )
+        return label
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            turns = self.stats["turns"]
+            return {
+                **self.stats,
+                "skip_rate": self.stats["skipped"] / turns if turns else 0.0,
+                "skipped_by_label": dict(self.skipped_by_label),
+                "threshold": self.threshold,
+                "training_examples": sum(self.label_counts.values()),
+            }
+
+
+def load_examples(path: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+    """jsonl 학습 데이터를 읽습니다. limit이 있으면 마지막 limit건만 메모리에 유지"""
+    if not path or not os.path.exists(path):
+        return []
+    examples: deque = deque(maxlen=limit or None)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                examples.append((record["text"], record["label"]))
+            except (ValueError, KeyError):
+                logger.warning(f"라우터 학습 데이터 형식 오류 무시: {line[:80]}")
+    return list(examples)
+
+
+def load_router_log(limit: int) -> List[Tuple[str, str]]:
+    """라우터 로그(교체된 .1 파일 포함)에서 최근 limit건"""
+    if not ROUTER_LOG_PATH:
+        return []
+    examples = load_examples(f"{ROUTER_LOG_PATH}.1", limit) + load_examples(
+        ROUTER_LOG_PATH, limit
+    )
+    return examples[-limit:]
+
+
+_log_lock = threading.Lock()
+
+
+def record_llm_decision(text: str, label: str) -> None:
+    """LLM 라우터의 결정을 로그에 남기고 사전 라우터에 즉시 반영합니다."""
+    if label not in LABELS or len(normalize(text)) < MIN_TEXT_LENGTH:
+        return
+    pre_router.learn(text, label)
+    if not ROUTER_LOG_PATH:
+        return
+    try:
+        with _log_lock:
+            os.makedirs(os.path.dirname(ROUTER_LOG_PATH) or ".", exist_ok=True)
+            with open(ROUTER_LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"text": text, "label": label}, ensure_ascii=False))
+                f.write("\n")
+                size = f.tell()
+            if size > ROUTER_LOG_MAX_BYTES:
+                os.replace(ROUTER_LOG_PATH, f"{ROUTER_LOG_PATH}.1")
+    except OSError as e:
+        logger.warning(f"라우터 로그 기록 실패: {str(e)}")
+
+
+pre_router = IntentPreRouter().fit(
+    load_examples(str(EXAMPLES_PATH)) + load_router_log(ROUTER_LOG_MAX_EXAMPLES)
+)
+logger.info(f"사전 라우터 학습 완료: {dict(pre_router.label_counts)}")
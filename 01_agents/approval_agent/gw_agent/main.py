@@ -6,22 +6,38 @@
 
 import os
 import json
+import asyncio
 import uuid
 import logging
 import traceback
 import sys
-from typing import Dict, Optional, List, Union
+from typing import AsyncIterator, Dict, Optional, List, Union
 from pathlib import Path
 
-from fastapi import FastAPI, Request, HTTPException, Depends
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi import (
+    FastAPI,
+    Request,
+    HTTPException,
+    Depends,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
 
 # 일반 챗봇 모듈 가져오기
-from general_chatbot import process_general_chat
+from general_chatbot import api_client, astream_general_chat, process_general_chat
+from intent_router import pre_router
+import checkpoint_store
 
 # 로깅 설정
 logging.basicConfig(
@@ -47,8 +63,9 @@ else:
 # API 키를 환경변수로 명시적 설정
 os.environ["OPENAI_API_KEY"] = openai_api_key
 
-# 세션 저장소
-general_sessions: Dict[str, Dict] = {}  # 일반 챗봇 세션 추가
+# 세션 저장소 (checkpoint_store 백엔드 공유 - 워커 간 공유, TTL/개수 상한 적용)
+general_sessions = checkpoint_store.get_session_store("general")
+maintenance_task: Optional[asyncio.Task] = None
 
 # FastAPI 앱 생성
 app = FastAPI(title="N2 GW 일반 챗봇")
@@ -63,6 +80,36 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
 templates = Jinja2Templates(directory=templates_dir)
 
 
+async def _maintenance_loop():
+    """체크포인트/세션 저장소를 주기적으로 정리 (TTL 만료, LRU 축출, 압축)"""
+    while True:
+        await asyncio.sleep(checkpoint_store.MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(checkpoint_store.run_maintenance)
+        except Exception as e:
+            logger.error(f"체크포인트 저장소 정리 중 오류: {str(e)}")
+
+
+@app.on_event("startup")
+async def startup_event():
+    global maintenance_task
+    maintenance_task = asyncio.create_task(_maintenance_loop())
+    logger.info(
+        f"체크포인트 저장소 정리 작업 시작: backend={checkpoint_store.CHECKPOINT_BACKEND}, "
+        f"interval={checkpoint_store.MAINTENANCE_INTERVAL_SECONDS}s"
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+    checkpoint_store.close()
+    logger.info("체크포인트 저장소 종료")
+    await asyncio.to_thread(api_client.close)
+    logger.info("API 클라이언트 종료")
+
+
 # API 요청 모델
 class ChatRequest(BaseModel):
     message: str = Field(..., description="사용자 메시지")
@@ -172,148 +219,154 @@ def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=json.dumps(error_detail))
 
 
-# N2 챗봇 요청 처리
-def process_general_agent_request(
-    message: str, session_id: str, session_state: Dict = None
-):
-    """N2 챗봇 요청 처리"""
-    logger.info(f"N2 챗봇 요청 처리 시작: message={message}, session_id={session_id}")
-
-    try:
-        # 세션 상태 처리 로직
-        if session_state:
-            # 클라이언트에서 전달한 세션 상태 사용
-            logger.debug("클라이언트에서 전달한 세션 상태 사용")
-
-            # 중요: session_id를 thread_id로 설정
-            session_state["thread_id"] = session_id
-            logger.info(f"세션 상태에 thread_id 설정: {session_id}")
-
-            # 필수 필드가 없는 경우 초기화
-            if "messages" not in session_state:
-                session_state["messages"] = []
-                logger.info("session_state에 messages 필드 초기화")
-
-            if "vacation_info" not in session_state:
-                session_state["vacation_info"] = {
+def _resolve_session_state(session_id: str, session_state: Dict = None) -> Dict:
+    """클라이언트가 보낸 상태 또는 서버 저장 상태로 이번 요청의 세션 상태를 만듭니다."""
+    # 세션 상태 처리 로직
+    if session_state:
+        # 클라이언트에서 전달한 세션 상태 사용
+        logger.debug("클라이언트에서 전달한 세션 상태 사용")
+
+        # 중요: session_id를 thread_id로 설정
+        session_state["thread_id"] = session_id
+        logger.info(f"세션 상태에 thread_id 설정: {session_id}")
+
+        # 필수 필드가 없는 경우 초기화
+        if "messages" not in session_state:
+            session_state["messages"] = []
+            logger.info("session_state에 messages 필드 초기화")
+
+        if "vacation_info" not in session_state:
+            session_state["vacation_info"] = {
+                "drafterId": "01180001",  # 기본 직원 ID
+                "mstPid": 1,
+                "aprvNm": "",
+                "docCn": "",
+                "dayList": [],
+                "lineList": [],
+            }
+            logger.info("session_state에 vacation_info 필드 초기화")
+
+        if "next" not in session_state:
+            session_state["next"] = "supervisor"
+            logger.info("session_state에 next 필드 초기화")
+
+        if "interrupted" not in session_state:
+            session_state["interrupted"] = False
+            logger.info("session_state에 interrupted 필드 초기화")
+    else:
+        # 기존 서버 세션 상태 가져오기
+        session_state = general_sessions.get(session_id, None)
+        logger.debug(f"서버에 저장된 세션 상태 존재 여부: {session_state is not None}")
+
+        # 세션 상태가 없으면 새로 생성하고 thread_id 설정
+        if not session_state:
+            # GeneralAgentState와 동일한 구조로 초기화
+            session_state = {
+                "messages": [],  # 메시지 배열 초기화
+                "vacation_info": {
                     "drafterId": "01180001",  # 기본 직원 ID
                     "mstPid": 1,
                     "aprvNm": "",
                     "docCn": "",
                     "dayList": [],
                     "lineList": [],
-                }
-                logger.info("session_state에 vacation_info 필드 초기화")
+                },
+                "next": "supervisor",  # 초기 노드
+                "interrupted": False,  # 인터럽트 상태
+            }
+            logger.info("새 세션 상태를 GeneralAgentState 구조로 초기화")
 
-            if "next" not in session_state:
-                session_state["next"] = "supervisor"
-                logger.info("session_state에 next 필드 초기화")
+        # 기존 세션이든 새 세션이든 thread_id 설정
+        session_state["thread_id"] = session_id
+        logger.info(f"세션 상태에 thread_id 설정: {session_id}")
 
-            if "interrupted" not in session_state:
-                session_state["interrupted"] = False
-                logger.info("session_state에 interrupted 필드 초기화")
-        else:
-            # 기존 서버 세션 상태 가져오기
-            session_state = general_sessions.get(session_id, None)
-            logger.debug(
-                f"서버에 저장된 세션 상태 존재 여부: {session_state is not None}"
+    return session_state
+
+
+def _store_session_result(session_id: str, result: Dict) -> Dict:
+    """챗봇 결과를 세션 저장소에 반영하고 API 응답을 만듭니다."""
+    if "session_state" in result:
+        # thread_id 일관성 확인 및 설정
+        if result["session_state"].get("thread_id") != session_id:
+            logger.warning(
+                f"thread_id 불일치 감지: {result['session_state'].get('thread_id')} != {session_id}"
             )
+            result["session_state"]["thread_id"] = session_id
+            logger.info(f"thread_id 강제 일치 처리: {session_id}")
+
+        # 세션 상태 업데이트 - 결과의 상태를 서버 세션 저장소에 저장
+        general_sessions[session_id] = result["session_state"]
+        logger.info("세션 상태 업데이트 완료")
+
+        # 응답 반환
+        logger.info("N2 챗봇 요청 처리 완료")
+
+        # 그래프 실행이 완료되었는지 확인 (END 노드에 도달했는지)
+        if result["session_state"].get("next") == "__end__":
+            logger.info(f"그래프 실행 완료: thread_id={session_id} - 세션 초기화 진행")
+
+            # 기존 세션 삭제
+            if session_id in general_sessions:
+                del general_sessions[session_id]
+                logger.info(f"기존 세션 삭제: {session_id}")
+
+            # 새 세션 ID 생성
+            new_session_id = str(uuid.uuid4())
+            logger.info(f"새 세션 ID 생성: {new_session_id}")
+
+            # 새 빈 세션 상태 생성
+            general_sessions[new_session_id] = {
+                "messages": [],
+                "vacation_info": {
+                    "drafterId": "01180001",
+                    "mstPid": 1,
+                    "aprvNm": "",
+                    "docCn": "",
+                    "dayList": [],
+                    "lineList": [],
+                },
+                "next": "supervisor",
+                "interrupted": False,
+                "thread_id": new_session_id,
+            }
 
-            # 세션 상태가 없으면 새로 생성하고 thread_id 설정
-            if not session_state:
-                # GeneralAgentState와 동일한 구조로 초기화
-                session_state = {
-                    "messages": [],  # 메시지 배열 초기화
-                    "vacation_info": {
-                        "drafterId": "01180001",  # 기본 직원 ID
-                        "mstPid": 1,
-                        "aprvNm": "",
-                        "docCn": "",
-                        "dayList": [],
-                        "lineList": [],
-                    },
-                    "next": "supervisor",  # 초기 노드
-                    "interrupted": False,  # 인터럽트 상태
-                }
-                logger.info("새 세션 상태를 GeneralAgentState 구조로 초기화")
-
-            # 기존 세션이든 새 세션이든 thread_id 설정
-            session_state["thread_id"] = session_id
-            logger.info(f"세션 상태에 thread_id 설정: {session_id}")
+            # 응답에 새 세션 ID 포함
+            return {
+                "response": result["response"],
+                "session_id": new_session_id,  # 새 세션 ID 반환
+                "session_state": general_sessions[new_session_id],  # 새 세션 상태 반환
+                "metadata": {"thread_id": new_session_id, "session_reset": True},
+            }
 
-        # 챗봇 호출
-        logger.info("process_general_chat 호출")
-        result = process_general_chat(message, session_state)
-        logger.debug(f"process_general_chat 처리 결과: {result}")
+        # 일반적인 경우 기존 세션 ID 유지
+        return {
+            "response": result["response"],
+            "session_id": session_id,
+            "session_state": result["session_state"],  # 세션 상태 반환
+            "metadata": result.get("metadata", {}),
+        }
+    else:
+        error_msg = "응답에 'session_state'가 없습니다."
+        logger.error(error_msg)
+        raise Exception(error_msg)
 
-        if "session_state" in result:
-            # thread_id 일관성 확인 및 설정
-            if result["session_state"].get("thread_id") != session_id:
-                logger.warning(
-                    f"thread_id 불일치 감지: {result['session_state'].get('thread_id')} != {session_id}"
-                )
-                result["session_state"]["thread_id"] = session_id
-                logger.info(f"thread_id 강제 일치 처리: {session_id}")
 
-            # 세션 상태 업데이트 - 결과의 상태를 서버 세션 저장소에 저장
-            general_sessions[session_id] = result["session_state"]
-            logger.info("세션 상태 업데이트 완료")
+# N2 챗봇 요청 처리
+def process_general_agent_request(
+    message: str, session_id: str, session_state: Dict = None
+):
+    """N2 챗봇 요청 처리"""
+    logger.info(f"N2 챗봇 요청 처리 시작: message={message}, session_id={session_id}")
 
-            # 응답 반환
-            logger.info("N2 챗봇 요청 처리 완료")
+    try:
+        session_state = _resolve_session_state(session_id, session_state)
 
-            # 그래프 실행이 완료되었는지 확인 (END 노드에 도달했는지)
-            if result["session_state"].get("next") == "__end__":
-                logger.info(
-                    f"그래프 실행 완료: thread_id={session_id} - 세션 초기화 진행"
-                )
+        # 챗봇 호출
+        logger.info("process_general_chat 호출")
+        result = process_general_chat(message, session_state)
+        logger.debug(f"process_general_chat 처리 결과: {result}")
 
-                # 기존 세션 삭제
-                if session_id in general_sessions:
-                    del general_sessions[session_id]
-                    logger.info(f"기존 세션 삭제: {session_id}")
-
-                # 새 세션 ID 생성
-                new_session_id = str(uuid.uuid4())
-                logger.info(f"새 세션 ID 생성: {new_session_id}")
-
-                # 새 빈 세션 상태 생성
-                general_sessions[new_session_id] = {
-                    "messages": [],
-                    "vacation_info": {
-                        "drafterId": "01180001",
-                        "mstPid": 1,
-                        "aprvNm": "",
-                        "docCn": "",
-                        "dayList": [],
-                        "lineList": [],
-                    },
-                    "next": "supervisor",
-                    "interrupted": False,
-                    "thread_id": new_session_id,
-                }
-
-                # 응답에 새 세션 ID 포함
-                return {
-                    "response": result["response"],
-                    "session_id": new_session_id,  # 새 세션 ID 반환
-                    "session_state": general_sessions[
-                        new_session_id
-                    ],  # 새 세션 상태 반환
-                    "metadata": {"thread_id": new_session_id, "session_reset": True},
-                }
-
-            # 일반적인 경우 기존 세션 ID 유지
-            return {
-                "response": result["response"],
-                "session_id": session_id,
-                "session_state": result["session_state"],  # 세션 상태 반환
-                "metadata": result.get("metadata", {}),
-            }
-        else:
-            error_msg = "응답에 'session_state'가 없습니다."
-            logger.error(error_msg)
-            raise Exception(error_msg)
+        return _store_session_result(session_id, result)
     except Exception as e:
         error_msg = f"N2 챗봇 요청 처리 중 오류: {str(e)}"
         logger.error(error_msg)
@@ -321,6 +374,99 @@ def process_general_agent_request(
         raise Exception(error_msg)
 
 
+async def stream_general_agent_request(
+    message: str, session_id: str, session_state: Dict = None
+) -> AsyncIterator[Dict]:
+    """N2 챗봇 요청을 스트리밍으로 처리 (토큰/노드 전환 이벤트 → 마지막에 done 이벤트)"""
+    logger.info(
+        f"N2 챗봇 스트리밍 요청 처리 시작: message={message}, session_id={session_id}"
+    )
+    # 세션 저장소 접근(SQLite 가능)은 이벤트 루프를 막지 않도록 스레드에서 실행
+    session_state = await asyncio.to_thread(
+        _resolve_session_state, session_id, session_state
+    )
+
+    async for event in astream_general_chat(message, session_state):
+        if event["event"] == "done":
+            result = {k: v for k, v in event.items() if k != "event"}
+            response = await asyncio.to_thread(
+                _store_session_result, session_id, result
+            )
+            event = {"event": "done", **response}
+        yield jsonable_encoder(event)
+
+
+def _format_sse(event: Dict) -> str:
+    payload = json.dumps(event, ensure_ascii=False)
+    return f"event: {event['event']}\ndata: {payload}\n\n"
+
+
+# 채팅 스트리밍 API 엔드포인트 (SSE)
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """채팅 스트리밍 API 엔드포인트 (text/event-stream)"""
+    logger.info(f"채팅 스트리밍 API 요청 받음: message={request.message}")
+    session_id = get_or_create_session_id(request.session_id)
+
+    async def event_source():
+        try:
+            async for event in stream_general_agent_request(
+                request.message, session_id, request.session_state
+            ):
+                yield _format_sse(event)
+        except Exception as e:
+            logger.error(f"채팅 스트리밍 처리 중 오류: {str(e)}")
+            logger.error(traceback.format_exc())
+            yield _format_sse(
+                {"event": "error", "message": "서버 내부 오류가 발생했습니다."}
+            )
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 채팅 WebSocket 엔드포인트
+@app.websocket("/ws/chat")
+async def chat_websocket(websocket: WebSocket):
+    """채팅 WebSocket 엔드포인트 (요청마다 ChatRequest 형식의 JSON을 받아 이벤트를 전송)"""
+    await websocket.accept()
+    try:
+        while True:
+            frame = await websocket.receive_text()
+            try:
+                request = ChatRequest.model_validate_json(frame)
+            except ValidationError as e:
+                # 잘못된 프레임은 연결을 끊지 않고 오류 이벤트로 알림
+                logger.warning(f"WebSocket 요청 형식 오류: {e}")
+                await websocket.send_json(
+                    {
+                        "event": "error",
+                        "message": "잘못된 요청 형식입니다.",
+                        "detail": jsonable_encoder(
+                            e.errors(include_url=False, include_context=False)
+                        ),
+                    }
+                )
+                continue
+            session_id = get_or_create_session_id(request.session_id)
+            try:
+                async for event in stream_general_agent_request(
+                    request.message, session_id, request.session_state
+                ):
+                    await websocket.send_json(event)
+            except Exception as e:
+                logger.error(f"WebSocket 채팅 처리 중 오류: {str(e)}")
+                logger.error(traceback.format_exc())
+                await websocket.send_json(
+                    {"event": "error", "message": "서버 내부 오류가 발생했습니다."}
+                )
+    except WebSocketDisconnect:
+        logger.info("WebSocket 연결 종료")
+
+
 # API 상태 확인
 @app.get("/api/health")
 def health_check():
@@ -332,6 +478,13 @@ def health_check():
     }
 
 
+# 사전 라우터 지표 (LLM 라우팅을 건너뛴 비율 등)
+@app.get("/api/router/stats")
+def router_stats():
+    """사전 라우터 지표"""
+    return pre_router.snapshot()
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,135 @@
+"""
+한국어 날짜/시간 파싱 커버리지·지연 벤치마크
+
+`date_expressions.json` 코퍼스를 두 가지 설정으로 파싱해 LLM 호출 수를 비교합니다.
+LLM 호출은 카운터가 달린 스텁으로 교체하므로 네트워크/비용이 들지 않습니다.
+
+- legacy: 규칙 기반 엔진 비활성화 (기존 dateutil 규칙 → LLM, 시간 표현은 항상 LLM 먼저)
+- engine: 현재 설정 (temporal.py 엔진 → 신뢰도 미달 시에만 기존 경로)
+
+추가로 엔진이 확신한 결과의 정답률(코퍼스 expected 기준)과 건당 지연(콜드/메모이즈)을 출력합니다.
+expected가 null인 날짜 표현이 LLM 실패(스텁) 시 None이 아닌 값으로 채워지면 실패로 종료합니다.
+
+실행 예:
+    python benchmarks/date_parsing_benchmark.py
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from form_selector import utils  # noqa: E402
+from form_selector.temporal import parse_temporal  # noqa: E402
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "date_expressions.json")
+
+
+def load_corpus() -> Dict[str, Any]:
+    with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def install_llm_stub() -> None:
+    """실제 LLM 대신 호출 횟수만 세고 None을 돌려주는 스텁"""
+    utils._request_llm_datetime_parsing = lambda text, today_iso: None
+
+
+def reset_counters() -> None:
+    for key in utils.DATE_PARSE_STATS:
+        utils.DATE_PARSE_STATS[key] = 0
+    utils._llm_datetime_cache.clear()
+    parse_temporal.cache_clear()
+
+
+def run_corpus(cases: List[Dict[str, Any]], today: str) -> Dict[str, Any]:
+    reset_counters()
+    filled = []  # LLM이 실패했는데도 값이 채워진 null 날짜 표현
+    for case in cases:
+        if case["kind"] == "date":
+            value = utils.parse_relative_date_to_iso(case["text"], today)
+            if case["expected"] is None and value is not None:
+                filled.append((case["text"], value))
+        else:
+            utils.parse_datetime_description_to_iso_local(case["text"], today)
+    return {**utils.DATE_PARSE_STATS, "filled": filled}
+
+
+def engine_accuracy(cases: List[Dict[str, Any]], today: str) -> Dict[str, Any]:
+    confident, correct, wrong = 0, 0, []
+    for case in cases:
+        result = parse_temporal(case["text"], today)
+        if (
+            result.start is None
+            or result.confidence < utils.DATE_RULE_CONFIDENCE_THRESHOLD
+        ):
+            continue
+        confident += 1
+        value = result.date_iso() if case["kind"] == "date" else result.datetime_iso()
+        if value == case["expected"]:
+            correct += 1
+        else:
+            wrong.append((case["text"], value, case["expected"]))
+    return {"confident": confident, "correct": correct, "wrong": wrong}
+
+
+def engine_latency_us(
+    cases: List[Dict[str, Any]], today: str, rounds: int = 200
+) -> Dict[str, float]:
+    texts = [case["text"] for case in cases]
+    started = time.perf_counter()
+    for _ in range(rounds):
+        parse_temporal.cache_clear()
+        for text in texts:
+            parse_temporal(text, today)
+    cold = (time.perf_counter() - started) / (rounds * len(texts)) * 1e6
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            parse_temporal(text, today)
+    warm = (time.perf_counter() - started) / (rounds * len(texts)) * 1e6
+    return {"cold": cold, "memoized": warm}
+
+
+def main():
+    corpus = load_corpus()
+    cases, today = corpus["cases"], corpus["today"]
+    install_llm_stub()
+
+    threshold = utils.DATE_RULE_CONFIDENCE_THRESHOLD
+    utils.DATE_RULE_CONFIDENCE_THRESHOLD = float("inf")  # 엔진 비활성화 = 기존 동작
+    legacy = run_corpus(cases, today)
+    utils.DATE_RULE_CONFIDENCE_THRESHOLD = threshold
+    engine = run_corpus(cases, today)
+
+    accuracy = engine_accuracy(cases, today)
+    latency = engine_latency_us(cases, today)
+
+    print(f"corpus={len(cases)} today={today} threshold={threshold}")
+    print(f"legacy: llm_calls={legacy['llm_calls']}")
+    print(
+        f"engine: llm_calls={engine['llm_calls']} rule_hits={engine['rule_hits']} "
+        f"(avoided {legacy['llm_calls'] - engine['llm_calls']} LLM calls)"
+    )
+    print(
+        f"engine coverage={accuracy['confident'] / len(cases):.1%} "
+        f"accuracy(on confident)={accuracy['correct']}/{accuracy['confident']}"
+    )
+    for text, value, expected in accuracy["wrong"]:
+        print(f"  mismatch: {text!r} -> {value} (expected {expected})")
+    print(
+        f"engine latency: cold={latency['cold']:.1f}µs/expr memoized={latency['memoized']:.2f}µs/expr"
+    )
+    for text, value in engine["filled"]:
+        print(f"  filled without LLM: {text!r} -> {value} (expected None)")
+    if engine["filled"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+분류+추출 단일 호출(fused) 모드 vs 기존 2단계 경로 벤치마크
+
+`client_test_cases.json`의 모든 케이스에 대해 두 경로를 실제 LLM으로 호출하고
+다음 항목을 비교합니다. (OPENAI_API_KEY 필요, 실제 비용 발생)
+
+- 토큰 사용량 (prompt / completion / total) 및 비용: `get_openai_callback`
+- 지연 시간 (케이스별 wall-clock)
+- 분류 정확도: `expected_form`과 분류된 양식의 english_id 비교
+- 슬롯 일치율: 2단계 경로의 non-null 슬롯 중 fused 결과와 값이 같은 비율
+
+실행 예:
+    python benchmarks/fused_mode_benchmark.py --limit 8
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from langchain_community.callbacks import get_openai_callback  # noqa: E402
+
+from form_selector.form_configs import KOREAN_TO_ENGLISH_MAP  # noqa: E402
+from form_selector.llm import (  # noqa: E402
+    SLOT_EXTRACTOR_CHAINS,
+    get_form_classifier_chain,
+    get_fused_classify_extract_chain,
+)
+
+TEST_CASES_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "client_test_cases.json")
+)
+
+
+def load_cases(limit: Optional[int]) -> List[Dict[str, Any]]:
+    with open(TEST_CASES_PATH, "r", encoding="utf-8") as f:
+        test_cases = json.load(f)["test_cases"]
+    cases = [case for group in test_cases.values() for case in group]
+    return cases[:limit] if limit else cases
+
+
+def is_expected_form(form_type: Optional[str], expected_form: str) -> bool:
+    """테스트 케이스의 expected_form(예: dispatch_business_trip)과 분류 결과를 비교합니다."""
+    english_id = KOREAN_TO_ENGLISH_MAP.get(form_type or "", "")
+    return expected_form.replace("_", "") in english_id.replace("_", "")
+
+
+def run_two_stage(classifier, text: str) -> Tuple[Optional[str], Dict[str, Any]]:
+    classified = classifier.invoke({"input": text})
+    form_type = getattr(classified, "form_type", None)
+    if form_type not in SLOT_EXTRACTOR_CHAINS:
+        return form_type, {}
+    slots = SLOT_EXTRACTOR_CHAINS[form_type].invoke({"input": text})
+    return form_type, slots.model_dump() if slots else {}
+
+
+def run_fused(fused_chain, text: str) -> Tuple[Optional[str], Dict[str, Any]]:
+    result = fused_chain.invoke({"input": text}).result
+    return result.form_type, result.slots.model_dump()
+
+
+def measure(runner, chain, cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    latencies, outputs, correct, failures = [], [], 0, 0
+    with get_openai_callback() as cb:
+        for case in cases:
+            started = time.perf_counter()
+            try:
+                form_type, slots = runner(chain, case["input"])
+            except Exception as e:
+                print(f"  [{case['case_name']}] 실패: {e}")
+                form_type, slots = None, {}
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+            outputs.append(slots)
+            correct += is_expected_form(form_type, case["expected_form"])
+    return {
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_mean_ms": statistics.mean(latencies) * 1000,
+        "prompt_tokens": cb.prompt_tokens,
+        "completion_tokens": cb.completion_tokens,
+        "total_tokens": cb.total_tokens,
+        "cost_usd": cb.total_cost,
+        "accuracy": correct / len(cases),
+        "failures": failures,
+        "outputs": outputs,
+    }
+
+
+def slot_agreement(
+    baseline: List[Dict[str, Any]], candidate: List[Dict[str, Any]]
+) -> float:
+    matched = total = 0
+    for base_slots, cand_slots in zip(baseline, candidate):
+        for key, value in base_slots.items():
+            if value in (None, "", []):
+                continue
+            total += 1
+            matched += cand_slots.get(key) == value
+    return matched / total if total else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fused vs two-stage benchmark")
+    parser.add_argument("--limit", type=int, default=None, help="케이스 수 제한")
+    args = parser.parse_args()
+
+    cases = load_cases(args.limit)
+    print(f"cases={len(cases)}")
+
+    two_stage = measure(run_two_stage, get_form_classifier_chain(), cases)
+    fused = measure(run_fused, get_fused_classify_extract_chain(), cases)
+    agreement = slot_agreement(two_stage["outputs"], fused["outputs"])
+
+    for label, stats in (("two_stage", two_stage), ("fused", fused)):
+        print(
+            f"{label:>9}: p50={stats['latency_p50_ms']:.0f}ms mean={stats['latency_mean_ms']:.0f}ms "
+            f"tokens={stats['total_tokens']} (prompt={stats['prompt_tokens']}, "
+            f"completion={stats['completion_tokens']}) cost=${stats['cost_usd']:.4f} "
+            f"accuracy={stats['accuracy']:.1%} failures={stats['failures']}"
+        )
+    print(f"slot agreement (fused vs two_stage): {agreement:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+/form-selector 엔드포인트 부하 테스트 하네스
+
+LLM 체인과 결재라인 API를 고정 지연(latency)을 갖는 스텁으로 교체한 뒤,
+동일한 부하를 두 가지 방식으로 흘려 비교합니다.
+
+- before: async 핸들러 안에서 동기 `classify_and_extract_slots_for_template` 호출 (기존 방식)
+- after : `aclassify_and_extract_slots_for_template` 호출 (현재 main.py 방식)
+
+실행 예:
+    python benchmarks/load_test.py --requests 200 --concurrency 50 --llm-latency 0.3
+
+출력: 모드별 p50/p99 지연(ms)과 초당 처리량(req/s)
+"""
+
+import argparse
+import asyncio
+import functools
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("OPENAI_API_KEY", "sk-load-test")
+# 동일 입력을 반복 전송하므로 응답 캐시를 끄고 파이프라인 자체의 처리량만 측정합니다.
+os.environ.setdefault("FORM_SELECTOR_CACHE_ENABLED", "false")
+
+from fastapi import FastAPI  # noqa: E402
+from langchain_core.runnables import RunnableLambda  # noqa: E402
+
+from form_selector import schema, service  # noqa: E402
+from form_selector.form_configs import FORM_CONFIGS, TEMPLATE_FILENAME_MAP  # noqa: E402
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STUB_FORM_TYPE = "연차 신청서"
+STUB_SLOTS = {
+    "leave_type": "연차",
+    "start_date": "2025-07-07",
+    "end_date": "2025-07-09",
+    "reason": "개인 사유",
+}
+STUB_APPROVAL_RESPONSE = {
+    "code": 1,
+    "message": "성공",
+    "data": [
+        {"aprvPsId": "01160001", "aprvPsNm": "최순명", "aprvDvTy": "AGREEMENT", "ordr": 1}
+    ],
+}
+
+
+def _stub_chain(result_factory, latency: float) -> RunnableLambda:
+    """동기/비동기 호출 모두 `latency`초 후 결과를 돌려주는 스텁 체인"""
+
+    def _invoke(_payload):
+        time.sleep(latency)
+        return result_factory()
+
+    async def _ainvoke(_payload):
+        await asyncio.sleep(latency)
+        return result_factory()
+
+    return RunnableLambda(_invoke, afunc=_ainvoke)
+
+
+def install_stubs(llm_latency: float, approval_latency: float) -> None:
+    """LLM 체인, 템플릿 검색, 결재라인 API를 스텁으로 교체합니다."""
+    classifier = _stub_chain(
+        lambda: schema.FormClassifierOutput(form_type=STUB_FORM_TYPE, keywords=["연차"]),
+        llm_latency,
+    )
+    service.get_form_classifier_chain = lambda: classifier
+    slot_model = FORM_CONFIGS[STUB_FORM_TYPE].model
+    service.SLOT_EXTRACTOR_CHAINS = {
+        STUB_FORM_TYPE: _stub_chain(lambda: slot_model(**STUB_SLOTS), llm_latency)
+    }
+
+    templates: Dict[str, str] = {}
+    for form_type, relative_path in TEMPLATE_FILENAME_MAP.items():
+        with open(os.path.join(BASE_DIR, relative_path), "r", encoding="utf-8") as f:
+            templates[form_type] = f.read()
+    service.retrieve_template = lambda form_type, keywords=None: templates.get(
+        form_type
+    )
+
+    def _sync_handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(approval_latency)
+        return httpx.Response(200, json=STUB_APPROVAL_RESPONSE)
+
+    async def _async_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(approval_latency)
+        return httpx.Response(200, json=STUB_APPROVAL_RESPONSE)
+
+    httpx.Client = functools.partial(
+        httpx.Client, transport=httpx.MockTransport(_sync_handler)
+    )
+    service._approval_http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_async_handler)
+    )
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/before")
+    async def before(user_input: schema.UserInput):
+        return service.classify_and_extract_slots_for_template(user_input)
+
+    @app.post("/after")
+    async def after(user_input: schema.UserInput):
+        return await service.aclassify_and_extract_slots_for_template(user_input)
+
+    return app
+
+
+async def run_load(
+    app: FastAPI, path: str, total_requests: int, concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://load-test", timeout=None
+    ) as client:
+
+        async def _one(i: int):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post(
+                    path, json={"input": "내일 연차 쓰고 싶어요", "drafterId": "01180001"}
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_one(i) for i in range(total_requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "rps": total_requests / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/form-selector load test")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--approval-latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    install_stubs(args.llm_latency, args.approval_latency)
+    app = build_app()
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} "
+        f"llm_latency={args.llm_latency}s approval_latency={args.approval_latency}s"
+    )
+    for label, path in (("before", "/before"), ("after", "/after")):
+        stats = asyncio.run(run_load(app, path, args.requests, args.concurrency))
+        print(
+            f"{label:>6}: p50={stats['p50_ms']:.1f}ms p99={stats['p99_ms']:.1f}ms "
+            f"throughput={stats['rps']:.1f} req/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+양식 → API Payload 변환 처리량 벤치마크
+
+골든 파일(payload_golden.json)의 form_data를 반복해 N건(기본 10,000건)을 변환합니다.
+(LLM/외부 API 호출 없음)
+
+- legacy  : 기존 방식 (결재자 dict → ApproverDetail 변환 후 양식별 프로세서의
+            convert_to_api_payload, 매 호출 로깅). 비교를 위해 git 기준 커밋의
+            프로세서 코드를 임시 모듈로 불러옵니다. (`--legacy-ref`, 기본 HEAD~1)
+- compiled: payload_mapping의 컴파일된 변환 함수 (convert_form_data_to_api_payload)
+
+실행 예:
+    python benchmarks/payload_benchmark.py --count 10000
+    python benchmarks/payload_benchmark.py --no-legacy
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import logging  # noqa: E402
+
+from form_selector import schema  # noqa: E402
+from form_selector.processors import ProcessorFactory  # noqa: E402
+from form_selector.service import convert_form_data_to_api_payload  # noqa: E402
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "payload_golden.json")
+LEGACY_PROCESSORS = (
+    ("연차 신청서", "annual_leave_processor", "AnnualLeaveProcessor"),
+    ("야근식대비용 신청서", "dinner_expense_processor", "DinnerExpenseProcessor"),
+    (
+        "교통비 신청서",
+        "transportation_expense_processor",
+        "TransportationExpenseProcessor",
+    ),
+    ("파견 및 출장 보고서", "dispatch_report_processor", "DispatchReportProcessor"),
+    (
+        "비품/소모품 구입내역서",
+        "inventory_purchase_processor",
+        "InventoryPurchaseProcessor",
+    ),
+    ("구매 품의서", "purchase_approval_processor", "PurchaseApprovalProcessor"),
+    ("개인 경비 사용 내역서", "personal_expense_processor", "PersonalExpenseProcessor"),
+    ("법인카드 지출내역서", "corporate_card_processor", "CorporateCardProcessor"),
+)
+
+
+def load_legacy_converters(ref: str) -> Optional[Dict[str, Callable]]:
+    """git ref의 프로세서 코드에서 convert_to_api_payload를 불러옵니다. (없으면 None)"""
+    package_dir = os.path.join(BASE_DIR, "form_selector", "processors")
+    converters = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for form_name, module_name, class_name in LEGACY_PROCESSORS:
+            try:
+                source = subprocess.run(
+                    ["git", "show", f"{ref}:./{module_name}.py"],
+                    cwd=package_dir,
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+            except (OSError, subprocess.CalledProcessError):
+                return None
+            if "def convert_to_api_payload" not in source:
+                return None
+            path = os.path.join(tmp, f"{module_name}.py")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(source)
+            # 상대 import(.base_processor, ..business_calendar)가 현재 패키지를 가리키도록 로드
+            spec = importlib.util.spec_from_file_location(
+                f"form_selector.processors.legacy_{module_name}", path
+            )
+            module = importlib.util.module_from_spec(spec)
+            module.__package__ = "form_selector.processors"
+            spec.loader.exec_module(module)
+            processor_class = getattr(module, class_name)
+            processor_class.__abstractmethods__ = frozenset()
+            converters[form_name] = processor_class().convert_to_api_payload
+    return converters
+
+
+def legacy_convert(converters: Dict[str, Callable], form_type: str, form_data: Dict):
+    """기존 convert_form_data_to_api_payload 흐름 (결재자 변환 + 프로세서 변환)"""
+    logging.info(f"Converting form data to API payload for form_type: {form_type}")
+    logging.info(f"Input form_data: {form_data}")
+    if form_data.get("approvers"):
+        form_data["approvers"] = [
+            (
+                schema.ApproverDetail(**{"aprvPsNm": "", **approver})
+                if isinstance(approver, dict)
+                else approver
+            )
+            for approver in form_data["approvers"]
+        ]
+    return converters[ProcessorFactory.resolve_form_type(form_type)](form_data)
+
+
+def run(
+    name: str, convert: Callable, workload: List[Dict[str, Any]], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        inputs = [copy.deepcopy(case["form_data"]) for case in workload]
+        started = time.perf_counter()
+        for case, form_data in zip(workload, inputs):
+            convert(case["form_type"], form_data)
+        timings.append(time.perf_counter() - started)
+    elapsed = statistics.median(timings)
+    print(
+        f"{name:<9} {len(workload):>7} {elapsed * 1000:>10.1f} "
+        f"{len(workload) / elapsed:>12.0f} {elapsed / len(workload) * 1e6:>9.2f}"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="payload conversion benchmark")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-ref", default="HEAD~1")
+    parser.add_argument("--no-legacy", action="store_true")
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="서비스 기본 로그 레벨 (INFO 로깅 비용 포함)",
+    )
+    args = parser.parse_args()
+
+    # 서비스와 같은 레벨로 로깅하되 출력은 버림 (포매팅/핸들러 비용만 측정)
+    logging.basicConfig(
+        level=args.log_level,
+        handlers=[logging.StreamHandler(open(os.devnull, "w"))],
+        force=True,
+    )
+    logging.getLogger().setLevel(args.log_level)
+
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    workload = [cases[i % len(cases)] for i in range(args.count)]
+
+    print(
+        f"{'path':<9} {'count':>7} {'total_ms':>10} {'payloads/s':>12} {'us/each':>9}"
+    )
+    compiled = run("compiled", convert_form_data_to_api_payload, workload, args.repeat)
+
+    converters = None if args.no_legacy else load_legacy_converters(args.legacy_ref)
+    if converters is None:
+        if not args.no_legacy:
+            print(f"legacy 프로세서를 {args.legacy_ref}에서 찾을 수 없어 생략합니다.")
+        return
+    legacy = run(
+        "legacy",
+        lambda form_type, form_data: legacy_convert(converters, form_type, form_data),
+        workload,
+        args.repeat,
+    )
+    mismatches = sum(
+        legacy_convert(converters, case["form_type"], copy.deepcopy(case["form_data"]))
+        != case["expected_payload"]
+        for case in cases
+    )
+    print(f"speedup: {legacy / compiled:.1f}x (legacy golden mismatches: {mismatches})")
+
+
+if __name__ == "__main__":
+    main()
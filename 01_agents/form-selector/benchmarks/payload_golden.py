@@ -0,0 +1,273 @@
+"""
+양식 → API Payload 변환 골든 파일 검사
+
+client_test_cases.json의 양식별 케이스(24건)에서 HTML 폼이 제출하는 것과 같은 형태의
+form_data를 만들고, `convert_form_data_to_api_payload` 결과를 골든 파일
+(payload_golden.json)과 비교합니다. 케이스마다 아이템 목록/구 형식(`*_1` 필드),
+쉼표가 들어간 금액, 누락 필드(기본값) 같은 변형도 함께 검사합니다.
+
+변환 규칙을 의도적으로 바꾼 경우에만 `--update`로 골든 파일을 다시 만듭니다.
+
+실행 예:
+    python benchmarks/payload_golden.py            # 검사 (불일치 시 exit 1)
+    python benchmarks/payload_golden.py --update   # 골든 파일 갱신
+"""
+
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, BASE_DIR)
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import logging  # noqa: E402
+
+from form_selector.service import convert_form_data_to_api_payload  # noqa: E402
+
+logging.disable(logging.WARNING)
+
+CASES_PATH = os.path.join(BASE_DIR, "client_test_cases.json")
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "payload_golden.json")
+
+# client_test_cases.json의 키 → 프론트엔드가 /submit-form에 보내는 form_type
+BACKEND_FORM_TYPES = {
+    "annual_leave": "annual_leave",
+    "dinner_expense": "dinner_expense",
+    "transportation_expense": "transportation_expense",
+    "dispatch_business_trip": "dispatch_businesstrip_report",
+    "inventory_purchase": "inventory_purchase_report",
+    "purchase_approval": "purchase_approval_form",
+    "personal_expense": "personal_expense_report",
+    "corporate_card": "corporate_card_statement",
+}
+APPROVERS = [
+    {"aprvPsId": "01180002", "aprvPsNm": "김팀장", "aprvDvTy": "AGREEMENT", "ordr": 1},
+    {
+        "aprvPsId": "01180003",
+        "aprvPsNm": "이본부장",
+        "aprvDvTy": "APPROVAL",
+        "ordr": "2",
+    },
+]
+
+_DATE = re.compile(r"(\d{1,2})월\s*(\d{1,2})일")
+_AMOUNT = re.compile(r"(\d+)(만)?원")
+_ITEM = re.compile(
+    r"([^\s,.]+(?: [^\s,.\d]+)?) (\d+)(?:개|박스|팩|대|세트)[^,]*?(?:단가|각|대당) (\d+)(만)?원"
+)
+
+
+def _dates(text: str) -> List[str]:
+    return [f"2025-{int(m):02d}-{int(d):02d}" for m, d in _DATE.findall(text)]
+
+
+def _amounts(text: str) -> List[int]:
+    return [int(n) * (10000 if man else 1) for n, man in _AMOUNT.findall(text)]
+
+
+def _items(text: str) -> List[Dict[str, Any]]:
+    items = []
+    for name, quantity, price, man in _ITEM.findall(text):
+        unit_price = int(price) * (10000 if man else 1)
+        items.append(
+            {
+                "item_name": name,
+                "item_quantity": int(quantity),
+                "item_unit_price": unit_price,
+                "item_total_price": int(quantity) * unit_price,
+            }
+        )
+    return items
+
+
+def build_form_data(form_key: str, case: Dict[str, Any]) -> Dict[str, Any]:
+    """테스트 케이스 입력으로 HTML 폼 제출 데이터를 만듭니다. (LLM 없이 결정적)"""
+    text = case["input"]
+    dates = _dates(text) or ["2025-07-04"]
+    amounts = _amounts(text) or [0]
+    form = {
+        "title": case["case_name"],
+        "drafterId": case["drafterId"],
+        "approvers": copy.deepcopy(APPROVERS),
+    }
+    if form_key == "annual_leave":
+        leave_type = "half_day_afternoon" if "반차" in text else "annual"
+        form.update(start_date=dates[0], end_date=dates[-1], leave_type=leave_type)
+        form["reason"] = text
+    elif form_key == "dinner_expense":
+        form.update(
+            work_date="2025-07-01",
+            dinner_expense_amount=str(amounts[0]),
+            work_details=text,
+            work_location="본사",
+            overtime_time="22:00",
+        )
+    elif form_key == "transportation_expense":
+        form.update(
+            departure_date="2025-07-01",
+            total_amount=str(amounts[-1]),
+            origin="회사",
+            destination="고객사",
+            transport_details="지하철",
+            purpose=text,
+        )
+    elif form_key == "dispatch_business_trip":
+        start, end = (dates + dates)[0], (dates + dates)[1]
+        if start == end and "부터" in text:
+            end = re.sub(r"\d{2}$", re.search(r"(\d+)일까지", text).group(1), start)
+        form.update(
+            start_date=start,
+            end_date=end,
+            destination=text.split()[0],
+            duration_days="3",
+            report_details=text,
+            purpose="출장 보고",
+        )
+    elif form_key in ("inventory_purchase", "purchase_approval"):
+        items = _items(text)
+        if form_key == "purchase_approval":
+            for item in items:
+                item.update(item_spec="표준", item_supplier="협력사")
+            form.update(draft_date="2025-07-01", total_purchase_amount=amounts[-1])
+        else:
+            form.update(request_date="2025-07-01", total_amount=amounts[-1])
+        form.update(items=items, purpose=text)
+    elif form_key == "personal_expense":
+        categories = re.findall(r"\d+일 ([^\s\d]+)", text)
+        for i, (date, amount) in enumerate(zip(dates, amounts), 1):
+            form[f"expense_date_{i}"] = date
+            form[f"expense_amount_{i}"] = str(amount)
+            form[f"expense_category_{i}"] = (
+                categories[i - 1] if i <= len(categories) else ""
+            )
+            form[f"expense_description_{i}"] = f"경비 {i}"
+        form.update(purpose=text, usage_status="cash", total_expense_amount=amounts[-1])
+    elif form_key == "corporate_card":
+        descriptions = re.findall(r"\d+일 ([^\d]+?) \d+원", text)
+        form["card_usage_items"] = [
+            {
+                "usage_date": date,
+                "usage_category": description.split()[-1],
+                "usage_description": description,
+                "usage_amount": amount,
+            }
+            for date, amount, description in zip(
+                dates[-len(descriptions) :], amounts, descriptions
+            )
+        ]
+        form.update(
+            card_number="1234-56**-****-7890",
+            card_user_name="홍길동",
+            statement_date="2025-07-31",
+            total_usage_amount=amounts[-1],
+            purpose=text,
+        )
+    return form
+
+
+def variants(form_key: str, form: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """같은 케이스의 변형 (구 형식 필드, 쉼표 금액, 누락 필드)"""
+    result = {}
+    list_field = {
+        "inventory_purchase": "items",
+        "purchase_approval": "items",
+        "corporate_card": "card_usage_items",
+    }.get(form_key)
+    if list_field:
+        flat = {k: v for k, v in form.items() if k != list_field}
+        for i, item in enumerate(form[list_field], 1):
+            for key, value in item.items():
+                if form_key == "corporate_card" and key == "usage_description":
+                    key = "merchant_name"
+                flat[f"{key}_{i}"] = value
+        result["flat"] = flat
+
+    commas = copy.deepcopy(form)
+    for key, value in list(commas.items()):
+        if "amount" in key and isinstance(value, (str, int)) and str(value).isdigit():
+            commas[key] = f"{int(value):,}"
+    result["comma_amounts"] = commas
+
+    result["minimal"] = {
+        k: v
+        for k, v in form.items()
+        if k in ("drafterId", "start_date", "work_date", "departure_date")
+    }
+    if form_key == "annual_leave":
+        result["single_day"] = {**form, "end_date": ""}
+    return result
+
+
+def build_cases() -> List[Dict[str, Any]]:
+    with open(CASES_PATH, "r", encoding="utf-8") as f:
+        test_cases = json.load(f)["test_cases"]
+    cases = []
+    for form_key, items in test_cases.items():
+        form_type = BACKEND_FORM_TYPES[form_key]
+        for case in items:
+            form = build_form_data(form_key, case)
+            cases.append(
+                {
+                    "case_name": case["case_name"],
+                    "form_type": form_type,
+                    "form_data": form,
+                }
+            )
+        for name, form in variants(
+            form_key, build_form_data(form_key, items[0])
+        ).items():
+            cases.append(
+                {
+                    "case_name": f"{items[0]['case_name']} [{name}]",
+                    "form_type": form_type,
+                    "form_data": form,
+                }
+            )
+    return cases
+
+
+def convert(case: Dict[str, Any]) -> Dict[str, Any]:
+    return convert_form_data_to_api_payload(
+        case["form_type"], copy.deepcopy(case["form_data"])
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="payload golden file check")
+    parser.add_argument("--update", action="store_true", help="골든 파일 갱신")
+    args = parser.parse_args()
+
+    if args.update:
+        cases = build_cases()
+        for case in cases:
+            case["expected_payload"] = convert(case)
+        with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+            json.dump(cases, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"골든 파일 갱신: {len(cases)}건 → {GOLDEN_PATH}")
+        return
+
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    failures = 0
+    for case in cases:
+        actual = convert(case)
+        if actual != case["expected_payload"]:
+            failures += 1
+            print(f"FAIL {case['form_type']}: {case['case_name']}")
+            for key in sorted(set(actual) | set(case["expected_payload"])):
+                if actual.get(key) != case["expected_payload"].get(key):
+                    print(f"  {key}: expected={case['expected_payload'].get(key)!r}")
+                    print(f"  {' ' * len(key)}  actual  ={actual.get(key)!r}")
+    print(f"{len(cases) - failures}/{len(cases)} passed")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+HTML 템플릿 렌더링 마이크로 벤치마크
+
+모든 양식 템플릿에 대해 현실적인 슬롯 딕셔너리를 만들어 두 방식을 비교합니다.
+
+- legacy  : 기존 `fill_template` 방식 (슬롯 복사 + items JSON + `re.sub` 전체 스캔)
+- compiled: 현재 `BaseFormProcessor.fill_template` (캐싱된 렌더 플랜 + 단일 join)
+
+출력: 양식별 렌더 시간(µs/req)과 요청당 임시 할당 피크(bytes, tracemalloc 기준)
+form_selector 임포트 시 켜지는 INFO 로깅은 렌더 비용만 비교하도록 측정 중 끕니다.
+
+실행 예:
+    python benchmarks/render_benchmark.py --iterations 20000
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from form_selector.converters import FieldConverter  # noqa: E402
+from form_selector.form_configs import TEMPLATE_FILENAME_MAP  # noqa: E402
+from form_selector.processors import DefaultFormProcessor  # noqa: E402
+from form_selector.processors.template_renderer import (  # noqa: E402
+    PLACEHOLDER_PATTERN,
+)
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TODAY = "2025-07-01"
+ITEM_KEYS = {"items", "expense_items", "card_usage_items"}
+
+field_converter = FieldConverter()
+
+
+def legacy_fill_template(template: str, slots: Dict[str, Any], today: str) -> str:
+    """변경 전 `fill_template` 구현 (비교 기준)"""
+    processed_slots = field_converter.escape_backslashes_for_regex(slots)
+
+    items_json_str = "null"
+    for item_key in ("items", "expense_items", "card_usage_items"):
+        if item_key in slots and isinstance(slots[item_key], list):
+            items_json_str = json.dumps(slots[item_key], ensure_ascii=False)
+            break
+
+    def replacer(match):
+        key = match.group(1)
+        if key == "items_json":
+            return items_json_str
+        if key == "today":
+            return today
+        value = processed_slots.get(key, "")
+        return value if isinstance(value, str) else str(value)
+
+    return re.sub(r"{(\w+)}", replacer, template)
+
+
+def _sample_value(name: str) -> Any:
+    if "date" in name:
+        return "2025-07-07"
+    if "amount" in name or "days" in name:
+        return 125000
+    if name == "approvers_json":
+        return json.dumps(
+            [{"aprvPsId": "01160001", "aprvPsNm": "최순명", "ordr": 1}],
+            ensure_ascii=False,
+        )
+    return f"{name} 샘플 값 - 서울 본사 3층 회의실"
+
+
+def build_slots(template: str) -> Dict[str, Any]:
+    """템플릿의 플레이스홀더 이름으로 실제 요청과 비슷한 슬롯 딕셔너리를 만듭니다."""
+    names = set(PLACEHOLDER_PATTERN.findall(template))
+    slots = {name: _sample_value(name) for name in names if name not in ("today",)}
+    slots.pop("items_json", None)
+    if "items_json" in names:
+        slots["items"] = [
+            {
+                "item_name": f"품목 {i}",
+                "item_quantity": i + 1,
+                "item_unit_price": 15000,
+                "item_purpose": "팀 업무용",
+                "item_delivery_request_date": "2025-07-10",
+            }
+            for i in range(5)
+        ]
+    # 렌더링에 쓰이지 않는 슬롯도 함께 전달되는 실제 상황을 반영
+    slots.update({"reason": "개인 사유", "leave_type": "annual", "leave_days": 1.0})
+    return slots
+
+
+def time_per_call(fn: Callable[[], str], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def peak_alloc_per_call(fn: Callable[[], str]) -> int:
+    fn()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fill_template micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+    # 로그 출력 비용이 렌더 시간에 섞이지 않도록 측정 중 로깅 비활성화
+    logging.disable(logging.INFO)
+
+    processor = DefaultFormProcessor()
+    totals = {"legacy": 0.0, "compiled": 0.0}
+    print(
+        f"{'form_type':<24} {'size':>7} {'legacy µs':>10} {'compiled µs':>12} "
+        f"{'legacy B':>9} {'compiled B':>11}"
+    )
+    for form_type, relative_path in TEMPLATE_FILENAME_MAP.items():
+        with open(os.path.join(BASE_DIR, relative_path), "r", encoding="utf-8") as f:
+            template = f.read()
+        slots = build_slots(template)
+
+        legacy = lambda: legacy_fill_template(template, slots, TODAY)  # noqa: E731
+        compiled = lambda: processor.fill_template(template, slots, TODAY)  # noqa: E731
+        assert legacy() == compiled(), f"렌더 결과 불일치: {form_type}"
+
+        legacy_us = time_per_call(legacy, args.iterations)
+        compiled_us = time_per_call(compiled, args.iterations)
+        totals["legacy"] += legacy_us
+        totals["compiled"] += compiled_us
+        print(
+            f"{form_type:<24} {len(template):>7} {legacy_us:>10.2f} {compiled_us:>12.2f} "
+            f"{peak_alloc_per_call(legacy):>9} {peak_alloc_per_call(compiled):>11}"
+        )
+
+    print(
+        f"total: legacy={totals['legacy']:.2f}µs compiled={totals['compiled']:.2f}µs "
+        f"speedup={totals['legacy'] / totals['compiled']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+양식 검증 처리량 벤치마크
+
+골든 파일(payload_golden.json)의 form_data로 초당 검증 건수를 비교합니다. (LLM 호출 없음)
+
+- base    : 기존 BaseValidator 경로 (DefaultValidator.validate, 필수/날짜/숫자 메서드를
+            차례로 호출하고 매 호출 로깅). 최상위 공통 필드만 검사합니다.
+- single  : 컴파일된 검증기로 한 건씩 (validate_form)
+- batch   : 컴파일된 검증기로 --batch-size건씩 한 번에 (validate_forms, 집계 포함)
+
+compiled 경로는 아이템 목록/구 형식 필드/선택값까지 검사하므로 base보다 규칙이 많습니다.
+
+실행 예:
+    python benchmarks/validation_benchmark.py --count 10000 --batch-size 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import logging  # noqa: E402
+
+from form_selector.validators import (  # noqa: E402
+    DefaultValidator,
+    get_form_validator,
+    validate_form,
+    validate_forms,
+)
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "payload_golden.json")
+
+
+def measure(name: str, fn: Callable[[], object], count: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    elapsed = statistics.median(timings)
+    print(
+        f"{name:<7} {count:>7} {elapsed * 1000:>10.1f} {count / elapsed:>14.0f} "
+        f"{elapsed / count * 1e6:>9.2f}"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="form validation benchmark")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="서비스 기본 로그 레벨 (INFO 로깅 비용 포함)",
+    )
+    args = parser.parse_args()
+
+    # 서비스와 같은 레벨로 로깅하되 출력은 버림 (포매팅/핸들러 비용만 측정)
+    logging.basicConfig(
+        level=args.log_level,
+        handlers=[logging.StreamHandler(open(os.devnull, "w"))],
+        force=True,
+    )
+
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    forms = [
+        {
+            "form_type": cases[i % len(cases)]["form_type"],
+            "form_data": cases[i % len(cases)]["form_data"],
+        }
+        for i in range(args.count)
+    ]
+
+    # 기존 경로: 양식별 필수 필드를 form_config로 넘긴 DefaultValidator
+    base_validators = {
+        form["form_type"]: DefaultValidator(
+            {
+                "required_fields": list(
+                    get_form_validator(form["form_type"]).required_fields
+                )
+            }
+        )
+        for form in forms
+    }
+
+    def run_base():
+        for form in forms:
+            base_validators[form["form_type"]].validate(form["form_data"])
+
+    def run_single():
+        for form in forms:
+            validate_form(form["form_type"], form["form_data"])
+
+    def run_batch():
+        for start in range(0, len(forms), args.batch_size):
+            validate_forms(forms[start : start + args.batch_size])
+
+    print(
+        f"{'path':<7} {'count':>7} {'total_ms':>10} {'validations/s':>14} {'us/each':>9}"
+    )
+    base = measure("base", run_base, len(forms), args.repeat)
+    single = measure("single", run_single, len(forms), args.repeat)
+    batch = measure("batch", run_batch, len(forms), args.repeat)
+    print(f"speedup vs base: single {base / single:.1f}x, batch {base / batch:.1f}x")
+
+    summary = validate_forms(forms[: args.batch_size]).to_dict()
+    print(
+        f"batch of {summary['total']}: valid={summary['valid_count']} "
+        f"invalid={summary['invalid_count']} errors={summary['error_counts']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+영업일(근무일) 달력
+
+- 주말(토/일)과 한국 공휴일(대체공휴일, 임시공휴일 포함)을 제외한 영업일 계산
+- 공휴일 표는 미리 계산해 `numpy.busdaycalendar`로 한 번만 만들고,
+  날짜 범위 생성/일수 계산/N영업일 뒤 날짜는 numpy busday 함수로 벡터화
+- 일수 계산(`count_business_days`)과 날짜 이동(`add_business_days`)은 범위 길이와 무관하게 상수 시간
+
+표에 없는 공휴일(추가 임시공휴일, 회사 지정 휴무일)은 `GW_EXTRA_HOLIDAYS`에
+쉼표로 구분한 YYYY-MM-DD로 지정합니다.
+
+gw_agent의 `business_calendar.py`와 같은 내용으로 유지합니다.
+(gw_agent의 `benchmarks/business_calendar_sync_check.py`가 두 파일의 차이를 검사합니다.)
+"""
+
+import math
+import os
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+# 한국 공휴일 (관공서의 공휴일에 관한 규정 기준, 대체/임시공휴일 포함)
+KR_HOLIDAYS: Dict[int, Dict[str, str]] = {
+    2024: {
+        "2024-01-01": "신정",
+        "2024-02-09": "설날 연휴",
+        "2024-02-10": "설날",
+        "2024-02-11": "설날 연휴",
+        "2024-02-12": "대체공휴일(설날)",
+        "2024-03-01": "삼일절",
+        "2024-04-10": "국회의원 선거일",
+        "2024-05-05": "어린이날",
+        "2024-05-06": "대체공휴일(어린이날)",
+        "2024-05-15": "부처님오신날",
+        "2024-06-06": "현충일",
+        "2024-08-15": "광복절",
+        "2024-09-16": "추석 연휴",
+        "2024-09-17": "추석",
+        "2024-09-18": "추석 연휴",
+        "2024-10-01": "국군의 날(임시공휴일)",
+        "2024-10-03": "개천절",
+        "2024-10-09": "한글날",
+        "2024-12-25": "성탄절",
+    },
+    2025: {
+        "2025-01-01": "신정",
+        "2025-01-27": "임시공휴일",
+        "2025-01-28": "설날 연휴",
+        "2025-01-29": "설날",
+        "2025-01-30": "설날 연휴",
+        "2025-03-01": "삼일절",
+        "2025-03-03": "대체공휴일(삼일절)",
+        "2025-05-05": "어린이날/부처님오신날",
+        "2025-05-06": "대체공휴일(부처님오신날)",
+        "2025-06-03": "대통령 선거일",
+        "2025-06-06": "현충일",
+        "2025-08-15": "광복절",
+        "2025-10-03": "개천절",
+        "2025-10-05": "추석 연휴",
+        "2025-10-06": "추석",
+        "2025-10-07": "추석 연휴",
+        "2025-10-08": "대체공휴일(추석)",
+        "2025-10-09": "한글날",
+        "2025-12-25": "성탄절",
+    },
+    2026: {
+        "2026-01-01": "신정",
+        "2026-02-16": "설날 연휴",
+        "2026-02-17": "설날",
+        "2026-02-18": "설날 연휴",
+        "2026-03-01": "삼일절",
+        "2026-03-02": "대체공휴일(삼일절)",
+        "2026-05-05": "어린이날",
+        "2026-05-24": "부처님오신날",
+        "2026-05-25": "대체공휴일(부처님오신날)",
+        "2026-06-03": "전국동시지방선거일",
+        "2026-06-06": "현충일",
+        "2026-08-15": "광복절",
+        "2026-08-17": "대체공휴일(광복절)",
+        "2026-09-24": "추석 연휴",
+        "2026-09-25": "추석",
+        "2026-09-26": "추석 연휴",
+        "2026-10-03": "개천절",
+        "2026-10-05": "대체공휴일(개천절)",
+        "2026-10-09": "한글날",
+        "2026-12-25": "성탄절",
+    },
+    2027: {
+        "2027-01-01": "신정",
+        "2027-02-06": "설날 연휴",
+        "2027-02-07": "설날",
+        "2027-02-08": "설날 연휴",
+        "2027-02-09": "대체공휴일(설날)",
+        "2027-03-01": "삼일절",
+        "2027-05-05": "어린이날",
+        "2027-05-13": "부처님오신날",
+        "2027-06-06": "현충일",
+        "2027-08-15": "광복절",
+        "2027-08-16": "대체공휴일(광복절)",
+        "2027-09-14": "추석 연휴",
+        "2027-09-15": "추석",
+        "2027-09-16": "추석 연휴",
+        "2027-10-03": "개천절",
+        "2027-10-04": "대체공휴일(개천절)",
+        "2027-10-09": "한글날",
+        "2027-10-11": "대체공휴일(한글날)",
+        "2027-12-25": "성탄절",
+        "2027-12-27": "대체공휴일(성탄절)",
+    },
+}
+
+# 음력/대체공휴일 표가 없는 연도에 적용할 양력 고정 공휴일
+FIXED_HOLIDAYS = (
+    "01-01",
+    "03-01",
+    "05-05",
+    "06-06",
+    "08-15",
+    "10-03",
+    "10-09",
+    "12-25",
+)
+
+WEEKMASK = "1111100"  # 월~금 근무
+BUSINESS_DAYS_PER_WEEK = WEEKMASK.count("1")
+
+# 연차 유형별 1일당 차감 일수
+DV_TYPE_DAYS: Dict[str, float] = {
+    "DAY": 1.0,
+    "HALF_AM": 0.5,
+    "HALF_PM": 0.5,
+    "HALF_H_AM": 0.25,
+    "HALF_H_PM": 0.25,
+    "QUARTER_AM": 0.25,
+    "QUARTER_PM": 0.25,
+}
+
+
+def _holiday_dates() -> np.ndarray:
+    holidays = [day for table in KR_HOLIDAYS.values() for day in table]
+    first, last = min(KR_HOLIDAYS), max(KR_HOLIDAYS)
+    # 표 범위 밖(±10년)은 고정 공휴일만 적용
+    for year in list(range(first - 10, first)) + list(range(last + 1, last + 11)):
+        holidays.extend(f"{year}-{month_day}" for month_day in FIXED_HOLIDAYS)
+    extra = os.getenv("GW_EXTRA_HOLIDAYS", "")
+    holidays.extend(day.strip() for day in extra.split(",") if day.strip())
+    return np.unique(np.array(holidays, dtype="datetime64[D]"))
+
+
+HOLIDAYS = _holiday_dates()
+CALENDAR = np.busdaycalendar(weekmask=WEEKMASK, holidays=HOLIDAYS)
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    """YYYY-MM-DD 문자열/date/datetime을 numpy 일 단위 날짜로 변환합니다. (형식 오류 시 ValueError)"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+def is_business_day(value: DateLike) -> bool:
+    return bool(np.is_busday(to_day(value), busdaycal=CALENDAR))
+
+
+def business_days(start: DateLike, end: DateLike) -> np.ndarray:
+    """start~end(양끝 포함) 사이의 영업일 배열 (datetime64[D])"""
+    start_day, end_day = to_day(start), to_day(end)
+    if end_day < start_day:
+        return np.array([], dtype="datetime64[D]")
+    days = np.arange(start_day, end_day + 1, dtype="datetime64[D]")
+    return days[np.is_busday(days, busdaycal=CALENDAR)]
+
+
+def business_day_strings(start: DateLike, end: DateLike) -> List[str]:
+    """start~end(양끝 포함) 사이의 영업일을 YYYY-MM-DD 문자열 리스트로 반환합니다."""
+    return np.datetime_as_string(business_days(start, end), unit="D").tolist()
+
+
+def count_business_days(start: DateLike, end: DateLike) -> int:
+    """start~end(양끝 포함) 사이의 영업일 수 (범위 길이와 무관하게 상수 시간)"""
+    start_day, end_day = to_day(start), to_day(end)
+    if end_day < start_day:
+        return 0
+    return int(np.busday_count(start_day, end_day + 1, busdaycal=CALENDAR))
+
+
+def add_business_days(start: DateLike, days: int) -> date:
+    """start(영업일이 아니면 다음 영업일)부터 days 영업일 뒤의 날짜"""
+    shifted = np.busday_offset(to_day(start), days, roll="forward", busdaycal=CALENDAR)
+    return shifted.astype(date)
+
+
+def end_date_for(start: DateLike, leave_days: float) -> date:
+    """시작일 포함 leave_days 영업일을 쉴 때의 종료일 (1일 미만은 시작일 당일)"""
+    return add_business_days(start, max(math.ceil(leave_days) - 1, 0))
+
+
+def leave_days_between(start: DateLike, end: DateLike, dv_type: str = "DAY") -> float:
+    """기간 동안 차감되는 연차 일수 (영업일 수 × 유형별 차감 일수)"""
+    return count_business_days(start, end) * DV_TYPE_DAYS.get(dv_type, 1.0)
+
+
+def remaining_after(remaining_days: float, requested: Iterable[Dict]) -> float:
+    """dayList(`{"reqYmd", "dvType"}` 목록) 신청 후 남는 연차 일수"""
+    used = sum(DV_TYPE_DAYS.get(day.get("dvType"), 1.0) for day in requested)
+    return remaining_days - used
@@ -0,0 +1,403 @@
+"""
+양식 분류 / 슬롯 추출 LLM 응답 캐시 모듈
+
+거의 같은 요청("내일 연차 쓰고 싶어요")이 반복될 때 gpt-4o 호출을 줄이기 위한 2단 캐시입니다.
+
+1.  **Exact 계층 (LRU)**:
+    정규화된 입력 + `current_date_iso`를 키로 분류 결과와 원본 슬롯(LLM이 추출한 자연어 값)을
+    함께 저장합니다. 적중 시 분류/슬롯 추출 LLM 호출을 모두 건너뜁니다.
+2.  **Semantic 계층 (임베딩 유사도)**:
+    입력 임베딩을 프로세스 내 벡터 인덱스(numpy 행렬, 코사인 유사도)에 저장합니다.
+    유사도가 임계값 이상이면 **분류 결과만** 재사용합니다. 문장이 조금만 달라도
+    슬롯 값("내일" vs "모레")은 달라지므로 슬롯 추출은 다시 수행합니다.
+    조회 시 임베딩은 `FORM_SELECTOR_SEMANTIC_EMBED_TIMEOUT`초만 기다립니다. 그 안에 오지 않으면
+    semantic 조회를 건너뛰고 분류를 시작하며, 늦게 도착한 임베딩은 저장(store)에만 사용합니다.
+
+캐시에는 날짜 변환 전의 원본 슬롯만 저장합니다. 상대 날짜("내일", "다음 주 월요일")는
+캐시 적중 여부와 관계없이 항상 요청 시점의 `current_date_iso`로 다시 변환됩니다.
+
+두 계층 모두 TTL과 최대 항목 수(초과 시 가장 오래 사용되지 않은 항목부터 제거)를 가지며,
+적중/미스/제거 횟수는 `FormResponseCache.stats()`로 확인할 수 있습니다.
+"""
+
+import asyncio
+import copy
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.getenv("FORM_SELECTOR_CACHE_ENABLED", "true").lower() == "true"
+CACHE_MAX_ENTRIES = int(os.getenv("FORM_SELECTOR_CACHE_MAX_ENTRIES", "1024"))
+CACHE_TTL_SECONDS = float(os.getenv("FORM_SELECTOR_CACHE_TTL_SECONDS", "3600"))
+SEMANTIC_CACHE_ENABLED = (
+    os.getenv("FORM_SELECTOR_SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+)
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("FORM_SELECTOR_SEMANTIC_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(
+    os.getenv("FORM_SELECTOR_SEMANTIC_CACHE_MAX_ENTRIES", "4096")
+)
+# 캐시 미스 경로에서 임베딩을 기다리는 최대 시간 (초). 분류 LLM 호출보다 충분히 짧게 유지
+SEMANTIC_EMBED_TIMEOUT = float(os.getenv("FORM_SELECTOR_SEMANTIC_EMBED_TIMEOUT", "0.3"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCT_RE = re.compile(r"[\s.!?~…]+$")
+
+
+def normalize_input(text: str) -> str:
+    """캐시 키용 입력 정규화: 양끝 공백/끝 문장부호 제거, 공백 축약, 소문자화"""
+    text = _WHITESPACE_RE.sub(" ", text.strip()).lower()
+    return _TRAILING_PUNCT_RE.sub("", text)
+
+
+@dataclass
+class CachedResponse:
+    """캐시에 저장되는 분류/슬롯 추출 결과"""
+
+    form_type: str
+    keywords: List[str]
+    raw_slots: Optional[Dict[str, Any]]  # None이면 분류 결과만 재사용 가능
+    tier: str = "exact"  # 적중한 계층 ("exact" 또는 "semantic")
+
+
+@dataclass
+class CacheLookup:
+    """조회 결과. 미스일 때 계산한 임베딩은 저장 시 재사용합니다."""
+
+    hit: Optional[CachedResponse]
+    embedding: Optional[List[float]] = None
+    # 조회 시간 안에 끝나지 않은 임베딩 작업 (저장 시점에 끝났으면 결과를 사용)
+    pending_embedding: Optional["asyncio.Task"] = None
+
+
+@dataclass
+class _Entry:
+    value: CachedResponse
+    expires_at: float
+
+
+@dataclass
+class CacheStats:
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    embedding_errors: int = 0
+    embedding_timeouts: int = 0
+
+
+class ExactLRUCache:
+    """TTL과 최대 크기를 갖는 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, stats: CacheStats):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._stats = stats
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def put(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticIndex:
+    """정규화된 임베딩을 numpy 행렬에 보관하는 프로세스 내 벡터 인덱스
+
+    최대 크기를 넘으면 마지막 적중 시각이 가장 오래된 항목을 제거하고,
+    만료된 항목은 검색 시 함께 정리합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        threshold: float,
+        stats: CacheStats,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._stats = stats
+        self._vectors: Optional[np.ndarray] = None  # (n, dim), L2 정규화됨
+        self._values: List[CachedResponse] = []
+        self._expires_at: List[float] = []
+        self._last_used: List[float] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def _drop(self, indices: List[int]) -> None:
+        if not indices:
+            return
+        keep = np.ones(len(self._values), dtype=bool)
+        keep[indices] = False
+        self._vectors = self._vectors[keep] if keep.any() else None
+        self._values = [v for v, k in zip(self._values, keep) if k]
+        self._expires_at = [v for v, k in zip(self._expires_at, keep) if k]
+        self._last_used = [v for v, k in zip(self._last_used, keep) if k]
+
+    def search(self, vector: List[float]) -> Optional[CachedResponse]:
+        query = self._normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            if self._vectors is None:
+                return None
+            expired = [i for i, exp in enumerate(self._expires_at) if exp <= now]
+            if expired:
+                self._stats.expirations += len(expired)
+                self._drop(expired)
+                if self._vectors is None:
+                    return None
+            similarities = self._vectors @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            self._last_used[best] = now
+            return self._values[best]
+
+    def add(self, vector: List[float], value: CachedResponse) -> None:
+        normalized = self._normalize(vector)[np.newaxis, :]
+        now = time.monotonic()
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = normalized
+            else:
+                self._vectors = np.vstack([self._vectors, normalized])
+            self._values.append(value)
+            self._expires_at.append(now + self.ttl_seconds)
+            self._last_used.append(now)
+            overflow = len(self._values) - self.max_entries
+            if overflow > 0:
+                oldest = list(np.argsort(self._last_used)[:overflow])
+                self._stats.evictions += overflow
+                self._drop(oldest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = None
+            self._values, self._expires_at, self._last_used = [], [], []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class FormResponseCache:
+    """분류/슬롯 추출 결과에 대한 2단(exact → semantic) 캐시"""
+
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], Any]] = None,
+        embed_timeout: float = SEMANTIC_EMBED_TIMEOUT,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        semantic_threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        semantic_max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        enabled: bool = CACHE_ENABLED,
+    ):
+        """
+        Args:
+            embed_fn: 문자열을 받아 임베딩 벡터를 돌려주는 async 함수.
+                None이면 semantic 계층을 사용하지 않습니다.
+            embed_timeout: 조회 시 임베딩을 기다리는 최대 시간 (초)
+        """
+        self.enabled = enabled
+        self._stats = CacheStats()
+        self._exact = ExactLRUCache(max_entries, ttl_seconds, self._stats)
+        self._embed_fn = embed_fn
+        self._embed_timeout = embed_timeout
+        self._semantic = SemanticIndex(
+            semantic_max_entries, ttl_seconds, semantic_threshold, self._stats
+        )
+
+    @staticmethod
+    def _exact_key(normalized_input: str, current_date_iso: str) -> str:
+        return f"{current_date_iso}|{normalized_input}"
+
+    async def _embed(
+        self, normalized_input: str
+    ) -> Tuple[Optional[List[float]], Optional[asyncio.Task]]:
+        """(임베딩, 시간 초과로 남은 작업). 시간 안에 끝나지 않으면 작업은 계속 실행됩니다."""
+        if self._embed_fn is None:
+            return None, None
+        task = asyncio.ensure_future(self._embed_fn(normalized_input))
+        task.add_done_callback(self._on_embedding_done)
+        try:
+            return (
+                await asyncio.wait_for(asyncio.shield(task), self._embed_timeout),
+                None,
+            )
+        except asyncio.TimeoutError:
+            self._stats.embedding_timeouts += 1
+            logger.info(
+                f"Semantic cache embedding exceeded {self._embed_timeout}s; "
+                f"skipping semantic lookup"
+            )
+            return None, task
+        except Exception:
+            return None, None  # _on_embedding_done에서 집계/로그
+
+    def _on_embedding_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._stats.embedding_errors += 1
+            logger.warning(f"Semantic cache embedding failed: {error}")
+
+    @staticmethod
+    def _late_embedding(lookup: CacheLookup) -> Optional[List[float]]:
+        """조회 후 도착한 임베딩. 아직 진행 중이면 취소하고 None"""
+        task = lookup.pending_embedding
+        if task is None:
+            return None
+        if not task.done():
+            task.cancel()
+            return None
+        if task.cancelled() or task.exception() is not None:
+            return None
+        return task.result()
+
+    async def alookup(self, text: str, current_date_iso: str) -> CacheLookup:
+        """exact → semantic 순서로 조회합니다. 반환된 슬롯은 호출 측이 수정해도 되는 복사본입니다."""
+        if not self.enabled:
+            return CacheLookup(hit=None)
+        normalized = normalize_input(text)
+
+        hit = self._exact.get(self._exact_key(normalized, current_date_iso))
+        if hit is not None:
+            self._stats.exact_hits += 1
+            return CacheLookup(
+                hit=CachedResponse(
+                    hit.form_type,
+                    list(hit.keywords),
+                    copy.deepcopy(hit.raw_slots),
+                    tier="exact",
+                )
+            )
+
+        vector, pending = await self._embed(normalized)
+        if vector is not None:
+            semantic_hit = self._semantic.search(vector)
+            if semantic_hit is not None:
+                self._stats.semantic_hits += 1
+                return CacheLookup(
+                    hit=CachedResponse(
+                        semantic_hit.form_type,
+                        list(semantic_hit.keywords),
+                        None,
+                        tier="semantic",
+                    ),
+                    embedding=vector,
+                )
+
+        self._stats.misses += 1
+        return CacheLookup(hit=None, embedding=vector, pending_embedding=pending)
+
+    def store(
+        self,
+        lookup: CacheLookup,
+        text: str,
+        current_date_iso: str,
+        form_type: str,
+        keywords: List[str],
+        raw_slots: Dict[str, Any],
+    ) -> None:
+        """분류 결과와 원본 슬롯(날짜 변환 전)을 저장합니다.
+
+        exact 계층에는 항상 저장하고, semantic 계층에는 조회 시 계산한 임베딩(또는 조회 후
+        도착한 임베딩)이 있고 semantic 적중이 아니었던 경우에만 추가합니다.
+        """
+        if not self.enabled:
+            return
+        normalized = normalize_input(text)
+        value = CachedResponse(form_type, list(keywords), copy.deepcopy(raw_slots))
+        self._exact.put(self._exact_key(normalized, current_date_iso), value)
+        self._stats.stores += 1
+
+        embedding = lookup.embedding or self._late_embedding(lookup)
+        if embedding is not None and lookup.hit is None:
+            self._semantic.add(
+                embedding, CachedResponse(form_type, list(keywords), None)
+            )
+
+    def clear(self) -> None:
+        self._exact.clear()
+        self._semantic.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = (
+            self._stats.exact_hits + self._stats.semantic_hits + self._stats.misses
+        )
+        return {
+            "enabled": self.enabled,
+            "exact_entries": len(self._exact),
+            "semantic_entries": len(self._semantic),
+            "exact_hits": self._stats.exact_hits,
+            "semantic_hits": self._stats.semantic_hits,
+            "misses": self._stats.misses,
+            "hit_rate": (
+                (self._stats.exact_hits + self._stats.semantic_hits) / lookups
+                if lookups
+                else 0.0
+            ),
+            "stores": self._stats.stores,
+            "evictions": self._stats.evictions,
+            "expirations": self._stats.expirations,
+            "embedding_errors": self._stats.embedding_errors,
+            "embedding_timeouts": self._stats.embedding_timeouts,
+        }
+
+
+def _build_default_embed_fn() -> Optional[Callable[[str], Any]]:
+    if not SEMANTIC_CACHE_ENABLED:
+        return None
+    try:
+        from langchain_openai import OpenAIEmbeddings
+
+        embeddings = OpenAIEmbeddings()
+    except Exception as e:
+        logger.warning(f"Semantic cache disabled (embeddings unavailable): {e}")
+        return None
+    return embeddings.aembed_query
+
+
+# service.py에서 사용하는 프로세스 전역 캐시
+response_cache = FormResponseCache(embed_fn=_build_default_embed_fn())
@@ -15,25 +15,45 @@ from ..utils import (
 )
 
 
+# 예: "3일", "2 주", "1개월", "5일간", "일주일 동안", "반나절" 등
+DURATION_PATTERN = re.compile(
+    r"(\d+\s*(일|주|달|개월|년|시간)(간|동안)?)|(하루|이틀|사흘|나흘|닷새|엿새|일주일|한달|반나절)"
+)
+TIME_HHMM_PATTERN = re.compile(r"^\d{1,2}:\d{2}$")
+
+
 def is_duration_string(text: str) -> bool:
     """문자열이 기간(duration) 표현일 가능성이 높은지 확인합니다."""
     if not isinstance(text, str):
         return False
-    # 예: "3일", "2 주", "1개월", "5일간", "일주일 동안", "반나절" 등
-    duration_pattern = re.compile(
-        r"(\d+\s*(일|주|달|개월|년|시간)(간|동안)?)|(하루|이틀|사흘|나흘|닷새|엿새|일주일|한달|반나절)"
-    )
-    return duration_pattern.search(text) is not None
+    return DURATION_PATTERN.search(text) is not None
 
 
 class DateConverter:
     """날짜 관련 변환을 전담하는 클래스"""
 
     # 날짜 관련 슬롯 키 이름에 포함될 수 있는 문자열 리스트
-    DATE_SLOT_KEY_SUBSTRINGS = ["date", "일자", "기간"]
+    DATE_SLOT_KEY_SUBSTRINGS = ("date", "일자", "기간")
+    # convert_date_fields: 동적으로 날짜 필드를 찾기 위한 키워드 / 제외할 키워드
+    DATE_KEY_SUBSTRINGS = ("date", "day", "ymd")
+    EXCLUDE_KEY_SUBSTRINGS = ("duration", "period", "days", "length")
+    # convert_general_date_slots에서 건너뛰는 주요 날짜 필드 (convert_date_fields에서 처리됨)
+    MAIN_DATE_FIELDS = frozenset(
+        {
+            "start_date",
+            "end_date",
+            "application_date",
+            "work_date",
+            "departure_date",
+            "request_date",
+            "draft_date",
+            "statement_date",
+            "usage_date",
+        }
+    )
 
     def __init__(self):
-        # 이 클래스는 특정 폼 설정에 의존하지 않으므로, 생성자에 특별한 설정이 필요 없습니다.
+        # 이 클래스는 상태가 없으므로 프로세서 간에 하나의 인스턴스를 공유합니다.
         pass
 
     def convert_date_fields(
@@ -42,19 +62,14 @@ class DateConverter:
         """일반 날짜 필드들을 YYYY-MM-DD 형식으로 변환.
         'start_date'와 'end_date'는 컨텍스트를 유지하며 함께 파싱될 수 있습니다.
         """
-        # 동적으로 날짜 필드를 찾기 위한 키워드
-        DATE_KEY_SUBSTRINGS = ["date", "day", "ymd"]
-        # 날짜 필드에서 제외할 키워드
-        EXCLUDE_KEY_SUBSTRINGS = ["duration", "period", "days", "length"]
-
         # 1. 처리할 모든 날짜 필드를 동적으로 식별
         date_fields_to_process = [
             key
             for key, value in slots.items()
             if isinstance(value, str)
-            and any(substr in key.lower() for substr in DATE_KEY_SUBSTRINGS)
+            and any(substr in key.lower() for substr in self.DATE_KEY_SUBSTRINGS)
             and not any(
-                ex_substr in key.lower() for ex_substr in EXCLUDE_KEY_SUBSTRINGS
+                ex_substr in key.lower() for ex_substr in self.EXCLUDE_KEY_SUBSTRINGS
             )
         ]
 
@@ -154,10 +169,8 @@ class DateConverter:
 
     def convert_datetime_to_time(self, datetime_str: str, current_date_iso: str) -> str:
         """datetime을 time으로 변환 (야근시간 등)"""
-        import re
-
         # 이미 HH:MM 형식인지 확인
-        if re.match(r"^\d{1,2}:\d{2}$", datetime_str):
+        if TIME_HHMM_PATTERN.match(datetime_str):
             logging.debug(f"Time '{datetime_str}' is already in HH:MM format")
             return datetime_str
 
@@ -180,21 +193,9 @@ class DateConverter:
         self, slots: Dict[str, Any], current_date_iso: str
     ) -> Dict[str, Any]:
         """일반적인 날짜 슬롯들을 키 이름 기준으로 자동 감지하여 변환"""
-        main_date_fields = [
-            "start_date",
-            "end_date",
-            "application_date",
-            "work_date",
-            "departure_date",
-            "request_date",
-            "draft_date",
-            "statement_date",
-            "usage_date",
-        ]
-
         for key, value in list(slots.items()):
             # 이미 처리된 주요 필드는 건너뜀
-            if key in main_date_fields:
+            if key in self.MAIN_DATE_FIELDS:
                 continue
 
             # 날짜 관련 키워드가 포함된 필드만 처리
@@ -24,6 +24,31 @@ class FieldConverter:
         "오후반반차": "quarter_day_afternoon",
     }
 
+    # 개인 경비 분류 키워드 → HTML select value (위에서부터 먼저 매칭되는 분류 사용)
+    EXPENSE_CATEGORY_KEYWORDS = (
+        # 교통비 관련
+        (
+            "traffic",
+            ("교통", "택시", "지하철", "버스", "주차", "ktx", "항공", "유류", "톨게이트"),
+        ),
+        # 숙박비 관련
+        ("accommodation", ("숙박", "호텔", "펜션", "게스트하우스", "모텔")),
+        # 식대 관련
+        (
+            "meals",
+            ("식", "음식", "커피", "음료", "카페", "식당", "회식", "점심", "저녁", "간식"),
+        ),
+        # 접대비 관련
+        (
+            "entertainment",
+            ("접대", "거래처", "고객", "클라이언트", "비즈니스", "미팅", "상담"),
+        ),
+        # 교육훈련비 관련
+        ("education", ("교육", "세미나", "연수", "강의", "자격증", "도서")),
+        # 소모품비 관련
+        ("supplies", ("사무용품", "문구", "소모품", "it용품", "프린터", "복사")),
+    )
+
     def convert_leave_type(self, leave_type_text: str) -> str:
         """휴가 종류 텍스트를 HTML <select>의 value로 변환"""
         if leave_type_text in self.LEAVE_TYPE_TEXT_TO_VALUE_MAP:
@@ -60,77 +85,9 @@ class FieldConverter:
             return ""
 
         category_lower = category_text.lower()
-
-        # 교통비 관련
-        if any(
-            keyword in category_lower
-            for keyword in [
-                "교통",
-                "택시",
-                "지하철",
-                "버스",
-                "주차",
-                "ktx",
-                "항공",
-                "유류",
-                "톨게이트",
-            ]
-        ):
-            return "traffic"
-
-        # 숙박비 관련
-        if any(
-            keyword in category_lower
-            for keyword in ["숙박", "호텔", "펜션", "게스트하우스", "모텔"]
-        ):
-            return "accommodation"
-
-        # 식대 관련
-        if any(
-            keyword in category_lower
-            for keyword in [
-                "식",
-                "음식",
-                "커피",
-                "음료",
-                "카페",
-                "식당",
-                "회식",
-                "점심",
-                "저녁",
-                "간식",
-            ]
-        ):
-            return "meals"
-
-        # 접대비 관련
-        if any(
-            keyword in category_lower
-            for keyword in [
-                "접대",
-                "거래처",
-                "고객",
-                "클라이언트",
-                "비즈니스",
-                "미팅",
-                "상담",
-            ]
-        ):
-            return "entertainment"
-
-        # 교육훈련비 관련
-        if any(
-            keyword in category_lower
-            for keyword in ["교육", "세미나", "연수", "강의", "자격증", "도서"]
-        ):
-            return "education"
-
-        # 소모품비 관련
-        if any(
-            keyword in category_lower
-            for keyword in ["사무용품", "문구", "소모품", "it용품", "프린터", "복사"]
-        ):
-            return "supplies"
+        for value, keywords in self.EXPENSE_CATEGORY_KEYWORDS:
+            if any(keyword in category_lower for keyword in keywords):
+                return value
 
         # 기타
         return "other"
@@ -9,6 +9,16 @@ LangChain을 사용하여 LLM(Large Language Model) 체인을 구성하고 관
     분류된 특정 양식에 필요한 구체적인 정보(슬롯 값)들을 사용자 입력에서
     추출합니다. 각 양식마다 별도의 슬롯 추출 체인이 동적으로 생성됩니다.
     (`_create_slot_extraction_chain`, `SLOT_EXTRACTOR_CHAINS`)
+3.  **분류+추출 단일 호출 (Fused Mode, 선택)**:
+    양식 종류와 해당 양식의 슬롯을 한 번의 구조화 출력 호출로 함께 추출합니다.
+    출력 스키마는 `FORM_CONFIGS`의 Pydantic 모델들에 대한 discriminated union입니다.
+    (`get_fused_classify_extract_chain`, `FusedFormOutput`)
+
+체인 레지스트리 (`chain_registry`):
+    모든 체인은 모듈 로드 시 한 번 생성되어 `ChainRegistry`에 캐싱됩니다.
+    요청마다 프롬프트 파일을 읽거나 파서 포맷 지침을 다시 만들지 않으며,
+    프롬프트 파일의 mtime이 바뀌면 해당 체인만 다시 생성합니다(hot reload).
+    생성/재생성 소요 시간은 `chain_registry.stats()`로 확인할 수 있습니다.
 
 주요 구성 요소:
 -   `ChatOpenAI`: OpenAI의 LLM 모델 (예: "gpt-4o")을 사용합니다.
@@ -21,8 +31,14 @@ LangChain을 사용하여 LLM(Large Language Model) 체인을 구성하고 관
 """
 
 import os
+import threading
+import time
 from dotenv import load_dotenv
 import logging
+from typing import Any, Callable, Dict, Iterator, List, Literal, Mapping, Union
+
+from pydantic import Field as PydanticField, create_model
+from typing_extensions import Annotated
 
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import (
@@ -40,21 +56,205 @@ from .schema import FormClassifierOutput
 
 # form_configs.py에서 양식 설정과 관련된 정보들을 가져옴
 from .form_configs import FORM_CONFIGS, AVAILABLE_FORM_TYPES
+from .observability import llm_metrics_handler
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 기본 LLM 모델 (모든 체인에서 공유 가능)
-llm = ChatOpenAI(model="gpt-4o", temperature=0)
+# 기본 LLM 모델 (모든 체인에서 공유 가능). 호출별 지연 시간/토큰/비용은 콜백으로 기록
+llm = ChatOpenAI(model="gpt-4o", temperature=0, callbacks=[llm_metrics_handler])
 
 # PROMPT_BASE_DIR: 프롬프트 파일들이 위치한 기본 디렉토리 경로.
 # __file__은 현재 파일(llm.py)의 경로를 나타냅니다.
 PROMPT_BASE_DIR = os.path.join(os.path.dirname(__file__), "prompts")
 
+CLASSIFIER_PROMPT_FILENAME = "form_classifier_prompt.txt"  # 양식 분류기용 프롬프트 파일명
+FUSED_PROMPT_FILENAME = "fused_classify_extract_prompt.txt"  # fused 모드 프롬프트 파일명
+
+# 레지스트리 체인 이름 (슬롯 추출 체인은 양식명을 그대로 이름으로 사용)
+CLASSIFIER_CHAIN_NAME = "__form_classifier__"
+FUSED_CHAIN_NAME = "__fused_classify_extract__"
+
+# 프롬프트 파일 mtime 확인 최소 간격 (초). 0이면 매 조회마다 확인합니다.
+PROMPT_RELOAD_CHECK_INTERVAL = float(os.getenv("PROMPT_RELOAD_CHECK_INTERVAL", "1.0"))
+
+
+class ChainReloadError(RuntimeError):
+    """강제 재생성 중 일부 체인의 빌더가 실패함 (실패한 체인은 기존 체인을 유지)"""
+
+    def __init__(self, errors: Dict[str, str], timings: Dict[str, float]):
+        super().__init__(f"체인 재생성 실패: {', '.join(errors)}")
+        self.errors = errors
+        self.timings = timings
+
+
+class ChainRegistry:
+    """LCEL 체인을 한 번만 생성해 보관하고, 프롬프트 파일 변경 시 다시 생성하는 레지스트리
+
+    각 체인은 (이름, 프롬프트 파일명, 빌더 함수)로 등록됩니다. `get()`은 캐싱된 체인을
+    반환하며, 마지막 확인 후 `check_interval`초가 지났으면 프롬프트 파일의 mtime을 확인해
+    바뀐 경우에만 빌더를 다시 호출합니다. 재생성에 실패하면 기존 체인을 계속 사용합니다.
+    """
+
+    def __init__(self, prompt_dir: str, check_interval: float = 1.0):
+        self.prompt_dir = prompt_dir
+        self.check_interval = check_interval
+        self._builders: Dict[str, Callable[[], Any]] = {}
+        self._prompt_files: Dict[str, str] = {}
+        self._chains: Dict[str, Any] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._last_checked: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, prompt_filename: str, builder: Callable[[], Any]):
+        """체인 빌더를 등록합니다. 실제 생성은 `build_all()` 또는 첫 `get()` 시점에 합니다."""
+        self._builders[name] = builder
+        self._prompt_files[name] = prompt_filename
+        self._stats[name] = {
+            "prompt_file": prompt_filename,
+            "build_count": 0,
+            "build_ms": None,
+            "last_built_at": None,
+            "reload_count": 0,
+            "last_reload_ms": None,
+        }
+
+    def names(self) -> List[str]:
+        return list(self._builders.keys())
+
+    def _prompt_mtime(self, name: str) -> float:
+        try:
+            return os.path.getmtime(
+                os.path.join(self.prompt_dir, self._prompt_files[name])
+            )
+        except OSError:
+            return 0.0
+
+    def _build(self, name: str, is_reload: bool) -> Any:
+        mtime = self._prompt_mtime(name)
+        started = time.perf_counter()
+        # LLM 호출 지표(observability)를 체인별로 나눌 수 있도록 체인 이름을 메타데이터로 부여
+        chain = self._builders[name]().with_config(
+            metadata={"chain": name.strip("_")}
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self._chains[name] = chain
+        self._mtimes[name] = mtime
+        self._last_checked[name] = time.monotonic()
+        stats = self._stats[name]
+        stats["build_count"] += 1
+        stats["last_built_at"] = time.time()
+        if is_reload:
+            stats["reload_count"] += 1
+            stats["last_reload_ms"] = round(elapsed_ms, 3)
+            logger.info(f"체인 '{name}' 재생성 완료 ({elapsed_ms:.1f}ms)")
+        else:
+            stats["build_ms"] = round(elapsed_ms, 3)
+        return chain
+
+    def get(self, name: str) -> Any:
+        """캐싱된 체인을 반환합니다. 프롬프트 파일이 바뀌었으면 다시 생성합니다."""
+        chain = self._chains.get(name)
+        if chain is not None:
+            now = time.monotonic()
+            if now - self._last_checked.get(name, 0.0) < self.check_interval:
+                return chain
+            self._last_checked[name] = now
+            if self._prompt_mtime(name) == self._mtimes.get(name):
+                return chain
+
+        with self._lock:
+            # 다른 스레드가 이미 생성/재생성했는지 다시 확인
+            if name in self._chains and self._prompt_mtime(name) == self._mtimes.get(
+                name
+            ):
+                return self._chains[name]
+            if name not in self._builders:
+                raise KeyError(name)
+            is_reload = name in self._chains
+            try:
+                return self._build(name, is_reload=is_reload)
+            except Exception as e:
+                if not is_reload:
+                    raise
+                logger.error(
+                    f"체인 '{name}' 재생성 실패, 기존 체인을 계속 사용합니다: {e}"
+                )
+                return self._chains[name]
+
+    def reload(self, name: str = None) -> Dict[str, float]:
+        """지정한 체인(없으면 전체)을 강제로 다시 생성하고 체인별 소요 시간(ms)을 반환합니다.
+
+        등록되지 않은 이름이면 KeyError를 발생시킵니다. 빌더가 실패한 체인은 기존 체인을
+        계속 사용하며, 나머지 체인을 모두 처리한 뒤 ChainReloadError로 실패 내역을 알립니다.
+        """
+        if name and name not in self._builders:
+            raise KeyError(name)
+        targets = [name] if name else self.names()
+        timings = {}
+        errors = {}
+        with self._lock:
+            for target in targets:
+                try:
+                    self._build(target, is_reload=target in self._chains)
+                except Exception as e:
+                    logger.error(
+                        f"체인 '{target}' 재생성 실패, 기존 체인을 계속 사용합니다: {e}"
+                    )
+                    errors[target] = f"{type(e).__name__}: {e}"
+                    continue
+                timings[target] = self._stats[target]["last_reload_ms"] or self._stats[
+                    target
+                ]["build_ms"]
+        if errors:
+            raise ChainReloadError(errors, timings)
+        return timings
+
+    def build_all(self) -> float:
+        """등록된 모든 체인을 생성하고 전체 소요 시간(ms)을 반환합니다."""
+        started = time.perf_counter()
+        with self._lock:
+            for name in self.names():
+                if name not in self._chains:
+                    self._build(name, is_reload=False)
+        return (time.perf_counter() - started) * 1000
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+
+class _SlotExtractorChains(Mapping):
+    """양식명 -> 슬롯 추출 체인 조회를 레지스트리에 위임하는 읽기 전용 매핑"""
+
+    def __init__(self, registry: ChainRegistry, form_names: List[str]):
+        self._registry = registry
+        self._form_names = list(form_names)
+
+    def __getitem__(self, form_name: str):
+        if form_name not in self._form_names:
+            raise KeyError(form_name)
+        return self._registry.get(form_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._form_names)
+
+    def __len__(self) -> int:
+        return len(self._form_names)
+
+
+chain_registry = ChainRegistry(PROMPT_BASE_DIR, PROMPT_RELOAD_CHECK_INTERVAL)
+
 
 # --- 1단계: 양식 분류 체인 ---
 def get_form_classifier_chain():
+    """레지스트리에 캐싱된 양식 분류 체인을 반환합니다. (`_build_form_classifier_chain` 참고)"""
+    return chain_registry.get(CLASSIFIER_CHAIN_NAME)
+
+
+def _build_form_classifier_chain():
     """사용자 입력으로부터 양식 종류와 키워드를 추출하는 Langchain Expression Language (LCEL) 체인을 생성하여 반환합니다.
 
     이 체인은 다음 구성 요소로 이루어집니다:
@@ -69,10 +269,7 @@ def get_form_classifier_chain():
     """
     parser = PydanticOutputParser(pydantic_object=FormClassifierOutput)
 
-    classifier_prompt_filename = (
-        "form_classifier_prompt.txt"  # 양식 분류기용 프롬프트 파일명
-    )
-    classifier_prompt_path = os.path.join(PROMPT_BASE_DIR, classifier_prompt_filename)
+    classifier_prompt_path = os.path.join(PROMPT_BASE_DIR, CLASSIFIER_PROMPT_FILENAME)
 
     try:
         with open(classifier_prompt_path, "r", encoding="utf-8") as f:
@@ -162,19 +359,109 @@ def _create_slot_extraction_chain(
     return prompt | llm | parser
 
 
-# service.py에서 사용할 슬롯 추출 체인 맵 (동적 생성)
-SLOT_EXTRACTOR_CHAINS = {
-    form_name: _create_slot_extraction_chain(
-        form_name,  # 로깅을 위해 form_name 전달
-        config.prompt_template_path,  # 이제 파일명만 전달 -> prompt_template_path 로 수정
-        config.model,
+# service.py에서 사용할 슬롯 추출 체인 맵 (레지스트리에 위임)
+SLOT_EXTRACTOR_CHAINS = _SlotExtractorChains(chain_registry, list(FORM_CONFIGS.keys()))
+
+
+# --- 선택: 분류 + 슬롯 추출 단일 호출 (Fused Mode) ---
+def _build_fused_output_model():
+    """`FORM_CONFIGS`의 슬롯 모델마다 `form_type` Literal 판별자를 가진 래퍼 모델을 만들고,
+    이들의 discriminated union을 `result` 필드로 갖는 최상위 모델을 생성합니다.
+
+    예: {"result": {"form_type": "연차 신청서", "keywords": [...], "slots": {...AnnualLeaveSlots}}}
+    """
+    variants = []
+    for form_name, config in FORM_CONFIGS.items():
+        variants.append(
+            create_model(
+                f"Fused{config.model.__name__}",
+                form_type=(Literal[form_name], ...),
+                keywords=(
+                    List[str],
+                    PydanticField(default_factory=list, description="추출된 키워드 리스트"),
+                ),
+                slots=(
+                    config.model,
+                    PydanticField(
+                        default_factory=config.model,
+                        description=f"'{form_name}' 양식의 슬롯",
+                    ),
+                ),
+            )
+        )
+    return create_model(
+        "FusedFormOutput",
+        result=(
+            Annotated[Union[tuple(variants)], PydanticField(discriminator="form_type")],
+            ...,
+        ),
     )
-    for form_name, config in FORM_CONFIGS.items()
-}
+
+
+FusedFormOutput = _build_fused_output_model()
+
+
+def get_fused_classify_extract_chain():
+    """레지스트리에 캐싱된 fused 체인을 반환합니다. (`_build_fused_classify_extract_chain` 참고)"""
+    return chain_registry.get(FUSED_CHAIN_NAME)
+
+
+def _build_fused_classify_extract_chain():
+    """양식 분류와 슬롯 추출을 한 번의 LLM 호출로 수행하는 LCEL 체인을 반환합니다.
+
+    반환 값:
+        LCEL Chain: "input" 문자열을 받아 `FusedFormOutput` 객체를 반환하는 체인.
+        `result.form_type`, `result.keywords`, `result.slots`(해당 양식 Pydantic 모델)를 가집니다.
+        출력이 스키마에 맞지 않으면 `OutputParserException`이 발생하며,
+        호출 측(service.py)은 이 경우 기존 2단계 경로로 폴백합니다.
+    """
+    parser = PydanticOutputParser(pydantic_object=FusedFormOutput)
+
+    fused_prompt_path = os.path.join(PROMPT_BASE_DIR, FUSED_PROMPT_FILENAME)
+    try:
+        with open(fused_prompt_path, "r", encoding="utf-8") as f:
+            prompt_content_template = f.read()
+    except FileNotFoundError:
+        logger.error(f"Fused 모드 프롬프트 파일을 찾을 수 없습니다: {fused_prompt_path}")
+        raise
+
+    system_message_content_with_instructions = prompt_content_template.replace(
+        "{format_instructions}", parser.get_format_instructions()
+    ).replace("{available_forms}", ", ".join(AVAILABLE_FORM_TYPES))
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(content=system_message_content_with_instructions),
+            ("human", "{input}"),
+        ]
+    )
+
+    logger.info("분류+추출 단일 호출(fused) 체인이 성공적으로 생성되었습니다.")
+    return prompt | llm | parser
+
+
+# --- 체인 등록 및 초기 생성 (모듈 로드 시 1회) ---
+chain_registry.register(
+    CLASSIFIER_CHAIN_NAME, CLASSIFIER_PROMPT_FILENAME, _build_form_classifier_chain
+)
+for _form_name, _config in FORM_CONFIGS.items():
+    chain_registry.register(
+        _form_name,
+        _config.prompt_template_path,
+        lambda form_name=_form_name, config=_config: _create_slot_extraction_chain(
+            form_name, config.prompt_template_path, config.model
+        ),
+    )
+chain_registry.register(
+    FUSED_CHAIN_NAME, FUSED_PROMPT_FILENAME, _build_fused_classify_extract_chain
+)
+_initial_build_ms = chain_registry.build_all()
 logger.info(
-    f"총 {len(SLOT_EXTRACTOR_CHAINS)}개의 양식에 대한 슬롯 추출 체인이 생성되었습니다."
+    f"총 {len(chain_registry.names())}개의 체인(분류 1, 슬롯 추출 {len(SLOT_EXTRACTOR_CHAINS)}, fused 1)을 "
+    f"{_initial_build_ms:.1f}ms에 생성했습니다."
 )
 
+
 if __name__ == "__main__":
     # 이 모듈의 체인들을 테스트하기 위한 간단한 실행 블록입니다.
     # 실제 애플리케이션에서는 `service.py`를 통해 이러한 체인들이 호출됩니다.
@@ -0,0 +1,252 @@
+"""
+form_selector 요청 처리 계측 모듈 (단계별 소요 시간, LLM 토큰/비용, 페이로드 로그 샘플링)
+
+1.  **단계 span (`stage_span`)**:
+    cache / classify / fused / retrieve / extract / process / render / approval 단계의 소요 시간을
+    `form_selector_stage_seconds{stage, outcome}` 히스토그램에 기록합니다.
+    `start_request_trace()`로 시작한 요청 안에서는 단계별 소요 시간(ms)을 모아 두었다가
+    `log_request_trace()`가 요청당 한 줄의 JSON 로그로 남깁니다.
+2.  **LLM 호출 계측 (`LLMMetricsCallbackHandler`)**:
+    LangChain 콜백으로 호출별 지연 시간과 입력/출력 토큰 수, 추정 비용(USD)을
+    체인 이름(`chain` 메타데이터)과 모델별로 기록합니다. 단가는 `LLM_PRICING_PER_1M_TOKENS`를
+    따르며 `FORM_SELECTOR_LLM_PRICING`(JSON)으로 덮어쓸 수 있습니다.
+3.  **페이로드 로그 샘플링 (`log_payload`)**:
+    슬롯 딕셔너리/외부 API 응답처럼 큰 객체는 `FORM_SELECTOR_PAYLOAD_LOG_SAMPLE_RATE` 비율로만
+    로깅합니다. 샘플링되지 않은 요청은 객체를 문자열로 만들지 않습니다.
+
+모든 지표는 `/metrics`(Prometheus 텍스트 포맷)로 노출됩니다. 대시보드 쿼리 예:
+    - 단계별 p95: histogram_quantile(0.95, sum by (le, stage) (rate(form_selector_stage_seconds_bucket[5m])))
+    - 체인별 시간당 비용: sum by (chain) (increase(form_selector_llm_cost_usd_sum[1h]))
+    - 호출당 평균 입력 토큰: rate(form_selector_llm_tokens_sum{kind="input"}[5m])
+      / rate(form_selector_llm_tokens_count{kind="input"}[5m])
+"""
+
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
+
+logger = logging.getLogger(__name__)
+
+# 큰 페이로드(슬롯, 외부 API 요청/응답) 로깅 비율 (0이면 끔, 1이면 항상 로깅)
+PAYLOAD_LOG_SAMPLE_RATE = float(
+    os.getenv("FORM_SELECTOR_PAYLOAD_LOG_SAMPLE_RATE", "0.01")
+)
+
+# 모델별 1M 토큰당 단가 (USD, (입력, 출력))
+LLM_PRICING_PER_1M_TOKENS: Dict[str, Tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+}
+LLM_PRICING_PER_1M_TOKENS.update(
+    {
+        model: tuple(prices)
+        for model, prices in json.loads(
+            os.getenv("FORM_SELECTOR_LLM_PRICING", "{}")
+        ).items()
+    }
+)
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+STAGE_SECONDS = Histogram(
+    "form_selector_stage_seconds",
+    "form_selector 요청 처리 단계별 소요 시간",
+    ["stage", "outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+LLM_CALL_SECONDS = Histogram(
+    "form_selector_llm_call_seconds",
+    "LLM 호출 1회의 소요 시간",
+    ["chain", "model", "outcome"],
+    buckets=(0.25, 0.5, 1, 2, 4, 8, 15, 30, 60),
+)
+LLM_TOKENS = Histogram(
+    "form_selector_llm_tokens",
+    "LLM 호출 1회의 토큰 수 (kind=input/output)",
+    ["chain", "model", "kind"],
+    buckets=(50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000),
+)
+LLM_COST_USD = Histogram(
+    "form_selector_llm_cost_usd",
+    "LLM 호출 1회의 추정 비용 (USD)",
+    ["chain", "model"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+# 현재 요청의 단계별 소요 시간(ms). create_task/to_thread는 컨텍스트를 복사하므로
+# 같은 딕셔너리를 공유하며, run_in_executor는 copy_context().run으로 넘겨야 합니다.
+_request_trace: contextvars.ContextVar[Optional[Dict[str, float]]] = (
+    contextvars.ContextVar("form_selector_request_trace", default=None)
+)
+
+
+def observe_stage(stage: str, seconds: float, outcome: str = "ok") -> None:
+    """단계 소요 시간을 히스토그램과 현재 요청 trace에 기록합니다."""
+    STAGE_SECONDS.labels(stage, outcome).observe(seconds)
+    trace = _request_trace.get()
+    if trace is not None:
+        trace[stage] = round(seconds * 1000, 3)
+        if outcome != "ok":
+            trace[f"{stage}_outcome"] = outcome
+
+
+@contextmanager
+def stage_span(stage: str) -> Iterator[None]:
+    """`with` 블록의 소요 시간을 단계 `stage`로 기록합니다. 예외가 나면 outcome=error."""
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        observe_stage(stage, time.perf_counter() - started, outcome)
+
+
+def start_request_trace() -> Dict[str, float]:
+    """현재 컨텍스트에서 요청 trace를 시작하고 단계별 소요 시간 딕셔너리를 반환합니다."""
+    trace: Dict[str, float] = {}
+    _request_trace.set(trace)
+    return trace
+
+
+def log_request_trace(trace: Dict[str, float], started: float, **fields: Any) -> None:
+    """요청 trace를 한 줄의 JSON 로그로 남깁니다. (`started`는 time.perf_counter() 값)"""
+    record = {
+        **{key: value for key, value in fields.items() if value is not None},
+        "total_ms": round((time.perf_counter() - started) * 1000, 3),
+        "stages_ms": trace,
+    }
+    logger.info(f"form_selector trace {json.dumps(record, ensure_ascii=False)}")
+
+
+def log_payload(target: logging.Logger, label: str, payload: Any) -> None:
+    """큰 페이로드를 `PAYLOAD_LOG_SAMPLE_RATE` 비율로만 INFO 로깅합니다."""
+    if (
+        PAYLOAD_LOG_SAMPLE_RATE > 0
+        and random.random() < PAYLOAD_LOG_SAMPLE_RATE
+        and target.isEnabledFor(logging.INFO)
+    ):
+        target.info(f"{label}: {payload}")
+
+
+def estimate_cost_usd(model: str, input_tokens: int, output_tokens: int) -> float:
+    """단가표로 LLM 호출 비용을 추정합니다. 모르는 모델은 0."""
+    pricing = LLM_PRICING_PER_1M_TOKENS.get(model)
+    if pricing is None:
+        # 응답 모델명에 날짜 접미사가 붙는 경우 (예: gpt-4o-2024-08-06)
+        pricing = next(
+            (
+                prices
+                for name, prices in sorted(
+                    LLM_PRICING_PER_1M_TOKENS.items(), key=lambda item: -len(item[0])
+                )
+                if model.startswith(f"{name}-")
+            ),
+            (0.0, 0.0),
+        )
+    return (input_tokens * pricing[0] + output_tokens * pricing[1]) / 1_000_000
+
+
+def _token_usage(response: LLMResult) -> Tuple[int, int, Optional[str]]:
+    """LLM 응답에서 (입력 토큰, 출력 토큰, 응답 모델명)을 꺼냅니다."""
+    input_tokens = output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+    llm_output = response.llm_output or {}
+    if not input_tokens and not output_tokens:
+        token_usage = llm_output.get("token_usage") or {}
+        input_tokens = token_usage.get("prompt_tokens", 0)
+        output_tokens = token_usage.get("completion_tokens", 0)
+    return input_tokens, output_tokens, llm_output.get("model_name")
+
+
+class LLMMetricsCallbackHandler(BaseCallbackHandler):
+    """LLM 호출별 지연 시간/토큰/비용을 Prometheus 히스토그램에 기록하는 콜백
+
+    체인 이름은 실행 config의 `chain` 메타데이터(`ChainRegistry`가 부여)에서 가져오며,
+    메타데이터가 없는 호출(날짜 파싱 등)은 "other"로 기록합니다.
+    """
+
+    # 기록만 하므로 비동기 호출에서도 스레드 풀을 거치지 않고 바로 실행
+    run_inline = True
+
+    def __init__(self):
+        self._runs: Dict[UUID, Tuple[float, str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID, metadata: Optional[Dict[str, Any]], kwargs) -> None:
+        invocation_params = kwargs.get("invocation_params") or {}
+        model = (
+            invocation_params.get("model_name")
+            or invocation_params.get("model")
+            or "unknown"
+        )
+        chain = (metadata or {}).get("chain", "other")
+        with self._lock:
+            self._runs[run_id] = (time.perf_counter(), chain, model)
+
+    def _finish(self, run_id: UUID) -> Optional[Tuple[float, str, str]]:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return None
+        started, chain, model = run
+        return time.perf_counter() - started, chain, model
+
+    def on_chat_model_start(
+        self, serialized, messages, *, run_id: UUID, metadata=None, **kwargs
+    ) -> None:
+        self._start(run_id, metadata, kwargs)
+
+    def on_llm_start(
+        self, serialized, prompts, *, run_id: UUID, metadata=None, **kwargs
+    ) -> None:
+        self._start(run_id, metadata, kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        run = self._finish(run_id)
+        if run is None:
+            return
+        elapsed, chain, model = run
+        input_tokens, output_tokens, response_model = _token_usage(response)
+        LLM_CALL_SECONDS.labels(chain, model, "ok").observe(elapsed)
+        LLM_TOKENS.labels(chain, model, "input").observe(input_tokens)
+        LLM_TOKENS.labels(chain, model, "output").observe(output_tokens)
+        LLM_COST_USD.labels(chain, model).observe(
+            estimate_cost_usd(response_model or model, input_tokens, output_tokens)
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        run = self._finish(run_id)
+        if run is not None:
+            elapsed, chain, model = run
+            LLM_CALL_SECONDS.labels(chain, model, "error").observe(elapsed)
+
+
+llm_metrics_handler = LLMMetricsCallbackHandler()
+
+
+def render_metrics() -> bytes:
+    """Prometheus 텍스트 포맷으로 현재 지표를 반환합니다."""
+    return generate_latest()
@@ -0,0 +1,544 @@
+"""
+HTML 폼 데이터 → 결재 API Payload 선언적 매핑
+
+양식별 변환 규칙을 필드 경로/변환기/기본값으로 이루어진 스펙(`PayloadSpec`)으로 선언하고,
+모듈 로드 시 한 번 컴파일해 양식별 변환 함수(`(form_data) -> payload`)로 만듭니다.
+변환 경로는 하나뿐이며(예외 기반 fallback 없음), 지원하지 않는 양식은 ValueError입니다.
+
+스펙 구성 요소:
+- `Form(key, default, convert)`: 폼 최상위 필드 (`form_data.get(key, default)`)
+- `Item(key, default, convert)`: amountList 아이템 필드 (단일 행 양식에서는 폼 자체)
+- `FirstOf(spec, ...)`: 처음으로 값이 있는(truthy) 스펙, 모두 비면 마지막 값
+- `Const(value)`, `Json({...})` (JSON 문자열, ensure_ascii=False)
+- `DayRange`: start_date~end_date dayList (영업일/달력일)
+- `AmountRow`: 조건부 단일 amountList 행
+- `AmountRows`: 아이템 목록 필드 또는 구 형식(`<key>_1..N`) 필드에서 amountList 생성
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .business_calendar import business_day_strings
+from .form_configs import ENGLISH_TO_KOREAN_MAP
+from .processors.corporate_card_processor import CorporateCardProcessor
+
+Getter = Callable[[Dict[str, Any], Dict[str, Any]], Any]
+
+# json.dumps(..., ensure_ascii=False)는 호출마다 인코더를 새로 만들므로 하나를 재사용
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+# strptime("%Y-%m-%d")과 같이 0이 빠진 월/일("2025-6-3")도 허용
+_ISO_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+_APPROVER_KEYS = frozenset(("aprvPsId", "aprvDvTy", "ordr"))
+
+
+def int_or_zero(value: Any) -> int:
+    """숫자 문자열/정수만 int로, 그 외("15,000", "", None 등)는 0"""
+    return int(value) if str(value).isdigit() else 0
+
+
+# 휴가 종류(HTML select value) → API dvType
+LEAVE_DV_TYPES = {
+    "annual": "DAY",
+    "half_day_morning": "HALF_AM",
+    "half_day_afternoon": "HALF_PM",
+    "quarter_day_morning": "QUARTER_AM",
+    "quarter_day_afternoon": "QUARTER_PM",
+}
+
+
+def leave_dv_type(leave_type: Any) -> str:
+    return LEAVE_DV_TYPES.get(leave_type, "DAY")
+
+
+@dataclass(frozen=True)
+class Form:
+    key: str
+    default: Any = ""
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass(frozen=True)
+class Item:
+    key: str
+    default: Any = ""
+    convert: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass(frozen=True)
+class Const:
+    value: Any
+
+
+@dataclass(frozen=True)
+class FirstOf:
+    specs: Tuple["Spec", ...]
+
+    def __init__(self, *specs: "Spec"):
+        object.__setattr__(self, "specs", specs)
+
+
+@dataclass(frozen=True)
+class Json:
+    fields: Dict[str, "Spec"]
+
+
+Spec = Union[Form, Item, Const, FirstOf, Json]
+
+
+@dataclass(frozen=True)
+class DayRange:
+    """start_date~end_date(양끝 포함) dayList
+
+    business_days=True면 주말/공휴일 제외, single_day=True면 end_date 없이
+    start_date만 있을 때 그 하루를 넣습니다. 날짜 형식이 잘못되었거나 순서가
+    뒤바뀐 경우 빈 목록입니다.
+    """
+
+    dv_type: Spec
+    business_days: bool = False
+    single_day: bool = False
+
+
+@dataclass(frozen=True)
+class AmountRow:
+    """`when`의 폼 필드가 모두 값이 있을 때만 만드는 amountList 단일 행"""
+
+    row: Dict[str, Spec]
+    when: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class AmountRows:
+    """아이템 목록 → amountList
+
+    `list_field`가 리스트면 그 아이템을, 아니면 구 형식 `<key>_1`..`<key>_{flat_count}`
+    필드를 아이템으로 읽습니다. `required` 필드가 빈 아이템은 건너뜁니다.
+    구 형식의 행 구성이 다르면 `flat_row`로 따로 지정합니다.
+    """
+
+    row: Dict[str, Spec]
+    required: str
+    flat_count: int
+    list_field: Optional[str] = None
+    flat_row: Optional[Dict[str, Spec]] = None
+
+
+@dataclass(frozen=True)
+class PayloadSpec:
+    mst_pid: str
+    title: str
+    doc_cn: Spec
+    apd_info: Dict[str, Spec] = field(default_factory=dict)
+    drafter_id: str = "00009"
+    days: Optional[DayRange] = None
+    amounts: Optional[Union[AmountRow, AmountRows]] = None
+
+
+# --- 양식별 스펙 (키: FORM_CONFIGS의 한국어 양식명) --- #
+
+_EMPTY_JSON = Const(_encode_json({}))
+
+PAYLOAD_SPECS: Dict[str, PayloadSpec] = {
+    "연차 신청서": PayloadSpec(
+        mst_pid="1",
+        title="연차 사용 신청",
+        doc_cn=Form("reason", "개인 사유"),
+        days=DayRange(
+            dv_type=Form("leave_type", "annual", leave_dv_type),
+            business_days=True,
+            single_day=True,
+        ),
+    ),
+    "야근식대비용 신청서": PayloadSpec(
+        mst_pid="3",
+        title="야근 식대 신청",
+        drafter_id="",
+        doc_cn=Form("work_details", "야근 식대 신청"),
+        apd_info={
+            "work_location": Form("work_location"),
+            "overtime_time": Form("overtime_time"),
+            "bank_account_for_deposit": Form("bank_account_for_deposit"),
+        },
+        amounts=AmountRow(
+            row={
+                "useYmd": Form("work_date"),
+                "dvNm": Const("식대"),
+                "useRsn": Form("work_details"),
+                "qnty": Const(1),
+                "amt": Form("dinner_expense_amount", 0, int_or_zero),
+                "aditInfo": _EMPTY_JSON,
+            },
+            when=("work_date", "dinner_expense_amount"),
+        ),
+    ),
+    "교통비 신청서": PayloadSpec(
+        mst_pid="4",
+        title="교통비 신청",
+        doc_cn=Form("purpose", "교통비 신청"),
+        apd_info={"notes": Form("notes")},
+        amounts=AmountRow(
+            row={
+                "useYmd": Form("departure_date"),
+                "dvNm": Const("교통비"),
+                "useRsn": Form("purpose"),
+                "qnty": Const(1),
+                "amt": Form("total_amount", 0, int_or_zero),
+                "aditInfo": Json(
+                    {
+                        "origin": Form("origin"),
+                        "destination": Form("destination"),
+                        "transport_details": Form("transport_details"),
+                    }
+                ),
+            },
+            when=("departure_date", "total_amount"),
+        ),
+    ),
+    "파견 및 출장 보고서": PayloadSpec(
+        mst_pid="5",
+        title="파견/출장 보고서",
+        doc_cn=Form("purpose", "파견/출장 보고서"),
+        apd_info={
+            "destination": Form("destination"),
+            "period_days": Form("duration_days", 0, int_or_zero),
+            "accomplishments": Form("report_details"),
+            "challenges": Form("challenges"),
+            "next_actions": Form("next_actions"),
+        },
+        days=DayRange(dv_type=Const("DAY")),
+    ),
+    "비품/소모품 구입내역서": PayloadSpec(
+        mst_pid="6",
+        title="비품/소모품 구입내역서",
+        doc_cn=Form("purpose", "비품/소모품 구입내역서"),
+        apd_info={
+            "request_date": Form("request_date"),
+            "purpose": Form("purpose"),
+            "total_amount": Form("total_amount", 0),
+        },
+        amounts=AmountRows(
+            row={
+                "useYmd": Form("request_date"),
+                "dvNm": Item("item_name"),
+                "useRsn": Item("item_purpose"),
+                "qnty": Item("item_quantity", 0, int_or_zero),
+                "amt": Item("item_total_price", 0, int_or_zero),
+                "aditInfo": Json(
+                    {"unitPrice": Item("item_unit_price", 0, int_or_zero)}
+                ),
+            },
+            required="item_name",
+            list_field="items",
+            flat_count=6,
+        ),
+    ),
+    "구매 품의서": PayloadSpec(
+        mst_pid="7",
+        title="구매 품의서",
+        doc_cn=Form("purpose", "구매 품의서"),
+        apd_info={
+            "delivery_location": Form("delivery_location"),
+            "payment_terms": Form("payment_terms"),
+            "attached_files_description": Form("attached_files_description"),
+            "total_purchase_amount": Form("total_purchase_amount", 0),
+        },
+        amounts=AmountRows(
+            row={
+                "useYmd": FirstOf(Item("item_delivery_date", None), Form("draft_date")),
+                "dvNm": Item("item_name"),
+                "useRsn": Item("item_notes"),
+                "qnty": Item("item_quantity", 0, int_or_zero),
+                "amt": Item("item_total_price", 0, int_or_zero),
+                "aditInfo": Json(
+                    {
+                        "spec": Item("item_spec"),
+                        "unitPrice": Item("item_unit_price", 0),
+                        "supplier": Item("item_supplier"),
+                    }
+                ),
+            },
+            required="item_name",
+            list_field="items",
+            flat_count=3,
+        ),
+    ),
+    "개인 경비 사용 내역서": PayloadSpec(
+        mst_pid="8",
+        title="개인 경비 사용 신청",
+        doc_cn=Form("purpose", "개인 경비 사용 신청"),
+        apd_info={
+            "usage_status": Form("usage_status"),
+            "total_amount": Form("total_expense_amount", 0),
+        },
+        amounts=AmountRows(
+            row={
+                "useYmd": Item("expense_date"),
+                "dvNm": Item("expense_category", "기타"),
+                "useRsn": Item("expense_description"),
+                "qnty": Const(1),
+                "amt": Item("expense_amount", 0, int_or_zero),
+                "aditInfo": Json({"notes": Item("expense_notes")}),
+            },
+            required="expense_date",
+            flat_count=3,
+        ),
+    ),
+    "법인카드 지출내역서": PayloadSpec(
+        mst_pid="9",
+        title="법인카드 사용 내역서",
+        doc_cn=Form("purpose", "법인카드 사용 내역서"),
+        apd_info={
+            "card_number": Form("card_number"),
+            "card_user_name": Form("card_user_name"),
+            "statement_date": Form("statement_date"),
+            "total_amount": Form("total_usage_amount", 0),
+        },
+        amounts=AmountRows(
+            row={
+                "useYmd": Item("usage_date"),
+                "dvNm": Item(
+                    "usage_category", "기타", CorporateCardProcessor.convert_category
+                ),
+                "useRsn": Item("usage_description"),
+                "qnty": Const(1),
+                "amt": Item("usage_amount", 0, int_or_zero),
+                "aditInfo": Json({"notes": Item("usage_notes")}),
+            },
+            required="usage_date",
+            list_field="card_usage_items",
+            flat_count=6,
+            # 구 형식은 카테고리를 그대로 쓰고 상점명을 사용 사유로 넣습니다.
+            flat_row={
+                "useYmd": Item("usage_date"),
+                "dvNm": Item("usage_category", "기타"),
+                "useRsn": Item("merchant_name"),
+                "qnty": Const(1),
+                "amt": Item("usage_amount", 0, int_or_zero),
+                "aditInfo": Json({"notes": Item("usage_notes")}),
+            },
+        ),
+    ),
+}
+
+# 예전 legacy 변환기 키 → 한국어 양식명 (english_id는 ENGLISH_TO_KOREAN_MAP으로 조회)
+LEGACY_FORM_TYPE_ALIASES = {
+    "personal_expense": "개인 경비 사용 내역서",
+    "inventory_purchase": "비품/소모품 구입내역서",
+    "purchase_approval": "구매 품의서",
+    "corporate_card": "법인카드 지출내역서",
+    "dispatch_report": "파견 및 출장 보고서",
+}
+
+
+# --- 스펙 컴파일 --- #
+
+
+def _compile_value(spec: Spec) -> Getter:
+    """스펙 하나를 `(form, item) -> 값` 함수로 컴파일합니다."""
+    if isinstance(spec, (Form, Item)):
+        key, default, convert = spec.key, spec.default, spec.convert
+        if isinstance(spec, Form):
+            if convert is None:
+                return lambda form, item: form.get(key, default)
+            return lambda form, item: convert(form.get(key, default))
+        if convert is None:
+            return lambda form, item: item.get(key, default)
+        return lambda form, item: convert(item.get(key, default))
+    if isinstance(spec, Const):
+        value = spec.value
+        return lambda form, item: value
+    if isinstance(spec, FirstOf):
+        getters = [_compile_value(s) for s in spec.specs]
+
+        def first_of(form, item):
+            for getter in getters:
+                value = getter(form, item)
+                if value:
+                    return value
+            return value
+
+        return first_of
+    if isinstance(spec, Json):
+        fields = _compile_fields(spec.fields)
+        return lambda form, item: _encode_json(
+            {name: getter(form, item) for name, getter in fields}
+        )
+    raise TypeError(f"알 수 없는 매핑 스펙입니다: {spec!r}")
+
+
+def _compile_fields(fields: Dict[str, Spec]) -> List[Tuple[str, Getter]]:
+    return [(name, _compile_value(spec)) for name, spec in fields.items()]
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    match = _ISO_DATE.fullmatch(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+def _compile_days(spec: Optional[DayRange]):
+    if spec is None:
+        return lambda form: []
+    dv_type_of = _compile_value(spec.dv_type)
+
+    def day_list(form):
+        start_date = form.get("start_date", "")
+        end_date = form.get("end_date", "")
+        if not start_date:
+            return []
+        dv_type = dv_type_of(form, form)
+        if not end_date:
+            return (
+                [{"reqYmd": start_date, "dvType": dv_type}] if spec.single_day else []
+            )
+        start, end = _parse_date(start_date), _parse_date(end_date)
+        if start is None or end is None:
+            return []
+        if spec.business_days:
+            days = business_day_strings(start, end)
+        else:
+            days = [
+                (start + timedelta(days=i)).isoformat()
+                for i in range((end - start).days + 1)
+            ]
+        return [{"reqYmd": day, "dvType": dv_type} for day in days]
+
+    return day_list
+
+
+def _compile_amounts(spec: Optional[Union[AmountRow, AmountRows]]):
+    if spec is None:
+        return lambda form: []
+
+    row = _compile_fields(spec.row)
+    if isinstance(spec, AmountRow):
+        when = spec.when
+
+        def single_row(form):
+            if not all(form.get(key) for key in when):
+                return []
+            return [{name: getter(form, form) for name, getter in row}]
+
+        return single_row
+
+    flat_row = _compile_fields(spec.flat_row) if spec.flat_row else row
+    item_keys = {
+        s.key
+        for fields in (spec.row, spec.flat_row or {})
+        for s in _item_specs(fields.values())
+    }
+    flat_keys = [
+        [(key, f"{key}_{i}") for key in item_keys]
+        for i in range(1, spec.flat_count + 1)
+    ]
+    required, list_field = spec.required, spec.list_field
+
+    def rows(form):
+        items = form.get(list_field) if list_field else None
+        if isinstance(items, list):
+            return [
+                {name: getter(form, item) for name, getter in row}
+                for item in items
+                if item.get(required)
+            ]
+        result = []
+        for keys in flat_keys:
+            item = {key: form[flat] for key, flat in keys if flat in form}
+            if item.get(required):
+                result.append({name: getter(form, item) for name, getter in flat_row})
+        return result
+
+    return rows
+
+
+def _item_specs(specs):
+    for spec in specs:
+        if isinstance(spec, Item):
+            yield spec
+        elif isinstance(spec, FirstOf):
+            yield from _item_specs(spec.specs)
+        elif isinstance(spec, Json):
+            yield from _item_specs(spec.fields.values())
+
+
+def line_list(approvers: Optional[List[Any]]) -> List[Dict[str, Any]]:
+    """결재자 목록(dict 또는 ApproverDetail) → lineList"""
+    lines = []
+    for approver in approvers or ():
+        if isinstance(approver, dict):
+            missing = _APPROVER_KEYS - approver.keys()
+            if missing:
+                raise ValueError(
+                    f"결재자 정보에 필수 필드가 없습니다: {', '.join(sorted(missing))}"
+                )
+            lines.append(
+                {
+                    "aprvPslId": approver["aprvPsId"],
+                    "aprvDvTy": approver["aprvDvTy"],
+                    "ordr": int(approver["ordr"]),
+                }
+            )
+            continue
+        lines.append(
+            {
+                "aprvPslId": approver.aprvPsId,
+                "aprvDvTy": approver.aprvDvTy,
+                "ordr": int(approver.ordr),
+            }
+        )
+    return lines
+
+
+def compile_spec(spec: PayloadSpec) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """PayloadSpec을 `(form_data) -> payload` 변환 함수로 컴파일합니다."""
+    mst_pid, title, drafter_id = spec.mst_pid, spec.title, spec.drafter_id
+    doc_cn = _compile_value(spec.doc_cn)
+    apd_info = _compile_value(Json(spec.apd_info))
+    day_list = _compile_days(spec.days)
+    amount_list = _compile_amounts(spec.amounts)
+
+    def convert(form_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "mstPid": mst_pid,
+            "aprvNm": form_data.get("title", title),
+            "drafterId": form_data.get("drafterId", drafter_id),
+            "docCn": doc_cn(form_data, form_data),
+            "apdInfo": apd_info(form_data, form_data),
+            "lineList": line_list(form_data.get("approvers")),
+            "dayList": day_list(form_data),
+            "amountList": amount_list(form_data),
+        }
+
+    return convert
+
+
+PAYLOAD_CONVERTERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    form_name: compile_spec(spec) for form_name, spec in PAYLOAD_SPECS.items()
+}
+
+
+def resolve_form_name(form_type: str) -> Optional[str]:
+    """한국어 양식명/english_id/legacy 키를 한국어 양식명으로 바꿉니다. (미지원 시 None)"""
+    if form_type in PAYLOAD_CONVERTERS:
+        return form_type
+    form_name = ENGLISH_TO_KOREAN_MAP.get(form_type) or LEGACY_FORM_TYPE_ALIASES.get(
+        form_type
+    )
+    return form_name if form_name in PAYLOAD_CONVERTERS else None
+
+
+def convert_payload(form_type: str, form_data: Dict[str, Any]) -> Dict[str, Any]:
+    """폼 데이터를 API Payload로 변환합니다. (지원하지 않는 양식이면 ValueError)"""
+    form_name = resolve_form_name(form_type)
+    if form_name is None:
+        raise ValueError(f"지원하지 않는 양식 타입입니다: {form_type}")
+    return PAYLOAD_CONVERTERS[form_name](form_data)
@@ -5,13 +5,13 @@
 """
 
 import logging
-import json
 from typing import Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import re
 
 from .base_processor import BaseFormProcessor
 from ..utils import parse_duration_to_days  # 새로운 유틸리티 함수 임포트
+from ..business_calendar import count_business_days, end_date_for
 
 
 class AnnualLeaveProcessor(BaseFormProcessor):
@@ -50,7 +50,7 @@ class AnnualLeaveProcessor(BaseFormProcessor):
             for slot_name in duration_source_slots:
                 source_value = slots.get(slot_name)
                 if isinstance(source_value, str):
-                    days = parse_duration_to_days(source_value)
+                    days = parse_duration_to_days(source_value, business_days=True)
                     if days is not None:
                         parsed_days = days
                         slots["leave_days"] = parsed_days
@@ -62,7 +62,7 @@ class AnnualLeaveProcessor(BaseFormProcessor):
                             slots["end_date"] = None
                         break  # 첫 번째로 찾은 기간 정보를 사용
 
-        # 2. 시작일과 기간(leave_days)으로 종료일 계산
+        # 2. 시작일과 기간(leave_days)으로 종료일 계산 (주말/공휴일 제외)
         start_date_str = slots.get("start_date")
         leave_days = slots.get("leave_days")
         end_date_str = slots.get("end_date")
@@ -76,12 +76,9 @@ class AnnualLeaveProcessor(BaseFormProcessor):
             try:
                 # leave_days가 "3"과 같이 문자열일 수 있으므로 float으로 변환
                 days_to_add = float(leave_days)
-                # '3일간'은 시작일 포함 3일이므로 (3 - 1)일을 더해야 함
+                # '3일간'은 시작일 포함 3영업일
                 # 반차(0.5) 등 1일 미만은 날짜를 더하지 않음
-                delta = days_to_add - 1 if days_to_add >= 1 else 0
-
-                start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-                end_date = start_date + timedelta(days=int(delta))
+                end_date = end_date_for(start_date_str, days_to_add)
                 slots["end_date"] = end_date.isoformat()
                 logging.info(
                     f"Calculated end_date: {slots['end_date']} from start_date: {start_date_str} and leave_days: {leave_days}"
@@ -91,7 +88,7 @@ class AnnualLeaveProcessor(BaseFormProcessor):
                     f"Could not calculate end_date from start_date='{start_date_str}' and leave_days='{leave_days}'. Error: {e}"
                 )
 
-        # 3. 시작일과 종료일이 있는데 연차일수가 없으면 역으로 계산
+        # 3. 시작일과 종료일이 있는데 연차일수가 없으면 역으로 계산 (영업일 수)
         start_date_str = slots.get("start_date")
         end_date_str = slots.get("end_date")
         leave_days = slots.get("leave_days")
@@ -108,7 +105,7 @@ class AnnualLeaveProcessor(BaseFormProcessor):
                 end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
 
                 if end_date >= start_date:
-                    calculated_days = (end_date - start_date).days + 1
+                    calculated_days = count_business_days(start_date, end_date)
                     slots["leave_days"] = float(calculated_days)
                     logging.info(
                         f"Calculated leave_days: {slots['leave_days']} from start_date: {start_date_str} and end_date: {end_date_str}"
@@ -129,93 +126,3 @@ class AnnualLeaveProcessor(BaseFormProcessor):
         """
         logging.debug("AnnualLeaveProcessor: No item dates to convert")
         return slots
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """연차 신청서 폼 데이터를 API Payload로 변환 (Legacy 형식과 동일)"""
-        logger.info("AnnualLeaveProcessor: Converting form data to API payload")
-
-        # 기존 Legacy API 형식과 동일한 구조 사용
-        payload = {
-            "mstPid": "1",  # API 명세에 맞게 string 형태로 수정
-            "aprvNm": form_data.get("title", "연차 사용 신청"),
-            "drafterId": form_data.get("drafterId", "00009"),
-            "docCn": form_data.get("reason", "개인 사유"),
-            "apdInfo": json.dumps({}, ensure_ascii=False),
-            "lineList": [],
-            "dayList": [],
-            "amountList": [],
-        }
-
-        # dayList 구성 (연차 날짜 정보) - 날짜 범위 전체 생성
-        start_date = form_data.get("start_date", "")
-        end_date = form_data.get("end_date", "")
-        leave_type = form_data.get("leave_type", "annual")
-
-        # 휴가 종류를 API dvType으로 변환
-        dv_type_map = {
-            "annual": "DAY",
-            "half_day_morning": "HALF_AM",
-            "half_day_afternoon": "HALF_PM",
-            "quarter_day_morning": "QUARTER_AM",
-            "quarter_day_afternoon": "QUARTER_PM",
-        }
-
-        if start_date and end_date:
-            try:
-                # 날짜 문자열을 datetime 객체로 변환
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-
-                logging.info(
-                    f"[연차 신청서] dayList 생성 시작: {start_date} ~ {end_date}"
-                )
-
-                if start_dt <= end_dt:
-                    current_date = start_dt
-                    while current_date <= end_dt:
-                        payload["dayList"].append(
-                            {
-                                "reqYmd": current_date.isoformat(),  # YYYY-MM-DD 형식
-                                "dvType": dv_type_map.get(leave_type, "DAY"),
-                            }
-                        )
-                        current_date += timedelta(days=1)
-
-                    logging.info(
-                        f"[연차 신청서] dayList 생성 완료: {len(payload['dayList'])}개 날짜"
-                    )
-                else:
-                    logging.warning(
-                        f"[연차 신청서] 잘못된 날짜 순서: start_date({start_date}) > end_date({end_date})"
-                    )
-
-            except ValueError as e:
-                logging.error(
-                    f"[연차 신청서] 날짜 파싱 오류: {e}, start_date={start_date}, end_date={end_date}"
-                )
-            except Exception as e:
-                logging.error(f"[연차 신청서] dayList 생성 중 예외 발생: {e}")
-        elif start_date:
-            # end_date가 없고 start_date만 있는 경우 (당일 휴가)
-            payload["dayList"].append(
-                {"reqYmd": start_date, "dvType": dv_type_map.get(leave_type, "DAY")}
-            )
-            logging.info(f"[연차 신청서] 당일 휴가 dayList 생성: {start_date}")
-        else:
-            logging.warning(
-                f"[연차 신청서] 시작일이 누락되어 dayList를 생성할 수 없습니다."
-            )
-
-        # 결재라인 정보 추가 (Legacy와 동일하게 aprvPslId 사용)
-        if "approvers" in form_data and form_data["approvers"]:
-            for approver in form_data["approvers"]:
-                payload["lineList"].append(
-                    {
-                        "aprvPslId": approver.aprvPsId,  # Legacy 형식: aprvPslId
-                        "aprvDvTy": approver.aprvDvTy,
-                        "ordr": int(approver.ordr),
-                    }
-                )
-
-        logging.info("AnnualLeaveProcessor: API payload conversion completed")
-        return payload
@@ -6,15 +6,25 @@
 
 import logging
 import json
-import re
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
 from ..converters import DateConverter, ItemConverter, FieldConverter
+from .template_renderer import get_render_plan
+
+# 변환기는 상태가 없으므로 모든 프로세서가 한 인스턴스씩을 공유합니다.
+_DATE_CONVERTER = DateConverter()
+_ITEM_CONVERTER = ItemConverter()
+_FIELD_CONVERTER = FieldConverter()
 
 
 class BaseFormProcessor(ABC):
-    """양식 처리를 위한 기본 클래스"""
+    """양식 처리를 위한 기본 클래스
+
+    프로세서는 요청 간 상태를 갖지 않아야 합니다. `ProcessorFactory`가 양식별로 한 번만
+    생성해 여러 요청(스레드)에서 공유하므로, 처리 중 값은 인스턴스 속성이 아닌 지역 변수나
+    슬롯 딕셔너리에만 저장합니다.
+    """
 
     def __init__(self, form_config: Optional[Dict[str, Any]] = None):
         """
@@ -22,9 +32,9 @@ class BaseFormProcessor(ABC):
             form_config: 양식별 설정 정보
         """
         self.form_config = form_config or {}
-        self.date_converter = DateConverter()
-        self.item_converter = ItemConverter()
-        self.field_converter = FieldConverter()
+        self.date_converter = _DATE_CONVERTER
+        self.item_converter = _ITEM_CONVERTER
+        self.field_converter = _FIELD_CONVERTER
 
     def process_slots(
         self, slots_dict: Dict[str, Any], current_date_iso: str
@@ -106,33 +116,19 @@ class BaseFormProcessor(ABC):
     def fill_template(
         self, template: str, slots: Dict[str, Any], current_date_iso: str
     ) -> str:
-        """HTML 템플릿에 슬롯 값 채우기"""
-
-        # 백슬래시 이스케이프 처리
-        processed_slots = self.field_converter.escape_backslashes_for_regex(slots)
-
-        # JSON 문자열 생성 (아이템 리스트용)
-        items_json_str = self.generate_items_json(slots)
-
-        # 플레이스홀더 치환
-        def replacer(match):
-            key_in_template = match.group(1)
-
-            if key_in_template == "items_json":
-                return items_json_str
+        """HTML 템플릿에 슬롯 값 채우기
 
-            if key_in_template == "today":
-                return current_date_iso
-
-            value_to_return = processed_slots.get(key_in_template, "")
+        템플릿별로 캐싱된 렌더 플랜을 사용하므로 요청마다 정규식 스캔을 하지 않습니다.
+        """
+        plan = get_render_plan(template)
 
-            if isinstance(value_to_return, str):
-                return value_to_return
-            else:
-                return str(value_to_return)
+        overrides = {"today": current_date_iso}
+        # JSON 문자열 생성 (아이템 리스트용) - 템플릿에 items_json이 있을 때만
+        if plan.uses("items_json"):
+            overrides["items_json"] = self.generate_items_json(slots)
 
-        filled_template = re.sub(r"{(\w+)}", replacer, template)
-        logging.info(f"Template filled successfully by {self.__class__.__name__}")
+        filled_template = plan.render(slots, overrides)
+        logging.debug(f"Template filled successfully by {self.__class__.__name__}")
 
         return filled_template
 
@@ -170,11 +166,6 @@ class BaseFormProcessor(ABC):
         """아이템 내 날짜 변환 - 양식별 구현"""
         pass
 
-    @abstractmethod
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """HTML 폼 데이터를 API 페이로드로 변환 - 양식별 구현"""
-        pass
-
 
 class DefaultFormProcessor(BaseFormProcessor):
     """기본 양식 처리기 (특별한 처리가 필요 없는 양식용)"""
@@ -192,7 +183,3 @@ class DefaultFormProcessor(BaseFormProcessor):
         self, slots: Dict[str, Any], current_date_iso: str
     ) -> Dict[str, Any]:
         return slots
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """기본 API 페이로드 변환 (특별한 처리가 필요 없는 양식용)"""
-        return form_data
@@ -2,8 +2,6 @@
 
 from typing import Dict, Any, List
 from .base_processor import BaseFormProcessor
-import logging
-import json
 
 
 class CorporateCardProcessor(BaseFormProcessor):
@@ -143,7 +141,8 @@ class CorporateCardProcessor(BaseFormProcessor):
 
         return result
 
-    def convert_category(self, category: str) -> str:
+    @classmethod
+    def convert_category(cls, category: str) -> str:
         """카테고리 매핑: 한국어나 자연어를 영어 카테고리로 변환"""
         if not category:
             return "other"
@@ -151,11 +150,11 @@ class CorporateCardProcessor(BaseFormProcessor):
         category_lower = category.lower().strip()
 
         # 직접 매핑
-        if category_lower in self.CATEGORY_MAPPING:
-            return self.CATEGORY_MAPPING[category_lower]
+        if category_lower in cls.CATEGORY_MAPPING:
+            return cls.CATEGORY_MAPPING[category_lower]
 
         # 부분 문자열 매칭
-        for key, value in self.CATEGORY_MAPPING.items():
+        for key, value in cls.CATEGORY_MAPPING.items():
             if key in category_lower or category_lower in key:
                 return value
 
@@ -184,89 +183,3 @@ class CorporateCardProcessor(BaseFormProcessor):
             processed["statement_date"] = ""
 
         return processed
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """법인카드 지출내역서 폼 데이터를 API Payload로 변환"""
-        logging.info("CorporateCardProcessor: Converting form data to API payload")
-
-        payload = {
-            "mstPid": "9",
-            "aprvNm": form_data.get("title", "법인카드 사용 내역서"),
-            "drafterId": form_data.get("drafterId", "00009"),
-            "docCn": form_data.get("purpose", "법인카드 사용 내역서"),
-            "apdInfo": json.dumps(
-                {
-                    "card_number": form_data.get("card_number", ""),
-                    "card_user_name": form_data.get("card_user_name", ""),
-                    "statement_date": form_data.get("statement_date", ""),
-                    "total_amount": form_data.get("total_usage_amount", 0),
-                },
-                ensure_ascii=False,
-            ),
-            "lineList": [],
-            "dayList": [],
-            "amountList": [],
-        }
-
-        # amountList 구성 (카드 사용 내역)
-        if "card_usage_items" in form_data and isinstance(
-            form_data["card_usage_items"], list
-        ):
-            for item in form_data["card_usage_items"]:
-                usage_date = item.get("usage_date")
-                if not usage_date:
-                    continue
-
-                usage_amount = item.get("usage_amount", 0)
-
-                # 카테고리 매핑 적용
-                raw_category = item.get("usage_category", "기타")
-                mapped_category = self.convert_category(raw_category)
-
-                adit_info = {"notes": item.get("usage_notes", "")}
-
-                payload["amountList"].append(
-                    {
-                        "useYmd": usage_date,
-                        "dvNm": mapped_category,
-                        "useRsn": item.get("usage_description", ""),  # 상점명
-                        "qnty": 1,
-                        "amt": int(usage_amount) if str(usage_amount).isdigit() else 0,
-                        "aditInfo": json.dumps(adit_info, ensure_ascii=False),
-                    }
-                )
-        else:
-            # Fallback for older format
-            for i in range(1, 7):  # 최대 6개 항목
-                usage_date = form_data.get(f"usage_date_{i}")
-                if not usage_date:
-                    continue
-
-                usage_amount = form_data.get(f"usage_amount_{i}", 0)
-
-                adit_info = {"notes": form_data.get(f"usage_notes_{i}", "")}
-
-                payload["amountList"].append(
-                    {
-                        "useYmd": usage_date,
-                        "dvNm": form_data.get(f"usage_category_{i}", "기타"),
-                        "useRsn": form_data.get(f"merchant_name_{i}", ""),
-                        "qnty": 1,
-                        "amt": int(usage_amount) if str(usage_amount).isdigit() else 0,
-                        "aditInfo": json.dumps(adit_info, ensure_ascii=False),
-                    }
-                )
-
-        # 결재라인 정보 추가
-        if "approvers" in form_data and form_data["approvers"]:
-            for approver in form_data["approvers"]:
-                payload["lineList"].append(
-                    {
-                        "aprvPslId": approver.aprvPsId,
-                        "aprvDvTy": approver.aprvDvTy,
-                        "ordr": int(approver.ordr),
-                    }
-                )
-
-        logging.info("CorporateCardProcessor: API payload conversion completed")
-        return payload
@@ -10,7 +10,6 @@
 from typing import Dict, Any
 from .base_processor import BaseFormProcessor
 import logging
-import json
 
 
 class DinnerExpenseProcessor(BaseFormProcessor):
@@ -187,57 +186,3 @@ class DinnerExpenseProcessor(BaseFormProcessor):
             pass  # 그대로 유지
 
         return f"{hour:02d}:{minute:02d}"
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """야근 식대 신청서 폼 데이터를 API Payload로 변환 (New Spec)"""
-        logging.info("DinnerExpenseProcessor: Converting form data to API payload")
-
-        payload = {
-            "mstPid": "3",
-            "aprvNm": form_data.get("title", "야근 식대 신청"),
-            "drafterId": form_data.get("drafterId", ""),
-            "docCn": form_data.get("work_details", "야근 식대 신청"),
-            "apdInfo": json.dumps(
-                {
-                    "work_location": form_data.get("work_location", ""),
-                    "overtime_time": form_data.get("overtime_time", ""),
-                    "bank_account_for_deposit": form_data.get(
-                        "bank_account_for_deposit", ""
-                    ),
-                },
-                ensure_ascii=False,
-            ),
-            "lineList": [],
-            "dayList": [],
-            "amountList": [],
-        }
-
-        # amountList 구성 (비용 정산 정보)
-        work_date = form_data.get("work_date", "")
-        dinner_amount = form_data.get("dinner_expense_amount", 0)
-
-        if work_date and dinner_amount:
-            payload["amountList"].append(
-                {
-                    "useYmd": work_date,
-                    "dvNm": "식대",
-                    "useRsn": form_data.get("work_details", ""),
-                    "qnty": 1,
-                    "amt": int(dinner_amount) if str(dinner_amount).isdigit() else 0,
-                    "aditInfo": json.dumps({}, ensure_ascii=False),
-                }
-            )
-
-        # 결재라인 정보 추가 (service.py에서 이미 ApproverDetail 객체로 변환됨)
-        if "approvers" in form_data and form_data["approvers"]:
-            for approver in form_data["approvers"]:
-                payload["lineList"].append(
-                    {
-                        "aprvPslId": approver.aprvPsId,
-                        "aprvDvTy": approver.aprvDvTy,
-                        "ordr": int(approver.ordr),
-                    }
-                )
-
-        logging.info("DinnerExpenseProcessor: API payload conversion completed")
-        return payload
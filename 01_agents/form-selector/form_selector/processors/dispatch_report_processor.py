@@ -1,11 +1,9 @@
 """파견 및 출장보고서 전용 프로세서"""
 
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, Optional
 from .base_processor import BaseFormProcessor
-import json
-import logging
 
 
 class DispatchReportProcessor(BaseFormProcessor):
@@ -131,65 +129,3 @@ class DispatchReportProcessor(BaseFormProcessor):
                 processed[field] = default_value
 
         return processed
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """파견/출장 보고서 폼 데이터를 API Payload로 변환"""
-        logging.info("DispatchReportProcessor: Converting form data to API payload")
-
-        payload = {
-            "mstPid": "5",  # API 명세에 맞게 string 형태로 수정
-            "aprvNm": form_data.get("title", "파견/출장 보고서"),
-            "drafterId": form_data.get("drafterId", "00009"),
-            "docCn": form_data.get("purpose", "파견/출장 보고서"),
-            "apdInfo": json.dumps(
-                {
-                    "destination": form_data.get("destination", ""),
-                    "period_days": int(form_data.get("duration_days", 0)),
-                    "accomplishments": form_data.get("report_details", ""),
-                    "challenges": form_data.get("challenges", ""),
-                    "next_actions": form_data.get("next_actions", ""),
-                },
-                ensure_ascii=False,
-            ),
-            "lineList": [],
-            "dayList": [],
-            "amountList": [],
-        }
-
-        # dayList 구성 (파견/출장 날짜 정보)
-        start_date = form_data.get("start_date", "")
-        end_date = form_data.get("end_date", "")
-
-        if start_date and end_date:
-            try:
-                from datetime import datetime, timedelta
-
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-
-                if start_dt <= end_dt:
-                    current_date = start_dt
-                    while current_date <= end_dt:
-                        payload["dayList"].append(
-                            {
-                                "reqYmd": current_date.isoformat(),
-                                "dvType": "DAY",
-                            }
-                        )
-                        current_date += timedelta(days=1)
-            except ValueError as e:
-                logging.error(f"파견/출장 보고서 날짜 파싱 오류: {e}")
-
-        # 결재라인 정보 추가
-        if "approvers" in form_data and form_data["approvers"]:
-            for approver in form_data["approvers"]:
-                payload["lineList"].append(
-                    {
-                        "aprvPslId": approver.aprvPsId,
-                        "aprvDvTy": approver.aprvDvTy,
-                        "ordr": int(approver.ordr),
-                    }
-                )
-
-        logging.info("DispatchReportProcessor: API payload conversion completed")
-        return payload
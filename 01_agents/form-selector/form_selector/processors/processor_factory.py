@@ -1,12 +1,15 @@
 """
 프로세서 팩토리 클래스
 
-양식 타입에 따라 적절한 프로세서를 생성하고 반환합니다.
+양식 타입에 따라 적절한 프로세서를 반환합니다. 프로세서는 상태가 없으므로 양식별로
+한 번만 생성해 프로세스 전체에서 공유합니다.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 
+from ..form_configs import ENGLISH_TO_KOREAN_MAP, FORM_CONFIGS
 from .base_processor import BaseFormProcessor, DefaultFormProcessor
 from .annual_leave_processor import AnnualLeaveProcessor
 from .personal_expense_processor import PersonalExpenseProcessor
@@ -19,33 +22,41 @@ from .dispatch_report_processor import DispatchReportProcessor
 
 
 class ProcessorFactory:
-    """양식별 프로세서를 생성하는 팩토리 클래스"""
+    """양식별 프로세서를 생성/캐싱하는 팩토리 클래스"""
 
-    # 양식 타입별 프로세서 매핑
+    # 양식 타입(FORM_CONFIGS의 한국어 양식명)별 프로세서 매핑.
+    # 영어 식별자(english_id)는 ENGLISH_TO_KOREAN_MAP으로 한국어 양식명에 맞춰 조회합니다.
     PROCESSOR_MAP = {
         "연차 신청서": AnnualLeaveProcessor,
-        "annual_leave": AnnualLeaveProcessor,
-        "개인 경비 사용내역서": PersonalExpenseProcessor,
-        "personal_expense_report": PersonalExpenseProcessor,
+        "개인 경비 사용 내역서": PersonalExpenseProcessor,
         "야근식대비용 신청서": DinnerExpenseProcessor,
-        "dinner_expense": DinnerExpenseProcessor,
         "교통비 신청서": TransportationExpenseProcessor,
-        "transportation_expense": TransportationExpenseProcessor,
         "비품/소모품 구입내역서": InventoryPurchaseProcessor,
-        "inventory_purchase_report": InventoryPurchaseProcessor,
         "구매 품의서": PurchaseApprovalProcessor,
-        "purchase_approval_form": PurchaseApprovalProcessor,
         "법인카드 지출내역서": CorporateCardProcessor,
-        "corporate_card_statement": CorporateCardProcessor,
         "파견 및 출장 보고서": DispatchReportProcessor,
-        "dispatch_businesstrip_report": DispatchReportProcessor,
     }
 
+    # 양식명 → 공유 프로세서 인스턴스
+    _instances: Dict[str, BaseFormProcessor] = {}
+    _DEFAULT_KEY = "__default__"
+    _lock = threading.Lock()
+
+    @classmethod
+    def resolve_form_type(cls, form_type: str) -> str:
+        """영어 식별자가 들어오면 한국어 양식명으로 바꿉니다."""
+        if form_type in cls.PROCESSOR_MAP:
+            return form_type
+        return ENGLISH_TO_KOREAN_MAP.get(form_type, form_type)
+
     @classmethod
     def create_processor(
         cls, form_type: str, form_config: Optional[Dict[str, Any]] = None
     ) -> BaseFormProcessor:
-        """양식 타입에 맞는 프로세서 생성
+        """양식 타입에 맞는 프로세서 반환
+
+        `form_config`가 없으면 양식별로 캐싱된 공유 인스턴스를 반환하고,
+        있으면 해당 설정으로 새 인스턴스를 생성합니다.
 
         Args:
             form_type: 양식 타입 (한국어 또는 영어)
@@ -54,7 +65,16 @@ class ProcessorFactory:
         Returns:
             BaseFormProcessor: 해당 양식의 전용 프로세서 또는 기본 프로세서
         """
-        processor_class = cls.PROCESSOR_MAP.get(form_type, DefaultFormProcessor)
+        resolved = cls.resolve_form_type(form_type)
+        if resolved not in cls.PROCESSOR_MAP:
+            # 알 수 없는 양식은 하나의 기본 프로세서 인스턴스를 공유 (캐시 키가 무한히 늘지 않도록)
+            resolved = cls._DEFAULT_KEY
+        if form_config is None:
+            processor = cls._instances.get(resolved)
+            if processor is not None:
+                return processor
+
+        processor_class = cls.PROCESSOR_MAP.get(resolved, DefaultFormProcessor)
 
         if processor_class != DefaultFormProcessor:
             logging.info(
@@ -65,7 +85,12 @@ class ProcessorFactory:
                 f"Creating default processor for unsupported form_type: {form_type}"
             )
 
-        return processor_class(form_config)
+        if form_config is not None:
+            return processor_class(form_config)
+
+        with cls._lock:
+            # 다른 스레드가 먼저 생성했으면 그 인스턴스를 사용
+            return cls._instances.setdefault(resolved, processor_class())
 
     @classmethod
     def get_supported_forms(cls) -> list:
@@ -80,16 +105,45 @@ class ProcessorFactory:
             form_type: 양식 타입
             processor_class: 프로세서 클래스
         """
-        cls.PROCESSOR_MAP[form_type] = processor_class
+        resolved = cls.resolve_form_type(form_type)
+        with cls._lock:
+            cls.PROCESSOR_MAP[resolved] = processor_class
+            cls._instances.pop(resolved, None)
         logging.info(
             f"Registered new processor: {form_type} -> {processor_class.__name__}"
         )
 
+    @classmethod
+    def warm_up(cls) -> Dict[str, str]:
+        """FORM_CONFIGS의 모든 양식에 대해 공유 프로세서를 미리 생성하고 self-test를 수행합니다.
+
+        각 양식명과 english_id가 전용 프로세서로 해석되는지 확인하며,
+        하나라도 기본 프로세서로 떨어지면 RuntimeError를 발생시킵니다.
+
+        Returns:
+            Dict[str, str]: 양식명 → 프로세서 클래스명
+        """
+        resolved: Dict[str, str] = {}
+        failures: List[str] = []
+        for form_name, config in FORM_CONFIGS.items():
+            for name in (form_name, config.english_id):
+                processor = cls.create_processor(name)
+                if isinstance(processor, DefaultFormProcessor):
+                    failures.append(name)
+            resolved[form_name] = cls.create_processor(form_name).__class__.__name__
+
+        if failures:
+            raise RuntimeError(
+                f"Processor self-test failed, no processor registered for: {failures}"
+            )
+        logging.info(f"Processor self-test passed for {len(resolved)} forms")
+        return resolved
+
 
 def get_form_processor(
     form_type: str, form_config: Optional[Dict[str, Any]] = None
 ) -> BaseFormProcessor:
-    """편의 함수: 양식 프로세서 생성
+    """편의 함수: 양식 프로세서 조회 (form_config가 없으면 공유 인스턴스)
 
     Args:
         form_type: 양식 타입
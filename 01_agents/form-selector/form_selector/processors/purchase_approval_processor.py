@@ -2,8 +2,6 @@
 
 from typing import Dict, Any, List
 from .base_processor import BaseFormProcessor
-import logging
-import json
 
 
 class PurchaseApprovalProcessor(BaseFormProcessor):
@@ -101,109 +99,3 @@ class PurchaseApprovalProcessor(BaseFormProcessor):
             processed["special_notes"] = ""
 
         return processed
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """구매 품의서 폼 데이터를 API Payload로 변환"""
-        logging.info("PurchaseApprovalProcessor: Converting form data to API payload")
-
-        payload = {
-            "mstPid": "7",
-            "aprvNm": form_data.get("title", "구매 품의서"),
-            "drafterId": form_data.get("drafterId", "00009"),
-            "docCn": form_data.get("purpose", "구매 품의서"),
-            "apdInfo": json.dumps(
-                {
-                    "delivery_location": form_data.get("delivery_location", ""),
-                    "payment_terms": form_data.get("payment_terms", ""),
-                    "attached_files_description": form_data.get(
-                        "attached_files_description", ""
-                    ),
-                    "total_purchase_amount": form_data.get("total_purchase_amount", 0),
-                },
-                ensure_ascii=False,
-            ),
-            "lineList": [],
-            "dayList": [],
-            "amountList": [],
-        }
-
-        # amountList 구성 (구매 품목)
-        if "items" in form_data and isinstance(form_data["items"], list):
-            for item in form_data["items"]:
-                item_name = item.get("item_name")
-                if not item_name:
-                    continue
-
-                item_total_price = item.get("item_total_price", 0)
-                item_quantity = item.get("item_quantity", 0)
-
-                adit_info = {
-                    "spec": item.get("item_spec", ""),
-                    "unitPrice": item.get("item_unit_price", 0),
-                    "supplier": item.get("item_supplier", ""),
-                }
-
-                payload["amountList"].append(
-                    {
-                        "useYmd": item.get("item_delivery_date")
-                        or form_data.get("draft_date", ""),
-                        "dvNm": item_name,
-                        "useRsn": item.get("item_notes", ""),
-                        "qnty": (
-                            int(item_quantity) if str(item_quantity).isdigit() else 0
-                        ),
-                        "amt": (
-                            int(item_total_price)
-                            if str(item_total_price).isdigit()
-                            else 0
-                        ),
-                        "aditInfo": json.dumps(adit_info, ensure_ascii=False),
-                    }
-                )
-        else:
-            # Fallback for older format
-            for i in range(1, 4):  # 최대 3개 항목
-                item_name = form_data.get(f"item_name_{i}")
-                if not item_name:
-                    continue
-
-                item_total_price = form_data.get(f"item_total_price_{i}", 0)
-                item_quantity = form_data.get(f"item_quantity_{i}", 0)
-
-                adit_info = {
-                    "spec": form_data.get(f"item_spec_{i}", ""),
-                    "unitPrice": form_data.get(f"item_unit_price_{i}", 0),
-                    "supplier": form_data.get(f"item_supplier_{i}", ""),
-                }
-
-                payload["amountList"].append(
-                    {
-                        "useYmd": form_data.get(f"item_delivery_date_{i}")
-                        or form_data.get("draft_date", ""),
-                        "dvNm": item_name,
-                        "useRsn": form_data.get(f"item_notes_{i}", ""),
-                        "qnty": (
-                            int(item_quantity) if str(item_quantity).isdigit() else 0
-                        ),
-                        "amt": (
-                            int(item_total_price)
-                            if str(item_total_price).isdigit()
-                            else 0
-                        ),
-                        "aditInfo": json.dumps(adit_info, ensure_ascii=False),
-                    }
-                )
-
-        # 결재라인 정보 추가
-        if "approvers" in form_data and form_data["approvers"]:
-            for approver in form_data["approvers"]:
-                payload["lineList"].append(
-                    {
-                        "aprvPslId": approver.aprvPsId,
-                        "aprvDvTy": approver.aprvDvTy,
-                        "ordr": int(approver.ordr),
-                    }
-                )
-
-        logging.info("PurchaseApprovalProcessor: API payload conversion completed")
-        return payload
@@ -0,0 +1,63 @@
+"""
+사전 컴파일된 HTML 템플릿 렌더러
+
+템플릿을 `{placeholder}` 기준으로 한 번만 분해해 "렌더 플랜"(리터럴 조각 + 플레이스홀더
+위치 목록)으로 만들어 캐싱합니다. 요청마다 정규식으로 HTML 전체를 훑는 대신, 플랜의
+조각 리스트를 복사해 플레이스홀더 자리만 채운 뒤 한 번의 `join`으로 결과를 만듭니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# 기존 `re.sub(r"{(\w+)}", ...)`와 동일한 플레이스홀더 규칙
+PLACEHOLDER_PATTERN = re.compile(r"{(\w+)}")
+
+# 템플릿 수(양식 수)보다 넉넉하게 잡되, 템플릿 핫 리로드로 생기는 이전 버전은 밀려나도록 제한
+RENDER_PLAN_CACHE_SIZE = 64
+
+
+class TemplateRenderPlan:
+    """템플릿 한 개에 대한 컴파일 결과
+
+    `segments`는 [리터럴, 플레이스홀더, 리터럴, ...] 순서이며 홀수 인덱스가 플레이스홀더
+    자리입니다. 렌더링 시 홀수 인덱스만 값으로 바꿉니다.
+    """
+
+    __slots__ = ("segments", "placeholders", "placeholder_names")
+
+    def __init__(self, template: str):
+        self.segments: List[str] = PLACEHOLDER_PATTERN.split(template)
+        self.placeholders: Tuple[Tuple[int, str], ...] = tuple(
+            (index, self.segments[index]) for index in range(1, len(self.segments), 2)
+        )
+        self.placeholder_names = frozenset(name for _, name in self.placeholders)
+
+    def uses(self, name: str) -> bool:
+        return name in self.placeholder_names
+
+    def render(
+        self,
+        slots: Dict[str, Any],
+        overrides: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """플레이스홀더를 채운 HTML을 반환합니다.
+
+        Args:
+            slots: 슬롯 값 (문자열이 아니면 `str()`로 변환, 없으면 빈 문자열)
+            overrides: 슬롯보다 우선하는 값 (예: today, items_json)
+        """
+        parts = self.segments.copy()
+        for index, name in self.placeholders:
+            if overrides and name in overrides:
+                value = overrides[name]
+            else:
+                value = slots.get(name, "")
+            parts[index] = value if isinstance(value, str) else str(value)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=RENDER_PLAN_CACHE_SIZE)
+def get_render_plan(template: str) -> TemplateRenderPlan:
+    """템플릿 문자열별 렌더 플랜을 반환합니다. (양식당 템플릿이 하나이므로 사실상 양식별 캐시)"""
+    return TemplateRenderPlan(template)
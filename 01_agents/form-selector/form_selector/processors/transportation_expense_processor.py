@@ -11,7 +11,6 @@
 from typing import Dict, Any
 from .base_processor import BaseFormProcessor
 import logging
-import json
 
 
 class TransportationExpenseProcessor(BaseFormProcessor):
@@ -129,55 +128,3 @@ class TransportationExpenseProcessor(BaseFormProcessor):
                 return 0
 
         return 0
-
-    def convert_to_api_payload(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
-        """교통비 신청서 폼 데이터를 API Payload로 변환 (New Spec)"""
-
-        payload = {
-            "mstPid": "4",
-            "aprvNm": form_data.get("title", "교통비 신청"),
-            "drafterId": form_data.get("drafterId", "00009"),
-            "docCn": form_data.get("purpose", "교통비 신청"),
-            "apdInfo": json.dumps(
-                {
-                    "notes": form_data.get("notes", ""),
-                },
-                ensure_ascii=False,
-            ),
-            "lineList": [],
-            "dayList": [],
-            "amountList": [],
-        }
-
-        # amountList 구성 (비용 정산 정보)
-        departure_date = form_data.get("departure_date", "")
-        total_amount = form_data.get("total_amount", 0)
-
-        if departure_date and total_amount:
-            adit_info = {
-                "origin": form_data.get("origin", ""),
-                "destination": form_data.get("destination", ""),
-                "transport_details": form_data.get("transport_details", ""),
-            }
-            payload["amountList"].append(
-                {
-                    "useYmd": departure_date,
-                    "dvNm": "교통비",
-                    "useRsn": form_data.get("purpose", ""),
-                    "qnty": 1,
-                    "amt": int(total_amount) if str(total_amount).isdigit() else 0,
-                    "aditInfo": json.dumps(adit_info, ensure_ascii=False),
-                }
-            )
-
-        # 결재라인 정보 추가 (service.py에서 이미 ApproverDetail 객체로 변환됨)
-        if "approvers" in form_data and form_data["approvers"]:
-            for approver in form_data["approvers"]:
-                payload["lineList"].append(
-                    {
-                        "aprvPslId": approver.aprvPsId,
-                        "aprvDvTy": approver.aprvDvTy,
-                        "ordr": int(approver.ordr),
-                    }
-                )
-        return payload
@@ -1,108 +1,408 @@
 """
 RAG (Retrieval Augmented Generation) 모듈.
-VectorStore를 사용하여 HTML 템플릿을 검색합니다.
+
+HTML 템플릿은 `TemplateStore`가 시작 시 `TEMPLATE_FILENAME_MAP` 기준으로 한 번 읽어
+form_type → HTML 딕셔너리로 보관합니다. `retrieve_template`은 이 딕셔너리를 O(1)로 조회하며,
+등록되지 않았거나 표기가 약간 다른 form_type일 때만 VectorStore(FAISS) 검색으로 폴백합니다.
+
+- 템플릿 파일이 수정되면 mtime 확인(`check_interval`초 간격)으로 자동으로 다시 읽습니다.
+- 모듈 import 시에는 파일/네트워크 I/O를 하지 않습니다. 앱 startup 훅에서
+  `await initialize()`를 호출하면 템플릿을 cold-start 예산 안에서 읽고, FAISS 인덱스는
+  백그라운드 스레드에서 로드/빌드하며 진행률을 `vector_store_status()`로 보고합니다.
+- 인덱스가 준비되기 전이거나 빌드에 실패한 경우에도 템플릿 조회는 정상 동작하며,
+  폴백 검색만 건너뜁니다.
 """
 
+import asyncio
+import difflib
 import os
-from typing import List, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 from langchain_community.vectorstores import FAISS
 from langchain_openai import OpenAIEmbeddings
 from langchain_core.documents import Document
 
 # --- VectorStore 설정 --- #
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 TEMPLATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../templates"))
 FAISS_INDEX_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "../faiss_index")
 )
+TEMPLATE_RELOAD_CHECK_INTERVAL = float(
+    os.getenv("FORM_SELECTOR_TEMPLATE_RELOAD_INTERVAL", "1.0")
+)
+VECTOR_FALLBACK_ENABLED = (
+    os.getenv("FORM_SELECTOR_VECTOR_FALLBACK_ENABLED", "true").lower() == "true"
+)
+FUZZY_MATCH_CUTOFF = float(os.getenv("FORM_SELECTOR_TEMPLATE_FUZZY_CUTOFF", "0.85"))
+# startup 훅이 템플릿 로드를 기다리는 최대 시간(초). 초과해도 기동은 계속됩니다.
+COLD_START_BUDGET_SECONDS = float(
+    os.getenv("FORM_SELECTOR_COLD_START_BUDGET_SECONDS", "2.0")
+)
+# startup 시 FAISS 인덱스를 백그라운드로 미리 준비할지 여부
+VECTOR_STORE_PREWARM = (
+    os.getenv("FORM_SELECTOR_VECTOR_STORE_PREWARM", "true").lower() == "true"
+)
+# 인덱스 빌드 실패 후 폴백 요청에서 재시도하기까지의 대기 시간(초)
+VECTOR_STORE_RETRY_SECONDS = float(
+    os.getenv("FORM_SELECTOR_VECTOR_STORE_RETRY_SECONDS", "60")
+)
+VECTOR_STORE_BUILD_BATCH_SIZE = 2
 
-# form_configs.py에서 FORM_CONFIGS를 가져와서 form_type 매핑에 사용
-from .form_configs import FORM_CONFIGS
+# form_configs.py에서 form_type 매핑을 가져와서 사용
+from .form_configs import ENGLISH_TO_KOREAN_MAP, TEMPLATE_FILENAME_MAP
 
-# 전역 VectorStore 인스턴스 (앱 로드 시 초기화 권장)
+# 전역 VectorStore 인스턴스 (startup 백그라운드 작업 또는 첫 폴백 검색 시 초기화)
 vector_store: Optional[FAISS] = None
+_vector_store_lock = threading.Lock()
+# 인덱스 준비 상태: pending → loading/building → ready | failed (또는 disabled)
+_vector_store_state: Dict[str, Any] = {
+    "status": "pending",
+    "source": None,
+    "documents_total": 0,
+    "documents_done": 0,
+    "started_at": None,
+    "elapsed_ms": None,
+    "error": None,
+    "failed_at": None,
+}
+_vector_store_task: Optional[asyncio.Task] = None
+
+
+def _compact(text: str) -> str:
+    """공백/밑줄을 제거하고 소문자로 바꿔 표기 차이를 흡수합니다. (예: "사용 내역서" ↔ "사용내역서")"""
+    return "".join(text.split()).replace("_", "").lower()
+
+
+class TemplateReloadError(RuntimeError):
+    """강제 재로드 중 일부 템플릿을 읽지 못함 (해당 템플릿은 마지막으로 읽은 내용을 유지)"""
+
+    def __init__(self, errors: Dict[str, str], elapsed_ms: float):
+        super().__init__(f"템플릿 재로드 실패: {', '.join(errors)}")
+        self.errors = errors
+        self.elapsed_ms = elapsed_ms
+
+
+class TemplateStore:
+    """form_type → HTML 템플릿을 메모리에 보관하고 파일 변경 시 다시 읽는 저장소"""
+
+    def __init__(
+        self,
+        base_dir: str,
+        filename_map: Dict[str, str],
+        check_interval: float = 1.0,
+    ):
+        self.base_dir = base_dir
+        self.filename_map = dict(filename_map)
+        self.check_interval = check_interval
+        self._templates: Dict[str, str] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._last_checked: Dict[str, float] = {}
+        # 표기가 다른 form_type(공백 차이, english_id)을 정식 양식명으로 바꾸는 별칭 테이블
+        self._aliases: Dict[str, str] = {}
+        for form_type in self.filename_map:
+            self._aliases[_compact(form_type)] = form_type
+        for english_id, form_type in ENGLISH_TO_KOREAN_MAP.items():
+            if form_type in self.filename_map:
+                self._aliases[_compact(english_id)] = form_type
+        self._stats = {
+            "hits": 0,
+            "alias_hits": 0,
+            "fuzzy_hits": 0,
+            "vector_fallbacks": 0,
+            "misses": 0,
+            "reload_count": 0,
+            "load_ms": None,
+        }
+        # 마지막 읽기에 실패한 form_type -> 오류 메시지
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def _path(self, form_type: str) -> str:
+        return os.path.join(self.base_dir, self.filename_map[form_type])
+
+    def _load(self, form_type: str) -> bool:
+        path = self._path(form_type)
+        try:
+            mtime = os.path.getmtime(path)
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Warning: template for '{form_type}' could not be read: {e}")
+            self._errors[form_type] = f"{type(e).__name__}: {e}"
+            return False
+        self._templates[form_type] = content
+        self._mtimes[form_type] = mtime
+        self._last_checked[form_type] = time.monotonic()
+        self._errors.pop(form_type, None)
+        return True
+
+    def load_all(self) -> float:
+        """매핑된 모든 템플릿을 읽고 소요 시간(ms)을 반환합니다.
+
+        읽지 못한 템플릿은 마지막으로 읽은 내용을 유지하며, 오류는 `errors()`로 확인합니다.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            for form_type in self.filename_map:
+                self._load(form_type)
+            self.loaded = True
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._stats["load_ms"] = round(elapsed_ms, 3)
+        print(f"TemplateStore loaded {len(self._templates)} templates ({elapsed_ms:.1f}ms)")
+        return elapsed_ms
+
+    def _reload_if_changed(self, form_type: str) -> None:
+        now = time.monotonic()
+        if now - self._last_checked.get(form_type, 0.0) < self.check_interval:
+            return
+        self._last_checked[form_type] = now
+        try:
+            mtime = os.path.getmtime(self._path(form_type))
+        except OSError:
+            return  # 파일이 사라져도 마지막으로 읽은 내용을 계속 사용
+        if mtime != self._mtimes.get(form_type):
+            with self._lock:
+                if self._load(form_type):
+                    self._stats["reload_count"] += 1
+                    print(f"TemplateStore reloaded template for '{form_type}'")
+
+    def resolve(self, form_type: str) -> Optional[str]:
+        """입력된 form_type을 등록된 양식명으로 정규화합니다. 찾지 못하면 None."""
+        if form_type in self.filename_map:
+            return form_type
+        compact = _compact(form_type or "")
+        alias = self._aliases.get(compact)
+        if alias:
+            self._stats["alias_hits"] += 1
+            return alias
+        matches = difflib.get_close_matches(
+            compact, list(self._aliases.keys()), n=1, cutoff=FUZZY_MATCH_CUTOFF
+        )
+        if matches:
+            self._stats["fuzzy_hits"] += 1
+            return self._aliases[matches[0]]
+        return None
+
+    def get(self, form_type: str) -> Optional[str]:
+        """form_type에 해당하는 HTML 템플릿을 반환합니다. (별칭/유사 표기 포함)"""
+        if not self.loaded:
+            # startup 훅을 거치지 않은 경우(스크립트, 동기 경로) 첫 조회 시 로드
+            self.load_all()
+        resolved = self.resolve(form_type)
+        if resolved is None:
+            return None
+        self._reload_if_changed(resolved)
+        html = self._templates.get(resolved)
+        if html is not None:
+            self._stats["hits"] += 1
+        return html
+
+    def documents(self) -> List[Document]:
+        """FAISS 폴백 인덱스 생성을 위한 Document 목록"""
+        if not self.loaded:
+            self.load_all()
+        return [
+            Document(
+                page_content=content,
+                metadata={
+                    "form_type": form_type,
+                    "source": os.path.basename(self.filename_map[form_type]),
+                },
+            )
+            for form_type, content in self._templates.items()
+        ]
+
+    def reload(self) -> float:
+        """모든 템플릿을 강제로 다시 읽고 소요 시간(ms)을 반환합니다.
+
+        읽지 못한 템플릿이 있으면 (기존 내용은 유지한 채) TemplateReloadError를 발생시킵니다.
+        """
+        self._stats["reload_count"] += 1
+        elapsed_ms = self.load_all()
+        if self._errors:
+            raise TemplateReloadError(dict(self._errors), elapsed_ms)
+        return elapsed_ms
+
+    def errors(self) -> Dict[str, str]:
+        """마지막 읽기에 실패한 템플릿별 오류"""
+        return dict(self._errors)
+
+    def record_fallback(self, found: bool) -> None:
+        self._stats["vector_fallbacks" if found else "misses"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "templates": len(self._templates),
+            "loaded": self.loaded,
+            "load_errors": dict(self._errors),
+            "vector_store_status": _vector_store_state["status"],
+        }
+
+
+template_store = TemplateStore(
+    BASE_DIR, TEMPLATE_FILENAME_MAP, TEMPLATE_RELOAD_CHECK_INTERVAL
+)
+
+
+def vector_store_status() -> Dict[str, Any]:
+    """FAISS 인덱스 준비 상태와 진행률을 반환합니다."""
+    state = dict(_vector_store_state)
+    total = state["documents_total"]
+    state["progress"] = (
+        1.0
+        if state["status"] == "ready"
+        else round(state["documents_done"] / total, 3) if total else 0.0
+    )
+    return state
 
 
 def _build_or_load_vector_store() -> FAISS:
-    """FAISS 인덱스를 로드하거나, 없으면 빌드하고 저장합니다."""
+    """FAISS 인덱스를 로드하거나, 없으면 TemplateStore의 템플릿으로 빌드하고 저장합니다.
+
+    문서를 `VECTOR_STORE_BUILD_BATCH_SIZE`개씩 임베딩하며 `_vector_store_state`에
+    진행률을 기록합니다. 실패하면 상태를 failed로 남기고 예외를 다시 던집니다.
+    """
     global vector_store
     if vector_store:
         return vector_store
 
-    embeddings = OpenAIEmbeddings()
+    with _vector_store_lock:
+        if vector_store:
+            return vector_store
 
-    if os.path.exists(FAISS_INDEX_PATH):
-        print(f"Loading FAISS index from {FAISS_INDEX_PATH}")
-        vector_store = FAISS.load_local(
-            FAISS_INDEX_PATH, embeddings, allow_dangerous_deserialization=True
+        started = time.perf_counter()
+        _vector_store_state.update(
+            started_at=time.time(), error=None, documents_done=0, elapsed_ms=None
+        )
+        try:
+            embeddings = OpenAIEmbeddings()
+
+            if os.path.exists(FAISS_INDEX_PATH):
+                print(f"Loading FAISS index from {FAISS_INDEX_PATH}")
+                _vector_store_state.update(status="loading", source="disk")
+                store = FAISS.load_local(
+                    FAISS_INDEX_PATH, embeddings, allow_dangerous_deserialization=True
+                )
+            else:
+                print(
+                    f"Building FAISS index as it does not exist at {FAISS_INDEX_PATH}"
+                )
+                documents = template_store.documents()
+                if not documents:
+                    raise ValueError(
+                        "No HTML templates (defined in FORM_CONFIGS) found to build vector store."
+                    )
+                _vector_store_state.update(
+                    status="building", source="build", documents_total=len(documents)
+                )
+                store = None
+                for i in range(0, len(documents), VECTOR_STORE_BUILD_BATCH_SIZE):
+                    batch = documents[i : i + VECTOR_STORE_BUILD_BATCH_SIZE]
+                    if store is None:
+                        store = FAISS.from_documents(batch, embeddings)
+                    else:
+                        store.add_documents(batch)
+                    _vector_store_state["documents_done"] += len(batch)
+                    print(
+                        f"FAISS build progress: {_vector_store_state['documents_done']}/{len(documents)}"
+                    )
+                store.save_local(FAISS_INDEX_PATH)
+                print(f"FAISS index built and saved to {FAISS_INDEX_PATH}")
+        except Exception as e:
+            _vector_store_state.update(
+                status="failed",
+                error=str(e),
+                failed_at=time.monotonic(),
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+            )
+            raise
+
+        vector_store = store
+        _vector_store_state.update(
+            status="ready",
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
         )
         return vector_store
 
-    print(f"Building FAISS index as it does not exist at {FAISS_INDEX_PATH}")
-    documents: List[Document] = []
-    if not os.path.exists(TEMPLATE_DIR):
-        raise FileNotFoundError(f"Template directory not found: {TEMPLATE_DIR}")
 
-    # HTML 파일명과 form_type을 매핑 (메타데이터로 사용)
-    # config.html_template_path (예: "templates/annual_leave.html")에서 순수 파일명(예: "annual_leave.html")을 키로 사용
-    filename_to_form_type_map = {
-        os.path.basename(config.html_template_path): form_name
-        for form_name, config in FORM_CONFIGS.items()
-    }
+def _vector_store_retry_allowed() -> bool:
+    """최근에 빌드가 실패했다면 재시도 대기 시간 동안 폴백 요청에서의 재빌드를 막습니다."""
+    if _vector_store_state["status"] in ("loading", "building"):
+        return False  # 백그라운드 작업이 진행 중이면 요청을 붙잡아 두지 않음
+    failed_at = _vector_store_state["failed_at"]
+    if _vector_store_state["status"] == "failed" and failed_at is not None:
+        return time.monotonic() - failed_at >= VECTOR_STORE_RETRY_SECONDS
+    return True
 
-    for filename in os.listdir(TEMPLATE_DIR):
-        if filename.endswith(".html"):
-            file_path = os.path.join(TEMPLATE_DIR, filename)
 
-            # filename_to_form_type_map을 사용하여 form_configs.py에 정의된 form_type 가져오기
-            form_type = filename_to_form_type_map.get(filename)
+async def _prewarm_vector_store() -> None:
+    try:
+        await asyncio.to_thread(_build_or_load_vector_store)
+    except Exception as e:
+        # 인덱스가 없어도 템플릿 조회는 가능하므로 워커를 죽이지 않습니다.
+        print(f"Warning: background FAISS initialisation failed: {e}")
 
-            if not form_type:
-                # FORM_CONFIGS에 정의되지 않은 HTML 파일은 경고 후 건너뛰거나 기본값 처리
-                print(
-                    f"Warning: HTML template '{filename}' is not defined in FORM_CONFIGS. Skipping or using fallback form_type."
-                )
-                # form_type = filename.replace(".html", "").replace("_", " ").title() # 예: 이전 fallback
-                # 여기서는 일단 건너뛰도록 처리 (엄격한 관리)
-                continue
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            documents.append(
-                Document(
-                    page_content=content,
-                    metadata={"form_type": form_type, "source": filename},
-                )
-            )
-            print(
-                f"Added '{filename}' to FAISS documents with form_type: '{form_type}'"
-            )
+async def initialize(
+    budget_seconds: float = COLD_START_BUDGET_SECONDS,
+    prewarm_vector_store: bool = VECTOR_STORE_PREWARM,
+) -> Dict[str, Any]:
+    """앱 startup 훅에서 호출하는 초기화 함수
 
-    if not documents:
-        raise ValueError(
-            "No HTML templates (defined in FORM_CONFIGS) found to build vector store."
+    템플릿 로드는 `budget_seconds` 안에서 기다리고(초과 시 경고 후 백그라운드에서 계속),
+    FAISS 인덱스 로드/빌드는 기다리지 않고 백그라운드 작업으로 시작합니다.
+    """
+    global _vector_store_task
+    started = time.perf_counter()
+    load_task = asyncio.ensure_future(asyncio.to_thread(template_store.load_all))
+    try:
+        await asyncio.wait_for(asyncio.shield(load_task), timeout=budget_seconds)
+    except asyncio.TimeoutError:
+        print(
+            f"Warning: template loading exceeded cold-start budget ({budget_seconds}s); continuing in background"
         )
 
-    vector_store = FAISS.from_documents(documents, embeddings)
-    vector_store.save_local(FAISS_INDEX_PATH)
-    print(f"FAISS index built and saved to {FAISS_INDEX_PATH}")
-    return vector_store
+    if not VECTOR_FALLBACK_ENABLED:
+        _vector_store_state["status"] = "disabled"
+    elif prewarm_vector_store and vector_store is None and _vector_store_task is None:
+        _vector_store_task = asyncio.create_task(_prewarm_vector_store())
 
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"RAG initialise finished in {elapsed_ms:.1f}ms (budget {budget_seconds}s)")
+    return {"elapsed_ms": round(elapsed_ms, 3), "templates_loaded": template_store.loaded}
 
-# 애플리케이션 시작 시 VectorStore를 로드하거나 빌드합니다.
-# 실제 FastAPI 앱에서는 Depends 또는 startup 이벤트에서 호출하는 것이 좋습니다.
-# 여기서는 모듈 로드 시 한 번 실행되도록 합니다.
-_build_or_load_vector_store()
 
+async def shutdown() -> None:
+    """진행 중인 백그라운드 인덱스 작업을 정리합니다. (to_thread 작업 자체는 끝까지 실행됨)"""
+    if _vector_store_task is not None and not _vector_store_task.done():
+        _vector_store_task.cancel()
 
-def retrieve_template(form_type: str, keywords: List[str] = None) -> Optional[str]:
-    """
-    주어진 form_type과 keywords를 기반으로 VectorStore에서 HTML 템플릿을 검색합니다.
-    form_type을 주요 검색어로, keywords를 보조 검색어로 사용합니다.
-    """
-    vs = _build_or_load_vector_store()
-    if not vs:
-        print("Error: Vector store is not initialized.")
+
+def is_ready() -> bool:
+    """요청을 처리할 준비가 되었는지 여부 (템플릿 로드 완료 기준, FAISS는 선택)"""
+    return template_store.loaded
+
+
+def _vector_search_template(form_type: str, keywords: List[str] = None) -> Optional[str]:
+    """등록되지 않은 form_type에 대해 VectorStore 유사도 검색으로 템플릿을 찾습니다."""
+    if not VECTOR_FALLBACK_ENABLED:
+        return None
+    if vector_store is None and not _vector_store_retry_allowed():
+        print(
+            f"RAG fallback skipped: vector store is {_vector_store_state['status']}"
+        )
+        return None
+
+    try:
+        vs = _build_or_load_vector_store()
+    except Exception as e:
+        # 오프라인 등으로 인덱스를 만들 수 없으면 폴백 없이 진행
+        print(f"Error: Vector store is not available: {e}")
         return None
 
     # 검색 쿼리 생성 (form_type을 명시적으로 포함)
@@ -113,32 +413,41 @@ def retrieve_template(form_type: str, keywords: List[str] = None) -> Optional[st
     print(f"RAG Query: {query}")
 
     try:
-        # 가장 유사한 문서 1개 검색, form_type 메타데이터로 필터링
-        retriever = vs.as_retriever(
-            search_kwargs={"k": 1, "filter": {"form_type": form_type}}
-        )
-        results = retriever.invoke(query)
-
+        results = vs.similarity_search(query, k=1)
         if results:
             print(
                 f"RAG Retrieved: {results[0].metadata['source']} for form_type '{results[0].metadata['form_type']}'"
             )
             return results[0].page_content
-        else:
-            print(f"RAG: No template found for query: {query}")
-            return None
+        print(f"RAG: No template found for query: {query}")
+        return None
     except Exception as e:
         print(f"Error during RAG template retrieval: {e}")
         return None
 
 
+def retrieve_template(form_type: str, keywords: List[str] = None) -> Optional[str]:
+    """
+    주어진 form_type에 해당하는 HTML 템플릿을 반환합니다.
+    TemplateStore에서 먼저 조회하고, 찾지 못한 경우에만 keywords를 보조 검색어로
+    사용하는 VectorStore 검색으로 폴백합니다.
+    """
+    html = template_store.get(form_type)
+    if html is not None:
+        return html
+
+    html = _vector_search_template(form_type, keywords)
+    template_store.record_fallback(found=html is not None)
+    return html
+
+
 # # 테스트용 코드
 # if __name__ == "__main__":
 #     # OPENAI_API_KEY 환경변수 설정 필요
 #     # from dotenv import load_dotenv
 #     # load_dotenv(dotenv_path=os.path.abspath(os.path.join(os.path.dirname(__file__), "../.env")))
 
-#     # vector_store를 먼저 빌드/로드합니다.
+#     # 폴백 검색용 vector_store를 미리 빌드/로드합니다.
 #     _build_or_load_vector_store()
 
 #     # 테스트 검색
@@ -0,0 +1,413 @@
+"""
+전자결재 양식 일괄 제출 모듈
+
+월말 경비 정산처럼 한 사용자가 수백 건의 양식을 한 번에 올리는 경우를 위한 모듈입니다.
+
+1.  **검증 + 변환 (한 번에)**: 모든 항목을 먼저 검증하고 API Payload로 변환합니다.
+    실패한 항목은 제출하지 않고 항목별 오류로 돌려줍니다.
+2.  **제출**: 공유 `httpx.AsyncClient`(커넥션 풀) 하나로 `register`에 PUT 합니다.
+    동시 제출 수는 `FORM_SELECTOR_SUBMIT_CONCURRENCY`로 제한합니다.
+3.  **재시도 큐**: 연결 실패, 429/502/503/504처럼 외부 API가 처리하지 않았다고 볼 수 있는 실패는
+    로컬 SQLite 파일(`FORM_SELECTOR_RETRY_QUEUE_DB`)에 저장되어 재기동 후에도 남습니다.
+    백그라운드 워커가 지수 백오프로 다시 제출하고, 최대 시도 횟수를 넘으면 `dead` 상태로
+    남겨 확인할 수 있게 합니다.
+    제출할 항목은 `UPDATE ... RETURNING`으로 `inflight` 상태와 임대 만료 시각을 한 번에
+    기록해 가져가므로, 여러 워커 프로세스와 수동 처리 요청이 같은 항목을 중복 제출하지
+    않습니다. 임대가 만료된 항목(처리 중 프로세스가 죽은 경우)은 다시 가져갑니다.
+    응답 대기 중 타임아웃이나 4xx는 중복 등록 위험이 있거나 다시 보내도 실패하므로 큐에 넣지 않습니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .service import convert_form_data_to_api_payload
+from .validators import validate_forms
+
+logger = logging.getLogger(__name__)
+
+SUBMIT_CONCURRENCY = int(os.getenv("FORM_SELECTOR_SUBMIT_CONCURRENCY", "8"))
+SUBMIT_TIMEOUT = float(os.getenv("FORM_SELECTOR_SUBMIT_TIMEOUT", "30"))
+SUBMIT_MAX_BATCH = int(os.getenv("FORM_SELECTOR_SUBMIT_MAX_BATCH", "500"))
+RETRY_QUEUE_DB = os.getenv(
+    "FORM_SELECTOR_RETRY_QUEUE_DB",
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "submit_retry_queue.sqlite3")
+    ),
+)
+RETRY_INTERVAL_SECONDS = float(os.getenv("FORM_SELECTOR_RETRY_INTERVAL", "60"))
+RETRY_MAX_ATTEMPTS = int(os.getenv("FORM_SELECTOR_RETRY_MAX_ATTEMPTS", "5"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("FORM_SELECTOR_RETRY_BACKOFF", "60"))
+RETRY_LEASE_SECONDS = float(os.getenv("FORM_SELECTOR_RETRY_LEASE", "300"))
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+# 양식 제출에 재사용하는 공유 AsyncClient (커넥션 풀 유지)
+_submit_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_submit_http_client() -> httpx.AsyncClient:
+    """양식 제출용 공유 `httpx.AsyncClient`를 반환합니다. (없으면 생성)"""
+    global _submit_http_client
+    if _submit_http_client is None or _submit_http_client.is_closed:
+        _submit_http_client = httpx.AsyncClient(
+            timeout=SUBMIT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=SUBMIT_CONCURRENCY,
+                max_keepalive_connections=SUBMIT_CONCURRENCY,
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+    return _submit_http_client
+
+
+async def close_submit_http_client() -> None:
+    """공유 `httpx.AsyncClient`를 닫습니다. (앱 종료 시 호출)"""
+    global _submit_http_client
+    if _submit_http_client is not None and not _submit_http_client.is_closed:
+        await _submit_http_client.aclose()
+    _submit_http_client = None
+
+
+def register_url() -> str:
+    api_base_url = os.getenv(
+        "APPROVAL_API_BASE_URL", "https://dev-api.ntoday.kr/api/v1/epaper"
+    )
+    # 모든 양식에 대해 동일한 엔드포인트 사용
+    return f"{api_base_url}/register"
+
+
+def is_retryable(error: Exception) -> bool:
+    """외부 API가 요청을 처리하지 않았다고 볼 수 있는 실패인지 (재시도 큐 대상)"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUS_CODES
+    return isinstance(
+        error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    )
+
+
+def describe_error(error: Exception) -> str:
+    if isinstance(error, httpx.HTTPStatusError):
+        detail = f"외부 API 오류: {error.response.status_code}"
+        try:
+            detail += f" - {error.response.json()}"
+        except ValueError:
+            detail += f" - {error.response.text}"
+        return detail
+    return f"외부 API 요청 오류: {type(error).__name__}: {error}"
+
+
+async def put_register(api_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """변환된 Payload 하나를 `register`에 제출합니다. (HTTP 오류 시 예외)"""
+    response = await get_submit_http_client().put(register_url(), json=api_payload)
+    response.raise_for_status()
+    return response.json()
+
+
+# --- 재시도 큐 --- #
+
+
+class RetryQueue:
+    """제출 실패 항목을 보관하는 SQLite 기반 재시도 큐"""
+
+    def __init__(self, path: str = RETRY_QUEUE_DB):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS retry_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    form_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    next_attempt_at REAL NOT NULL,
+                    lease_until REAL,
+                    created_at REAL NOT NULL
+                )
+                """)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(retry_queue)")
+            }
+            if "lease_until" not in columns:
+                # 임대 컬럼 추가 전에 만들어진 큐 파일
+                self._conn.execute(
+                    "ALTER TABLE retry_queue ADD COLUMN lease_until REAL"
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_retry_due "
+                "ON retry_queue (status, next_attempt_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def enqueue_many(self, items: List[Tuple[str, Dict[str, Any], str]]) -> List[int]:
+        """(form_type, payload, 오류) 목록을 저장하고 큐 ID 목록을 반환합니다."""
+        now = time.time()
+        ids = []
+        with self._lock:
+            conn = self._connection()
+            for form_type, payload, error in items:
+                cursor = conn.execute(
+                    "INSERT INTO retry_queue "
+                    "(form_type, payload, attempts, last_error, next_attempt_at, "
+                    "created_at) VALUES (?, ?, 1, ?, ?, ?)",
+                    (
+                        form_type,
+                        json.dumps(payload, ensure_ascii=False),
+                        error,
+                        now + RETRY_BACKOFF_SECONDS,
+                        now,
+                    ),
+                )
+                ids.append(cursor.lastrowid)
+            conn.commit()
+        return ids
+
+    def claim_due(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """재시도 시점이 된 항목을 `inflight`로 바꾸며 가져옵니다.
+
+        선택과 상태 변경이 한 문장이라 다른 프로세스가 같은 항목을 가져갈 수 없습니다.
+        임대(`RETRY_LEASE_SECONDS`)가 만료된 `inflight` 항목도 다시 가져갑니다.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "UPDATE retry_queue SET status = 'inflight', lease_until = ? "
+                "WHERE id IN ("
+                "SELECT id FROM retry_queue "
+                "WHERE (status = 'pending' AND next_attempt_at <= ?) "
+                "OR (status = 'inflight' AND lease_until <= ?) "
+                "ORDER BY next_attempt_at LIMIT ?"
+                ") RETURNING id, form_type, payload, attempts",
+                (now + RETRY_LEASE_SECONDS, now, now, limit),
+            ).fetchall()
+            conn.commit()
+        return [
+            {
+                "id": row[0],
+                "form_type": row[1],
+                "payload": json.loads(row[2]),
+                "attempts": row[3],
+            }
+            for row in rows
+        ]
+
+    def mark_done(self, item_id: int) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM retry_queue WHERE id = ?", (item_id,))
+            conn.commit()
+
+    def mark_failed(
+        self, item_id: int, attempts: int, error: str, retryable: bool
+    ) -> None:
+        """재시도 실패 기록. 재시도 불가이거나 최대 횟수를 넘으면 dead로 전환"""
+        dead = not retryable or attempts >= RETRY_MAX_ATTEMPTS
+        next_attempt_at = time.time() + RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1))
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE retry_queue SET status = ?, attempts = ?, last_error = ?, "
+                "next_attempt_at = ?, lease_until = NULL WHERE id = ?",
+                (
+                    "dead" if dead else "pending",
+                    attempts,
+                    error,
+                    next_attempt_at,
+                    item_id,
+                ),
+            )
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT status, COUNT(*), MIN(next_attempt_at) FROM retry_queue "
+                    "GROUP BY status"
+                )
+                .fetchall()
+            )
+        stats: Dict[str, Any] = {
+            "pending": 0,
+            "inflight": 0,
+            "dead": 0,
+            "next_attempt_at": None,
+        }
+        for status, count, next_attempt_at in rows:
+            stats[status] = count
+            if status == "pending":
+                stats["next_attempt_at"] = next_attempt_at
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+retry_queue = RetryQueue()
+# 백그라운드 워커와 수동 처리 요청이 같은 프로세스에서 겹쳐 실행되지 않도록 직렬화
+_retry_run_lock = asyncio.Lock()
+
+
+async def process_retry_queue(limit: int = 100) -> Dict[str, int]:
+    """재시도 시점이 된 항목을 가져가(claim) 다시 제출합니다."""
+    async with _retry_run_lock:
+        return await _process_claimed(limit)
+
+
+async def _process_claimed(limit: int) -> Dict[str, int]:
+    items = await asyncio.to_thread(retry_queue.claim_due, limit)
+    semaphore = asyncio.Semaphore(SUBMIT_CONCURRENCY)
+    counts = {"retried": len(items), "submitted": 0, "failed": 0}
+
+    async def retry(item: Dict[str, Any]) -> None:
+        async with semaphore:
+            try:
+                await put_register(item["payload"])
+            except Exception as e:
+                counts["failed"] += 1
+                logger.warning(
+                    f"재시도 제출 실패: id={item['id']} attempts={item['attempts'] + 1} "
+                    f"{describe_error(e)}"
+                )
+                await asyncio.to_thread(
+                    retry_queue.mark_failed,
+                    item["id"],
+                    item["attempts"] + 1,
+                    describe_error(e),
+                    is_retryable(e),
+                )
+                return
+        counts["submitted"] += 1
+        await asyncio.to_thread(retry_queue.mark_done, item["id"])
+
+    await asyncio.gather(*(retry(item) for item in items))
+    if items:
+        logger.info(f"재시도 큐 처리: {counts}")
+    return counts
+
+
+async def retry_worker() -> None:
+    """`RETRY_INTERVAL_SECONDS`마다 재시도 큐를 처리하는 백그라운드 작업"""
+    while True:
+        try:
+            await process_retry_queue()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"재시도 큐 처리 중 오류: {e}", exc_info=True)
+        await asyncio.sleep(RETRY_INTERVAL_SECONDS)
+
+
+# --- 일괄 제출 --- #
+
+
+def prepare_batch(forms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """모든 항목을 검증하고 API Payload로 변환합니다.
+
+    Returns:
+        항목별 {"index", "form_type", "api_payload"} 또는
+        {"index", "form_type", "error", "errors"(검증 실패 시 구조화된 오류)}
+    """
+    # 지원 양식/필수 필드/날짜·숫자 형식을 배치 전체에 대해 한 번에 검증
+    validation = validate_forms(forms)
+    prepared = []
+    for index, (form, result) in enumerate(zip(forms, validation.results)):
+        form_type = form.get("form_type") if isinstance(form, dict) else None
+        form_data = form.get("form_data") if isinstance(form, dict) else None
+        item = {"index": index, "form_type": form_type}
+        if not form_type or not isinstance(form_data, dict) or not form_data:
+            prepared.append({**item, "error": "form_type과 form_data가 필요합니다."})
+            continue
+
+        if not result.is_valid:
+            prepared.append(
+                {**item, "error": "; ".join(result.errors), "errors": result.details}
+            )
+            continue
+
+        try:
+            item["api_payload"] = convert_form_data_to_api_payload(form_type, form_data)
+        except ValueError as e:
+            item["error"] = str(e)
+        except Exception as e:
+            logger.error(
+                f"폼 데이터 변환 중 오류 발생: index={index} {e}", exc_info=True
+            )
+            item["error"] = "폼 데이터를 API Payload로 변환하는 중 오류가 발생했습니다."
+        prepared.append(item)
+    return prepared
+
+
+async def submit_batch(forms: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """양식 N건을 검증/변환 후 제한된 동시성으로 제출하고 항목별 결과를 반환합니다."""
+    started = time.perf_counter()
+    # 검증/변환은 CPU 작업이므로 이벤트 루프 밖에서 한 번에 처리
+    prepared = await asyncio.to_thread(prepare_batch, forms)
+    semaphore = asyncio.Semaphore(SUBMIT_CONCURRENCY)
+
+    async def submit(item: Dict[str, Any]) -> Dict[str, Any]:
+        if "error" in item:
+            return {**item, "status": "invalid"}
+        async with semaphore:
+            try:
+                response_data = await put_register(item["api_payload"])
+                return {
+                    "index": item["index"],
+                    "form_type": item["form_type"],
+                    "status": "submitted",
+                    "api_response": response_data,
+                }
+            except Exception as e:
+                return {
+                    "index": item["index"],
+                    "form_type": item["form_type"],
+                    "status": "queued" if is_retryable(e) else "failed",
+                    "error": describe_error(e),
+                    "api_payload": item["api_payload"],
+                }
+
+    results = await asyncio.gather(*(submit(item) for item in prepared))
+
+    queued = [result for result in results if result["status"] == "queued"]
+    if queued:
+        queue_ids = await asyncio.to_thread(
+            retry_queue.enqueue_many,
+            [(r["form_type"], r["api_payload"], r["error"]) for r in queued],
+        )
+        for result, queue_id in zip(queued, queue_ids):
+            result["retry_id"] = queue_id
+    for result in results:
+        result.pop("api_payload", None)
+
+    summary = {
+        status: sum(1 for r in results if r["status"] == status)
+        for status in ("submitted", "invalid", "failed", "queued")
+    }
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"일괄 제출 완료: total={len(forms)} {summary} ({elapsed_ms:.0f}ms)")
+    return {
+        "success": summary["submitted"] == len(forms),
+        "total": len(forms),
+        **summary,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "results": list(results),
+    }
@@ -0,0 +1,501 @@
+"""
+한국어 시간 표현(날짜/시간/기간) 규칙 기반 파서
+
+"내일", "다음 주 화요일 오후 3시 반", "12월 23일부터 25일까지", "7월 7일부터 3일간" 같은
+표현을 테이블과 사전 컴파일된 정규식만으로 해석합니다. 결과에는 신뢰도(confidence)가
+함께 담기며, `utils.py`는 신뢰도가 낮을 때만 LLM 파싱으로 폴백합니다.
+
+해석 방식:
+- 입력을 앞에서부터 훑으며 `_RULES`의 패턴을 순서대로 `match`합니다.
+- 날짜 토큰은 "앵커"로 쌓이고, 두 번째 앵커(또는 기간 토큰)는 범위의 끝으로 해석합니다.
+  두 앵커 사이에 범위 연결어("부터", "까지", "~" 등)가 없으면("내일 말고 모레") 신뢰도를 낮춥니다.
+- 조사/연결어("에", "부터", "까지", "~" 등)는 건너뛰고, 어떤 규칙에도 맞지 않는 글자가
+  남으면 신뢰도를 낮춥니다.
+"""
+
+import calendar
+import re
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+# 이 값 이상이면 규칙 기반 결과를 그대로 사용합니다. (utils.py에서 환경변수로 덮어씀)
+DEFAULT_CONFIDENCE_THRESHOLD = 0.8
+# 규칙에 맞지 않는 글자가 섞였을 때의 신뢰도 상한
+PARTIAL_MATCH_CONFIDENCE = 0.5
+# 오전/오후 표기 없이 1~6시처럼 해석이 갈리는 시간의 신뢰도
+AMBIGUOUS_HOUR_CONFIDENCE = 0.7
+# 월 정보 없이 "15일"만 있는 경우의 신뢰도
+DAY_ONLY_CONFIDENCE = 0.6
+
+# --- 표현 테이블 --- #
+RELATIVE_DAY_OFFSETS = {
+    "오늘": 0,
+    "금일": 0,
+    "당일": 0,
+    "내일모레": 2,
+    "낼모레": 2,
+    "내일": 1,
+    "명일": 1,
+    "낼": 1,
+    "모레": 2,
+    "글피": 3,
+    "어제": -1,
+    "작일": -1,
+    "그저께": -2,
+    "그제": -2,
+    "그끄저께": -3,
+    "그끄제": -3,
+}
+
+# 두 단어로 이루어진 표현은 사이 공백을 허용 ("내일 모레", "낼 모레")
+RELATIVE_DAY_COMPOUNDS = {"내일모레": ("내일", "모레"), "낼모레": ("낼", "모레")}
+
+WEEK_PREFIX_OFFSETS = {
+    "이번": 0,
+    "금번": 0,
+    "금": 0,
+    "다다음": 2,
+    "다음": 1,
+    "차": 1,
+    "담": 1,
+    "내": 1,
+    "지지난": -2,
+    "지난": -1,
+    "저번": -1,
+    "전": -1,
+}
+
+MONTH_PREFIX_OFFSETS = {
+    "이번달": 0,
+    "이번월": 0,
+    "금월": 0,
+    "다다음달": 2,
+    "다음달": 1,
+    "내달": 1,
+    "익월": 1,
+    "지난달": -1,
+    "저번달": -1,
+    "전월": -1,
+}
+
+WEEKDAYS = {"월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6}
+
+KOREAN_DAY_COUNTS = {
+    "하루": 1,
+    "이틀": 2,
+    "사흘": 3,
+    "나흘": 4,
+    "닷새": 5,
+    "엿새": 6,
+    "이레": 7,
+    "일주일": 7,
+    "열흘": 10,
+}
+
+PM_PERIODS = {"오후", "저녁", "밤"}
+AM_PERIODS = {"오전", "아침", "새벽"}
+
+
+def _alternation(words) -> str:
+    """긴 표현이 먼저 매칭되도록 길이 역순으로 정렬한 정규식 선택지"""
+    return "|".join(sorted((re.escape(w) for w in words), key=len, reverse=True))
+
+
+def _relative_day_alternation() -> str:
+    """RELATIVE_DAY_OFFSETS 선택지 (복합 표현은 단어 사이 공백 허용, 긴 표현 우선)"""
+    return "|".join(
+        r"\s*".join(map(re.escape, RELATIVE_DAY_COMPOUNDS.get(word, (word,))))
+        for word in sorted(RELATIVE_DAY_OFFSETS, key=len, reverse=True)
+    )
+
+
+def _spaced(word: str) -> str:
+    """글자 사이 공백을 허용하는 패턴 (예: "다음달" → "다\\s*음\\s*달")"""
+    return r"\s*".join(re.escape(ch) for ch in word)
+
+
+_PERIOD = r"(?P<period>오전|오후|아침|저녁|밤|새벽|낮)?\s*"
+_WEEKDAY = r"(?P<weekday>[월화수목금토일])"
+_DAY_COUNT = r"(?P<count>\d+|" + _alternation(KOREAN_DAY_COUNTS) + r")"
+
+_PATTERNS = {
+    "ymd": re.compile(
+        r"(?P<y>\d{4})\s*(?:년\s*|[-./])\s*(?P<m>\d{1,2})\s*(?:월\s*|[-./])\s*(?P<d>\d{1,2})(?:\s*일)?"
+    ),
+    "mdy_slash": re.compile(r"(?P<m>\d{1,2})/(?P<d>\d{1,2})/(?P<y>\d{4})"),
+    "md": re.compile(r"(?P<m>\d{1,2})\s*월\s*(?P<d>\d{1,2})\s*일"),
+    "md_slash": re.compile(r"(?P<m>\d{1,2})/(?P<d>\d{1,2})(?![/\d])"),
+    "nights_days": re.compile(
+        r"(?P<nights>\d+)\s*박\s*(?P<days>\d+)\s*일(?:\s*(?:간|동안))?"
+    ),
+    "offset": re.compile(
+        _DAY_COUNT
+        + r"\s*(?P<unit>일|주일|주|개월|달|년)?\s*(?P<direction>후|뒤|이후|전|이전)"
+    ),
+    "duration": re.compile(
+        r"(?:(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>일|주일|주)\s*(?:간|동안)"
+        r"|(?P<word>" + _alternation(KOREAN_DAY_COUNTS) + r")(?:\s*(?:간|동안))?)"
+    ),
+    "relative_day": re.compile(r"(?P<word>" + _relative_day_alternation() + r")"),
+    "week_weekday": re.compile(
+        r"(?P<prefix>"
+        + _alternation(WEEK_PREFIX_OFFSETS)
+        + r")\s*주\s*"
+        + _WEEKDAY
+        + r"(?:\s*요일)?"
+    ),
+    "week_only": re.compile(
+        r"(?P<prefix>" + _alternation(WEEK_PREFIX_OFFSETS) + r")\s*주(?!\s*일)"
+    ),
+    "month_day": re.compile(
+        r"(?P<prefix>"
+        + "|".join(
+            _spaced(w) for w in sorted(MONTH_PREFIX_OFFSETS, key=len, reverse=True)
+        )
+        + r")\s*(?:(?P<d>\d{1,2})\s*일|(?P<last>말일|말|마지막\s*날)|(?P<first>초|첫\s*날))?"
+    ),
+    "weekday": re.compile(_WEEKDAY + r"\s*요일"),
+    "day_only": re.compile(r"(?P<d>\d{1,2})\s*일(?!\s*(?:간|동안|후|뒤|전|이후|이전))"),
+    "time_hm": re.compile(
+        _PERIOD + r"(?P<h>\d{1,2})\s*시(?:\s*(?P<mi>\d{1,2})\s*분|\s*(?P<half>반))?"
+    ),
+    "time_colon": re.compile(_PERIOD + r"T?(?P<h>\d{1,2}):(?P<mi>\d{2})(?::\d{2})?"),
+    "time_named": re.compile(r"(?P<named>정오|자정)"),
+    "period_only": re.compile(r"(?P<period>오전|오후|아침|점심|저녁|밤|새벽|낮)"),
+    "range_start": re.compile(r"부터|에서부터|에서|[~∼〜]|-|–"),
+    "range_end": re.compile(r"까지"),
+    "filler": re.compile(r"쯤|경에?|께|정도|중에?|의|및|에는|에|로|으로|날|때|[,·()]"),
+}
+
+
+@dataclass(frozen=True)
+class TemporalResult:
+    """규칙 기반 해석 결과 (메모이즈되어 공유되므로 불변)"""
+
+    start: Optional[date] = None
+    end: Optional[date] = None
+    hour: Optional[int] = None
+    minute: Optional[int] = None
+    duration_days: Optional[float] = None
+    confidence: float = 0.0
+    rules: Tuple[str, ...] = ()
+
+    @property
+    def has_time(self) -> bool:
+        return self.hour is not None
+
+    def date_iso(self) -> Optional[str]:
+        return self.start.isoformat() if self.start else None
+
+    def end_iso(self) -> Optional[str]:
+        return self.end.isoformat() if self.end else None
+
+    def datetime_iso(self) -> Optional[str]:
+        if not self.start or self.hour is None:
+            return None
+        return f"{self.start.isoformat()}T{self.hour:02d}:{self.minute or 0:02d}"
+
+
+@dataclass
+class _ScanState:
+    today: date
+    anchors: List[date] = field(default_factory=list)
+    hour: Optional[int] = None
+    minute: Optional[int] = None
+    duration_days: Optional[float] = None
+    confidences: List[float] = field(default_factory=list)
+    rules: List[str] = field(default_factory=list)
+    has_range_connector: bool = False
+
+    def add_anchor(self, value: date, rule: str, confidence: float = 1.0) -> None:
+        self.anchors.append(value)
+        self.rules.append(rule)
+        self.confidences.append(confidence)
+
+    @property
+    def context(self) -> date:
+        """월/연도 정보가 없는 표현이 참조할 기준 날짜 (직전 앵커, 없으면 오늘)"""
+        return self.anchors[-1] if self.anchors else self.today
+
+
+def _smart_year(month: int, today: date) -> int:
+    """연도 없는 월/일: 기준 월보다 이전 월이면 다음 해, 아니면 올해"""
+    return today.year + 1 if month < today.month else today.year
+
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _day_count(value: str) -> int:
+    return int(value) if value.isdigit() else KOREAN_DAY_COUNTS[value]
+
+
+def _on_ymd(m: re.Match, state: _ScanState) -> bool:
+    value = _safe_date(int(m["y"]), int(m["m"]), int(m["d"]))
+    if value is None:
+        return False
+    state.add_anchor(value, "ymd")
+    return True
+
+
+def _on_md(m: re.Match, state: _ScanState) -> bool:
+    month, day = int(m["m"]), int(m["d"])
+    if state.anchors:
+        # 범위의 끝("12월 23일부터 1월 2일까지")은 시작일 이후가 되도록 연도를 정함
+        start = state.anchors[-1]
+        year = start.year + 1 if month < start.month else start.year
+    else:
+        year = _smart_year(month, state.today)
+    value = _safe_date(year, month, day)
+    if value is None:
+        return False
+    state.add_anchor(value, "md")
+    return True
+
+
+def _on_offset(m: re.Match, state: _ScanState) -> bool:
+    count = _day_count(m["count"])
+    unit = m["unit"] or "일"
+    if m["direction"] in ("전", "이전"):
+        count = -count
+    base = state.today
+    if unit == "일":
+        value = base + timedelta(days=count)
+    elif unit in ("주", "주일"):
+        value = base + timedelta(weeks=count)
+    elif unit in ("개월", "달"):
+        value = base + relativedelta(months=count)
+    else:
+        value = base + relativedelta(years=count)
+    state.add_anchor(value, "offset")
+    return True
+
+
+def _on_nights_days(m: re.Match, state: _ScanState) -> bool:
+    state.duration_days = float(m["days"])
+    state.rules.append("nights_days")
+    state.confidences.append(1.0)
+    return True
+
+
+def _on_duration(m: re.Match, state: _ScanState) -> bool:
+    if m["word"]:
+        days = float(KOREAN_DAY_COUNTS[m["word"]])
+    else:
+        days = float(m["num"]) * (7 if m["unit"] in ("주", "주일") else 1)
+    state.duration_days = days
+    state.rules.append("duration")
+    state.confidences.append(1.0)
+    return True
+
+
+def _on_relative_day(m: re.Match, state: _ScanState) -> bool:
+    word = re.sub(r"\s+", "", m["word"])
+    state.add_anchor(
+        state.today + timedelta(days=RELATIVE_DAY_OFFSETS[word]), "relative_day"
+    )
+    return True
+
+
+def _week_monday(prefix: str, today: date) -> date:
+    return (
+        today
+        - timedelta(days=today.weekday())
+        + timedelta(weeks=WEEK_PREFIX_OFFSETS[prefix])
+    )
+
+
+def _on_week_weekday(m: re.Match, state: _ScanState) -> bool:
+    monday = _week_monday(m["prefix"], state.today)
+    state.add_anchor(monday + timedelta(days=WEEKDAYS[m["weekday"]]), "week_weekday")
+    return True
+
+
+def _on_week_only(m: re.Match, state: _ScanState) -> bool:
+    # "다음 주"처럼 요일이 없으면 해당 주 월요일로 보되 확신하지 않음
+    state.add_anchor(_week_monday(m["prefix"], state.today), "week_only", 0.6)
+    return True
+
+
+def _on_month_day(m: re.Match, state: _ScanState) -> bool:
+    prefix = re.sub(r"\s+", "", m["prefix"])
+    first = date(state.today.year, state.today.month, 1) + relativedelta(
+        months=MONTH_PREFIX_OFFSETS[prefix]
+    )
+    if m["d"]:
+        value = _safe_date(first.year, first.month, int(m["d"]))
+        if value is None:
+            return False
+        state.add_anchor(value, "month_day")
+    elif m["last"]:
+        last_day = calendar.monthrange(first.year, first.month)[1]
+        state.add_anchor(first.replace(day=last_day), "month_day")
+    elif m["first"]:
+        state.add_anchor(first, "month_day")
+    else:
+        state.add_anchor(first, "month_only", 0.6)
+    return True
+
+
+def _on_weekday(m: re.Match, state: _ScanState) -> bool:
+    # 단독 요일: 오늘을 포함한 가장 가까운 미래의 해당 요일
+    days_diff = (WEEKDAYS[m["weekday"]] - state.today.weekday()) % 7
+    state.add_anchor(state.today + timedelta(days=days_diff), "weekday")
+    return True
+
+
+def _on_day_only(m: re.Match, state: _ScanState) -> bool:
+    day = int(m["d"])
+    context = state.context
+    value = _safe_date(context.year, context.month, day)
+    if value is None:
+        return False
+    if state.anchors:
+        # "12월 30일부터 2일까지" → 다음 달 2일
+        if value < context:
+            value = value + relativedelta(months=1)
+        state.add_anchor(value, "day_only")
+    else:
+        state.add_anchor(value, "day_only", DAY_ONLY_CONFIDENCE)
+    return True
+
+
+def _set_time(state: _ScanState, period: Optional[str], hour: int, minute: int) -> bool:
+    if hour > 24 or minute > 59:
+        return False
+    confidence = 1.0
+    if period in PM_PERIODS and hour < 12:
+        hour += 12
+    elif period == "낮" and hour <= 6:
+        hour += 12
+    elif period in AM_PERIODS and hour == 12:
+        hour = 0
+    elif period is None and 1 <= hour <= 6:
+        confidence = AMBIGUOUS_HOUR_CONFIDENCE
+    state.hour, state.minute = hour % 24, minute
+    state.rules.append("time")
+    state.confidences.append(confidence)
+    return True
+
+
+def _on_time_hm(m: re.Match, state: _ScanState) -> bool:
+    minute = 30 if m["half"] else int(m["mi"] or 0)
+    return _set_time(state, m["period"], int(m["h"]), minute)
+
+
+def _on_time_colon(m: re.Match, state: _ScanState) -> bool:
+    return _set_time(state, m["period"], int(m["h"]), int(m["mi"]))
+
+
+def _on_time_named(m: re.Match, state: _ScanState) -> bool:
+    state.hour, state.minute = (12, 0) if m["named"] == "정오" else (0, 0)
+    state.rules.append("time")
+    state.confidences.append(1.0)
+    return True
+
+
+def _on_skip(m: re.Match, state: _ScanState) -> bool:
+    return True
+
+
+def _on_range_connector(m: re.Match, state: _ScanState) -> bool:
+    state.has_range_connector = True
+    return True
+
+
+# 순서가 곧 우선순위입니다. (긴/구체적인 표현 → 짧은/일반적인 표현)
+_RULES: List[Tuple[str, Callable[[re.Match, _ScanState], bool]]] = [
+    ("ymd", _on_ymd),
+    ("mdy_slash", _on_ymd),
+    ("time_colon", _on_time_colon),
+    ("md", _on_md),
+    ("md_slash", _on_md),
+    ("nights_days", _on_nights_days),
+    ("offset", _on_offset),
+    ("duration", _on_duration),
+    ("time_hm", _on_time_hm),
+    ("time_named", _on_time_named),
+    ("relative_day", _on_relative_day),
+    ("week_weekday", _on_week_weekday),
+    ("month_day", _on_month_day),
+    ("weekday", _on_weekday),
+    ("week_only", _on_week_only),
+    ("day_only", _on_day_only),
+    ("period_only", _on_skip),
+    ("range_start", _on_range_connector),
+    ("range_end", _on_range_connector),
+    ("filler", _on_skip),
+]
+_COMPILED_RULES = [(_PATTERNS[name], handler) for name, handler in _RULES]
+
+
+def _scan(text: str, today: date) -> TemporalResult:
+    state = _ScanState(today=today)
+    pos, length, unknown_chars = 0, len(text), 0
+    while pos < length:
+        if text[pos].isspace():
+            pos += 1
+            continue
+        for pattern, handler in _COMPILED_RULES:
+            m = pattern.match(text, pos)
+            if m and m.end() > pos and handler(m, state):
+                pos = m.end()
+                break
+        else:
+            unknown_chars += 1
+            pos += 1
+
+    if not state.anchors and state.hour is None and state.duration_days is None:
+        return TemporalResult(confidence=0.0, rules=tuple(state.rules))
+
+    start = state.anchors[0] if state.anchors else None
+    if start is None and state.hour is not None:
+        start = today  # "오후 3시"처럼 시간만 있으면 기준일
+    end = state.anchors[1] if len(state.anchors) > 1 else None
+    if end is None and start is not None and state.duration_days:
+        end = start + timedelta(days=max(int(state.duration_days) - 1, 0))
+
+    confidence = min(state.confidences) if state.confidences else 1.0
+    if len(state.anchors) > 2 or (
+        end is not None and start is not None and end < start
+    ):
+        confidence = min(confidence, PARTIAL_MATCH_CONFIDENCE)
+    if len(state.anchors) == 2 and not state.has_range_connector:
+        # "내일, 모레", "12월 23일 25일"처럼 범위인지 선택지 나열인지 알 수 없음
+        confidence = min(confidence, PARTIAL_MATCH_CONFIDENCE)
+    if unknown_chars:
+        confidence = min(confidence, PARTIAL_MATCH_CONFIDENCE)
+
+    return TemporalResult(
+        start=start,
+        end=end,
+        hour=state.hour,
+        minute=state.minute,
+        duration_days=state.duration_days,
+        confidence=confidence,
+        rules=tuple(state.rules),
+    )
+
+
+@lru_cache(maxsize=4096)
+def parse_temporal(text: str, today_iso: str) -> TemporalResult:
+    """한국어 시간 표현을 해석합니다. 결과는 (text, today_iso) 단위로 메모이즈됩니다.
+
+    Args:
+        text: 해석할 문자열 (예: "다음 주 화요일 오후 3시 반")
+        today_iso: 기준일 (YYYY-MM-DD)
+
+    Returns:
+        TemporalResult. 해석할 수 없으면 confidence=0.0
+    """
+    if not isinstance(text, str) or not text.strip():
+        return TemporalResult()
+    return _scan(text.strip(), date.fromisoformat(today_iso))
@@ -6,10 +6,25 @@ from typing import Optional, Dict, Any, Literal, Union
 from pydantic import BaseModel, Field
 import json
 import logging
+import os
+from collections import OrderedDict
 
 from .llm import llm  # llm.py 에서 공유 LLM 객체 가져오기
+from .business_calendar import BUSINESS_DAYS_PER_WEEK
+from .temporal import DEFAULT_CONFIDENCE_THRESHOLD, parse_temporal
 from langchain_core.messages import HumanMessage, AIMessage
 
+# 규칙 기반 엔진(temporal.py) 결과를 그대로 쓰기 위한 최소 신뢰도. 미만이면 기존 규칙/LLM으로 폴백
+DATE_RULE_CONFIDENCE_THRESHOLD = float(
+    os.getenv("FORM_SELECTOR_DATE_RULE_CONFIDENCE", str(DEFAULT_CONFIDENCE_THRESHOLD))
+)
+# LLM 날짜 파싱 결과 메모이즈 크기 ((text, today) 단위)
+LLM_DATETIME_CACHE_SIZE = int(os.getenv("FORM_SELECTOR_DATE_LLM_CACHE_SIZE", "2048"))
+_llm_datetime_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+# 날짜 파싱 경로별 카운터 (벤치마크/모니터링용)
+DATE_PARSE_STATS = {"rule_hits": 0, "llm_calls": 0, "llm_memo_hits": 0}
+
 
 # Function calling을 위한 함수 스키마 정의
 class DateTimeOutput(BaseModel):
@@ -23,8 +38,28 @@ class DateTimeOutput(BaseModel):
     )
 
 
-# LLM 기반 날짜/시간 파싱을 위한 함수
 def _call_llm_for_datetime_parsing(text: str, today_iso: str) -> Optional[str]:
+    """LLM 날짜 파싱을 (text, today_iso) 단위로 메모이즈해 호출합니다.
+    실패(None)는 일시적인 오류일 수 있으므로 캐싱하지 않습니다.
+    """
+    key = (text, today_iso)
+    cached = _llm_datetime_cache.get(key)
+    if cached is not None:
+        _llm_datetime_cache.move_to_end(key)
+        DATE_PARSE_STATS["llm_memo_hits"] += 1
+        return cached
+
+    DATE_PARSE_STATS["llm_calls"] += 1
+    result = _request_llm_datetime_parsing(text, today_iso)
+    if result:
+        _llm_datetime_cache[key] = result
+        if len(_llm_datetime_cache) > LLM_DATETIME_CACHE_SIZE:
+            _llm_datetime_cache.popitem(last=False)
+    return result
+
+
+# LLM 기반 날짜/시간 파싱을 위한 함수
+def _request_llm_datetime_parsing(text: str, today_iso: str) -> Optional[str]:
     """
     주어진 텍스트에서 날짜 또는 날짜시간 정보를 LLM을 통해 파싱합니다.
     Function calling을 활용하여 결과를 구조화된 형태로 받습니다.
@@ -178,7 +213,7 @@ def _call_llm_for_datetime_parsing(text: str, today_iso: str) -> Optional[str]:
             return None
 
     except Exception as e:
-        print(f"Error in _call_llm_for_datetime_parsing: {e}")
+        print(f"Error in _request_llm_datetime_parsing: {e}")
         return None
 
 
@@ -277,6 +312,15 @@ def parse_relative_date_to_iso(
     original_date_str = date_str.strip()
     processed_str = original_date_str.lower().replace(" ", "")
 
+    # 0. 규칙 기반 엔진: 신뢰도가 충분하면 바로 반환 (범위 표현이면 시작일)
+    rule_result = parse_temporal(original_date_str, today.isoformat())
+    if (
+        rule_result.start is not None
+        and rule_result.confidence >= DATE_RULE_CONFIDENCE_THRESHOLD
+    ):
+        DATE_PARSE_STATS["rule_hits"] += 1
+        return rule_result.date_iso()
+
     # 1. 매우 간단한 상대 날짜 직접 처리
     if processed_str in ["오늘", "금일"]:
         return today.isoformat()
@@ -442,6 +486,15 @@ def parse_datetime_description_to_iso_local(
     )
     today = datetime.strptime(base_date_iso, "%Y-%m-%d").date()
 
+    # 0. 규칙 기반 엔진: 신뢰도가 충분하면 LLM 없이 반환 (시간 정보가 없으면 None)
+    rule_result = parse_temporal(datetime_str, base_date_iso)
+    if (
+        rule_result.start is not None
+        and rule_result.confidence >= DATE_RULE_CONFIDENCE_THRESHOLD
+    ):
+        DATE_PARSE_STATS["rule_hits"] += 1
+        return rule_result.datetime_iso()
+
     # 1. LLM 기반 파싱 시도
     parsed_by_llm = _call_llm_for_datetime_parsing(datetime_str, base_date_iso)
     if parsed_by_llm:
@@ -562,12 +615,13 @@ def parse_date_range_with_context(
     return parsed_start, parsed_end
 
 
-def parse_duration_to_days(text: str) -> Optional[float]:
+def parse_duration_to_days(text: str, business_days: bool = False) -> Optional[float]:
     """문자열에서 기간을 추출하여 '일' 단위로 변환합니다.
     'X월 Y일' 같은 날짜 표현을 기간으로 오인하지 않도록 주의합니다.
 
     Args:
         text: 기간을 나타내는 문자열 (예: "3일", "일주일", "2주간", "반나절")
+        business_days: True면 주 단위를 영업일(1주 = 5일)로 환산 (연차 일수 계산용)
 
     Returns:
         변환된 일수(float) 또는 변환 실패 시 None
@@ -577,6 +631,7 @@ def parse_duration_to_days(text: str) -> Optional[float]:
 
     text = text.strip()
     value = None
+    week_days = BUSINESS_DAYS_PER_WEEK if business_days else 7
 
     # 1. 'X월 Y일' 형식의 날짜 패턴인지 먼저 확인. 날짜면 기간이 아님.
     if re.search(r"\d{1,2}\s*월\s*\d{1,2}\s*일", text):
@@ -595,7 +650,7 @@ def parse_duration_to_days(text: str) -> Optional[float]:
         elif unit == "일":
             value = num
         elif unit == "주":
-            value = num * 7
+            value = num * week_days
         elif unit in ["달", "개월"]:
             value = num * 30  # 근사치
         elif unit == "년":
@@ -609,7 +664,7 @@ def parse_duration_to_days(text: str) -> Optional[float]:
             "나흘": 4,
             "닷새": 5,
             "엿새": 6,
-            "일주일": 7,
+            "일주일": week_days,
             "한달": 30,
             "두달": 60,
             "반나절": 0.5,
@@ -5,9 +5,21 @@
 """
 
 from .base_validator import BaseValidator, DefaultValidator, ValidationResult
+from .compiled_validator import (
+    BatchValidationResult,
+    CompiledFormValidator,
+    get_form_validator,
+    validate_form,
+    validate_forms,
+)
 
 __all__ = [
     "BaseValidator",
     "DefaultValidator",
     "ValidationResult",
+    "BatchValidationResult",
+    "CompiledFormValidator",
+    "get_form_validator",
+    "validate_form",
+    "validate_forms",
 ]
@@ -5,9 +5,31 @@
 """
 
 import logging
+import re
 from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# 양식 공통 날짜/숫자 필드
+DATE_FIELDS = (
+    "start_date",
+    "end_date",
+    "application_date",
+    "work_date",
+    "departure_date",
+    "request_date",
+    "draft_date",
+    "statement_date",
+)
+NUMERIC_FIELDS = (
+    "amount",
+    "total_amount",
+    "quantity",
+    "unit_price",
+    "total_price",
+)
+
 
 class ValidationResult:
     """검증 결과를 담는 클래스"""
@@ -21,11 +43,19 @@ class ValidationResult:
         self.is_valid = is_valid
         self.errors = errors or []
         self.warnings = warnings or []
+        # 구조화된 에러 ({"field", "code", "message"}), field/code를 준 에러만 기록
+        self.details: List[Dict[str, str]] = []
 
-    def add_error(self, message: str):
+    def add_error(
+        self, message: str, field: Optional[str] = None, code: Optional[str] = None
+    ):
         """에러 추가"""
         self.errors.append(message)
         self.is_valid = False
+        if field is not None or code is not None:
+            self.details.append(
+                {"field": field or "", "code": code or "invalid", "message": message}
+            )
 
     def add_warning(self, message: str):
         """경고 추가"""
@@ -91,57 +121,46 @@ class BaseValidator(ABC):
 
         for field in required_fields:
             if field not in form_data or not form_data[field]:
-                result.add_error(f"필수 필드가 누락되었습니다: {field}")
+                result.add_error(
+                    f"필수 필드가 누락되었습니다: {field}", field=field, code="required"
+                )
 
     def validate_date_formats(
         self, form_data: Dict[str, Any], result: ValidationResult
     ):
         """날짜 형식 검증"""
-        import re
-
-        date_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-
-        date_fields = [
-            "start_date",
-            "end_date",
-            "application_date",
-            "work_date",
-            "departure_date",
-            "request_date",
-            "draft_date",
-            "statement_date",
-        ]
-
-        for field in date_fields:
+        for field in DATE_FIELDS:
             if field in form_data and form_data[field]:
                 value = form_data[field]
-                if isinstance(value, str) and not date_pattern.match(value):
+                if isinstance(value, str) and not DATE_PATTERN.fullmatch(value):
                     result.add_error(
-                        f"잘못된 날짜 형식입니다: {field} = {value} (YYYY-MM-DD 형식이어야 합니다)"
+                        f"잘못된 날짜 형식입니다: {field} = {value} (YYYY-MM-DD 형식이어야 합니다)",
+                        field=field,
+                        code="invalid_date",
                     )
 
     def validate_numeric_fields(
         self, form_data: Dict[str, Any], result: ValidationResult
     ):
         """숫자 형식 검증"""
-        numeric_fields = [
-            "amount",
-            "total_amount",
-            "quantity",
-            "unit_price",
-            "total_price",
-        ]
-
-        for field in numeric_fields:
+        for field in NUMERIC_FIELDS:
             if field in form_data and form_data[field]:
                 value = form_data[field]
                 try:
                     if isinstance(value, str):
                         int(value)
                     elif not isinstance(value, (int, float)):
-                        result.add_error(f"숫자가 아닌 값입니다: {field} = {value}")
+                        result.add_error(
+                            f"숫자가 아닌 값입니다: {field} = {value}",
+                            field=field,
+                            code="invalid_number",
+                        )
                 except ValueError:
-                    result.add_error(f"잘못된 숫자 형식입니다: {field} = {value}")
+                    result.add_error(
+                        f"잘못된 숫자 형식입니다: {field} = {value}",
+                        field=field,
+                        code="invalid_number",
+                    )
 
     # 추상 메서드들 - 각 양식별 검증기에서 구현
     @abstractmethod
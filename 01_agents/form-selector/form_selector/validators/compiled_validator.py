@@ -0,0 +1,353 @@
+"""
+스키마 컴파일 검증기
+
+FORM_CONFIGS의 슬롯 모델(Pydantic)과 Payload 매핑 스펙에서 양식별 검증 규칙을 뽑아
+모듈 로드 시 한 번 컴파일합니다. 검증은 폼 필드를 한 번만 순회하며 필드명으로 규칙을
+바로 찾습니다. (날짜/숫자 정규식도 미리 컴파일)
+
+규칙:
+- 날짜: 슬롯 모델/매핑 스펙의 `*_date` 필드 → YYYY-MM-DD
+- 숫자: 슬롯 모델의 int/float 필드와 공통 금액 필드 → 정수/실수 (쉼표 불가, 변환 시 0이 되므로)
+- 선택값: Enum 필드 → 허용된 값
+- 필수: dayList/amountList 생성에 필요한 필드 (매핑 스펙의 DayRange/AmountRow)
+- 아이템 목록(`items` 등)은 아이템 모델 규칙으로, 구 형식(`<key>_1..N`)은 같은 규칙을 펼쳐서 검사
+
+여러 양식은 `validate_forms`로 한 번에 검증하며, 항목별 결과와 오류 코드/필드별 집계를 돌려줍니다.
+"""
+
+import re
+import typing
+from collections import Counter
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ..form_configs import FORM_CONFIGS
+from ..payload_mapping import (
+    PAYLOAD_SPECS,
+    AmountRow,
+    AmountRows,
+    FirstOf,
+    Form,
+    Item,
+    Json,
+    resolve_form_name,
+)
+from .base_validator import DATE_FIELDS, DATE_PATTERN, NUMERIC_FIELDS, ValidationResult
+
+NUMBER_PATTERN = re.compile(r"[-+]?\d+(\.\d+)?")
+_ITEM_INDEX = re.compile(r"\[\d+\]")
+
+# 구 형식 아이템 필드(`<key>_N`)의 최대 개수 (HTML 템플릿 기준)
+MAX_FLAT_ITEMS = 6
+
+# value -> (code, 메시지 템플릿) 또는 None. 메시지는 오류가 있을 때만 만듭니다.
+Check = Callable[[Any], Optional[Tuple[str, str]]]
+
+_INVALID_DATE = (
+    "invalid_date",
+    "잘못된 날짜 형식입니다: {field} = {value} (YYYY-MM-DD 형식이어야 합니다)",
+)
+_INVALID_NUMBER = ("invalid_number", "잘못된 숫자 형식입니다: {field} = {value}")
+_NOT_A_NUMBER = ("invalid_number", "숫자가 아닌 값입니다: {field} = {value}")
+
+
+def _check_date(value: Any) -> Optional[Tuple[str, str]]:
+    if isinstance(value, str) and not DATE_PATTERN.fullmatch(value):
+        return _INVALID_DATE
+    return None
+
+
+def _check_number(value: Any) -> Optional[Tuple[str, str]]:
+    if isinstance(value, str):
+        if not NUMBER_PATTERN.fullmatch(value.strip()):
+            return _INVALID_NUMBER
+    elif not isinstance(value, (int, float)):
+        return _NOT_A_NUMBER
+    return None
+
+
+def _choice_check(choices: Tuple[str, ...]) -> Check:
+    allowed = frozenset(choices)
+    error = (
+        "invalid_choice",
+        "허용되지 않는 값입니다: {field} = {value} ("
+        + ", ".join(choices)
+        + " 중 하나)",
+    )
+
+    def check(value: Any) -> Optional[Tuple[str, str]]:
+        return None if value in allowed else error
+
+    return check
+
+
+def _add_error(
+    result: ValidationResult, error: Tuple[str, str], field: str, value: Any
+):
+    code, template = error
+    result.add_error(template.format(field=field, value=value), field=field, code=code)
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Optional[X] → X"""
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if typing.get_origin(annotation) is typing.Union and len(args) == 1:
+        return args[0]
+    return annotation
+
+
+def _item_model(annotation: Any) -> Optional[type]:
+    """List[Model] → Model"""
+    annotation = _unwrap(annotation)
+    if typing.get_origin(annotation) in (list, List):
+        (inner,) = typing.get_args(annotation) or (None,)
+        if isinstance(inner, type) and issubclass(inner, BaseModel):
+            return inner
+    return None
+
+
+def _field_check(name: str, annotation: Any) -> Optional[Check]:
+    annotation = _unwrap(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _choice_check(tuple(str(member.value) for member in annotation))
+    if annotation in (int, float) or name in NUMERIC_FIELDS:
+        return _check_number
+    if name.endswith("_date") or name in DATE_FIELDS:
+        return _check_date
+    return None
+
+
+def _model_checks(model: type) -> Dict[str, Check]:
+    checks = {}
+    for name, field in model.model_fields.items():
+        check = _field_check(name, field.annotation)
+        if check:
+            checks[name] = check
+    return checks
+
+
+def _spec_fields(specs: Iterable[Any], kind: type) -> Iterable[str]:
+    for spec in specs:
+        if isinstance(spec, kind):
+            yield spec.key
+        elif isinstance(spec, FirstOf):
+            yield from _spec_fields(spec.specs, kind)
+        elif isinstance(spec, Json):
+            yield from _spec_fields(spec.fields.values(), kind)
+
+
+class CompiledFormValidator:
+    """양식 하나의 컴파일된 검증 규칙"""
+
+    def __init__(
+        self,
+        form_name: str,
+        field_checks: Dict[str, Check],
+        list_checks: Dict[str, Dict[str, Check]],
+        required_fields: Tuple[str, ...],
+        flat_checks: Optional[Dict[str, Check]] = None,
+    ):
+        self.form_name = form_name
+        self.list_checks = list_checks
+        self.required_fields = required_fields
+        # 필드명 → 규칙. 구 형식 `<key>_N` 필드도 같은 규칙으로 바로 찾도록 펼쳐 두고,
+        # 아이템 목록 필드는 아이템 검사 함수를 가리킵니다.
+        self.checks = dict(field_checks)
+        for item_checks in [*list_checks.values(), flat_checks or {}]:
+            for key, check in item_checks.items():
+                self.checks.setdefault(key, check)
+                for i in range(1, MAX_FLAT_ITEMS + 1):
+                    self.checks.setdefault(f"{key}_{i}", check)
+        self.list_fields = {
+            name: self._items_check(name, item_checks)
+            for name, item_checks in list_checks.items()
+        }
+
+    def validate(
+        self, form_data: Dict[str, Any], result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
+        result = result or ValidationResult()
+        if not isinstance(form_data, dict):
+            result.add_error(
+                "form_data는 객체여야 합니다.", field="form_data", code="invalid_type"
+            )
+            return result
+
+        checks, list_fields = self.checks, self.list_fields
+        for field, value in form_data.items():
+            check = checks.get(field)
+            if check is None:
+                items_check = list_fields.get(field)
+                if items_check is not None and isinstance(value, list):
+                    items_check(value, result)
+                continue
+            if value is None or value == "":
+                continue
+            error = check(value)
+            if error:
+                _add_error(result, error, field, value)
+
+        for field in self.required_fields:
+            if not form_data.get(field):
+                result.add_error(
+                    f"필수 필드가 누락되었습니다: {field}", field=field, code="required"
+                )
+        return result
+
+    @staticmethod
+    def _items_check(list_field: str, item_checks: Dict[str, Check]):
+        def check_items(items: List[Any], result: ValidationResult):
+            for index, item in enumerate(items):
+                if not isinstance(item, dict):
+                    path = f"{list_field}[{index}]"
+                    result.add_error(
+                        f"아이템은 객체여야 합니다: {path}",
+                        field=path,
+                        code="invalid_type",
+                    )
+                    continue
+                for key, value in item.items():
+                    check = item_checks.get(key)
+                    if check is None or value is None or value == "":
+                        continue
+                    error = check(value)
+                    if error:
+                        _add_error(result, error, f"{list_field}[{index}].{key}", value)
+
+        return check_items
+
+
+def compile_form_validator(form_name: str) -> CompiledFormValidator:
+    """FORM_CONFIGS의 슬롯 모델과 Payload 매핑 스펙으로 양식 검증기를 만듭니다."""
+    model = FORM_CONFIGS[form_name].model
+    field_checks = _model_checks(model)
+    list_checks = {
+        name: _model_checks(item_model)
+        for name, field in model.model_fields.items()
+        if (item_model := _item_model(field.annotation)) is not None
+    }
+    for name in list_checks:
+        field_checks.pop(name, None)
+    # 숫자/날짜 공통 필드는 모델에 없어도 검사 (기존 BaseValidator와 동일)
+    for name in NUMERIC_FIELDS:
+        field_checks.setdefault(name, _check_number)
+    for name in DATE_FIELDS:
+        field_checks.setdefault(name, _check_date)
+
+    required: List[str] = []
+    flat_checks: Dict[str, Check] = {}
+    spec = PAYLOAD_SPECS.get(form_name)
+    if spec is not None:
+        specs = [spec.doc_cn, *spec.apd_info.values()]
+        if spec.days is not None:
+            required.append("start_date")
+            if not spec.days.single_day:
+                required.append("end_date")
+        if isinstance(spec.amounts, AmountRow):
+            required.extend(spec.amounts.when)
+            specs.extend(spec.amounts.row.values())
+        elif isinstance(spec.amounts, AmountRows):
+            specs.extend(spec.amounts.row.values())
+            # 매핑 스펙에만 있는 아이템 날짜 필드 (예: item_delivery_date)
+            rows = [spec.amounts.row, spec.amounts.flat_row or {}]
+            item_checks = (
+                list_checks.setdefault(spec.amounts.list_field, {})
+                if spec.amounts.list_field
+                else flat_checks
+            )
+            for row in rows:
+                for name in _spec_fields(row.values(), Item):
+                    if name.endswith("_date"):
+                        item_checks.setdefault(name, _check_date)
+        for name in _spec_fields(specs, Form):
+            if name.endswith("_date"):
+                field_checks.setdefault(name, _check_date)
+
+    return CompiledFormValidator(
+        form_name,
+        field_checks,
+        list_checks,
+        tuple(dict.fromkeys(required)),
+        flat_checks,
+    )
+
+
+COMPILED_VALIDATORS: Dict[str, CompiledFormValidator] = {
+    form_name: compile_form_validator(form_name) for form_name in FORM_CONFIGS
+}
+
+
+def get_form_validator(form_type: str) -> Optional[CompiledFormValidator]:
+    """한국어 양식명/english_id로 컴파일된 검증기를 찾습니다. (미지원 시 None)"""
+    form_name = resolve_form_name(form_type)
+    return COMPILED_VALIDATORS.get(form_name) if form_name else None
+
+
+def validate_form(form_type: str, form_data: Dict[str, Any]) -> ValidationResult:
+    """양식 하나를 검증합니다. 지원하지 않는 양식이면 unsupported_form_type 오류입니다."""
+    validator = get_form_validator(form_type)
+    if validator is None:
+        result = ValidationResult()
+        result.add_error(
+            f"지원하지 않는 양식 타입입니다: {form_type}",
+            field="form_type",
+            code="unsupported_form_type",
+        )
+        return result
+    return validator.validate(form_data)
+
+
+class BatchValidationResult:
+    """여러 양식의 검증 결과 (항목별 결과 + 오류 코드/필드별 집계)"""
+
+    def __init__(self, results: List[ValidationResult]):
+        self.results = results
+        self.valid_count = sum(1 for r in results if r.is_valid)
+        self.invalid_count = len(results) - self.valid_count
+        self.error_counts = Counter(
+            detail["code"] for r in results for detail in r.details
+        )
+        # 아이템 위치는 빼고 집계 (card_usage_items[3].usage_date → card_usage_items[].usage_date)
+        self.field_counts = Counter(
+            _ITEM_INDEX.sub("[]", detail["field"])
+            for r in results
+            for detail in r.details
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        return self.invalid_count == 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "valid": self.is_valid,
+            "total": len(self.results),
+            "valid_count": self.valid_count,
+            "invalid_count": self.invalid_count,
+            "error_counts": dict(self.error_counts),
+            "field_counts": dict(self.field_counts),
+            "results": [
+                {"index": index, "valid": r.is_valid, "errors": r.details}
+                for index, r in enumerate(self.results)
+                if not r.is_valid
+            ],
+        }
+
+
+def validate_forms(forms: List[Dict[str, Any]]) -> BatchValidationResult:
+    """`[{"form_type", "form_data"}, ...]`을 한 번에 검증합니다."""
+    results = []
+    for form in forms:
+        if not isinstance(form, dict) or not form.get("form_type"):
+            result = ValidationResult()
+            result.add_error(
+                "form_type과 form_data가 필요합니다.",
+                field="form_type",
+                code="required",
+            )
+            results.append(result)
+            continue
+        results.append(validate_form(form["form_type"], form.get("form_data")))
+    return BatchValidationResult(results)
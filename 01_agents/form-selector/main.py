@@ -4,18 +4,28 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from form_selector.schema import UserInput
-from form_selector.service import classify_and_extract_slots_for_template
+from form_selector.service import aclassify_and_extract_slots_for_template
 import os
 from dotenv import load_dotenv
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 import logging
+import asyncio
 import httpx
 import json
 
 # schema와 service에서 추가된 모델/함수 임포트
 from form_selector import schema as form_schema  # schema 전체를 form_schema로 임포트
+from form_selector.llm import ChainReloadError, chain_registry
+from form_selector.cache import response_cache
+from form_selector import rag
+from form_selector.rag import TemplateReloadError, template_store
+from form_selector.processors import ProcessorFactory
+from form_selector import submission
+from form_selector.validators import validate_forms
+from form_selector import observability
 from form_selector.service import (
-    get_approval_info,
+    aget_approval_info,
+    close_approval_http_client,
     convert_form_data_to_api_payload,
 )  # 새로 추가한 서비스 함수
 
@@ -36,6 +46,42 @@ app.mount(
 )
 
 
+@app.on_event("startup")
+async def startup_event():
+    # 양식별 공유 프로세서 생성 및 FORM_CONFIGS 전체 해석 self-test (실패 시 기동 중단)
+    ProcessorFactory.warm_up()
+    # 템플릿 로드(cold-start 예산 내) 및 FAISS 인덱스 백그라운드 준비
+    await rag.initialize()
+    # 제출 실패 항목 재시도 워커 (재시도 큐는 디스크에 있으므로 재기동 후에도 이어서 처리)
+    app.state.retry_worker = asyncio.create_task(submission.retry_worker())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 결재라인 API 호출에 사용한 공유 httpx.AsyncClient 정리
+    await close_approval_http_client()
+    retry_worker = getattr(app.state, "retry_worker", None)
+    if retry_worker is not None:
+        retry_worker.cancel()
+    await submission.close_submit_http_client()
+    submission.retry_queue.close()
+    await rag.shutdown()
+
+
+@app.get("/health/ready")
+async def readiness_endpoint():
+    """템플릿이 로드되어 요청을 처리할 수 있으면 200, 아니면 503을 반환합니다.
+    FAISS 인덱스 상태(진행률 포함)는 참고용으로 함께 반환합니다."""
+    body = {
+        "ready": rag.is_ready(),
+        "templates": template_store.stats()["templates"],
+        "vector_store": rag.vector_store_status(),
+    }
+    if not body["ready"]:
+        raise HTTPException(status_code=503, detail=body)
+    return body
+
+
 @app.get("/")
 async def read_root():
     return RedirectResponse(url="/ui/login.html")
@@ -44,7 +90,7 @@ async def read_root():
 @app.post("/form-selector")
 async def form_selector_endpoint(user_input: UserInput):
     try:
-        result = classify_and_extract_slots_for_template(user_input)
+        result = await aclassify_and_extract_slots_for_template(user_input)
 
         if "error" in result:
             error_type = result.get("error")
@@ -76,11 +122,85 @@ async def form_selector_endpoint(user_input: UserInput):
         )
 
 
+# --- LLM 체인 레지스트리 상태/재로드 엔드포인트 --- #
+@app.get("/llm-chains/stats")
+async def llm_chain_stats_endpoint():
+    """체인별 생성/재생성 횟수와 소요 시간(ms)을 반환합니다."""
+    return chain_registry.stats()
+
+
+@app.post("/llm-chains/reload")
+async def llm_chain_reload_endpoint(name: str = None):
+    """프롬프트 파일 변경 여부와 관계없이 체인을 강제로 다시 생성합니다.
+
+    빌더가 실패한 체인(프롬프트 파일 누락/오류 등)은 기존 체인을 계속 사용하고 500으로 알립니다.
+    """
+    try:
+        # 프롬프트 파일 읽기와 체인 생성은 이벤트 루프 밖에서 실행
+        return {"reloaded_ms": await asyncio.to_thread(chain_registry.reload, name)}
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "CHAIN_NOT_FOUND", "message": f"등록되지 않은 체인: {name}"},
+        )
+    except ChainReloadError as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "CHAIN_RELOAD_FAILED",
+                "message": "일부 체인을 다시 생성하지 못해 기존 체인을 계속 사용합니다.",
+                "failed": e.errors,
+                "reloaded_ms": e.timings,
+            },
+        )
+
+
+@app.get("/cache/stats")
+async def response_cache_stats_endpoint():
+    """분류/슬롯 추출 응답 캐시의 적중/미스/제거 통계를 반환합니다."""
+    return response_cache.stats()
+
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """단계별 소요 시간, LLM 호출 지연 시간/토큰/비용 히스토그램 (Prometheus 텍스트 포맷)"""
+    return Response(
+        content=observability.render_metrics(),
+        media_type=observability.METRICS_CONTENT_TYPE,
+    )
+
+
+@app.get("/templates/stats")
+async def template_store_stats_endpoint():
+    """템플릿 저장소의 조회/폴백/재로드 통계를 반환합니다."""
+    return template_store.stats()
+
+
+@app.post("/templates/reload")
+async def template_store_reload_endpoint():
+    """파일 변경 여부와 관계없이 모든 HTML 템플릿을 다시 읽습니다.
+
+    읽지 못한 템플릿은 마지막으로 읽은 내용을 계속 사용하고 500으로 알립니다.
+    """
+    try:
+        return {"reloaded_ms": await asyncio.to_thread(template_store.reload)}
+    except TemplateReloadError as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "TEMPLATE_RELOAD_FAILED",
+                "message": "일부 템플릿을 읽지 못해 기존 템플릿을 계속 사용합니다.",
+                "failed": e.errors,
+                "reloaded_ms": e.elapsed_ms,
+            },
+        )
+
+
 # --- 결재자 정보 조회 엔드포인트 --- #
 @app.post("/approver-info", response_model=form_schema.ApproverInfoResponse)
 async def approver_info_endpoint(request: form_schema.ApproverInfoRequest):
     try:
-        result = get_approval_info(request)
+        result = await aget_approval_info(request)
         if result.code != 1:  # 실패 코드로 가정 (예: 0 또는 음수)
             # 서비스 함수 내부에서 HTTPException을 발생시키지 않는 경우, 여기서 처리
             # 여기서는 code=1이 성공이라고 가정하고, 그 외는 일반 오류로 처리하거나
@@ -141,7 +261,9 @@ async def fetch_my_line_endpoint(request: form_schema.ApproverInfoRequest):
             api_response.raise_for_status()  # HTTP 4xx/5xx 오류 발생 시 예외 발생
 
             api_response_json = api_response.json()
-            logging.info(f"외부 myLine API 응답: {api_response_json}")
+            observability.log_payload(
+                logging.root, "외부 myLine API 응답", api_response_json
+            )
 
             # API 응답 구조에 따라 파싱 로직을 조정해야 합니다.
             # 예시: 응답이 {"code": 1, "message": "...", "data": {"drafterName": "...", "drafterDepartment": "...", "approvers": [...]}} 형태라고 가정
@@ -272,39 +394,34 @@ async def submit_form_endpoint(request: dict):
             )
 
         # 1단계: 폼 데이터를 API Payload로 변환
-        api_payload = convert_form_data_to_api_payload(form_type, form_data)
+        try:
+            api_payload = convert_form_data_to_api_payload(form_type, form_data)
+        except ValueError as ve:
+            # 지원하지 않는 양식 타입 등의 경우
+            raise HTTPException(
+                status_code=400,
+                detail={"error": "INVALID_FORM_TYPE", "message": str(ve)},
+            )
 
         # 2단계: 외부 API로 제출
-        api_base_url = os.getenv(
-            "APPROVAL_API_BASE_URL", "https://dev-api.ntoday.kr/api/v1/epaper"
-        )
-
-        # 모든 양식에 대해 동일한 엔드포인트 사용
-        endpoint = "register"  # 실제 외부 API에서 사용하는 통합 엔드포인트
-        submit_url = f"{api_base_url}/{endpoint}"
-
-        headers = {"Content-Type": "application/json"}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            logging.info(f"외부 API 제출: POST {submit_url}")
-            logging.info(f"Payload: {api_payload}")
-
-            api_response = await client.put(
-                submit_url, json=api_payload, headers=headers
-            )
+        # 모든 양식에 대해 동일한 엔드포인트 사용 (공유 커넥션 풀)
+        submit_url = submission.register_url()
+        logging.info(f"외부 API 제출: PUT {submit_url}")
+        observability.log_payload(logging.root, "Payload", api_payload)
 
-            api_response.raise_for_status()
-            response_data = api_response.json()
+        response_data = await submission.put_register(api_payload)
 
-            logging.info(f"외부 API 응답: {response_data}")
+        observability.log_payload(logging.root, "외부 API 응답", response_data)
 
-            return {
-                "success": True,
-                "form_type": form_type,
-                "api_response": response_data,
-                "submitted_payload": api_payload,
-            }
+        return {
+            "success": True,
+            "form_type": form_type,
+            "api_response": response_data,
+            "submitted_payload": api_payload,
+        }
 
+    except HTTPException as http_exc:
+        raise http_exc
     except httpx.HTTPStatusError as e:
         error_detail = f"외부 API 오류: {e.response.status_code}"
         try:
@@ -342,6 +459,69 @@ async def submit_form_endpoint(request: dict):
         )
 
 
+@app.post("/validate-forms")
+async def validate_forms_endpoint(request: dict):
+    """여러 양식을 제출 없이 한 번에 검증하는 엔드포인트
+
+    요청: {"forms": [{"form_type": ..., "form_data": {...}}, ...]}
+    응답: 유효/무효 건수, 오류 코드·필드별 집계, 무효 항목의 구조화된 오류 목록
+    """
+    forms = request.get("forms")
+    if not isinstance(forms, list) or not forms:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "MISSING_FORMS", "message": "forms 목록이 필요합니다."},
+        )
+    if len(forms) > submission.SUBMIT_MAX_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "BATCH_TOO_LARGE",
+                "message": f"한 번에 최대 {submission.SUBMIT_MAX_BATCH}건까지 검증할 수 있습니다.",
+            },
+        )
+    # 검증은 CPU 작업이므로 이벤트 루프 밖에서 처리
+    report = await asyncio.to_thread(validate_forms, forms)
+    return report.to_dict()
+
+
+@app.post("/submit-forms")
+async def submit_forms_endpoint(request: dict):
+    """여러 양식을 한 번에 검증/변환하고 제출하는 일괄 제출 엔드포인트
+
+    요청: {"forms": [{"form_type": ..., "form_data": {...}}, ...]}
+    응답: 항목별 status (submitted / invalid / failed / queued)와 집계.
+    queued 항목은 재시도 큐에 저장되어 백그라운드에서 다시 제출됩니다.
+    """
+    forms = request.get("forms")
+    if not isinstance(forms, list) or not forms:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "MISSING_FORMS", "message": "forms 목록이 필요합니다."},
+        )
+    if len(forms) > submission.SUBMIT_MAX_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "BATCH_TOO_LARGE",
+                "message": f"한 번에 최대 {submission.SUBMIT_MAX_BATCH}건까지 제출할 수 있습니다.",
+            },
+        )
+    return await submission.submit_batch(forms)
+
+
+@app.get("/submit-forms/retry-queue")
+async def retry_queue_stats_endpoint():
+    """재시도 큐의 대기(pending)/처리 중(inflight)/포기(dead) 건수와 다음 재시도 시각을 반환합니다."""
+    return await asyncio.to_thread(submission.retry_queue.stats)
+
+
+@app.post("/submit-forms/retry-queue/process")
+async def retry_queue_process_endpoint():
+    """재시도 시점이 된 항목을 즉시 다시 제출합니다."""
+    return await submission.process_retry_queue()
+
+
 # --- END 2단계 변환 및 제출 엔드포인트 --- #
 
 
@@ -0,0 +1,36 @@
+"""add messages (room_id, timestamp, id) index
+
+Revision ID: 3f1c2a9d8b7e
+Revises: 
+Create Date: 2026-10-18 04:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d8b7e"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # init_db()로 새로 만든 DB에는 모델 정의로 이미 인덱스가 있으므로 if_not_exists
+    op.create_index(
+        "ix_messages_room_timestamp_id",
+        "messages",
+        ["room_id", "timestamp", "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_messages_room_timestamp_id", table_name="messages", if_exists=True
+    )
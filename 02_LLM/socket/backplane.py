@@ -0,0 +1,215 @@
+"""
+채팅 메시지 백플레인 (여러 워커/호스트 간 브로드캐스트 중계)
+
+한 워커에서 브로드캐스트한 메시지를 다른 워커에 전달해, 각 워커가 자기 로컬 소켓에 다시
+팬아웃하도록 합니다. ConnectionManager는 로컬 전송을 먼저 하고 백플레인에 publish하며,
+백플레인에서 받은 메시지는 메시지 `id`로 중복을 걸러낸 뒤 로컬 소켓에만 전송합니다.
+
+- InMemoryBackplane: 같은 프로세스 안에서만 중계 (단일 워커 기본값, 테스트용).
+  같은 InMemoryHub를 공유하는 인스턴스끼리 메시지를 주고받습니다.
+- RedisBackplane: Redis pub/sub 채널 하나로 모든 워커에 중계.
+  구독은 읽기 타임아웃이 없는 전용 연결을 쓰며, 연결이 끊기면 1초 후 다시 구독합니다.
+
+전달되는 봉투(envelope) 형식: {"origin": 워커 ID, "room_id": 방 ID, "message": 메시지}
+"""
+
+import asyncio
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional
+
+import orjson
+import redis.asyncio as aioredis
+
+# 백플레인 메시지 수신 콜백: (room_id, message) -> None
+MessageHandler = Callable[[str, dict], Awaitable[None]]
+
+REDIS_BACKPLANE_CHANNEL = "chat:broadcast"
+RECENT_MESSAGE_IDS_SIZE = 10000  # 중복 제거용으로 기억할 최근 메시지 ID 수
+
+
+def new_worker_id() -> str:
+    """워커(프로세스) 식별자. 자기가 보낸 메시지를 다시 받았을 때 구분하는 용도"""
+    return f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class RecentMessageIds:
+    """최근 메시지 ID 집합 (가장 오래된 ID부터 제거). 중복 전송 방지용"""
+
+    def __init__(self, maxsize: int = RECENT_MESSAGE_IDS_SIZE):
+        self.maxsize = maxsize
+        self._ids: OrderedDict = OrderedDict()
+
+    def add(self, message_id: str) -> bool:
+        """처음 보는 ID면 기록하고 True, 이미 본 ID면 False"""
+        if message_id in self._ids:
+            return False
+        self._ids[message_id] = None
+        if len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class Backplane(ABC):
+    """워커 간 메시지 중계 인터페이스"""
+
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or new_worker_id()
+        self.handler: Optional[MessageHandler] = None
+        self.published_count = 0
+        self.received_count = 0
+
+    async def start(self, handler: MessageHandler):
+        """다른 워커의 메시지를 받기 시작합니다. 자기가 보낸 메시지는 handler로 오지 않습니다."""
+        self.handler = handler
+
+    @abstractmethod
+    async def publish(self, room_id: str, message: dict):
+        """메시지를 다른 워커들에 전달합니다."""
+
+    async def close(self):
+        self.handler = None
+
+    def _envelope(self, room_id: str, message: dict) -> bytes:
+        return orjson.dumps(
+            {"origin": self.worker_id, "room_id": room_id, "message": message},
+            default=str,
+        )
+
+    async def _dispatch(self, payload):
+        """수신한 봉투를 handler로 넘깁니다. (자기 메시지와 잘못된 형식은 무시)"""
+        try:
+            envelope = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
+            print(f"Invalid backplane payload: {e}")
+            return
+        if envelope.get("origin") == self.worker_id or self.handler is None:
+            return
+        self.received_count += 1
+        await self.handler(envelope["room_id"], envelope["message"])
+
+    def stats(self) -> dict:
+        return {
+            "type": self.__class__.__name__,
+            "worker_id": self.worker_id,
+            "published": self.published_count,
+            "received": self.received_count,
+        }
+
+
+class InMemoryHub:
+    """InMemoryBackplane 인스턴스들이 공유하는 구독자 목록"""
+
+    def __init__(self):
+        self.subscribers: List["InMemoryBackplane"] = []
+
+
+class InMemoryBackplane(Backplane):
+    """프로세스 내 백플레인. hub를 공유하는 인스턴스(워커 역할)끼리 메시지를 중계"""
+
+    def __init__(
+        self, hub: Optional[InMemoryHub] = None, worker_id: Optional[str] = None
+    ):
+        super().__init__(worker_id)
+        self.hub = hub or InMemoryHub()
+
+    async def start(self, handler: MessageHandler):
+        await super().start(handler)
+        if self not in self.hub.subscribers:
+            self.hub.subscribers.append(self)
+
+    async def publish(self, room_id: str, message: dict):
+        payload = self._envelope(room_id, message)
+        self.published_count += 1
+        for subscriber in list(self.hub.subscribers):
+            if subscriber is not self:
+                await subscriber._dispatch(payload)
+
+    async def close(self):
+        if self in self.hub.subscribers:
+            self.hub.subscribers.remove(self)
+        await super().close()
+
+
+class RedisBackplane(Backplane):
+    """Redis pub/sub 백플레인
+
+    앱의 Redis 풀은 socket_timeout이 있어 메시지가 없는 동안 구독이 끊기므로,
+    백플레인은 타임아웃 없이 health check만 하는 별도 클라이언트를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        channel: str = REDIS_BACKPLANE_CHANNEL,
+        worker_id: Optional[str] = None,
+    ):
+        super().__init__(worker_id)
+        self.redis_url = redis_url
+        self.channel = channel
+        self.redis = None
+        self.listener_task: Optional[asyncio.Task] = None
+        self.subscribed = asyncio.Event()
+
+    async def start(self, handler: MessageHandler):
+        await super().start(handler)
+        self.redis = aioredis.from_url(
+            self.redis_url,
+            socket_connect_timeout=5.0,
+            health_check_interval=30,
+        )
+        await self.redis.ping()
+        self.listener_task = asyncio.create_task(self._listen())
+        # 첫 구독이 끝나기 전에 publish한 메시지를 놓치지 않도록 잠시 대기
+        try:
+            await asyncio.wait_for(self.subscribed.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            print(f"Redis backplane subscribe to {self.channel} timed out")
+
+    async def _listen(self):
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                self.subscribed.set()
+                print(f"Redis backplane subscribed: {self.channel} ({self.worker_id})")
+                async for item in pubsub.listen():
+                    if item.get("type") == "message":
+                        await self._dispatch(item["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Redis backplane listener error: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def publish(self, room_id: str, message: dict):
+        if self.redis is None:
+            return
+        try:
+            await self.redis.publish(self.channel, self._envelope(room_id, message))
+            self.published_count += 1
+        except Exception as e:
+            # 로컬 소켓에는 이미 전송했으므로 중계 실패만 기록
+            print(f"Redis backplane publish failed: {e}")
+
+    async def close(self):
+        if self.listener_task and not self.listener_task.done():
+            self.listener_task.cancel()
+            try:
+                await self.listener_task
+            except asyncio.CancelledError:
+                pass
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+        await super().close()
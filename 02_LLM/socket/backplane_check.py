@@ -0,0 +1,201 @@
+"""
+멀티 프로세스 백플레인 검증 스크립트
+
+한 머신에서 streaming:app 워커 프로세스 여러 개를 CHAT_BACKPLANE=redis로 띄우고,
+같은 방에 워커별로 나눠 접속한 클라이언트들이 서로의 메시지를 정확히 한 번씩 받는지 확인합니다.
+--redis-url을 주지 않으면 fakeredis TCP 서버를 띄워 사용합니다. (로컬 Redis 불필요)
+
+모든 클라이언트가 메시지를 한꺼번에 보내므로 클라이언트당 수신 수(전체 클라이언트 수 x --messages)가
+서버의 CLIENT_SEND_QUEUE_SIZE(256)를 넘으면 drop_oldest 정책으로 버려진 메시지가 missing에 잡힙니다.
+
+실행 예:
+    python backplane_check.py --workers 3 --clients-per-worker 5 --messages 3
+    python backplane_check.py --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+import websockets
+
+SOCKET_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECK_PREFIX = "bpcheck|"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_fake_redis() -> str:
+    """fakeredis TCP 서버를 백그라운드 스레드로 띄우고 URL을 반환"""
+    from fakeredis import TcpFakeServer
+
+    port = free_port()
+    server = TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"redis://127.0.0.1:{port}/0"
+
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"worker on port {port} exited: {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"worker on port {port} did not start")
+
+
+def start_workers(count: int, redis_url: str, workdir: str, log_level: str):
+    """워커마다 별도 작업 디렉터리(static/, templates, chat.db)로 uvicorn 프로세스 실행"""
+    env = dict(os.environ)
+    env["CHAT_BACKPLANE"] = "redis"
+    env["REDIS_URL"] = redis_url
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (SOCKET_DIR, env.get("PYTHONPATH")) if p
+    )
+
+    workers = []
+    for i in range(count):
+        cwd = os.path.join(workdir, f"worker{i}")
+        os.makedirs(os.path.join(cwd, "static"))
+        os.symlink(
+            os.path.join(SOCKET_DIR, "templates"), os.path.join(cwd, "templates")
+        )
+        port = free_port()
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "streaming:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(port),
+                "--log-level",
+                log_level,
+            ],
+            cwd=cwd,
+            env=env,
+            stdout=None if log_level == "debug" else subprocess.DEVNULL,
+        )
+        workers.append((port, process))
+
+    for port, process in workers:
+        wait_for_port(port, process)
+    return workers
+
+
+async def run_clients(ports, clients_per_worker: int, messages: int, timeout: float):
+    """클라이언트를 워커별로 나눠 접속시키고, 각자 보낸 메시지의 수신 현황을 반환"""
+    room_id = "room1"
+    clients = []
+    for i in range(len(ports) * clients_per_worker):
+        port = ports[i % len(ports)]
+        ws = await websockets.connect(
+            f"ws://127.0.0.1:{port}/ws/chat/bp{i:04d}/{room_id}", max_size=None
+        )
+        clients.append(ws)
+
+    expected = {
+        f"{CHECK_PREFIX}{i}|{n}" for i in range(len(clients)) for n in range(messages)
+    }
+    received = [Counter() for _ in clients]
+
+    async def receive(index: int, ws):
+        try:
+            while sum(received[index].values()) < len(expected):
+                frame = json.loads(await ws.recv())
+                for message in frame if isinstance(frame, list) else [frame]:
+                    content = message.get("content")
+                    if isinstance(content, str) and content.startswith(CHECK_PREFIX):
+                        received[index][content] += 1
+        except websockets.ConnectionClosed:
+            pass
+
+    receivers = [asyncio.create_task(receive(i, ws)) for i, ws in enumerate(clients)]
+    # 모든 워커의 입장 처리가 끝난 뒤 전송
+    await asyncio.sleep(0.5)
+
+    started = time.perf_counter()
+    for n in range(messages):
+        for i, ws in enumerate(clients):
+            await ws.send(json.dumps({"content": f"{CHECK_PREFIX}{i}|{n}"}))
+
+    _, pending = await asyncio.wait(receivers, timeout=timeout)
+    elapsed = time.perf_counter() - started
+    # 중복 수신을 잡기 위해 마지막 메시지 이후 잠시 더 수신
+    await asyncio.sleep(0.5)
+    for task in pending:
+        task.cancel()
+    for ws in clients:
+        await ws.close()
+    return expected, received, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="multi-process backplane check")
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--clients-per-worker", type=int, default=5)
+    parser.add_argument("--messages", type=int, default=3, help="클라이언트당 전송 수")
+    parser.add_argument("--redis-url", default=None, help="없으면 fakeredis 사용")
+    parser.add_argument("--timeout", type=float, default=15)
+    parser.add_argument("--log-level", default="warning")
+    args = parser.parse_args()
+
+    redis_url = args.redis_url or start_fake_redis()
+    workdir = tempfile.mkdtemp(prefix="backplane_check_")
+    workers = []
+    try:
+        workers = start_workers(args.workers, redis_url, workdir, args.log_level)
+        expected, received, elapsed = asyncio.run(
+            run_clients(
+                [port for port, _ in workers],
+                args.clients_per_worker,
+                args.messages,
+                args.timeout,
+            )
+        )
+    finally:
+        for _, process in workers:
+            process.terminate()
+        for _, process in workers:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    missing = sum(len(expected - set(counts)) for counts in received)
+    duplicated = sum(
+        count - 1 for counts in received for count in counts.values() if count > 1
+    )
+    print(
+        f"workers={args.workers} clients={len(received)} "
+        f"messages/client={len(expected)} elapsed={elapsed:.2f}s "
+        f"missing={missing} duplicated={duplicated}"
+    )
+    if missing or duplicated:
+        print("FAIL")
+        sys.exit(1)
+    print("OK: every client received every message exactly once")
+
+
+if __name__ == "__main__":
+    main()
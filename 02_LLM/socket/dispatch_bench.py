@@ -0,0 +1,162 @@
+"""
+방별 메시지 처리 방식 벤치마크 (유휴 CPU / 메시지당 지연)
+
+- polling  : 기존 샤드 프로세서 설계 (방마다 1초 주기 점검 루프 + SHARD_COUNT개 샤드 프로세서,
+             각 프로세서는 queue.get()을 batch_timeout(0.1초)으로 기다리고 매 회 sleep(0.01))
+- dispatch : RoomDispatcher (방마다 워커 1개, 메시지가 들어올 때만 깨어남)
+
+방 수(--rooms, 기본 1,10,100)마다 다음을 측정합니다.
+
+- idle cpu : 메시지 없이 --idle초 동안 프로세스 CPU 사용률
+- latency  : 초당 --rate개 메시지를 임의의 방에 넣고, 넣은 시각부터 handler가 받을 때까지의 지연
+- workers  : dispatch는 마지막 메시지 후 --idle-timeout이 지나면 워커가 모두 종료했는지 확인
+
+실행 예:
+    python dispatch_bench.py
+    python dispatch_bench.py --rooms 1,10,100 --idle 5 --rate 200 --count 1000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from room_dispatcher import RoomDispatcher
+
+SHARD_COUNT = 10  # 기존 streaming.py 설정
+POLL_BATCH_SIZE = 50
+POLL_BATCH_TIMEOUT = 0.1
+
+
+class PollingProcessors:
+    """기존 _process_message_queue / _process_shard_messages 동작 재현 (방, 샤드마다 프로세서)"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.queues = {}
+        self.tasks = []
+
+    def start(self, room_ids):
+        for room_id in room_ids:
+            self.tasks.append(asyncio.create_task(self._monitor(room_id)))
+            for shard_id in range(SHARD_COUNT):
+                queue = self.queues[(room_id, shard_id)] = asyncio.Queue(maxsize=1000)
+                self.tasks.append(asyncio.create_task(self._shard(room_id, queue)))
+
+    async def submit(self, room_id, item):
+        await self.queues[(room_id, random.randrange(SHARD_COUNT))].put(item)
+
+    async def _monitor(self, room_id):
+        while True:
+            await asyncio.sleep(1)  # 주기적 점검 간격
+
+    async def _shard(self, room_id, queue):
+        batch = []
+        last_process_time = time.time()
+        while True:
+            while len(batch) < POLL_BATCH_SIZE:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(queue.get(), POLL_BATCH_TIMEOUT)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            current_time = time.time()
+            if batch and (
+                len(batch) >= POLL_BATCH_SIZE
+                or current_time - last_process_time >= POLL_BATCH_TIMEOUT
+            ):
+                await self.handler(room_id, batch)
+                batch = []
+                last_process_time = current_time
+            await asyncio.sleep(0.01)
+
+    async def close(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+def percentile(values: list, q: int) -> float:
+    return (
+        statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+        if len(values) > 1
+        else 0.0
+    )
+
+
+async def measure_idle_cpu(seconds: float) -> float:
+    cpu_started, started = time.process_time(), time.perf_counter()
+    await asyncio.sleep(seconds)
+    return (time.process_time() - cpu_started) / (time.perf_counter() - started) * 100
+
+
+async def run(model: str, rooms: int, args) -> str:
+    room_ids = [f"room{i + 1}" for i in range(rooms)]
+    latencies = []
+
+    async def handler(room_id, batch):
+        now = time.perf_counter()
+        latencies.extend((now - sent) * 1000 for sent in batch)
+
+    if model == "polling":
+        processor = PollingProcessors(handler)
+        processor.start(room_ids)
+    else:
+        processor = RoomDispatcher(handler, idle_timeout=args.idle_timeout)
+        for room_id in room_ids:  # 모든 방에 사용자가 입장한 상태
+            processor.ensure_worker(room_id)
+
+    idle_cpu = await measure_idle_cpu(args.idle)
+    if model == "dispatch":
+        assert processor.stats()["active_workers"] == rooms, "worker exited while idle"
+
+    interval = 1 / args.rate
+    started = time.perf_counter()
+    for i in range(args.count):
+        delay = started + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await processor.submit(random.choice(room_ids), time.perf_counter())
+    while len(latencies) < args.count:
+        await asyncio.sleep(0.01)
+
+    extra = ""
+    if model == "dispatch":
+        await asyncio.sleep(args.idle_timeout + 0.5)
+        extra = f"  workers after idle timeout={processor.stats()['active_workers']}"
+    await processor.close()
+    return (
+        f"{model:<8} rooms={rooms:<4} idle cpu={idle_cpu:6.2f}%  "
+        f"latency p50={percentile(latencies, 50):7.2f}ms "
+        f"p99={percentile(latencies, 99):7.2f}ms{extra}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="room dispatch benchmark")
+    parser.add_argument("--rooms", default="1,10,100")
+    parser.add_argument("--models", default="polling,dispatch")
+    parser.add_argument("--idle", type=float, default=5, help="유휴 CPU 측정 시간 (초)")
+    parser.add_argument("--rate", type=float, default=200, help="초당 메시지 수")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=10,
+        help="워커 유휴 종료 (초, --idle보다 커야 함)",
+    )
+    args = parser.parse_args()
+    if args.idle_timeout <= args.idle:
+        parser.error(
+            "--idle-timeout은 --idle보다 커야 합니다 (측정 중 워커가 살아 있도록)"
+        )
+
+    for rooms in map(int, args.rooms.split(",")):
+        for model in args.models.split(","):
+            print(asyncio.run(run(model, rooms, args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+방 히스토리 조회 벤치마크 (대용량 messages 테이블, SQLite WAL)
+
+--rows개(기본 1천만) 메시지를 --rooms개 방에 나눠 만든 뒤 다음을 비교합니다.
+
+- old      : 기존 get_messages 방식 (ORM, room_id 필터 + timestamp 정렬, 행마다 get_nickname,
+             ix_messages_room_timestamp_id 인덱스 없음)
+- keyset   : fetch_history (인덱스 + (timestamp, id) 커서, users outer join)
+             첫 페이지 / 커서로 --pages페이지 연속 조회 / 테이블 중간 지점 페이지
+- cache    : cached_history (메모리 최근 메시지, DB 조회 없음)
+
+DB 파일은 --db 경로에 만들며, 이미 있으면 재사용합니다. (1천만 행 생성에 수 분, 디스크 약 2GB)
+
+실행 예:
+    python history_bench.py --rows 10000000 --db /tmp/history_bench.db
+    python history_bench.py --rows 1000000 --db /tmp/history_bench_1m.db
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from message_history import cached_history, decode_cursor, fetch_history
+from models import Base, Message
+
+INDEX_NAME = "ix_messages_room_timestamp_id"
+CHUNK_SIZE = 100000
+
+
+def create_wal_engine(db_file: str):
+    engine = create_engine(f"sqlite:///{db_file}")
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=100000")
+        cursor.close()
+
+    return engine
+
+
+def generate(db_file: str, rows: int, rooms: int, users: int):
+    """인덱스 없는 messages 테이블에 rows개 메시지 생성 (초 단위 타임스탬프라 같은 시각이 많음)"""
+    engine = create_wal_engine(db_file)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+    # 절반의 사용자만 가입 (나머지는 "사용자_xxxxxxxx" 닉네임)
+    conn.executemany(
+        "INSERT INTO users (id, nickname, username, password, is_admin) "
+        "VALUES (?, ?, ?, '', 0)",
+        [(f"user{i:06d}", f"닉네임{i}", f"user{i:06d}") for i in range(0, users, 2)],
+    )
+    started_at = datetime(2024, 1, 1)
+    types = ["user"] * 18 + ["system", "admin"]
+    started = time.perf_counter()
+    for chunk_start in range(0, rows, CHUNK_SIZE):
+        conn.executemany(
+            "INSERT INTO messages (id, user_id, content, room_id, type, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    uuid.uuid4().hex,
+                    f"user{random.randrange(users):06d}",
+                    f"message {i} " + "x" * random.randrange(10, 80),
+                    f"room{i % rooms + 1}",
+                    random.choice(types),
+                    # SQLAlchemy DateTime과 같은 저장 형식 (마이크로초 포함)
+                    (started_at + timedelta(seconds=i // 4)).isoformat(
+                        " ", "microseconds"
+                    ),
+                )
+                for i in range(chunk_start, min(chunk_start + CHUNK_SIZE, rows))
+            ],
+        )
+        conn.commit()
+        print(f"\rgenerated {min(chunk_start + CHUNK_SIZE, rows):,} rows", end="")
+    print(f" in {time.perf_counter() - started:.1f}s")
+    conn.close()
+
+
+def timed(fn, repeat: int):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="room history benchmark")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--rooms", type=int, default=4)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db", default="history_bench.db")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        generate(args.db, args.rows, args.rooms, args.users)
+
+    engine = create_wal_engine(args.db)
+    room_id = "room1"
+    with engine.connect() as conn:
+        total = conn.exec_driver_sql("SELECT count(*) FROM messages").scalar()
+        has_index = conn.exec_driver_sql(
+            "SELECT count(*) FROM sqlite_master WHERE type='index' AND name=?",
+            (INDEX_NAME,),
+        ).scalar()
+        middle = conn.exec_driver_sql(
+            "SELECT timestamp FROM messages WHERE rowid = ?", (total // 2,)
+        ).scalar()
+    print(f"messages={total:,} rooms={args.rooms} limit={args.limit}")
+
+    # 기존 방식 (인덱스 없이, 매 행 닉네임 조회)
+    if has_index:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP INDEX {INDEX_NAME}")
+    session = sessionmaker(bind=engine)()
+
+    def old_page(before=None):
+        query = session.query(Message).filter(Message.room_id == room_id)
+        if before:
+            query = query.filter(Message.timestamp < before)
+        messages = query.order_by(Message.timestamp.desc()).limit(args.limit + 1)
+        return [
+            {
+                "id": str(uuid.uuid4()),
+                "nickname": f"사용자_{message.user_id[:8]}",
+                "timestamp": message.timestamp.isoformat(),
+            }
+            for message in messages.all()[: args.limit]
+        ]
+
+    repeat = max(1, args.repeat // 2)
+    old_first, _ = timed(old_page, repeat)
+    old_middle, _ = timed(lambda: old_page(datetime.fromisoformat(str(middle))), repeat)
+    session.close()
+    print(f"old      first page {old_first:10.2f}ms  middle page {old_middle:10.2f}ms")
+
+    # 마이그레이션 (인덱스 생성)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"CREATE INDEX {INDEX_NAME} ON messages (room_id, timestamp, id)"
+        )
+    print(f"index    created in {time.perf_counter() - started:.1f}s")
+
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            # history_query와 같은 형태 (users outer join, 전체 컬럼)
+            "EXPLAIN QUERY PLAN SELECT messages.*, users.nickname FROM messages "
+            "LEFT OUTER JOIN users ON users.id = messages.user_id "
+            "WHERE messages.room_id = ? AND (messages.timestamp, messages.id) < (?, ?) "
+            "ORDER BY messages.timestamp DESC, messages.id DESC LIMIT 51",
+            (room_id, str(middle), "z"),
+        ).all()
+    print(f"plan     {' / '.join(row[-1] for row in plan)}")
+
+    keyset_first, (messages, cursor) = timed(
+        lambda: fetch_history(engine, room_id, args.limit), args.repeat
+    )
+
+    def walk():
+        page_cursor, seen = cursor, set()
+        for _ in range(args.pages):
+            page, page_cursor = fetch_history(
+                engine, room_id, args.limit, decode_cursor(page_cursor)
+            )
+            seen.update(message["id"] for message in page)
+        return seen
+
+    walk_ms, seen = timed(walk, args.repeat)
+    keyset_middle, _ = timed(
+        lambda: fetch_history(
+            engine, room_id, args.limit, (datetime.fromisoformat(str(middle)), "")
+        ),
+        args.repeat,
+    )
+    assert len(seen) == args.pages * args.limit, "keyset pages overlap"
+    print(
+        f"keyset   first page {keyset_first:10.2f}ms  middle page {keyset_middle:10.2f}ms"
+        f"  {args.pages} pages by cursor {walk_ms / args.pages:.2f}ms/page"
+        f" (no duplicates)"
+    )
+
+    cache_ms, _ = timed(
+        lambda: cached_history(messages[::-1] * 2, args.limit, complete=False),
+        args.repeat * 100,
+    )
+    print(f"cache    first page {cache_ms:10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
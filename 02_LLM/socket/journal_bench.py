@@ -0,0 +1,156 @@
+"""
+메시지 저장 처리량 / 이벤트 루프 지연 벤치마크 (SQLite WAL)
+
+- sync    : 메시지마다 세션 add + commit (기존 handle_disconnect 방식, 이벤트 루프에서 실행)
+- journal : MessageJournal.write() (배치 executemany, 쓰기 스레드에서 실행)
+
+각 경로로 --count개를 --rate(초당, 0이면 최대 속도)로 저장하면서 1ms 주기 ticker로 이벤트 루프 지연을
+측정합니다. 루프 지연은 같은 루프에서 처리되는 브로드캐스트가 늦어지는 정도와 같습니다.
+
+실행 예:
+    python journal_bench.py --count 20000
+    python journal_bench.py --count 20000 --rate 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from message_journal import MessageJournal
+from models import Base, Message
+
+
+def create_wal_engine(db_file: str):
+    """streaming.setup_database와 같은 PRAGMA를 적용한 엔진"""
+    engine = create_engine(f"sqlite:///{db_file}")
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def make_message(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "type": "user",
+        "user_id": f"user{i % 100}",
+        "nickname": f"사용자_{i % 100}",
+        "content": f"benchmark message {i} " + "x" * 80,
+        "room_id": f"room{i % 4 + 1}",
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+async def measure_loop_lag(lags: list, stop: asyncio.Event):
+    """1ms마다 깨어나 예정 시각보다 늦은 만큼(ms)을 기록"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - started - 0.001) * 1000)
+
+
+async def produce(write, count: int, rate: float, call_ms: list):
+    interval = 1 / rate if rate else 0
+    started = time.perf_counter()
+    for i in range(count):
+        if interval:
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        call_started = time.perf_counter()
+        await write(make_message(i))
+        call_ms.append((time.perf_counter() - call_started) * 1000)
+        if not interval and i % 100 == 0:
+            await asyncio.sleep(0)  # ticker가 돌 기회
+
+
+def percentile(values: list, q: float) -> float:
+    return (
+        statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+        if len(values) > 1
+        else 0.0
+    )
+
+
+async def run(path: str, count: int, rate: float):
+    db_file = os.path.join(tempfile.mkdtemp(prefix="journal_bench_"), "chat.db")
+    engine = create_wal_engine(db_file)
+    lags, call_ms = [], []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_lag(lags, stop))
+
+    started = time.perf_counter()
+    if path == "sync":
+        session = sessionmaker(bind=engine)()
+
+        async def write(message):
+            session.add(
+                Message(
+                    id=message["id"],
+                    user_id=message["user_id"],
+                    content=message["content"],
+                    room_id=message["room_id"],
+                    type=message["type"],
+                    timestamp=datetime.fromisoformat(message["timestamp"]),
+                )
+            )
+            session.commit()
+
+        await produce(write, count, rate, call_ms)
+        session.close()
+        journal = None
+    else:
+        journal = MessageJournal(engine)
+        journal.start()
+        await produce(journal.write, count, rate, call_ms)
+        await journal.close()
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    with engine.connect() as conn:
+        stored = conn.exec_driver_sql("SELECT count(*) FROM messages").scalar()
+    engine.dispose()
+
+    extra = ""
+    if journal:
+        stats = journal.stats()
+        extra = (
+            f" batches={stats['batches']} backpressure={stats['backpressure']}"
+            f" dropped={stats['dropped']}"
+        )
+    print(
+        f"{path:<8} stored={stored:>6} {stored / elapsed:>9.0f} rows/s "
+        f"write p50={percentile(call_ms, 50):.3f}ms p99={percentile(call_ms, 99):.3f}ms "
+        f"loop lag p99={percentile(lags, 99):.2f}ms max={max(lags, default=0):.2f}ms"
+        f"{extra}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="message persistence benchmark")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=0, help="초당 메시지 수 (0=최대)")
+    parser.add_argument("--paths", default="sync,journal")
+    args = parser.parse_args()
+
+    for path in args.paths.split(","):
+        asyncio.run(run(path, args.count, args.rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,23 @@
 import time
 import json
+import os
 import uuid
-from locust import HttpUser, task, between, events
+import gevent
+from locust import HttpUser, task, between, constant_pacing, events
 from locust.exception import StopUser
 import websocket
 from datetime import datetime
 import random
 
+# 100명 단일 방 팬아웃 시나리오 설정 (RoomFanoutUser)
+# 실행 예: locust -f locustfile.py RoomFanoutUser -u 100 -r 20 --headless -t 2m
+# 기존 채팅 시나리오만 실행: locust -f locustfile.py ChatUser
+FANOUT_ROOM_ID = os.getenv("FANOUT_ROOM_ID", "room1")
+# 사용자당 메시지 전송 간격 (초)
+FANOUT_SEND_INTERVAL = float(os.getenv("FANOUT_SEND_INTERVAL", "1.0"))
+# 팬아웃 측정용 메시지 표식 (content: fanout|<보낸 시각>|<보낸 사용자>)
+FANOUT_PREFIX = "fanout|"
+
 
 class WebSocketClient:
     def __init__(self, host):
@@ -212,3 +223,96 @@ class ChatUser(HttpUser):
             print(f"Error changing room: {e}")
             if self.connection_retry_count < self.max_connection_retries:
                 self.connection_retry_count += 1
+
+
+class RoomFanoutUser(HttpUser):
+    """모든 사용자가 한 방에 들어가 메시지를 보내고, 방 전체 브로드캐스트를 수신하는 시나리오
+
+    각 사용자는 FANOUT_SEND_INTERVAL마다 보낸 시각을 담은 메시지를 보내고, 별도 greenlet에서
+    방의 모든 메시지를 받습니다. 받은 팬아웃 메시지마다 "WS Broadcast / fan-out" 요청으로
+    기록하므로 Locust 통계의 RPS가 클라이언트 전체의 초당 수신 메시지 수, 응답 시간이
+    전송→수신 브로드캐스트 지연(ms)입니다. (여러 머신에서 실행하면 시계 차이가 포함됩니다)
+    """
+
+    wait_time = constant_pacing(FANOUT_SEND_INTERVAL)
+    host = "http://localhost:8000"
+
+    def on_start(self):
+        self.user_id = str(uuid.uuid4())
+        self.ws_client = WebSocketClient(self.host)
+        try:
+            self.ws_client.connect(self.user_id, FANOUT_ROOM_ID)
+        except Exception as e:
+            print(f"Fan-out WebSocket connection failed: {e}")
+            raise StopUser()
+        self.receiver = gevent.spawn(self._receive_loop)
+
+    def on_stop(self):
+        if getattr(self, "receiver", None):
+            self.receiver.kill(block=False)
+        if self.ws_client:
+            self.ws_client.disconnect()
+
+    def _receive_loop(self):
+        while self.ws_client and self.ws_client.connected:
+            try:
+                raw = self.ws_client.receive_message()
+            except Exception:
+                break
+            received_at = time.time()
+            try:
+                payload = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+            for message in payload if isinstance(payload, list) else [payload]:
+                content = message.get("content")
+                if not isinstance(content, str) or not content.startswith(
+                    FANOUT_PREFIX
+                ):
+                    continue
+                sent_at = float(content.split("|", 2)[1])
+                events.request.fire(
+                    request_type="WS Broadcast",
+                    name="fan-out",
+                    response_time=(received_at - sent_at) * 1000,
+                    response_length=len(raw),
+                    exception=None,
+                    context={},
+                )
+
+    @task
+    def send_fanout_message(self):
+        if not self.ws_client or not self.ws_client.connected:
+            raise StopUser()
+        content = f"{FANOUT_PREFIX}{time.time():.6f}|{self.user_id[:8]}"
+        start_time = time.time()
+        try:
+            self.ws_client.send_message({"type": "user", "content": content})
+            exception = None
+        except Exception as e:
+            exception = e
+        events.request.fire(
+            request_type="WS Send",
+            name="fan-out message",
+            response_time=(time.time() - start_time) * 1000,
+            response_length=len(content),
+            exception=exception,
+            context={},
+        )
+
+
+@events.test_stop.add_listener
+def report_fanout_stats(environment, **kwargs):
+    """팬아웃 시나리오 요약 (초당 수신 메시지 수, 브로드캐스트 지연 백분위수)"""
+    received = environment.stats.get("fan-out", "WS Broadcast")
+    sent = environment.stats.get("fan-out message", "WS Send")
+    if not received.num_requests:
+        return
+    duration = max(received.last_request_timestamp - received.start_time, 1e-9)
+    print(
+        f"[fan-out] sent={sent.num_requests} received={received.num_requests} "
+        f"messages/sec={received.num_requests / duration:.1f} "
+        f"latency p50={received.get_response_time_percentile(0.5):.0f}ms "
+        f"p95={received.get_response_time_percentile(0.95):.0f}ms "
+        f"p99={received.get_response_time_percentile(0.99):.0f}ms"
+    )
@@ -0,0 +1,161 @@
+"""
+방 메시지 히스토리 조회 (keyset 페이지네이션 + 최근 메시지 캐시)
+
+- 정렬: (timestamp DESC, id DESC). 같은 시각의 메시지도 id로 순서가 정해지므로 페이지 경계가 흔들리지 않습니다.
+- 커서: 페이지의 가장 오래된 메시지의 (timestamp, id)를 base64로 감싼 불투명 문자열.
+  다음 페이지는 `(timestamp, id) < 커서` 조건으로 ix_messages_room_timestamp_id 인덱스를 그대로 따라
+  읽으므로, 몇 번째 페이지든 OFFSET 없이 limit개만 읽습니다.
+- 닉네임: users 테이블을 outer join해 한 번의 쿼리로 가져옵니다.
+  (가입하지 않은 사용자는 ConnectionManager.get_nickname과 같은 "사용자_xxxxxxxx")
+- 최근 메시지 캐시: 첫 페이지(커서 없음)는 ConnectionManager.room_messages에서 바로 응답합니다.
+  캐시는 시작 시 DB의 최근 메시지로 채우며(load_room_tails), 이후 브로드캐스트로 갱신됩니다.
+  다른 인스턴스에서 릴레이된 메시지는 늦게 도착할 수 있으므로 캐시도 (timestamp, id)로 정렬해 자릅니다.
+"""
+
+import base64
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine import Engine
+
+from models import Message, User
+
+MAX_HISTORY_PAGE_SIZE = 100  # 한 페이지 최대 메시지 수
+
+# 메시지 유형별 표시 닉네임 (브로드캐스트할 때와 같은 값)
+NICKNAME_BY_TYPE = {"system": "시스템", "admin": "관리자"}
+
+
+class InvalidCursor(ValueError):
+    """커서 문자열을 해석할 수 없음"""
+
+
+def encode_cursor(timestamp, message_id: str) -> str:
+    """(timestamp, id)를 URL에 그대로 쓸 수 있는 커서 문자열로 변환"""
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    raw = f"{timestamp}|{message_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, message_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), message_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursor(cursor) from e
+
+
+def default_nickname(user_id: Optional[str]) -> str:
+    return f"사용자_{(user_id or '')[:8]}"
+
+
+def format_history_item(message: dict) -> dict:
+    """저장된 행 또는 브로드캐스트 메시지를 히스토리 응답 형식으로 변환"""
+    timestamp = message.get("timestamp")
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    message_type = message.get("type", "user")
+    return {
+        "id": message["id"],
+        "type": message_type,
+        "content": message.get("content", ""),
+        "user_id": message.get("user_id"),
+        "nickname": NICKNAME_BY_TYPE.get(message_type)
+        or message.get("nickname")
+        or default_nickname(message.get("user_id")),
+        "timestamp": timestamp,
+        "room_id": message.get("room_id"),
+    }
+
+
+def history_query(
+    room_id: str,
+    limit: int,
+    cursor: Optional[Tuple[datetime, str]] = None,
+    before: Optional[datetime] = None,
+):
+    """방 히스토리 keyset 쿼리 (다음 페이지 존재 확인용으로 limit + 1개)"""
+    query = (
+        select(
+            Message.id,
+            Message.type,
+            Message.content,
+            Message.user_id,
+            Message.timestamp,
+            Message.room_id,
+            User.nickname,
+        )
+        .outerjoin(User, User.id == Message.user_id)
+        .where(Message.room_id == room_id)
+    )
+    if cursor is not None:
+        query = query.where(tuple_(Message.timestamp, Message.id) < tuple_(*cursor))
+    elif before is not None:
+        # 이전 클라이언트 호환 (타임스탬프만 있는 커서)
+        query = query.where(Message.timestamp < before)
+    return query.order_by(Message.timestamp.desc(), Message.id.desc()).limit(limit + 1)
+
+
+def _sort_key(message: dict) -> Tuple[str, str]:
+    """DB 정렬과 같은 (timestamp, id) 키 (ISO 문자열은 시각 순서대로 비교됨)"""
+    timestamp = message.get("timestamp")
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    return timestamp or "", message["id"]
+
+
+def _page(items: List[dict], limit: int, has_more: bool):
+    """(응답 메시지, 다음 페이지 커서)"""
+    page = items[:limit]
+    next_cursor = None
+    if page and (has_more or len(items) > limit):
+        next_cursor = encode_cursor(page[-1]["timestamp"], page[-1]["id"])
+    return page, next_cursor
+
+
+def fetch_history(
+    engine: Engine,
+    room_id: str,
+    limit: int,
+    cursor: Optional[Tuple[datetime, str]] = None,
+    before: Optional[datetime] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """DB에서 한 페이지를 읽습니다. (동기 함수이므로 스레드 풀에서 실행)"""
+    with engine.connect() as conn:
+        rows = conn.execute(history_query(room_id, limit, cursor, before)).mappings()
+        items = [format_history_item(row) for row in rows]
+    return _page(items, limit, has_more=False)
+
+
+def cached_history(
+    cached_messages: List[dict], limit: int, complete: bool
+) -> Optional[Tuple[List[dict], Optional[str]]]:
+    """최근 메시지 캐시로 첫 페이지를 만듭니다. 캐시만으로 부족하면 None (DB 조회 필요)
+
+    complete는 캐시가 방의 전체 히스토리를 담고 있는지 여부입니다.
+    """
+    if len(cached_messages) < limit and not complete:
+        return None
+    # 도착 순서가 아닌 (timestamp DESC, id DESC) 순으로 limit + 1개만 골라 변환
+    # (다음 페이지 커서가 DB keyset 조건과 어긋나지 않도록)
+    newest = heapq.nlargest(limit + 1, cached_messages, key=_sort_key)
+    items = [format_history_item(message) for message in newest]
+    return _page(items, limit, has_more=not complete)
+
+
+def load_room_tails(
+    engine: Engine, room_ids: Iterable[str], size: int
+) -> Dict[str, Tuple[List[dict], bool]]:
+    """방별 최근 size개 메시지(오래된 순)와 그것이 전체 히스토리인지 여부를 읽어 캐시를 채움"""
+    tails = {}
+    with engine.connect() as conn:
+        for room_id in room_ids:
+            rows = conn.execute(history_query(room_id, size)).mappings().all()
+            messages = [format_history_item(row) for row in rows[:size]]
+            messages.reverse()
+            tails[room_id] = (messages, len(rows) <= size)
+    return tails
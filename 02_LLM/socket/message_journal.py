@@ -0,0 +1,188 @@
+"""
+채팅 메시지 write-behind 저장 (메시지 저널)
+
+브로드캐스트한 메시지를 큐에 넣기만 하고, 백그라운드 flush 태스크가 모아서 한 번에 저장합니다.
+
+- 배치 기준: MESSAGE_JOURNAL_BATCH_SIZE개가 모이거나 첫 메시지 이후
+  MESSAGE_JOURNAL_FLUSH_INTERVAL초가 지나면 flush
+- 저장: 배치당 한 번의 executemany INSERT를 전용 스레드(1개)에서 실행하므로
+  이벤트 루프를 막지 않고, SQLite 쓰기도 한 스레드로 직렬화됩니다.
+- 백프레셔: 큐(MESSAGE_JOURNAL_MAX_PENDING)가 가득 차면 write()가 최대
+  MESSAGE_JOURNAL_PUT_TIMEOUT초 동안 기다립니다. (메시지를 보낸 클라이언트의 수신 루프만 늦춰짐)
+  그래도 자리가 나지 않으면 메시지를 버리고 dropped로 집계합니다.
+- 실패한 배치는 MESSAGE_JOURNAL_MAX_RETRIES번까지 다시 시도하고, 그래도 실패하면 failed로 집계합니다.
+- close(): 새 메시지를 받지 않고 큐에 남은 메시지를 모두 저장한 뒤 종료합니다.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from models import Message
+
+MESSAGE_JOURNAL_BATCH_SIZE = 500  # 배치당 최대 메시지 수
+MESSAGE_JOURNAL_FLUSH_INTERVAL = 0.2  # 배치 최대 대기 시간 (초)
+MESSAGE_JOURNAL_MAX_PENDING = 10000  # 저장 대기 메시지 최대 개수 (백프레셔 기준)
+MESSAGE_JOURNAL_PUT_TIMEOUT = 1.0  # 큐가 가득 찼을 때 write()가 기다리는 최대 시간 (초)
+MESSAGE_JOURNAL_MAX_RETRIES = 3  # 배치 저장 재시도 횟수
+
+# 저장하는 메시지 유형 (room_status, pong 등 상태 메시지는 제외)
+PERSISTED_MESSAGE_TYPES = ("user", "admin", "system")
+SYSTEM_USER_ID = "system"  # user_id가 없는 시스템 메시지의 작성자
+
+
+def message_to_row(message: dict) -> dict:
+    """브로드캐스트 메시지를 messages 테이블 행으로 변환"""
+    timestamp = message.get("timestamp")
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return {
+        "id": message["id"],
+        "user_id": message.get("user_id") or SYSTEM_USER_ID,
+        "content": message.get("content", ""),
+        "room_id": message["room_id"],
+        "type": message.get("type", "user"),
+        "timestamp": timestamp or datetime.now(),
+    }
+
+
+class MessageJournal:
+    """메시지를 모아서 배치로 저장하는 write-behind 저널"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int = MESSAGE_JOURNAL_BATCH_SIZE,
+        flush_interval: float = MESSAGE_JOURNAL_FLUSH_INTERVAL,
+        max_pending: int = MESSAGE_JOURNAL_MAX_PENDING,
+        put_timeout: float = MESSAGE_JOURNAL_PUT_TIMEOUT,
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        # SQLite는 동시에 한 연결만 쓸 수 있으므로 쓰기 스레드는 1개
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="message-journal"
+        )
+        self.flush_task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.enqueued_count = 0
+        self.written_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+        self.batch_count = 0
+        self.backpressure_count = 0
+        self.last_flush_ms = 0.0
+
+    def start(self):
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush_loop())
+
+    async def write(self, message: dict) -> bool:
+        """메시지를 저장 큐에 넣습니다. 큐가 가득 차면 잠시 기다리고, 그래도 차 있으면 버림"""
+        if self.closed or message.get("type") not in PERSISTED_MESSAGE_TYPES:
+            return False
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.backpressure_count += 1
+            try:
+                await asyncio.wait_for(self.queue.put(message), self.put_timeout)
+            except asyncio.TimeoutError:
+                self.dropped_count += 1
+                print(f"Message journal full, dropped message {message.get('id')}")
+                return False
+        self.enqueued_count += 1
+        return True
+
+    async def _flush_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                return
+            batch = [message]
+            deadline = loop.time() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                # 이미 쌓인 메시지는 기다리지 않고 가져옴
+                try:
+                    message = self.queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        message = await asyncio.wait_for(self.queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if message is None:
+                    stop = True
+                    break
+                batch.append(message)
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _flush(self, batch: List[dict]):
+        loop = asyncio.get_running_loop()
+        for attempt in range(1, MESSAGE_JOURNAL_MAX_RETRIES + 1):
+            try:
+                started = time.perf_counter()
+                await loop.run_in_executor(self.executor, self._insert, batch)
+                self.last_flush_ms = (time.perf_counter() - started) * 1000
+                self.written_count += len(batch)
+                self.batch_count += 1
+                return
+            except Exception as e:
+                print(
+                    f"Message journal flush failed "
+                    f"(attempt {attempt}/{MESSAGE_JOURNAL_MAX_RETRIES}): {e}"
+                )
+                await asyncio.sleep(0.1 * attempt)
+        self.failed_count += len(batch)
+
+    def _insert(self, batch: List[dict]):
+        """배치를 한 트랜잭션, 한 번의 executemany INSERT로 저장 (쓰기 스레드에서 실행)"""
+        rows = [message_to_row(message) for message in batch]
+        with self.engine.begin() as conn:
+            conn.execute(insert(Message.__table__), rows)
+
+    async def close(self):
+        """새 메시지를 막고 남은 메시지를 모두 저장한 뒤 쓰기 스레드 종료"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.flush_task and not self.flush_task.done():
+            # 큐 끝에 종료 표시를 넣어 그 앞의 메시지까지 저장하게 함
+            await self.queue.put(None)
+            await self.flush_task
+        # 종료 표시 뒤에 들어온 메시지 (close 직전 백프레셔로 기다리던 write)
+        leftover = []
+        while not self.queue.empty():
+            message = self.queue.get_nowait()
+            if message is not None:
+                leftover.append(message)
+        for start in range(0, len(leftover), self.batch_size):
+            await self._flush(leftover[start : start + self.batch_size])
+        self.executor.shutdown(wait=True)
+        print(f"Message journal closed: {self.stats()}")
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.queue.qsize(),
+            "enqueued": self.enqueued_count,
+            "written": self.written_count,
+            "dropped": self.dropped_count,
+            "failed": self.failed_count,
+            "batches": self.batch_count,
+            "backpressure": self.backpressure_count,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
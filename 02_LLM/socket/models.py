@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     func,
     Float,
+    Index,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
@@ -42,6 +43,11 @@ class Message(Base):
     timestamp = Column(DateTime, default=datetime.now)
     user = relationship("User", back_populates="messages")
 
+    __table_args__ = (
+        # 방 히스토리 keyset 페이지네이션용 (기존 DB는 alembic 마이그레이션으로 추가)
+        Index("ix_messages_room_timestamp_id", "room_id", "timestamp", "id"),
+    )
+
 
 class RoomStats(Base):
     __tablename__ = "room_stats"
@@ -0,0 +1,127 @@
+"""
+방별 이벤트 기반 메시지 디스패처
+
+방마다 큐 하나와 워커 태스크 하나를 둡니다. 워커는 큐에 메시지가 들어올 때만 깨어나며
+(주기적 폴링/sleep 없음), 그때까지 쌓인 메시지를 최대 batch_size개씩 묶어 handler에 넘깁니다.
+
+- 워커는 방에 첫 사용자가 들어오거나(ensure_worker) 첫 메시지가 들어올 때(submit) 시작합니다.
+- idle_timeout초 동안 메시지가 없으면 워커는 종료하고 큐도 정리합니다. (다음 메시지에서 다시 시작)
+- 큐가 가득 차면 submit()이 자리가 날 때까지 기다립니다. (메시지를 보낸 쪽만 늦춰지는 백프레셔)
+- 한 방의 메시지는 한 워커가 순서대로 처리하므로 방 안의 전송 순서가 보장됩니다.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+# 방 워커 배치 처리 콜백: (room_id, items) -> None
+BatchHandler = Callable[[str, List[Any]], Awaitable[None]]
+
+ROOM_QUEUE_SIZE = 1000  # 방별 대기 메시지 최대 개수
+ROOM_BATCH_SIZE = 100  # 워커가 한 번에 처리하는 최대 메시지 수
+ROOM_WORKER_IDLE_TIMEOUT = 60  # 메시지가 없을 때 워커 종료까지 대기 시간 (초)
+
+
+class RoomDispatcher:
+    """방별 큐/워커를 필요할 때만 만들어 메시지를 배치로 처리"""
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        queue_size: int = ROOM_QUEUE_SIZE,
+        batch_size: int = ROOM_BATCH_SIZE,
+        idle_timeout: float = ROOM_WORKER_IDLE_TIMEOUT,
+    ):
+        self.handler = handler
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.idle_timeout = idle_timeout
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.workers: Dict[str, asyncio.Task] = {}
+        self.closed = False
+        self.started_count = 0
+        self.stopped_count = 0
+        self.batch_count = 0
+        self.backpressure_count = 0
+
+    def ensure_worker(self, room_id: str) -> asyncio.Queue:
+        """방 워커가 없으면 시작하고 방 큐를 반환"""
+        queue = self.queues.get(room_id)
+        if queue is None:
+            queue = self.queues[room_id] = asyncio.Queue(maxsize=self.queue_size)
+        worker = self.workers.get(room_id)
+        if worker is None or worker.done():
+            self.workers[room_id] = asyncio.create_task(self._run(room_id, queue))
+            self.started_count += 1
+        return queue
+
+    async def submit(self, room_id: str, item: Any) -> bool:
+        """메시지를 방 큐에 넣습니다. 큐가 가득 차면 자리가 날 때까지 대기"""
+        if self.closed:
+            return False
+        queue = self.ensure_worker(room_id)
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.backpressure_count += 1
+            await queue.put(item)
+        return True
+
+    async def _run(self, room_id: str, queue: asyncio.Queue):
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    if queue.empty():
+                        return
+                    continue
+
+                batch = [item]
+                while len(batch) < self.batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                try:
+                    await self.handler(room_id, batch)
+                    self.batch_count += 1
+                except Exception as e:
+                    print(f"Error dispatching messages for room {room_id}: {e}")
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        finally:
+            # 유휴 종료 또는 취소 시 이 워커의 등록만 정리 (그 사이 새 워커가 생겼으면 유지)
+            if self.workers.get(room_id) is asyncio.current_task():
+                del self.workers[room_id]
+                if self.queues.get(room_id) is queue and queue.empty():
+                    del self.queues[room_id]
+            self.stopped_count += 1
+
+    async def close(self, timeout: float = 5):
+        """새 메시지를 막고 대기 중인 메시지를 처리(최대 timeout초)한 뒤 모든 워커 종료"""
+        self.closed = True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self.queues.values())),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            print(f"Room dispatcher close timed out: {self.stats()}")
+        for worker in list(self.workers.values()):
+            worker.cancel()
+        for worker in list(self.workers.values()):
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self.workers.clear()
+        self.queues.clear()
+
+    def stats(self) -> dict:
+        return {
+            "active_workers": len(self.workers),
+            "pending": sum(queue.qsize() for queue in self.queues.values()),
+            "started": self.started_count,
+            "stopped": self.stopped_count,
+            "batches": self.batch_count,
+            "backpressure": self.backpressure_count,
+        }
@@ -9,9 +9,11 @@ from fastapi import (
     BackgroundTasks,
 )
 from fastapi.responses import HTMLResponse, JSONResponse
+from starlette.websockets import WebSocketState
 from fastapi.templating import Jinja2Templates
 from typing import Dict, List, Set, Optional, Union
 import json
+import orjson
 from datetime import datetime, timedelta
 import uuid
 from pydantic import BaseModel
@@ -20,7 +22,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy import create_engine, event
 import asyncio
-import aioredis
+import redis.asyncio as aioredis
 from collections import defaultdict
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -35,16 +37,30 @@ from models import (
     init_db,
     DB_FILE,
 )
+from backplane import Backplane, InMemoryBackplane, RecentMessageIds, RedisBackplane
+from message_history import (
+    MAX_HISTORY_PAGE_SIZE,
+    InvalidCursor,
+    cached_history,
+    decode_cursor,
+    fetch_history,
+    load_room_tails,
+)
+from message_journal import PERSISTED_MESSAGE_TYPES, MessageJournal
+from room_dispatcher import RoomDispatcher
 import hashlib
 import os
 import psutil
 import time
 
 # Redis 관련 전역 변수
-REDIS_URL = "redis://localhost:6379/0"
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 redis_pool = None
 REDIS_POOL_SIZE = 100
 
+# 워커 간 브로드캐스트 중계: "memory"(단일 프로세스) 또는 "redis"(Redis pub/sub)
+BACKPLANE_TYPE = os.getenv("CHAT_BACKPLANE", "memory")
+
 app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
@@ -58,6 +74,7 @@ KAFKA_TOPIC = "chat_messages"
 DB_POOL_SIZE = 50
 DB_MAX_OVERFLOW = DB_POOL_SIZE // 2
 DB_POOL_TIMEOUT = 30
+db_engine = None  # setup_database()로 만든 엔진 (startup에서 설정)
 
 # 스레드 풀 설정
 thread_pool = ThreadPoolExecutor(max_workers=4)
@@ -76,13 +93,17 @@ WEBSOCKET_PING_INTERVAL = 30  # 30초
 WEBSOCKET_PING_TIMEOUT = 5  # 5초
 MESSAGE_QUEUE_SIZE = 1000  # 메시지 큐 최대 크기
 BROADCAST_BATCH_SIZE = 100  # 브로드캐스트 배치 크기
+ROOM_WORKER_IDLE_TIMEOUT = 60  # 메시지가 없는 방 워커 종료까지 대기 시간 (초)
 CLEANUP_INTERVAL = 60  # 1분마다 정리
 MAX_MESSAGES_PER_ROOM = 100  # 방당 최대 메시지 수
 ERROR_COUNT_RESET_INTERVAL = 3600  # 1시간마다 에러 카운트 초기화
 
-# Shard 관리
-SHARD_COUNT = 10
-current_shard = 0
+# 클라이언트별 전송 큐 (느린 클라이언트가 방 전체 브로드캐스트를 막지 않도록 분리)
+CLIENT_SEND_QUEUE_SIZE = 256  # 클라이언트별 전송 대기 프레임 최대 개수
+CLIENT_SEND_TIMEOUT = 5  # 프레임 1개 전송 제한 시간 (초), 초과 시 연결 종료
+# 큐가 가득 찼을 때: "drop_oldest"(오래된 프레임 버림) 또는 "disconnect"(연결 종료)
+SLOW_CONSUMER_POLICY = "drop_oldest"
+SLOW_CONSUMER_CLOSE_CODE = 1013  # "disconnect" 정책의 close code (Try Again Later)
 
 
 # 데이터 모델
@@ -102,25 +123,107 @@ class ChatMessage(BaseModel):
     timestamp: datetime = datetime.now()
 
 
+def encode_message(message: Union[dict, list]) -> str:
+    """브로드캐스트 메시지를 WebSocket 텍스트 프레임으로 한 번만 직렬화"""
+    return orjson.dumps(message, default=str).decode()
+
+
+def is_websocket_connected(websocket: Optional[WebSocket]) -> bool:
+    """WebSocket이 아직 열려 있는지 확인 (accept 이후, close 이전)"""
+    return (
+        websocket is not None
+        and websocket.client_state == WebSocketState.CONNECTED
+        and websocket.application_state == WebSocketState.CONNECTED
+    )
+
+
+class ClientSender:
+    """클라이언트별 전송 큐와 writer 태스크
+
+    브로드캐스트는 미리 직렬화한 프레임을 큐에 넣기만 하고(대기 없음), 실제 전송은 이 writer
+    태스크가 순서대로 수행합니다. 큐가 가득 찬 느린 클라이언트는 SLOW_CONSUMER_POLICY에 따라
+    가장 오래된 프레임을 버리거나 연결을 끊습니다.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: str,
+        maxsize: int = CLIENT_SEND_QUEUE_SIZE,
+        policy: str = SLOW_CONSUMER_POLICY,
+    ):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.policy = policy
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.closed = False
+        self.close_task: Optional[asyncio.Task] = None
+        self.writer_task = asyncio.create_task(self._writer())
+
+    def offer(self, frame: str) -> bool:
+        """프레임을 전송 큐에 넣습니다. 연결을 끊었으면 False"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == "disconnect":
+            print(f"Slow consumer {self.user_id}: send queue full, disconnecting")
+            self.close(SLOW_CONSUMER_CLOSE_CODE, "Slow consumer")
+            return False
+
+        # drop_oldest: 가장 오래된 프레임을 버리고 최신 프레임을 넣음
+        self.queue.get_nowait()
+        self.dropped_count += 1
+        self.queue.put_nowait(frame)
+        return True
+
+    async def _writer(self):
+        try:
+            while True:
+                frame = await self.queue.get()
+                await asyncio.wait_for(
+                    self.websocket.send_text(frame), timeout=CLIENT_SEND_TIMEOUT
+                )
+                self.sent_count += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 전송 실패/타임아웃: 연결을 닫으면 수신 루프가 disconnect로 정리
+            print(f"Error sending message to user {self.user_id}: {e}")
+            self.closed = True
+            await self._close_websocket(1011, "Send failed")
+
+    async def _close_websocket(self, code: int, reason: str):
+        if is_websocket_connected(self.websocket):
+            try:
+                await self.websocket.close(code=code, reason=reason)
+            except Exception as e:
+                print(f"Error closing WebSocket for user {self.user_id}: {e}")
+
+    def stop(self):
+        """writer 태스크 중지 (연결 정리 시)"""
+        self.closed = True
+        if not self.writer_task.done():
+            self.writer_task.cancel()
+
+    def close(self, code: int, reason: str):
+        """writer 태스크를 중지하고 WebSocket 연결을 닫습니다."""
+        self.stop()
+        self.close_task = asyncio.create_task(self._close_websocket(code, reason))
+
+
 # 연결 관리자
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, Dict[str, weakref.ref[WebSocket]]] = (
             defaultdict(dict)
         )
-        self.connection_shards: List[Dict[str, Dict[str, weakref.ref[WebSocket]]]] = [
-            defaultdict(dict) for _ in range(SHARD_COUNT)
-        ]
-        self.shard_queues: List[Dict[str, asyncio.Queue]] = [
-            defaultdict(lambda: asyncio.Queue(maxsize=MESSAGE_QUEUE_SIZE))
-            for _ in range(SHARD_COUNT)
-        ]
-        self.shard_processors: List[List[asyncio.Task]] = [
-            [] for _ in range(SHARD_COUNT)
-        ]
-        self.shard_locks: List[asyncio.Lock] = [
-            asyncio.Lock() for _ in range(SHARD_COUNT)
-        ]
         self.user_info: Dict[str, UserInfo] = {}
         self.room_participants: Dict[str, Set[str]] = defaultdict(set)
         self.admin_messages: Dict[str, List[ChatMessage]] = defaultdict(list)
@@ -133,19 +236,27 @@ class ConnectionManager:
         self.producer = None
         self.consumer = None
         self.initialized = False
-        self.message_processors = []
+        # 방별 메시지 큐/워커 (메시지가 들어올 때만 깨어나고, 유휴 시 종료)
+        self.dispatcher = self._create_dispatcher()
         self.connection_count = 0
         self.last_cleanup = time.time()
         self.last_error_reset = time.time()
         self.room_messages: Dict[str, List[dict]] = defaultdict(list)
+        # room_messages가 방의 전체 히스토리인지 여부 (True면 첫 페이지 외에 DB 조회 불필요)
+        self.room_history_complete: Dict[str, bool] = {}
         self.cleanup_task = None
         self.error_reset_task = None
-        self.message_batch_size = 50  # 메시지 배치 크기
-        self.batch_timeout = 0.1  # 배치 타임아웃 (초)
         self.connection_pools: Dict[str, List[WebSocket]] = defaultdict(list)  # 연결 풀
         self.last_broadcast_time: Dict[str, float] = defaultdict(
             float
         )  # 마지막 브로드캐스트 시간
+        # 방별 클라이언트 전송 큐 (room_id -> user_id -> ClientSender)
+        self.client_senders: Dict[str, Dict[str, ClientSender]] = defaultdict(dict)
+        # 다른 워커로 중계하는 백플레인과 이미 전송한 메시지 ID (중복 전송 방지)
+        self.backplane: Optional[Backplane] = None
+        self.seen_message_ids = RecentMessageIds()
+        # 브로드캐스트 메시지 write-behind 저장 (startup에서 설정)
+        self.journal: Optional[MessageJournal] = None
 
     async def initialize(self):
         """비동기 초기화 및 정리 작업 시작"""
@@ -158,12 +269,14 @@ class ConnectionManager:
         self.cleanup_task = asyncio.create_task(self._periodic_cleanup())
         self.error_reset_task = asyncio.create_task(self._periodic_error_reset())
 
-        # 각 채팅방에 대한 메시지 큐 처리기 시작
-        for room_id in CHAT_ROOMS:
-            print(f"Starting message queue processor for room {room_id}")  # 디버깅 로그
-            self.message_processors.append(
-                asyncio.create_task(self._process_message_queue(room_id))
-            )
+        # 방 워커는 첫 사용자 입장 시 시작 (shutdown 이후 재초기화면 새로 생성)
+        if self.dispatcher.closed:
+            self.dispatcher = self._create_dispatcher()
+
+        if self.backplane is None:
+            await self.attach_backplane(InMemoryBackplane())
+        if self.journal:
+            self.journal.start()
 
         self.initialized = True
         print("ConnectionManager initialized successfully")  # 디버깅 로그
@@ -189,33 +302,43 @@ class ConnectionManager:
                 except asyncio.CancelledError:
                     pass
 
-            # 메시지 프로세서 작업 취소
-            for processor in self.message_processors:
-                if not processor.done():
-                    processor.cancel()
-                    try:
-                        await processor
-                    except asyncio.CancelledError:
-                        pass
+            # 방 워커 종료 (큐에 남은 메시지는 전송/저장 후 종료)
+            try:
+                await self.dispatcher.close()
+            except Exception as e:
+                print(f"Error closing room dispatcher: {e}")
 
             # 모든 WebSocket 연결 종료
             for room_id in list(self.active_connections.keys()):
                 for user_id, ws_ref in list(self.active_connections[room_id].items()):
                     ws = ws_ref() if ws_ref else None
-                    if ws and not getattr(ws, "_closed", False):
+                    if is_websocket_connected(ws):
                         try:
                             await ws.close(code=1000, reason="Server shutdown")
                         except Exception as e:
                             print(f"Error closing WebSocket for user {user_id}: {e}")
 
-            # 메시지 큐 정리
-            for room_id in list(self.shard_queues):
-                for shard_id in range(SHARD_COUNT):
-                    self.shard_queues[shard_id][room_id] = asyncio.Queue(
-                        maxsize=MESSAGE_QUEUE_SIZE
-                    )
+            # 남은 메시지 저장 후 저널 종료
+            if self.journal:
+                try:
+                    await self.journal.close()
+                except Exception as e:
+                    print(f"Error closing message journal: {e}")
+                self.journal = None
+
+            # 백플레인 종료
+            if self.backplane:
+                try:
+                    await self.backplane.close()
+                except Exception as e:
+                    print(f"Error closing backplane: {e}")
+                self.backplane = None
 
             # 연결 및 참가자 정보 초기화
+            for senders in self.client_senders.values():
+                for sender in senders.values():
+                    sender.stop()
+            self.client_senders.clear()
             self.active_connections.clear()
             self.room_participants.clear()
             self.user_info.clear()
@@ -233,152 +356,26 @@ class ConnectionManager:
         """사용자 정보 조회 (캐시 적용)"""
         return self.user_info.get(user_id)
 
-    def _get_shard_id(self, user_id: str) -> int:
-        """사용자 ID를 기반으로 샤드 ID 결정"""
-        return hash(user_id) % SHARD_COUNT
-
-    async def _process_shard_messages(self, shard_id: int, room_id: str):
-        """샤드별 메시지 처리"""
-        print(f"Starting shard processor for shard {shard_id}, room {room_id}")
-
-        try:
-            queue = self.shard_queues[shard_id][room_id]
-            batch = []
-            last_process_time = time.time()
-
-            while True:
-                try:
-                    # 배치 처리를 위한 메시지 수집
-                    while len(batch) < self.message_batch_size:
-                        try:
-                            message = await asyncio.wait_for(
-                                queue.get(), timeout=self.batch_timeout
-                            )
-                            batch.append(message)
-                        except asyncio.TimeoutError:
-                            break
-
-                    current_time = time.time()
-
-                    # 배치가 있거나 일정 시간이 지난 경우 처리
-                    if batch and (
-                        len(batch) >= self.message_batch_size
-                        or current_time - last_process_time >= self.batch_timeout
-                    ):
-                        async with self.shard_locks[shard_id]:
-                            # 배치 메시지 브로드캐스트
-                            if len(batch) == 1:
-                                await self._broadcast_to_shard(
-                                    shard_id,
-                                    self.connection_shards[shard_id][room_id].items(),
-                                    batch[0],
-                                )
-                            else:
-                                await self._broadcast_to_shard(
-                                    shard_id,
-                                    self.connection_shards[shard_id][room_id].items(),
-                                    batch,
-                                )
-
-                            # 메시지 히스토리 업데이트
-                            for message in batch:
-                                self._update_room_messages(room_id, message)
-
-                        batch = []
-                        last_process_time = current_time
-
-                    # 처리 간격 조절
-                    await asyncio.sleep(0.01)
-
-                except Exception as e:
-                    print(
-                        f"Error processing messages in shard {shard_id}, room {room_id}: {e}"
-                    )
-                    batch = []  # 에러 발생 시 배치 초기화
-                    await asyncio.sleep(1)  # 에러 발생 시 잠시 대기
-
-        except Exception as e:
-            print(f"Fatal error in shard processor {shard_id}, room {room_id}: {e}")
-        finally:
-            # 프로세서 종료 시 정리
-            if shard_id < len(self.shard_processors):
-                processors = self.shard_processors[shard_id]
-                for i, processor in enumerate(processors):
-                    if processor and processor.done():
-                        processors[i] = None
-
-    async def _process_message_queue(self, room_id: str):
-        """메시지 큐 처리기 - 샤드 기반 처리"""
-        print(f"Starting message queue processor for room {room_id}")
-
-        while True:
-            try:
-                # 각 샤드에 대한 프로세서 시작
-                for shard_id in range(SHARD_COUNT):
-                    # 기존 프로세서가 없거나 완료된 경우에만 새로 시작
-                    if (
-                        shard_id >= len(self.shard_processors)
-                        or not self.shard_processors[shard_id]
-                        or all(
-                            p is None or p.done()
-                            for p in self.shard_processors[shard_id]
-                        )
-                    ):
-
-                        processor = asyncio.create_task(
-                            self._process_shard_messages(shard_id, room_id)
-                        )
-
-                        # 샤드 프로세서 목록 확장
-                        while len(self.shard_processors) <= shard_id:
-                            self.shard_processors.append([])
-
-                        self.shard_processors[shard_id] = [processor]
-
-                await asyncio.sleep(1)  # 주기적 점검 간격
+    def _create_dispatcher(self) -> RoomDispatcher:
+        return RoomDispatcher(
+            self._broadcast_messages,
+            queue_size=MESSAGE_QUEUE_SIZE,
+            batch_size=BROADCAST_BATCH_SIZE,
+            idle_timeout=ROOM_WORKER_IDLE_TIMEOUT,
+        )
 
-            except Exception as e:
-                print(f"Error in message queue processor for room {room_id}: {e}")
-                await asyncio.sleep(1)  # 에러 발생 시 잠시 대기
+    async def _broadcast_messages(self, room_id: str, items: list):
+        """방 워커가 꺼낸 메시지 묶음을 한 프레임으로 직렬화해 방 전체에 전송
 
-    async def _broadcast_messages(self, room_id: str, messages: list):
-        """최적화된 메시지 브로드캐스트"""
+        워커는 로컬 전송만 합니다. 백플레인 중계와 저널 기록은 broadcast()가 보낸 쪽에서
+        처리하므로, 그쪽이 느려져도 방 전체의 전송이 막히지 않습니다.
+        """
         try:
-            current_time = time.time()
-            # 브로드캐스트 속도 제어
-            if (
-                current_time - self.last_broadcast_time[room_id] < 0.01
-            ):  # 최소 10ms 간격
-                await asyncio.sleep(0.01)
-
-            active_connections = []
-            if room_id in self.active_connections:
-                for user_id, ws_ref in list(self.active_connections[room_id].items()):
-                    ws = ws_ref() if ws_ref else None
-                    if ws and not getattr(ws, "_closed", False):
-                        active_connections.append(ws)
-                    else:
-                        if user_id in self.active_connections[room_id]:
-                            del self.active_connections[room_id][user_id]
-                        self.room_participants[room_id].discard(user_id)
-
-            if active_connections:
-                # 메시지 전송을 병렬로 처리
-                send_tasks = []
-                for ws in active_connections:
-                    if len(messages) == 1:
-                        send_tasks.append(self._safe_send(ws, messages[0]))
-                    else:
-                        send_tasks.append(self._safe_send(ws, messages))
-
-                # 병렬 전송 처리 (타임아웃 적용)
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*send_tasks, return_exceptions=True),
-                        timeout=2.0,  # 2초 타임아웃
-                    )
-                except asyncio.TimeoutError:
-                    print(f"Broadcast timeout in room {room_id}")
+            messages = items
+            # 수신자 수와 관계없이 묶음당 한 번만 JSON 인코딩
+            self._fan_out(
+                room_id, encode_message(messages[0] if len(messages) == 1 else messages)
+            )
 
             # 메시지 히스토리 업데이트 (최적화)
             self._update_room_messages(room_id, messages)
@@ -387,37 +384,104 @@ class ConnectionManager:
         except Exception as e:
             print(f"Error in broadcast_messages for room {room_id}: {e}")
 
-    async def _safe_send(self, websocket: WebSocket, data: Union[dict, list]):
-        """안전한 WebSocket 메시지 전송"""
-        try:
-            await websocket.send_json(data)
-            return True
-        except Exception as e:
-            print(f"Error sending message: {e}")
-            return False
+    def _fan_out(self, room_id: str, frame: str, user_ids=None) -> int:
+        """직렬화된 프레임을 방 참가자(또는 user_ids)의 전송 큐에 넣고 넣은 수를 반환
+
+        전송 완료를 기다리지 않으므로 느린 클라이언트가 있어도 바로 반환합니다.
+        """
+        senders = self.client_senders.get(room_id)
+        if not senders:
+            return 0
+        targets = (
+            senders.values()
+            if user_ids is None
+            else (senders[u] for u in user_ids if u in senders)
+        )
+        delivered = 0
+        for sender in list(targets):
+            if sender.offer(frame):
+                delivered += 1
+        return delivered
 
     def _update_room_messages(self, room_id: str, messages: list):
-        """메시지 히스토리 업데이트 (메모리 관리 최적화)"""
+        """메시지 히스토리 업데이트 (메모리 관리 최적화)
+
+        room_messages는 히스토리 API 첫 페이지 캐시이므로 저장 대상 메시지만 보관합니다.
+        """
         try:
             # 배치로 메시지 추가 (최대 개수 제한)
             current_messages = self.room_messages[room_id]
-            new_messages = messages if isinstance(messages, list) else [messages]
+            new_messages = [
+                message
+                for message in (messages if isinstance(messages, list) else [messages])
+                if message.get("type") in PERSISTED_MESSAGE_TYPES
+            ][-MAX_MESSAGES_PER_ROOM:]
+            if not new_messages:
+                return
 
             # 메모리 효율을 위해 리스트 크기 관리
             if len(current_messages) + len(new_messages) > MAX_MESSAGES_PER_ROOM:
-                # 오래된 메시지 제거
+                # 오래된 메시지 제거 (이제 캐시에 없는 메시지는 DB에서 조회)
                 self.room_messages[room_id] = (
-                    current_messages[-(MAX_MESSAGES_PER_ROOM - len(new_messages)) :]
+                    current_messages[
+                        len(current_messages)
+                        + len(new_messages)
+                        - MAX_MESSAGES_PER_ROOM :
+                    ]
                     + new_messages
                 )
+                self.room_history_complete[room_id] = False
             else:
                 current_messages.extend(new_messages)
 
         except Exception as e:
             print(f"Error updating room messages: {e}")
 
-    async def broadcast(self, message: dict, room_id: str):
-        """메시지 브로드캐스트 (샤딩 적용)"""
+    async def load_room_history(self, engine):
+        """DB의 최근 메시지로 방별 히스토리 캐시(room_messages)를 채움"""
+        try:
+            tails = await asyncio.get_running_loop().run_in_executor(
+                thread_pool,
+                load_room_tails,
+                engine,
+                list(CHAT_ROOMS),
+                MAX_MESSAGES_PER_ROOM,
+            )
+            for room_id, (messages, complete) in tails.items():
+                self.room_messages[room_id] = messages
+                self.room_history_complete[room_id] = complete
+                print(f"Room history loaded for {room_id}: {len(messages)} messages")
+        except Exception as e:
+            print(f"Error loading room history: {e}")
+
+    async def attach_backplane(self, backplane: Backplane):
+        """백플레인을 연결하고 다른 워커의 메시지 수신을 시작"""
+        try:
+            await backplane.start(self._on_backplane_message)
+        except Exception:
+            await backplane.close()
+            raise
+        if self.backplane is not None:
+            await self.backplane.close()
+        self.backplane = backplane
+        print(f"Backplane attached: {backplane.stats()}")  # 디버깅 로그
+
+    async def _on_backplane_message(self, room_id: str, message: dict):
+        """다른 워커에서 온 메시지를 로컬 소켓에만 전송 (다시 publish하지 않음)"""
+        try:
+            if not self.seen_message_ids.add(message.get("id")):
+                return
+            await self.dispatcher.submit(room_id, message)
+        except Exception as e:
+            print(f"Error relaying backplane message for room {room_id}: {e}")
+
+    async def broadcast(self, message: dict, room_id: str, relay: bool = True):
+        """메시지 브로드캐스트 (방 워커 큐에 넣으면 워커가 참가자 전송 큐에 전달)
+
+        relay=True면 백플레인으로 다른 워커에도 중계합니다.
+        저장 대상 메시지는 이 워커(메시지를 받은 워커)의 저널에만 기록합니다.
+        방 큐, 백플레인, 저널이 밀리면 이 호출(메시지를 보낸 쪽)만 기다리고 방 워커는 막히지 않습니다.
+        """
         try:
             if "id" not in message:
                 message["id"] = str(uuid.uuid4())
@@ -426,74 +490,23 @@ class ConnectionManager:
             if "room_id" not in message:
                 message["room_id"] = room_id
 
-            print(f"Broadcasting message to room {room_id}")  # 디버깅 로그
-
-            # 샤드별로 연결을 그룹화
-            shard_connections = defaultdict(list)
-            if room_id in self.active_connections:
-                for user_id, ws_ref in list(self.active_connections[room_id].items()):
-                    ws = ws_ref() if ws_ref else None
-                    if ws and not getattr(ws, "_closed", False):
-                        shard_id = self._get_shard_id(user_id)
-                        shard_connections[shard_id].append((user_id, ws))
-                    else:
-                        if user_id in self.active_connections[room_id]:
-                            del self.active_connections[room_id][user_id]
-                        self.room_participants[room_id].discard(user_id)
-
-            # 샤드별로 병렬 처리
-            broadcast_tasks = []
-            for shard_id, connections in shard_connections.items():
-                if connections:
-                    task = asyncio.create_task(
-                        self._broadcast_to_shard(shard_id, connections, message)
-                    )
-                    broadcast_tasks.append(task)
-
-            if broadcast_tasks:
-                await asyncio.gather(*broadcast_tasks)
+            self.seen_message_ids.add(message["id"])
+            if not await self.dispatcher.submit(room_id, message):
+                return False
 
-            # 메시지 히스토리 업데이트
-            self._update_room_messages(room_id, message)
+            if relay and self.backplane:
+                await self.backplane.publish(room_id, message)
+            if self.journal:
+                await self.journal.write(message)
             return True
 
         except Exception as e:
             print(f"Broadcasting error: {e}")
             return False
 
-    async def _broadcast_to_shard(
-        self, shard_id: int, connections: List[tuple], message: dict
-    ):
-        """샤드 내의 연결들에게 메시지 전송"""
-        try:
-            print(
-                f"Broadcasting to shard {shard_id} with {len(connections)} connections"
-            )
-            send_tasks = []
-
-            # 샤드 내에서 배치 처리
-            batch_size = 50  # 한 번에 처리할 연결 수
-            for i in range(0, len(connections), batch_size):
-                batch = connections[i : i + batch_size]
-                batch_tasks = []
-
-                for user_id, ws in batch:
-                    try:
-                        batch_tasks.append(self._safe_send(ws, message))
-                    except Exception as e:
-                        print(f"Error preparing send task for user {user_id}: {e}")
-                        continue
-
-                if batch_tasks:
-                    # 배치 단위로 전송 처리
-                    results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                    send_tasks.extend(results)
-
-                # 배치 사이에 짧은 대기 시간 추가
-                await asyncio.sleep(0.01)
-
-        except Exception as e:
-            print(f"Error in broadcast_to_shard {shard_id}: {e}")
+    def send_personal_message(self, message: dict, user_id: str, room_id: str) -> bool:
+        """한 사용자에게만 메시지 전송 (브로드캐스트와 같은 전송 큐를 사용해 순서 보장)"""
+        return self._fan_out(room_id, encode_message(message), (user_id,)) > 0
 
     def register_user(self, user_id: str, nickname: str, is_admin: bool = False):
         """사용자 정보 등록"""
@@ -561,16 +574,16 @@ class ConnectionManager:
 
             print(f"Broadcasting room status: {room_status}")
 
-            # 상태 메시지 생성
-            status_message = {
-                "type": "room_status",
-                "content": room_status,
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            # 모든 방에 상태 브로드캐스트
+            # 참가자가 있는 방에만 상태 브로드캐스트 (참가자 수는 워커별 값이므로 중계하지 않음)
             for room_id in CHAT_ROOMS.keys():
-                await self.broadcast(status_message, room_id)
+                if not self.client_senders.get(room_id):
+                    continue
+                status_message = {
+                    "type": "room_status",
+                    "content": room_status,
+                    "timestamp": datetime.now().isoformat(),
+                }
+                await self.broadcast(status_message, room_id, relay=False)
 
         except Exception as e:
             print(f"Error broadcasting room status: {e}")
@@ -611,20 +624,18 @@ class ConnectionManager:
                 self.active_connections[room_id][user_id] = weakref.ref(websocket)
                 self.room_participants[room_id].add(user_id)
 
-                # 6. 샤드 할당
-                shard_id = self._get_shard_id(user_id)
-                if room_id not in self.connection_shards[shard_id]:
-                    self.connection_shards[shard_id][room_id] = {}
-                self.connection_shards[shard_id][room_id][user_id] = weakref.ref(
-                    websocket
-                )
+                # 6. 클라이언트 전송 큐 생성
+                self.client_senders[room_id][user_id] = ClientSender(websocket, user_id)
+
+                # 7. 방 워커 시작 (방의 첫 사용자일 때)
+                self.dispatcher.ensure_worker(room_id)
 
                 print(f"Successfully connected user {user_id} to room {room_id}")
                 print(
                     f"Active connections in room {room_id}: {len(self.room_participants[room_id])}"
                 )
 
-                # 7. 연결 상태 브로드캐스트
+                # 8. 연결 상태 브로드캐스트
                 await self.broadcast_room_status()
                 return True
 
@@ -648,7 +659,7 @@ class ConnectionManager:
                 old_ws_ref = self.active_connections[room_id][user_id]
                 old_ws = old_ws_ref() if old_ws_ref else None
 
-                if old_ws and not getattr(old_ws, "_closed", True):
+                if is_websocket_connected(old_ws):
                     try:
                         await old_ws.close(
                             code=1000, reason="New connection established"
@@ -676,16 +687,13 @@ class ConnectionManager:
             if room_id in self.room_participants:
                 self.room_participants[room_id].discard(user_id)
 
-            # 샤드에서 제거
-            shard_id = self._get_shard_id(user_id)
-            if shard_id < len(self.connection_shards):
-                if room_id in self.connection_shards[shard_id]:
-                    if user_id in self.connection_shards[shard_id][room_id]:
-                        del self.connection_shards[shard_id][room_id][user_id]
-                    if not self.connection_shards[shard_id][
-                        room_id
-                    ]:  # 샤드의 방이 비었으면 방 정보도 제거
-                        del self.connection_shards[shard_id][room_id]
+            # 전송 큐 writer 중지
+            if room_id in self.client_senders:
+                sender = self.client_senders[room_id].pop(user_id, None)
+                if sender:
+                    sender.stop()
+                if not self.client_senders[room_id]:
+                    del self.client_senders[room_id]
 
         except Exception as e:
             print(f"Error in remove_connection: {e}")
@@ -697,7 +705,7 @@ class ConnectionManager:
             ws_ref = self.active_connections.get(room_id, {}).get(user_id)
             ws = ws_ref() if ws_ref else None
 
-            if ws and not getattr(ws, "_closed", True):
+            if is_websocket_connected(ws):
                 try:
                     await ws.close(code=1000, reason="Disconnected by server")
                 except Exception as e:
@@ -727,23 +735,12 @@ class ConnectionManager:
                         self.active_connections[room_id].items()
                     ):
                         ws = ws_ref() if ws_ref else None
-                        if not ws or getattr(ws, "_closed", True):
+                        if not is_websocket_connected(ws):
                             await self._cleanup_previous_connection(user_id, room_id)
                             print(
                                 f"Cleaned up disconnected user {user_id} from room {room_id}"
                             )
 
-                # 메시지 큐 정리
-                for shard_id in range(SHARD_COUNT):
-                    for room_id in list(self.shard_queues[shard_id].keys()):
-                        queue = self.shard_queues[shard_id][room_id]
-                        while queue.qsize() > MESSAGE_QUEUE_SIZE:
-                            try:
-                                await queue.get()
-                            except Exception as e:
-                                print(f"Error cleaning message queue: {e}")
-                                break
-
                 # 메모리 정리
                 gc.collect()
 
@@ -920,6 +917,9 @@ async def websocket_endpoint(
         # 4. 사용자 정보 조회 및 등록
         user = db.query(User).filter(User.id == user_id).first()
         nickname = user.nickname if user else f"사용자_{user_id[:8]}"
+        # 연결이 유지되는 동안 DB 커넥션을 붙잡지 않도록 바로 반환
+        # (풀 크기 이상 접속 시 다음 접속의 조회가 이벤트 루프를 막음)
+        db.close()
         manager.register_user(user_id, nickname, is_admin=False)
 
         # 5. ConnectionManager에 연결 추가
@@ -944,7 +944,7 @@ async def websocket_endpoint(
         while True:
             try:
                 # 연결 상태 확인
-                if getattr(websocket, "_closed", True):
+                if not is_websocket_connected(websocket):
                     print(f"WebSocket closed for user {user_id}")
                     break
 
@@ -957,7 +957,9 @@ async def websocket_endpoint(
 
                     # ping/pong 처리
                     if message_data.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
+                        manager.send_personal_message(
+                            {"type": "pong"}, user_id, room_id
+                        )
                         error_count = 0  # 성공적인 통신 시 에러 카운트 초기화
                         continue
 
@@ -1042,17 +1044,7 @@ async def handle_disconnect(user_id: str, room_id: str, db: Session, redis):
             user = db.query(User).filter(User.id == user_id).first()
             nickname = user.nickname if user else "알 수 없는 사용자"
 
-        # 퇴장 메시지 저장
         current_time = datetime.now()
-        db_message = Message(
-            user_id=user_id,
-            content=f"{nickname}님이 퇴장하셨습니다.",
-            room_id=room_id,
-            type="system",
-            timestamp=current_time,
-        )
-        db.add(db_message)
-        db.commit()
 
         # Redis에 상태 업데이트
         if redis_pool:
@@ -1068,10 +1060,11 @@ async def handle_disconnect(user_id: str, room_id: str, db: Session, redis):
             except Exception as e:
                 print(f"Redis 상태 업데이트 실패: {e}")
 
-        # 브로드캐스트
+        # 브로드캐스트 (퇴장 메시지는 저널을 통해 저장)
         await manager.broadcast(
             {
                 "type": "system",
+                "user_id": user_id,
                 "content": f"{nickname}님이 퇴장하셨습니다.",
                 "timestamp": current_time.isoformat(),
             },
@@ -1149,8 +1142,19 @@ async def startup_event():
     # Redis 풀 초기화
     await init_redis_pool()
 
-    # 데이터베이스 최적화 설정 적용
-    setup_database()
+    # 데이터베이스 최적화 설정 적용 (WAL 엔진으로 메시지 배치 저장, 히스토리 조회)
+    global db_engine
+    db_engine = setup_database()
+    manager.journal = MessageJournal(db_engine)
+    await manager.load_room_history(db_engine)
+
+    # 백플레인 연결 (Redis를 쓸 수 없으면 단일 프로세스용 메모리 백플레인)
+    if BACKPLANE_TYPE == "redis":
+        try:
+            await manager.attach_backplane(RedisBackplane(REDIS_URL))
+        except Exception as e:
+            print(f"Redis 백플레인 연결 실패: {e}")
+            print("메모리 백플레인으로 계속 진행합니다. (워커 간 중계 없음)")
 
     # ConnectionManager 초기화
     await manager.initialize()
@@ -1172,7 +1176,7 @@ async def shutdown_event():
         # Redis 연결 종료
         if redis_pool:
             try:
-                await redis_pool.close()
+                await redis_pool.aclose()
                 print("Redis connection closed")  # 디버깅 로그
             except Exception as e:
                 print(f"Error closing Redis connection: {e}")
@@ -1186,45 +1190,57 @@ async def shutdown_event():
 @app.get("/messages/{room_id}")
 async def get_messages(
     room_id: str,
+    cursor: Optional[str] = None,
     before: Optional[str] = None,
     limit: int = 50,
-    db: Session = Depends(get_db),
 ):
-    """이전 메시지 조회 API"""
+    """이전 메시지 조회 API (최신순, keyset 페이지네이션)
+
+    더 오래된 메시지가 있으면 X-Next-Cursor 헤더로 다음 페이지 커서를 반환합니다.
+    첫 페이지는 메모리의 최근 메시지 캐시에서, 이후 페이지는 DB 인덱스로 조회합니다.
+    `before`(타임스탬프)는 이전 클라이언트 호환용입니다.
+    """
+    limit = max(1, min(limit, MAX_HISTORY_PAGE_SIZE))
     try:
-        # 기본 쿼리 설정
-        query = db.query(Message).filter(Message.room_id == room_id)
+        page = None
+        if cursor is None and before is None:
+            page = cached_history(
+                manager.room_messages.get(room_id, []),
+                limit,
+                manager.room_history_complete.get(room_id, False),
+            )
 
-        # 타임스탬프 기준으로 필터링
-        if before:
-            try:
-                before_time = datetime.fromisoformat(before)
-                query = query.filter(Message.timestamp < before_time)
-            except ValueError:
-                print(f"잘못된 타임스탬프 형식: {before}")
-
-        # 최신 메시지부터 가져오기 (limit + 1개를 가져와서 더 있는지 확인)
-        messages = query.order_by(Message.timestamp.desc()).limit(limit + 1).all()
-
-        # 실제로 반환할 메시지 (limit 개수만큼)
-        return_messages = messages[:limit]
-
-        # 메시지 형식 변환
-        formatted_messages = []
-        for message in return_messages:
-            formatted_message = {
-                "id": str(uuid.uuid4()),  # 각 메시지에 고유 ID 부여
-                "type": message.type,
-                "content": message.content,
-                "user_id": message.user_id,
-                "nickname": manager.get_nickname(message.user_id),
-                "timestamp": message.timestamp.isoformat(),
-                "room_id": message.room_id,
-            }
-            formatted_messages.append(formatted_message)
+        if page is None:
+            keyset = None
+            before_time = None
+            if cursor:
+                try:
+                    keyset = decode_cursor(cursor)
+                except InvalidCursor:
+                    raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+            elif before:
+                try:
+                    before_time = datetime.fromisoformat(before)
+                except ValueError:
+                    print(f"잘못된 타임스탬프 형식: {before}")
+
+            # 동기 DB 조회는 스레드 풀에서 실행
+            page = await asyncio.get_running_loop().run_in_executor(
+                thread_pool,
+                fetch_history,
+                db_engine,
+                room_id,
+                limit,
+                keyset,
+                before_time,
+            )
 
-        return formatted_messages
+        messages, next_cursor = page
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+        return JSONResponse(content=messages, headers=headers)
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"메시지 조회 중 오류 발생: {e}")
         raise HTTPException(